@@ -0,0 +1,53 @@
+from leeger.calculator.parent.AllTimeCalculator import AllTimeCalculator
+from leeger.decorator.validators import validateLeague
+from leeger.model.filter import AllTimeFilters
+from leeger.model.frame.HeadToHead import HeadToHead
+from leeger.model.league.League import League
+from leeger.util.navigator.LeagueNavigator import LeagueNavigator
+from leeger.util.navigator.YearNavigator import YearNavigator
+from leeger.util.NumericSettings import NumericSettings
+
+
+class HeadToHeadAllTimeCalculator(AllTimeCalculator):
+    """
+    Used to calculate every Owner's record against every other Owner.
+    """
+
+    @classmethod
+    @validateLeague
+    def getHeadToHead(cls, league: League, **kwargs) -> HeadToHead:
+        """
+        Returns a HeadToHead with the wins, losses, ties, games played and points scored of each Owner against each other Owner in the given League.
+        It is built in one pass over the Matchups remaining after the filters are applied,
+        so any number of head-to-head lookups (or a full rivalry table) can be done without going through the Matchups again.
+
+        Example:
+            headToHead = HeadToHeadAllTimeCalculator.getHeadToHead(league)
+            headToHead.getWins("someOwnerId", "someOtherOwnerId")  # 4
+            headToHead.getPointsScored("someOwnerId", "someOtherOwnerId")  # Deci("612.4")
+        """
+        allTimeFilters = AllTimeFilters.getForLeague(league, **kwargs)
+        leagueIndex = LeagueNavigator.getLeagueIndex(league)
+
+        yearFramesRowsAndOwnerIds = list()
+        for yearNumber, yearFilters in cls._allTimeFiltersToYearFilters(
+            league, allTimeFilters
+        ).items():
+            yearFrame = YearNavigator.getYearFrame(
+                leagueIndex.getYearByYearNumber(int(yearNumber))
+            )
+            yearFramesRowsAndOwnerIds.append(
+                (
+                    yearFrame,
+                    yearFrame.getRows(yearFilters),
+                    [
+                        leagueIndex.getOwnerIdByTeamId(teamId)
+                        for teamId in yearFrame.teamIds
+                    ],
+                )
+            )
+        return HeadToHead.build(
+            LeagueNavigator.getAllOwnerIds(league),
+            yearFramesRowsAndOwnerIds,
+            NumericSettings.getFixedPointScaleIfUsed(**kwargs),
+        )
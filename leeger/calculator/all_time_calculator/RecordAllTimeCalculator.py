@@ -0,0 +1,454 @@
+import heapq
+from typing import Any, Callable
+
+import numpy
+
+from leeger.calculator.parent.AllTimeCalculator import AllTimeCalculator
+from leeger.decorator.validators import validateLeague
+from leeger.model.filter import AllTimeFilters
+from leeger.model.frame.MatchupColumns import MatchupColumns
+from leeger.model.league.League import League
+from leeger.model.stat.MatchupRecord import MatchupRecord
+from leeger.util.Deci import Deci
+from leeger.util.FixedPoint import FixedPoint
+from leeger.util.GeneralUtil import GeneralUtil
+from leeger.util.navigator.LeagueNavigator import LeagueNavigator
+from leeger.util.navigator.YearNavigator import YearNavigator
+from leeger.util.NumericSettings import NumericSettings
+
+
+class RecordAllTimeCalculator(AllTimeCalculator):
+    """
+    Used to find the records in a League's record book (e.g. the 10 highest scores ever).
+
+    Every Matchup remaining after the filters are applied is looked at as it was played (multi-week matchups are not combined),
+    which is how the Matchups are listed in the Excel export.
+    Records are found with a partial sort of columns built from each Year's YearFrame, so only the records that are returned are ever sorted.
+    Margins and combined scores that are compared as Decis are first narrowed down with a partial sort of their 64-bit floats,
+    so only the Matchups that could be records are ever made into Decis.
+    If records are tied, the one that was played first comes first.
+    """
+
+    @classmethod
+    def __getMatchupColumns(cls, league: League, **kwargs) -> MatchupColumns:
+        allTimeFilters = AllTimeFilters.getForLeague(league, **kwargs)
+        leagueIndex = LeagueNavigator.getLeagueIndex(league)
+        yearFramesAndRows = list()
+        for yearNumber, yearFilters in cls._allTimeFiltersToYearFilters(
+            league, allTimeFilters
+        ).items():
+            yearFrame = YearNavigator.getYearFrame(
+                leagueIndex.getYearByYearNumber(int(yearNumber))
+            )
+            yearFramesAndRows.append((yearFrame, yearFrame.getRows(yearFilters)))
+        return MatchupColumns.build(
+            yearFramesAndRows, NumericSettings.getFixedPointScaleIfUsed(**kwargs)
+        )
+
+    @staticmethod
+    def _getTopPositions(
+        keys: numpy.ndarray, numberOfRecords: int, *, largest: bool
+    ) -> list[int]:
+        """
+        Returns the positions of the numberOfRecords largest (or smallest) keys, best first.
+        Only the keys that could be returned are sorted, and if keys are tied, the earlier position comes first.
+        """
+        numberOfRecords = min(numberOfRecords, len(keys))
+        if numberOfRecords == 0:
+            return list()
+        keys = -keys if largest else keys
+        if numberOfRecords < len(keys):
+            # every key that is at least as good as the worst key in the top numberOfRecords
+            worstKey = keys[
+                numpy.argpartition(keys, numberOfRecords - 1)[:numberOfRecords]
+            ].max()
+            candidates = numpy.flatnonzero(keys <= worstKey)
+        else:
+            candidates = numpy.arange(len(keys))
+        # lexsort() sorts by the last key first, so ties are broken by position
+        order = numpy.lexsort((candidates, keys[candidates]))
+        return candidates[order[:numberOfRecords]].tolist()
+
+    @classmethod
+    def _getTopPositionsWithTolerance(
+        cls,
+        approximateKeys: numpy.ndarray,
+        tolerance: float,
+        getKey: Callable[[int], Any],
+        numberOfRecords: int,
+        *,
+        largest: bool,
+    ) -> list[int]:
+        """
+        Returns the positions of the numberOfRecords largest (or smallest) keys, best first.
+        Used for keys that can't be compared exactly in a NumPy array (e.g. Decis).
+        approximateKeys has a 64-bit float for each key that is never more than tolerance away from the key.
+        Candidates are picked with a partial sort of approximateKeys, and only the candidates are compared with getKey().
+        If keys are tied, the earlier position comes first.
+        """
+        numberOfRecords = min(numberOfRecords, len(approximateKeys))
+        if numberOfRecords == 0:
+            return list()
+        keys = -approximateKeys if largest else approximateKeys
+        # the key at every position in the top numberOfRecords is within 2 * tolerance of the worst approximate key in the top numberOfRecords
+        worstKey = keys[
+            numpy.argpartition(keys, numberOfRecords - 1)[:numberOfRecords]
+        ].max()
+        candidates = numpy.flatnonzero(keys <= worstKey + 2 * tolerance).tolist()
+        # candidates are in position order, and nlargest()/nsmallest() keep that order for ties
+        function = heapq.nlargest if largest else heapq.nsmallest
+        return function(numberOfRecords, candidates, key=getKey)
+
+    @staticmethod
+    def __getScoreSumTolerance(
+        teamAKey: numpy.ndarray, teamBKey: numpy.ndarray
+    ) -> float:
+        """
+        Returns how far the 64-bit float sum or difference of any two of the given scores can be from the exact sum or difference of the scores they came from.
+        Each score is within half a unit in the last place of its float, and so is the result of adding or subtracting them.
+        """
+        if len(teamAKey) == 0:
+            return 0.0
+        return float(
+            4
+            * numpy.finfo(numpy.float64).eps
+            * (numpy.abs(teamAKey) + numpy.abs(teamBKey)).max()
+        )
+
+    @classmethod
+    def __getMatchupRecord(
+        cls,
+        league: League,
+        matchupColumns: MatchupColumns,
+        position: int,
+        value: float | int | Deci,
+        *,
+        teamA: bool | None,
+    ) -> MatchupRecord:
+        """
+        Returns a MatchupRecord for the Matchup at the given position.
+        teamA is whether the record belongs to team A or team B, or None if it belongs to both teams.
+        """
+        yearFrame, row = matchupColumns.getYearFrameAndRow(position)
+        teamId = ownerId = None
+        if teamA is not None:
+            teamIndex = (
+                yearFrame.teamAIndex[row] if teamA else yearFrame.teamBIndex[row]
+            )
+            teamId = yearFrame.teamIds[teamIndex]
+            ownerId = LeagueNavigator.getLeagueIndex(league).getOwnerIdByTeamId(teamId)
+        return MatchupRecord(
+            matchup=yearFrame.matchups[row],
+            yearNumber=yearFrame.yearNumber,
+            weekNumber=int(yearFrame.weekNumbers[yearFrame.weekIndex[row]]),
+            teamId=teamId,
+            ownerId=ownerId,
+            value=value,
+        )
+
+    @classmethod
+    def __getScoreRecords(
+        cls,
+        league: League,
+        matchupColumns: MatchupColumns,
+        numberOfRecords: int,
+        *,
+        highest: bool,
+    ) -> list[MatchupRecord]:
+        # each side of each Matchup, with team A's side coming before team B's side
+        # 64-bit floats keep the order of the scores they were built from (and fixed-point integers are exact), so scores don't need to be compared as Decis
+        keys = numpy.column_stack(
+            (matchupColumns.teamAKey, matchupColumns.teamBKey)
+        ).ravel()
+        scoreRecords = list()
+        for sidePosition in cls._getTopPositions(
+            keys, numberOfRecords, largest=highest
+        ):
+            position, side = divmod(sidePosition, 2)
+            scoreValue = (
+                matchupColumns.teamAScoreValue[position]
+                if side == 0
+                else matchupColumns.teamBScoreValue[position]
+            )
+            scoreRecords.append(
+                cls.__getMatchupRecord(
+                    league, matchupColumns, position, scoreValue, teamA=side == 0
+                )
+            )
+        return scoreRecords
+
+    @classmethod
+    def __getMarginRecords(
+        cls,
+        league: League,
+        matchupColumns: MatchupColumns,
+        numberOfRecords: int,
+        *,
+        largest: bool,
+        **kwargs,
+    ) -> list[MatchupRecord]:
+        """
+        Returns the Matchups with a winner that have the largest (or smallest) margin of victory.
+        """
+        positionsWithWinner = numpy.flatnonzero(
+            matchupColumns.teamAWon | matchupColumns.teamBWon
+        )
+        teamAWon = matchupColumns.teamAWon[positionsWithWinner]
+        if NumericSettings.useFixedPoint(**kwargs):
+            scale = NumericSettings.getFixedPointScale(**kwargs)
+            margins = numpy.abs(
+                matchupColumns.teamAKey[positionsWithWinner]
+                - matchupColumns.teamBKey[positionsWithWinner]
+            )
+            topPositions = cls._getTopPositions(
+                margins, numberOfRecords, largest=largest
+            )
+            values = [FixedPoint.toDeci(margins[i], scale) for i in topPositions]
+        elif NumericSettings.useFloat(**kwargs):
+            margins = numpy.abs(
+                matchupColumns.teamAKey[positionsWithWinner]
+                - matchupColumns.teamBKey[positionsWithWinner]
+            )
+            topPositions = cls._getTopPositions(
+                margins, numberOfRecords, largest=largest
+            )
+            values = [Deci(margins[i]) for i in topPositions]
+        else:
+            # differences of floats aren't exact, so the closest margins are compared as Decis
+            teamAKey = matchupColumns.teamAKey[positionsWithWinner]
+            teamBKey = matchupColumns.teamBKey[positionsWithWinner]
+            teamAScoreValue = matchupColumns.teamAScoreValue[positionsWithWinner]
+            teamBScoreValue = matchupColumns.teamBScoreValue[positionsWithWinner]
+
+            def getMargin(i: int) -> Deci:
+                return Deci(abs(Deci(teamAScoreValue[i]) - Deci(teamBScoreValue[i])))
+
+            topPositions = cls._getTopPositionsWithTolerance(
+                numpy.abs(teamAKey - teamBKey),
+                cls.__getScoreSumTolerance(teamAKey, teamBKey),
+                getMargin,
+                numberOfRecords,
+                largest=largest,
+            )
+            values = [getMargin(i) for i in topPositions]
+
+        return [
+            cls.__getMatchupRecord(
+                league,
+                matchupColumns,
+                int(positionsWithWinner[i]),
+                value,
+                teamA=bool(teamAWon[i]),
+            )
+            for i, value in zip(topPositions, values)
+        ]
+
+    @classmethod
+    def __getCombinedScoreRecords(
+        cls,
+        league: League,
+        matchupColumns: MatchupColumns,
+        numberOfRecords: int,
+        *,
+        highest: bool,
+        **kwargs,
+    ) -> list[MatchupRecord]:
+        if NumericSettings.useFixedPoint(**kwargs):
+            scale = NumericSettings.getFixedPointScale(**kwargs)
+            combinedScores = matchupColumns.teamAKey + matchupColumns.teamBKey
+            topPositions = cls._getTopPositions(
+                combinedScores, numberOfRecords, largest=highest
+            )
+            values = [FixedPoint.toDeci(combinedScores[i], scale) for i in topPositions]
+        elif NumericSettings.useFloat(**kwargs):
+            combinedScores = matchupColumns.teamAKey + matchupColumns.teamBKey
+            topPositions = cls._getTopPositions(
+                combinedScores, numberOfRecords, largest=highest
+            )
+            values = [Deci(combinedScores[i]) for i in topPositions]
+        else:
+            # sums of floats aren't exact, so the closest combined scores are compared as Decis
+            def getCombinedScore(i: int) -> Deci:
+                return Deci(
+                    Deci(matchupColumns.teamAScoreValue[i])
+                    + Deci(matchupColumns.teamBScoreValue[i])
+                )
+
+            topPositions = cls._getTopPositionsWithTolerance(
+                matchupColumns.teamAKey + matchupColumns.teamBKey,
+                cls.__getScoreSumTolerance(
+                    matchupColumns.teamAKey, matchupColumns.teamBKey
+                ),
+                getCombinedScore,
+                numberOfRecords,
+                largest=highest,
+            )
+            values = [getCombinedScore(i) for i in topPositions]
+
+        return [
+            cls.__getMatchupRecord(league, matchupColumns, i, value, teamA=None)
+            for i, value in zip(topPositions, values)
+        ]
+
+    @classmethod
+    @validateLeague
+    def getHighestScores(
+        cls, league: League, numberOfRecords: int = 10, **kwargs
+    ) -> list[MatchupRecord]:
+        """
+        Returns the numberOfRecords highest scores in the given League, highest first.
+        Each record's value is the score.
+
+        Example response:
+            [
+            MatchupRecord(matchup=..., yearNumber=2019, weekNumber=3, teamId="someTeamId", ownerId="someOwnerId", value=201.4),
+            MatchupRecord(matchup=..., yearNumber=2021, weekNumber=11, teamId="someOtherTeamId", ownerId="someOtherOwnerId", value=188),
+            ...
+            ]
+        """
+        GeneralUtil.validatePositiveInt(numberOfRecords, "numberOfRecords")
+        return cls.__getScoreRecords(
+            league,
+            cls.__getMatchupColumns(league, **kwargs),
+            numberOfRecords,
+            highest=True,
+        )
+
+    @classmethod
+    @validateLeague
+    def getLowestScores(
+        cls, league: League, numberOfRecords: int = 10, **kwargs
+    ) -> list[MatchupRecord]:
+        """
+        Returns the numberOfRecords lowest scores in the given League, lowest first.
+        Each record's value is the score.
+
+        Example response:
+            [
+            MatchupRecord(matchup=..., yearNumber=2020, weekNumber=7, teamId="someTeamId", ownerId="someOwnerId", value=41.2),
+            MatchupRecord(matchup=..., yearNumber=2018, weekNumber=2, teamId="someOtherTeamId", ownerId="someOtherOwnerId", value=55),
+            ...
+            ]
+        """
+        GeneralUtil.validatePositiveInt(numberOfRecords, "numberOfRecords")
+        return cls.__getScoreRecords(
+            league,
+            cls.__getMatchupColumns(league, **kwargs),
+            numberOfRecords,
+            highest=False,
+        )
+
+    @classmethod
+    @validateLeague
+    def getBiggestBlowouts(
+        cls, league: League, numberOfRecords: int = 10, **kwargs
+    ) -> list[MatchupRecord]:
+        """
+        Returns the numberOfRecords Matchups in the given League with the largest margin of victory, largest first.
+        Each record belongs to the winner and its value is the margin of victory.
+        Ties are not included.
+
+        Example response:
+            [
+            MatchupRecord(matchup=..., yearNumber=2019, weekNumber=3, teamId="someTeamId", ownerId="someOwnerId", value=Deci("101.2")),
+            MatchupRecord(matchup=..., yearNumber=2022, weekNumber=9, teamId="someOtherTeamId", ownerId="someOtherOwnerId", value=Deci("88.4")),
+            ...
+            ]
+        """
+        GeneralUtil.validatePositiveInt(numberOfRecords, "numberOfRecords")
+        return cls.__getMarginRecords(
+            league,
+            cls.__getMatchupColumns(league, **kwargs),
+            numberOfRecords,
+            largest=True,
+            **kwargs,
+        )
+
+    @classmethod
+    @validateLeague
+    def getNarrowestWins(
+        cls, league: League, numberOfRecords: int = 10, **kwargs
+    ) -> list[MatchupRecord]:
+        """
+        Returns the numberOfRecords Matchups in the given League with the smallest margin of victory, smallest first.
+        Each record belongs to the winner and its value is the margin of victory (which is 0 for a win on a tiebreaker).
+        Ties are not included.
+
+        Example response:
+            [
+            MatchupRecord(matchup=..., yearNumber=2019, weekNumber=3, teamId="someTeamId", ownerId="someOwnerId", value=Deci("0")),
+            MatchupRecord(matchup=..., yearNumber=2022, weekNumber=9, teamId="someOtherTeamId", ownerId="someOtherOwnerId", value=Deci("0.04")),
+            ...
+            ]
+        """
+        GeneralUtil.validatePositiveInt(numberOfRecords, "numberOfRecords")
+        return cls.__getMarginRecords(
+            league,
+            cls.__getMatchupColumns(league, **kwargs),
+            numberOfRecords,
+            largest=False,
+            **kwargs,
+        )
+
+    @classmethod
+    @validateLeague
+    def getHighestCombinedScores(
+        cls, league: League, numberOfRecords: int = 10, **kwargs
+    ) -> list[MatchupRecord]:
+        """
+        Returns the numberOfRecords Matchups in the given League with the highest combined score, highest first.
+        Each record belongs to both teams and its value is the combined score.
+
+        Example response:
+            [
+            MatchupRecord(matchup=..., yearNumber=2019, weekNumber=3, teamId=None, ownerId=None, value=Deci("341.2")),
+            MatchupRecord(matchup=..., yearNumber=2022, weekNumber=9, teamId=None, ownerId=None, value=Deci("330.5")),
+            ...
+            ]
+        """
+        GeneralUtil.validatePositiveInt(numberOfRecords, "numberOfRecords")
+        return cls.__getCombinedScoreRecords(
+            league,
+            cls.__getMatchupColumns(league, **kwargs),
+            numberOfRecords,
+            highest=True,
+            **kwargs,
+        )
+
+    @classmethod
+    @validateLeague
+    def getRecordBook(
+        cls, league: League, numberOfRecords: int = 10, **kwargs
+    ) -> dict[str, list[MatchupRecord]]:
+        """
+        Returns every record in the given League's record book, keyed by record name.
+        The Matchup columns are only built once for every record.
+
+        Example response:
+            {
+            "highestScores": [MatchupRecord(...), ...],
+            "lowestScores": [MatchupRecord(...), ...],
+            "biggestBlowouts": [MatchupRecord(...), ...],
+            "narrowestWins": [MatchupRecord(...), ...],
+            "highestCombinedScores": [MatchupRecord(...), ...],
+            }
+        """
+        GeneralUtil.validatePositiveInt(numberOfRecords, "numberOfRecords")
+        matchupColumns = cls.__getMatchupColumns(league, **kwargs)
+        return {
+            "highestScores": cls.__getScoreRecords(
+                league, matchupColumns, numberOfRecords, highest=True
+            ),
+            "lowestScores": cls.__getScoreRecords(
+                league, matchupColumns, numberOfRecords, highest=False
+            ),
+            "biggestBlowouts": cls.__getMarginRecords(
+                league, matchupColumns, numberOfRecords, largest=True, **kwargs
+            ),
+            "narrowestWins": cls.__getMarginRecords(
+                league, matchupColumns, numberOfRecords, largest=False, **kwargs
+            ),
+            "highestCombinedScores": cls.__getCombinedScoreRecords(
+                league, matchupColumns, numberOfRecords, highest=True, **kwargs
+            ),
+        }
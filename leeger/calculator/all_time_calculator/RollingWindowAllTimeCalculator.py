@@ -0,0 +1,353 @@
+from typing import Any, Optional
+
+import numpy
+
+from leeger.calculator.parent.AllTimeCalculator import AllTimeCalculator
+from leeger.calculator.year_calculator.RollingWindowYearCalculator import (
+    RollingWindowYearCalculator,
+)
+from leeger.decorator.validators import validateLeague
+from leeger.model.filter import AllTimeFilters, YearFilters
+from leeger.model.frame.ScoresAggregate import ScoresAggregate
+from leeger.model.league.League import League
+from leeger.model.league.Year import Year
+from leeger.util.Deci import Deci
+from leeger.util.GeneralUtil import GeneralUtil
+from leeger.util.MonotonicQueue import MonotonicQueue
+from leeger.util.navigator.LeagueNavigator import LeagueNavigator
+from leeger.util.navigator.YearNavigator import YearNavigator
+
+
+class RollingWindowAllTimeCalculator(AllTimeCalculator):
+    """
+    Used to calculate stats over the trailing N weeks for every week in a League, with windows that can span multiple Years.
+
+    Weeks are lined up one after another from (yearNumberStart, weekNumberStart) to (yearNumberEnd, weekNumberEnd),
+    and every method returns a list for each Owner, where index i is the stat for the window that ends at the ith week in that line.
+    Each window is the last windowSize weeks up to and including that week,
+    and the stat for each window is exactly what the matching All-Time calculator returns for that range.
+
+    The League is validated once and each window is split into the part of it in each Year,
+    which is calculated from running totals and weekly rankings that are only built once per Year.
+    """
+
+    @classmethod
+    def __getWeeks(
+        cls, league: League, allTimeFilters: AllTimeFilters
+    ) -> list[tuple[Year, int]]:
+        """
+        Returns every (Year, week number) in the given filters, in the order they were played.
+        """
+        weeks: list[tuple[Year, int]] = list()
+        for year in league.years:
+            if not (
+                allTimeFilters.yearNumberStart
+                <= year.yearNumber
+                <= allTimeFilters.yearNumberEnd
+            ):
+                continue
+            weekNumberStart = (
+                allTimeFilters.weekNumberStart
+                if year.yearNumber == allTimeFilters.yearNumberStart
+                else 1
+            )
+            weekNumberEnd = (
+                allTimeFilters.weekNumberEnd
+                if year.yearNumber == allTimeFilters.yearNumberEnd
+                else len(year.weeks)
+            )
+            for weekNumber in range(weekNumberStart, weekNumberEnd + 1):
+                weeks.append((year, weekNumber))
+        return weeks
+
+    @classmethod
+    def __getWindows(
+        cls, league: League, windowSize: int, **kwargs
+    ) -> list[list[tuple[Year, YearFilters]]]:
+        """
+        Returns the Years in the window that ends at each week in the filters in kwargs,
+        with the YearFilters an All-Time calculator would use for each of those Years.
+        """
+        GeneralUtil.validatePositiveInt(windowSize, "windowSize")
+        allTimeFilters = AllTimeFilters.getForLeague(league, **kwargs)
+        weeks = cls.__getWeeks(league, allTimeFilters)
+
+        windows: list[list[tuple[Year, YearFilters]]] = list()
+        for i in range(len(weeks)):
+            window: list[tuple[Year, YearFilters]] = list()
+            for year, weekNumber in weeks[max(0, i - windowSize + 1) : i + 1]:
+                if len(window) > 0 and window[-1][0] is year:
+                    window[-1][1].weekNumberEnd = weekNumber
+                else:
+                    window.append(
+                        (
+                            year,
+                            YearFilters(
+                                weekNumberStart=weekNumber,
+                                weekNumberEnd=weekNumber,
+                                onlyChampionship=allTimeFilters.onlyChampionship,
+                                onlyPostSeason=allTimeFilters.onlyPostSeason,
+                                onlyRegularSeason=allTimeFilters.onlyRegularSeason,
+                            ),
+                        )
+                    )
+            windows.append(window)
+        return windows
+
+    @classmethod
+    def __sumGamesPlayed(
+        cls, league: League, window: list[tuple[Year, YearFilters]], **kwargs
+    ) -> dict[str, int]:
+        """
+        Returns the same thing as LeagueNavigator.getNumberOfGamesPlayed() for the given window.
+        """
+        ownerIdAndNumberOfGamesPlayed = {
+            ownerId: 0 for ownerId in LeagueNavigator.getAllOwnerIds(league)
+        }
+        leagueIndex = LeagueNavigator.getLeagueIndex(league)
+        for year, yearFilters in window:
+            teamIdAndNumberOfGamesPlayed = YearNavigator.getNumberOfGamesPlayed(
+                year, yearFilters, **kwargs
+            )
+            for teamId, numberOfGamesPlayed in teamIdAndNumberOfGamesPlayed.items():
+                ownerIdAndNumberOfGamesPlayed[
+                    leagueIndex.getOwnerIdByTeamId(teamId)
+                ] += numberOfGamesPlayed
+        return ownerIdAndNumberOfGamesPlayed
+
+    @staticmethod
+    def __divideByGamesPlayed(
+        ownerIdAndStat: dict[str, Optional[Deci]],
+        ownerIdAndNumberOfGamesPlayed: dict[str, int],
+    ) -> dict[str, Optional[Deci]]:
+        ownerIdAndStatPerGame = dict()
+        for ownerId in ownerIdAndStat:
+            if ownerIdAndNumberOfGamesPlayed[ownerId] == 0:
+                ownerIdAndStatPerGame[ownerId] = None
+            else:
+                ownerIdAndStatPerGame[ownerId] = (
+                    ownerIdAndStat[ownerId] / ownerIdAndNumberOfGamesPlayed[ownerId]
+                )
+        return ownerIdAndStatPerGame
+
+    @staticmethod
+    def __toOwnerIdAndWindows(
+        league: League, windowResults: list[dict[str, Any]]
+    ) -> dict[str, list]:
+        return {
+            ownerId: [windowResult[ownerId] for windowResult in windowResults]
+            for ownerId in LeagueNavigator.getAllOwnerIds(league)
+        }
+
+    @classmethod
+    @validateLeague
+    def getRollingPointsScoredPerGame(
+        cls, league: League, windowSize: int, **kwargs
+    ) -> dict[str, list[Optional[Deci]]]:
+        """
+        Returns the Points Scored per game over the last windowSize weeks, for each week and each Owner in the given League.
+        Returns None for an Owner in a window they have no games played in.
+
+        Example response:
+            {
+            "someOwnerId": [Deci("100.7"), Deci("110.2"), Deci("105.1"), ...],
+            "someOtherOwnerId": [Deci("141.2"), Deci("120.5"), None, ...],
+            ...
+            }
+        """
+        windowResults = list()
+        for window in cls.__getWindows(league, windowSize, **kwargs):
+            windowResults.append(
+                cls.__divideByGamesPlayed(
+                    cls._combineResults(
+                        league,
+                        [
+                            RollingWindowYearCalculator._getPointsScoredInWindow(
+                                year, yearFilters
+                            )
+                            for year, yearFilters in window
+                        ],
+                    ),
+                    cls.__sumGamesPlayed(league, window),
+                )
+            )
+        return cls.__toOwnerIdAndWindows(league, windowResults)
+
+    @classmethod
+    @validateLeague
+    def getRollingAWALPerGame(
+        cls, league: League, windowSize: int, **kwargs
+    ) -> dict[str, list[Optional[Deci]]]:
+        """
+        Returns the Adjusted Wins Against the League per game over the last windowSize weeks, for each week and each Owner in the given League.
+        Returns None for an Owner in a window they have no games played in.
+
+        Example response:
+            {
+            "someOwnerId": [Deci("0.7"), Deci("0.55"), Deci("0.6"), ...],
+            "someOtherOwnerId": [Deci("0.2"), Deci("0.3"), None, ...],
+            ...
+            }
+        """
+        windowResults = list()
+        for window in cls.__getWindows(league, windowSize, **kwargs):
+            windowResults.append(
+                cls.__divideByGamesPlayed(
+                    cls._combineResults(
+                        league,
+                        [
+                            RollingWindowYearCalculator._getAWALInWindow(
+                                year, yearFilters
+                            )
+                            for year, yearFilters in window
+                        ],
+                    ),
+                    cls.__sumGamesPlayed(
+                        league, window, countLeagueMedianGamesAsTwoGames=True
+                    ),
+                )
+            )
+        return cls.__toOwnerIdAndWindows(league, windowResults)
+
+    @classmethod
+    def __getRollingSingleScores(
+        cls, league: League, windowSize: int, *, maxScore: bool, **kwargs
+    ) -> dict[str, list[Optional[float | int]]]:
+        windows = cls.__getWindows(league, windowSize, **kwargs)
+        leagueIndex = LeagueNavigator.getLeagueIndex(league)
+        allOwnerIds = LeagueNavigator.getAllOwnerIds(league)
+
+        # each score as (position of its week, Owner ID, score), in the order they were played
+        scores: list[tuple[int, str, float | int]] = list()
+        for position, window in enumerate(windows):
+            year, yearFilters = window[-1]
+            yearFrame = YearNavigator.getYearFrame(year)
+            rows = yearFrame.getRows(
+                YearFilters(
+                    weekNumberStart=yearFilters.weekNumberEnd,
+                    weekNumberEnd=yearFilters.weekNumberEnd,
+                    onlyChampionship=yearFilters.onlyChampionship,
+                    onlyPostSeason=yearFilters.onlyPostSeason,
+                    onlyRegularSeason=yearFilters.onlyRegularSeason,
+                )
+            )
+            for teamAIndex, teamBIndex, teamAScore, teamBScore in zip(
+                yearFrame.teamAIndex[rows].tolist(),
+                yearFrame.teamBIndex[rows].tolist(),
+                yearFrame.teamAScoreValue[rows].tolist(),
+                yearFrame.teamBScoreValue[rows].tolist(),
+            ):
+                scores.append(
+                    (
+                        position,
+                        leagueIndex.getOwnerIdByTeamId(yearFrame.teamIds[teamAIndex]),
+                        teamAScore,
+                    )
+                )
+                scores.append(
+                    (
+                        position,
+                        leagueIndex.getOwnerIdByTeamId(yearFrame.teamIds[teamBIndex]),
+                        teamBScore,
+                    )
+                )
+
+        # scores are compared as they are, just like SingleScoreAllTimeCalculator
+        ownerIdAndMonotonicQueue = {
+            ownerId: MonotonicQueue(maxValue=maxScore) for ownerId in allOwnerIds
+        }
+        ownerIdAndSingleScores = {ownerId: list() for ownerId in allOwnerIds}
+        scorePosition = 0
+        for position in range(len(windows)):
+            while scorePosition < len(scores) and scores[scorePosition][0] == position:
+                _, ownerId, score = scores[scorePosition]
+                ownerIdAndMonotonicQueue[ownerId].push(position, score)
+                scorePosition += 1
+            for ownerId in allOwnerIds:
+                monotonicQueue = ownerIdAndMonotonicQueue[ownerId]
+                monotonicQueue.dropBefore(position - windowSize + 1)
+                ownerIdAndSingleScores[ownerId].append(monotonicQueue.getFront())
+        return ownerIdAndSingleScores
+
+    @classmethod
+    @validateLeague
+    def getRollingMaxScore(
+        cls, league: League, windowSize: int, **kwargs
+    ) -> dict[str, list[Optional[float | int]]]:
+        """
+        Returns the Max Score over the last windowSize weeks, for each week and each Owner in the given League.
+        Uses a monotonic queue for each Owner, so each score is only looked at when it enters and leaves the window.
+        Returns None for an Owner in a window they have no games played in.
+
+        Example response:
+            {
+            "someOwnerId": [100.7, 111, 111, ...],
+            "someOtherOwnerId": [112.2, 112.2, None, ...],
+            ...
+            }
+        """
+        return cls.__getRollingSingleScores(league, windowSize, maxScore=True, **kwargs)
+
+    @classmethod
+    @validateLeague
+    def getRollingMinScore(
+        cls, league: League, windowSize: int, **kwargs
+    ) -> dict[str, list[Optional[float | int]]]:
+        """
+        Returns the Min Score over the last windowSize weeks, for each week and each Owner in the given League.
+        Uses a monotonic queue for each Owner, so each score is only looked at when it enters and leaves the window.
+        Returns None for an Owner in a window they have no games played in.
+
+        Example response:
+            {
+            "someOwnerId": [78.6, 78.6, 90, ...],
+            "someOtherOwnerId": [102, 88.1, None, ...],
+            ...
+            }
+        """
+        return cls.__getRollingSingleScores(
+            league, windowSize, maxScore=False, **kwargs
+        )
+
+    @classmethod
+    @validateLeague
+    def getRollingScoringStandardDeviation(
+        cls, league: League, windowSize: int, **kwargs
+    ) -> dict[str, list[Optional[Deci]]]:
+        """
+        Returns the Scoring Standard Deviation over the last windowSize weeks, for each week and each Owner in the given League.
+        Each window is merged from the ScoresAggregate of each Year in it, which is only built once per Year and range of weeks.
+        Returns None for an Owner in a window they have no games played in.
+
+        Example response:
+            {
+            "someOwnerId": [Deci("10.7"), Deci("11.3"), Deci("8.2"), ...],
+            "someOtherOwnerId": [Deci("11.2"), Deci("0"), None, ...],
+            ...
+            }
+        """
+        leagueIndex = LeagueNavigator.getLeagueIndex(league)
+        allOwnerIds = LeagueNavigator.getAllOwnerIds(league)
+
+        windowResults = list()
+        for window in cls.__getWindows(league, windowSize, **kwargs):
+            ownerIdAndScores = {ownerId: list() for ownerId in allOwnerIds}
+            scoresAggregate = ScoresAggregate.merge(
+                [
+                    YearNavigator.getYearFrame(year).getScoresAggregate(yearFilters)
+                    for year, yearFilters in window
+                ]
+            ).mapIds(leagueIndex.teamIdToOwnerId)
+            for ownerId, score in zip(*scoresAggregate.getIdsAndScores()):
+                ownerIdAndScores[ownerId].append(Deci(score))
+
+            ownerIdAndScoringStandardDeviation = dict()
+            for ownerId in allOwnerIds:
+                if len(ownerIdAndScores[ownerId]) > 0:
+                    ownerIdAndScoringStandardDeviation[ownerId] = Deci(
+                        numpy.std(ownerIdAndScores[ownerId])
+                    )
+                else:
+                    ownerIdAndScoringStandardDeviation[ownerId] = None
+            windowResults.append(ownerIdAndScoringStandardDeviation)
+        return cls.__toOwnerIdAndWindows(league, windowResults)
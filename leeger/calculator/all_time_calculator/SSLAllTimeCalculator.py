@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Iterable, Optional
 
 from leeger.calculator.parent.AllTimeCalculator import AllTimeCalculator
 from leeger.calculator.year_calculator.SSLYearCalculator import SSLYearCalculator
@@ -44,62 +44,16 @@ class SSLAllTimeCalculator(AllTimeCalculator):
             ...
             }
         """
-        from leeger.calculator.year_calculator import TeamSummaryYearCalculator
-
         teamScoreResultsOrderedByYear = cls._getAllResultDictsByYear(
             league, SSLYearCalculator.getTeamScore, **kwargs
         )
-        gamesPlayedByYear: dict[str, dict[str, int]] = dict()
-
-        allTimeFilters = AllTimeFilters.getForLeague(league, **kwargs)
-        yearFiltersByYear = cls._allTimeFiltersToYearFilters(league, allTimeFilters)
-
-        for yearNumber in teamScoreResultsOrderedByYear.keys():
-            year = LeagueNavigator.getYearByYearNumber(league, int(yearNumber))
-            gamesPlayedByYear[yearNumber] = TeamSummaryYearCalculator.getGamesPlayed(
-                year, **yearFiltersByYear[str(yearNumber)].asKwargs()
-            )
-
-        ownerIdToTeamScoreAndGamesPlayedListMap: dict[str, list[tuple[Deci, int]]] = (
-            dict()
+        return cls.__adjustByGamesPlayed(
+            league,
+            teamScoreResultsOrderedByYear,
+            cls.__getGamesPlayedByYear(
+                league, teamScoreResultsOrderedByYear.keys(), **kwargs
+            ),
         )
-        # {"someOwnerId": [(Deci("101.5"), 4), (Deci("109.4), 5)]}
-        for yearNumber, teamScoreResultDict in teamScoreResultsOrderedByYear.items():
-            for teamId, teamScore in teamScoreResultDict.items():
-                team = LeagueNavigator.getTeamById(league, teamId)
-                gamesPlayed = gamesPlayedByYear[yearNumber][teamId]
-                if team.ownerId in ownerIdToTeamScoreAndGamesPlayedListMap:
-                    ownerIdToTeamScoreAndGamesPlayedListMap[team.ownerId].append(
-                        (teamScore, gamesPlayed)
-                    )
-                else:
-                    ownerIdToTeamScoreAndGamesPlayedListMap[team.ownerId] = [
-                        (teamScore, gamesPlayed)
-                    ]
-
-        # adjust team scores by games played
-        ownerIdAndAdjustedTeamScore: dict[str, Optional[Deci]] = dict()
-        for (
-            ownerId,
-            teamScoreAndGamesPlayedList,
-        ) in ownerIdToTeamScoreAndGamesPlayedListMap.items():
-            totalGamesPlayed = sum([tsagp[1] for tsagp in teamScoreAndGamesPlayedList])
-            if totalGamesPlayed > 0:
-                for teamScore, gamesPlayed in teamScoreAndGamesPlayedList:
-                    if teamScore is not None:
-                        percentageOfGamesPlayed = Deci(gamesPlayed / totalGamesPlayed)
-                        adjustedTeamScore = Deci(teamScore * percentageOfGamesPlayed)
-                        if ownerId in ownerIdAndAdjustedTeamScore:
-                            ownerIdAndAdjustedTeamScore[ownerId] += adjustedTeamScore
-                        else:
-                            ownerIdAndAdjustedTeamScore[ownerId] = adjustedTeamScore
-
-        # set to None if ownerId not in response dict
-        for ownerId in LeagueNavigator.getAllOwnerIds(league):
-            if ownerId not in ownerIdAndAdjustedTeamScore:
-                ownerIdAndAdjustedTeamScore[ownerId] = None
-
-        return ownerIdAndAdjustedTeamScore
 
     @classmethod
     @validateLeague
@@ -118,71 +72,119 @@ class SSLAllTimeCalculator(AllTimeCalculator):
             ...
             }
         """
-        from leeger.calculator.year_calculator import TeamSummaryYearCalculator
-
         teamSuccessResultsOrderedByYear = cls._getAllResultDictsByYear(
             league, SSLYearCalculator.getTeamSuccess, **kwargs
         )
+        return cls.__adjustByGamesPlayed(
+            league,
+            teamSuccessResultsOrderedByYear,
+            cls.__getGamesPlayedByYear(
+                league, teamSuccessResultsOrderedByYear.keys(), **kwargs
+            ),
+        )
+
+    @classmethod
+    def _getAdjustedTeamScoreAndTeamSuccess(
+        cls, league: League, **kwargs
+    ) -> tuple[dict[str, Optional[Deci]], dict[str, Optional[Deci]]]:
+        """
+        Returns (Adjusted Team Score, Adjusted Team Success) for each Owner in the given League.
+        Each Year's Team Score and Team Success are calculated from one shared set of stats and games played is only calculated once per Year.
+        """
+        teamScoreAndTeamSuccessOrderedByYear = cls._getAllResultDictsByYear(
+            league, SSLYearCalculator._getTeamScoreAndTeamSuccess, **kwargs
+        )
+        gamesPlayedByYear = cls.__getGamesPlayedByYear(
+            league, teamScoreAndTeamSuccessOrderedByYear.keys(), **kwargs
+        )
+        ownerIdAndAdjustedTeamScore = cls.__adjustByGamesPlayed(
+            league,
+            {
+                yearNumber: teamScoreAndTeamSuccess[0]
+                for yearNumber, teamScoreAndTeamSuccess in teamScoreAndTeamSuccessOrderedByYear.items()
+            },
+            gamesPlayedByYear,
+        )
+        ownerIdAndAdjustedTeamSuccess = cls.__adjustByGamesPlayed(
+            league,
+            {
+                yearNumber: teamScoreAndTeamSuccess[1]
+                for yearNumber, teamScoreAndTeamSuccess in teamScoreAndTeamSuccessOrderedByYear.items()
+            },
+            gamesPlayedByYear,
+        )
+        return ownerIdAndAdjustedTeamScore, ownerIdAndAdjustedTeamSuccess
+
+    @classmethod
+    def __getGamesPlayedByYear(
+        cls, league: League, yearNumbers: Iterable, **kwargs
+    ) -> dict[str, dict[str, int]]:
+        """
+        Returns the games played for each team in each of the given Years, using the filters each Year was calculated with.
+        """
+        from leeger.calculator.year_calculator import TeamSummaryYearCalculator
+
         gamesPlayedByYear: dict[str, dict[str, int]] = dict()
 
         allTimeFilters = AllTimeFilters.getForLeague(league, **kwargs)
         yearFiltersByYear = cls._allTimeFiltersToYearFilters(league, allTimeFilters)
 
-        for yearNumber in teamSuccessResultsOrderedByYear.keys():
+        for yearNumber in yearNumbers:
             year = LeagueNavigator.getYearByYearNumber(league, int(yearNumber))
             gamesPlayedByYear[yearNumber] = TeamSummaryYearCalculator.getGamesPlayed(
                 year, **yearFiltersByYear[str(yearNumber)].asKwargs()
             )
+        return gamesPlayedByYear
 
-        ownerIdToTeamSuccessAndGamesPlayedListMap: dict[str, list[tuple[Deci, int]]] = (
-            dict()
-        )
+    @classmethod
+    def __adjustByGamesPlayed(
+        cls,
+        league: League,
+        resultsOrderedByYear: dict[str, dict[str, Optional[Deci]]],
+        gamesPlayedByYear: dict[str, dict[str, int]],
+    ) -> dict[str, Optional[Deci]]:
+        """
+        Combines each Owner's yearly results, weighting each Year by the share of the Owner's games played in that Year.
+        """
+        ownerIdToResultAndGamesPlayedListMap: dict[str, list[tuple[Deci, int]]] = dict()
+        leagueIndex = LeagueNavigator.getLeagueIndex(league)
         # {"someOwnerId": [(Deci("101.5"), 4), (Deci("109.4), 5)]}
-        for (
-            yearNumber,
-            teamSuccessResultDict,
-        ) in teamSuccessResultsOrderedByYear.items():
-            for teamId, teamSuccess in teamSuccessResultDict.items():
-                team = LeagueNavigator.getTeamById(league, teamId)
+        for yearNumber, resultDict in resultsOrderedByYear.items():
+            for teamId, result in resultDict.items():
+                ownerId = leagueIndex.getOwnerIdByTeamId(teamId)
                 gamesPlayed = gamesPlayedByYear[yearNumber][teamId]
-                if team.ownerId in ownerIdToTeamSuccessAndGamesPlayedListMap:
-                    ownerIdToTeamSuccessAndGamesPlayedListMap[team.ownerId].append(
-                        (teamSuccess, gamesPlayed)
+                if ownerId in ownerIdToResultAndGamesPlayedListMap:
+                    ownerIdToResultAndGamesPlayedListMap[ownerId].append(
+                        (result, gamesPlayed)
                     )
                 else:
-                    ownerIdToTeamSuccessAndGamesPlayedListMap[team.ownerId] = [
-                        (teamSuccess, gamesPlayed)
+                    ownerIdToResultAndGamesPlayedListMap[ownerId] = [
+                        (result, gamesPlayed)
                     ]
 
-        # adjust team success by games played
-        ownerIdAndAdjustedTeamSuccess: dict[str, Optional[Deci]] = dict()
+        # adjust results by games played
+        ownerIdAndAdjustedResult: dict[str, Optional[Deci]] = dict()
         for (
             ownerId,
-            teamSuccessAndGamesPlayedList,
-        ) in ownerIdToTeamSuccessAndGamesPlayedListMap.items():
-            totalGamesPlayed = sum(
-                [tsagp[1] for tsagp in teamSuccessAndGamesPlayedList]
-            )
+            resultAndGamesPlayedList,
+        ) in ownerIdToResultAndGamesPlayedListMap.items():
+            totalGamesPlayed = sum([ragp[1] for ragp in resultAndGamesPlayedList])
             if totalGamesPlayed > 0:
-                for teamSuccess, gamesPlayed in teamSuccessAndGamesPlayedList:
-                    if teamSuccess is not None:
+                for result, gamesPlayed in resultAndGamesPlayedList:
+                    if result is not None:
                         percentageOfGamesPlayed = Deci(gamesPlayed / totalGamesPlayed)
-                        adjustedTeamSuccess = Deci(
-                            teamSuccess * percentageOfGamesPlayed
-                        )
-                        if ownerId in ownerIdAndAdjustedTeamSuccess:
-                            ownerIdAndAdjustedTeamSuccess[ownerId] += (
-                                adjustedTeamSuccess
-                            )
+                        adjustedResult = Deci(result * percentageOfGamesPlayed)
+                        if ownerId in ownerIdAndAdjustedResult:
+                            ownerIdAndAdjustedResult[ownerId] += adjustedResult
                         else:
-                            ownerIdAndAdjustedTeamSuccess[ownerId] = adjustedTeamSuccess
+                            ownerIdAndAdjustedResult[ownerId] = adjustedResult
 
         # set to None if ownerId not in response dict
         for ownerId in LeagueNavigator.getAllOwnerIds(league):
-            if ownerId not in ownerIdAndAdjustedTeamSuccess:
-                ownerIdAndAdjustedTeamSuccess[ownerId] = None
+            if ownerId not in ownerIdAndAdjustedResult:
+                ownerIdAndAdjustedResult[ownerId] = None
 
-        return ownerIdAndAdjustedTeamSuccess
+        return ownerIdAndAdjustedResult
 
     @classmethod
     @validateLeague
@@ -199,14 +201,25 @@ class SSLAllTimeCalculator(AllTimeCalculator):
             ...
             }
         """
-        ownerIdAndAdjustedTeamLuck: dict[str, Optional[Deci]] = dict()
-        ownerIdAndAdjustedTeamScore = SSLAllTimeCalculator.getAdjustedTeamScore(
-            league, **kwargs
-        )
-        ownerIdAndAdjustedTeamSuccess = SSLAllTimeCalculator.getAdjustedTeamSuccess(
-            league, **kwargs
+        (
+            ownerIdAndAdjustedTeamScore,
+            ownerIdAndAdjustedTeamSuccess,
+        ) = cls._getAdjustedTeamScoreAndTeamSuccess(league, **kwargs)
+        return cls._getAdjustedTeamLuckFromStats(
+            league, ownerIdAndAdjustedTeamScore, ownerIdAndAdjustedTeamSuccess
         )
 
+    @classmethod
+    def _getAdjustedTeamLuckFromStats(
+        cls,
+        league: League,
+        ownerIdAndAdjustedTeamScore: dict[str, Optional[Deci]],
+        ownerIdAndAdjustedTeamSuccess: dict[str, Optional[Deci]],
+    ) -> dict[str, Optional[Deci]]:
+        """
+        Returns the Adjusted Team Luck for each Owner from the already calculated Adjusted Team Score and Adjusted Team Success.
+        """
+        ownerIdAndAdjustedTeamLuck: dict[str, Optional[Deci]] = dict()
         for ownerId in LeagueNavigator.getAllOwnerIds(league):
             adjustedTeamScore = ownerIdAndAdjustedTeamScore[ownerId]
             adjustedTeamSuccess = ownerIdAndAdjustedTeamSuccess[ownerId]
@@ -130,6 +130,7 @@ class ScoringShareAllTimeCalculator(AllTimeCalculator):
             league, ScoringShareYearCalculator.getMaxScoringShare, **kwargs
         )
         # swap out team IDs for owner IDs
+        leagueIndex = LeagueNavigator.getLeagueIndex(league)
         maxScoringSharesByYear = dict()
         for (
             yearNumber,
@@ -137,7 +138,7 @@ class ScoringShareAllTimeCalculator(AllTimeCalculator):
         ) in maxScoringSharesByYearTeamIds.items():
             maxScoringSharesByYear[yearNumber] = dict()
             for teamId, maxScoringShare in maxScoringSharesByTeamId.items():
-                ownerId = LeagueNavigator.getTeamById(league, teamId).ownerId
+                ownerId = leagueIndex.getOwnerIdByTeamId(teamId)
                 maxScoringSharesByYear[yearNumber][ownerId] = maxScoringShare
 
         ownerIdAndMaxScoringShares: dict[str, list] = dict()
@@ -196,6 +197,7 @@ class ScoringShareAllTimeCalculator(AllTimeCalculator):
             league, ScoringShareYearCalculator.getMinScoringShare, **kwargs
         )
         # swap out team IDs for owner IDs
+        leagueIndex = LeagueNavigator.getLeagueIndex(league)
         minScoringSharesByYear = dict()
         for (
             yearNumber,
@@ -203,7 +205,7 @@ class ScoringShareAllTimeCalculator(AllTimeCalculator):
         ) in minScoringSharesByYearTeamIds.items():
             minScoringSharesByYear[yearNumber] = dict()
             for teamId, maxScoringShare in minScoringSharesByTeamId.items():
-                ownerId = LeagueNavigator.getTeamById(league, teamId).ownerId
+                ownerId = leagueIndex.getOwnerIdByTeamId(teamId)
                 minScoringSharesByYear[yearNumber][ownerId] = maxScoringShare
 
         ownerIdAndMinScoringShares: dict[str, list] = dict()
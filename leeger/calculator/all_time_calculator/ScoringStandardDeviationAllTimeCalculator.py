@@ -4,7 +4,6 @@ import numpy
 
 from leeger.calculator.parent.AllTimeCalculator import AllTimeCalculator
 from leeger.decorator.validators import validateLeague
-from leeger.model.filter import AllTimeFilters
 from leeger.model.league.League import League
 from leeger.util.Deci import Deci
 from leeger.util.navigator.LeagueNavigator import LeagueNavigator
@@ -41,20 +40,16 @@ class ScoringStandardDeviationAllTimeCalculator(AllTimeCalculator):
             ...
             }
         """
-        filters = AllTimeFilters.getForLeague(league, **kwargs)
-
         ownerIdAndScores = dict()
         allOwnerIds = LeagueNavigator.getAllOwnerIds(league)
         for ownerId in allOwnerIds:
             ownerIdAndScores[ownerId] = list()
 
-        for matchup in cls._getAllFilteredMatchups(
-            league, filters, simplifyMultiWeekMatchups=True
+        # merged from the scores of each Year, so Years that have already been calculated are not walked again
+        for ownerId, score in zip(
+            *cls._getScoresAggregate(league, **kwargs).getIdsAndScores()
         ):
-            ownerAId = LeagueNavigator.getTeamById(league, matchup.teamAId).ownerId
-            ownerBId = LeagueNavigator.getTeamById(league, matchup.teamBId).ownerId
-            ownerIdAndScores[ownerAId].append(Deci(matchup.teamAScore))
-            ownerIdAndScores[ownerBId].append(Deci(matchup.teamBScore))
+            ownerIdAndScores[ownerId].append(Deci(score))
 
         ownerIdAndScoringStandardDeviation = dict()
         for ownerId in allOwnerIds:
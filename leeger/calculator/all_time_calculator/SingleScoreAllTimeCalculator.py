@@ -36,13 +36,14 @@ class SingleScoreAllTimeCalculator(AllTimeCalculator):
         for ownerId in LeagueNavigator.getAllOwnerIds(league):
             ownerIdAndMaxScore[ownerId] = None
 
+        leagueIndex = LeagueNavigator.getLeagueIndex(league)
         for matchup in allMatchups:
-            aOwnerId = LeagueNavigator.getTeamById(league, matchup.teamAId).ownerId
+            aOwnerId = leagueIndex.getOwnerIdByTeamId(matchup.teamAId)
             aPreviousMaxScore = ownerIdAndMaxScore[aOwnerId]
             if aPreviousMaxScore is None or matchup.teamAScore > aPreviousMaxScore:
                 ownerIdAndMaxScore[aOwnerId] = matchup.teamAScore
 
-            bOwnerId = LeagueNavigator.getTeamById(league, matchup.teamBId).ownerId
+            bOwnerId = leagueIndex.getOwnerIdByTeamId(matchup.teamBId)
             bPreviousMaxScore = ownerIdAndMaxScore[bOwnerId]
             if bPreviousMaxScore is None or matchup.teamBScore > bPreviousMaxScore:
                 ownerIdAndMaxScore[bOwnerId] = matchup.teamBScore
@@ -73,13 +74,14 @@ class SingleScoreAllTimeCalculator(AllTimeCalculator):
         for ownerId in LeagueNavigator.getAllOwnerIds(league):
             ownerIdAndMinScore[ownerId] = None
 
+        leagueIndex = LeagueNavigator.getLeagueIndex(league)
         for matchup in allMatchups:
-            aOwnerId = LeagueNavigator.getTeamById(league, matchup.teamAId).ownerId
+            aOwnerId = leagueIndex.getOwnerIdByTeamId(matchup.teamAId)
             aPreviousMinScore = ownerIdAndMinScore[aOwnerId]
             if aPreviousMinScore is None or matchup.teamAScore < aPreviousMinScore:
                 ownerIdAndMinScore[aOwnerId] = matchup.teamAScore
 
-            bOwnerId = LeagueNavigator.getTeamById(league, matchup.teamBId).ownerId
+            bOwnerId = leagueIndex.getOwnerIdByTeamId(matchup.teamBId)
             bPreviousMinScore = ownerIdAndMinScore[bOwnerId]
             if bPreviousMinScore is None or matchup.teamBScore < bPreviousMinScore:
                 ownerIdAndMinScore[bOwnerId] = matchup.teamBScore
@@ -1,11 +1,16 @@
 from typing import Optional
 
+import numpy
+
 from leeger.calculator.parent.AllTimeCalculator import AllTimeCalculator
 from leeger.decorator.validators import validateLeague
 from leeger.model.filter import AllTimeFilters
 from leeger.model.league.League import League
 from leeger.util.Deci import Deci
 from leeger.util.navigator.LeagueNavigator import LeagueNavigator
+from leeger.util.navigator.YearNavigator import YearNavigator
+from leeger.util.NumericSettings import NumericSettings
+from leeger.util.SortedScores import SortedScores
 
 
 class SmartWinsAllTimeCalculator(AllTimeCalculator):
@@ -38,56 +43,37 @@ class SmartWinsAllTimeCalculator(AllTimeCalculator):
             }
         """
 
-        ####################
-        # Helper functions #
-        ####################
-        def getNumberOfScoresBeatAndTied(
-            score: float | int, scores: list[float | int]
-        ) -> list[int, int]:
-            scoresBeatAndTied = [0, 0]
-            for s in scores:
-                if score > s:
-                    scoresBeatAndTied[0] += 1
-                elif score == s:
-                    scoresBeatAndTied[1] += 1
-            # remove 1 from the scores tied tracker since we will always find a tie for this teams score in the list of all scores
-            scoresBeatAndTied[1] -= 1
-            return scoresBeatAndTied
-
-        ####################
-        ####################
-        ####################
-
-        filters = AllTimeFilters.getForLeague(league, **kwargs)
-
         # get all scores we want to include in our smart wins calculation
-        ownerIdsAndScores: list[tuple] = list()
-
-        for matchup in cls._getAllFilteredMatchups(
-            league, filters, simplifyMultiWeekMatchups=True
-        ):
-            teamA = LeagueNavigator.getTeamById(league, matchup.teamAId)
-            teamB = LeagueNavigator.getTeamById(league, matchup.teamBId)
-            ownerIdsAndScores.append((teamA.ownerId, matchup.teamAScore))
-            ownerIdsAndScores.append((teamB.ownerId, matchup.teamBScore))
-
-        allScores = LeagueNavigator.getAllScoresInLeague(
-            league, simplifyMultiWeekMatchups=True
+        # these are merged from the scores of each Year, so Years that have already been calculated are not walked again
+        ownerIds, scores = cls._getScoresAggregate(league, **kwargs).getIdsAndScores(
+            opponentScores=False
+        )
+        allScores = SortedScores.merge(
+            [YearNavigator.getSortedScores(year) for year in league.years]
         )
         ownerIdAndSmartWins = dict()
         allOwnerIds = LeagueNavigator.getAllOwnerIds(league)
         for ownerId in allOwnerIds:
             ownerIdAndSmartWins[ownerId] = None
 
-        for ownerId, score in ownerIdsAndScores:
-            scoresBeat, scoresTied = getNumberOfScoresBeatAndTied(score, allScores)
-            smartWins = (scoresBeat + (scoresTied / Deci(2))) / (
-                len(allScores) - Deci(1)
+        if NumericSettings.useFloat(**kwargs):
+            ownerIdToIndex = {ownerId: i for i, ownerId in enumerate(allOwnerIds)}
+            ownerIndexes = [ownerIdToIndex[ownerId] for ownerId in ownerIds]
+            smartWins = numpy.bincount(
+                ownerIndexes,
+                weights=allScores.getSmartWinsAsFloats(scores),
+                minlength=len(allOwnerIds),
             )
-            if ownerIdAndSmartWins[ownerId] is None:
-                ownerIdAndSmartWins[ownerId] = smartWins
-            else:
-                ownerIdAndSmartWins[ownerId] += smartWins
+            for ownerId in set(ownerIds):
+                ownerIdAndSmartWins[ownerId] = Deci(
+                    float(smartWins[ownerIdToIndex[ownerId]])
+                )
+        else:
+            for ownerId, smartWins in zip(ownerIds, allScores.getSmartWins(scores)):
+                if ownerIdAndSmartWins[ownerId] is None:
+                    ownerIdAndSmartWins[ownerId] = smartWins
+                else:
+                    ownerIdAndSmartWins[ownerId] += smartWins
 
         return ownerIdAndSmartWins
 
@@ -145,58 +131,37 @@ class SmartWinsAllTimeCalculator(AllTimeCalculator):
             }
         """
 
-        ####################
-        # Helper functions #
-        ####################
-        def getNumberOfScoresBeatAndTied(
-            score: float | int, scores: list[float | int]
-        ) -> list[int, int]:
-            scoresBeatAndTied = [0, 0]
-            for s in scores:
-                if score > s:
-                    scoresBeatAndTied[0] += 1
-                elif score == s:
-                    scoresBeatAndTied[1] += 1
-            # remove 1 from the scores tied tracker since we will always find a tie for this teams score in the list of all scores
-            scoresBeatAndTied[1] -= 1
-            return scoresBeatAndTied
-
-        ####################
-        ####################
-        ####################
-
-        filters = AllTimeFilters.getForLeague(league, **kwargs)
-
         # get all scores we want to include in our smart wins calculation
-        ownerIdsAndOpponentScores: list[tuple] = list()
-
-        for matchup in cls._getAllFilteredMatchups(
-            league, filters, simplifyMultiWeekMatchups=True
-        ):
-            teamA = LeagueNavigator.getTeamById(league, matchup.teamAId)
-            teamB = LeagueNavigator.getTeamById(league, matchup.teamBId)
-            ownerIdsAndOpponentScores.append((teamA.ownerId, matchup.teamBScore))
-            ownerIdsAndOpponentScores.append((teamB.ownerId, matchup.teamAScore))
-
-        allScores = LeagueNavigator.getAllScoresInLeague(
-            league, simplifyMultiWeekMatchups=True
+        # these are merged from the scores of each Year, so Years that have already been calculated are not walked again
+        ownerIds, scores = cls._getScoresAggregate(league, **kwargs).getIdsAndScores(
+            opponentScores=True
+        )
+        allScores = SortedScores.merge(
+            [YearNavigator.getSortedScores(year) for year in league.years]
         )
         ownerIdAndOpponentSmartWins = dict()
         allOwnerIds = LeagueNavigator.getAllOwnerIds(league)
         for ownerId in allOwnerIds:
             ownerIdAndOpponentSmartWins[ownerId] = None
 
-        for ownerId, opponentScore in ownerIdsAndOpponentScores:
-            scoresBeat, scoresTied = getNumberOfScoresBeatAndTied(
-                opponentScore, allScores
-            )
-            smartWins = (scoresBeat + (scoresTied / Deci(2))) / (
-                len(allScores) - Deci(1)
+        if NumericSettings.useFloat(**kwargs):
+            ownerIdToIndex = {ownerId: i for i, ownerId in enumerate(allOwnerIds)}
+            ownerIndexes = [ownerIdToIndex[ownerId] for ownerId in ownerIds]
+            smartWins = numpy.bincount(
+                ownerIndexes,
+                weights=allScores.getSmartWinsAsFloats(scores),
+                minlength=len(allOwnerIds),
             )
-            if ownerIdAndOpponentSmartWins[ownerId] is None:
-                ownerIdAndOpponentSmartWins[ownerId] = smartWins
-            else:
-                ownerIdAndOpponentSmartWins[ownerId] += smartWins
+            for ownerId in set(ownerIds):
+                ownerIdAndOpponentSmartWins[ownerId] = Deci(
+                    smartWins[ownerIdToIndex[ownerId]]
+                )
+        else:
+            for ownerId, smartWins in zip(ownerIds, allScores.getSmartWins(scores)):
+                if ownerIdAndOpponentSmartWins[ownerId] is None:
+                    ownerIdAndOpponentSmartWins[ownerId] = smartWins
+                else:
+                    ownerIdAndOpponentSmartWins[ownerId] += smartWins
 
         return ownerIdAndOpponentSmartWins
 
@@ -0,0 +1,156 @@
+import numpy
+
+from leeger.calculator.parent.AllTimeCalculator import AllTimeCalculator
+from leeger.decorator.validators import validateLeague
+from leeger.model.filter import AllTimeFilters
+from leeger.model.frame.Streaks import Streaks
+from leeger.model.league.League import League
+from leeger.util.navigator.LeagueNavigator import LeagueNavigator
+from leeger.util.navigator.YearNavigator import YearNavigator
+from leeger.util.NumericSettings import NumericSettings
+
+
+class StreakAllTimeCalculator(AllTimeCalculator):
+    """
+    Used to calculate all streak stats for Owners.
+    Streaks carry over from one Year to the next.
+    """
+
+    @classmethod
+    def _getStreaks(
+        cls, league: League, allTimeFilters: AllTimeFilters, **kwargs
+    ) -> Streaks:
+        """
+        Returns the Streaks of each Owner in the Matchups remaining after the given filters are applied.
+        """
+        leagueIndex = LeagueNavigator.getLeagueIndex(league)
+        ownerIds = LeagueNavigator.getAllOwnerIds(league)
+        ownerIdToIndex = {ownerId: i for i, ownerId in enumerate(ownerIds)}
+        fixedPointScale = NumericSettings.getFixedPointScaleIfUsed(**kwargs)
+
+        gameOwnerIndexes = list()
+        gameOutcomes = list()
+        scoreOwnerIndexes = list()
+        scoreAboveMedians = list()
+        # Years are in the order they were played, so each Year's games come after the last Year's
+        for yearNumber, yearFilters in cls._allTimeFiltersToYearFilters(
+            league, allTimeFilters
+        ).items():
+            yearFrame = YearNavigator.getYearFrame(
+                leagueIndex.getYearByYearNumber(int(yearNumber))
+            )
+            teamIndexToOwnerIndex = numpy.array(
+                [
+                    ownerIdToIndex[leagueIndex.getOwnerIdByTeamId(teamId)]
+                    for teamId in yearFrame.teamIds
+                ],
+                dtype=numpy.int64,
+            )
+            teamIndex, outcome = yearFrame.getOutcomesInOrderPlayed(
+                yearFrame.getRows(yearFilters), fixedPointScale=fixedPointScale
+            )
+            gameOwnerIndexes.append(teamIndexToOwnerIndex[teamIndex])
+            gameOutcomes.append(outcome)
+            teamIndex, aboveMedian = yearFrame.getScoresAboveMedianInOrderPlayed(
+                yearFilters
+            )
+            scoreOwnerIndexes.append(teamIndexToOwnerIndex[teamIndex])
+            scoreAboveMedians.append(aboveMedian)
+
+        return Streaks.build(
+            ownerIds,
+            numpy.concatenate(gameOwnerIndexes),
+            numpy.concatenate(gameOutcomes),
+            numpy.concatenate(scoreOwnerIndexes),
+            numpy.concatenate(scoreAboveMedians),
+        )
+
+    @classmethod
+    def __getStreak(cls, league: League, streakName: str, **kwargs) -> dict[str, int]:
+        """
+        Returns the streak with the given name (a Streaks field, i.e. "longestWinStreak") for each Owner in the given League.
+        """
+        streaks = cls._getStreaks(
+            league, AllTimeFilters.getForLeague(league, **kwargs), **kwargs
+        )
+        return streaks.toIdDict(getattr(streaks, streakName))
+
+    @classmethod
+    @validateLeague
+    def getStreaks(cls, league: League, **kwargs) -> Streaks:
+        """
+        Returns the Streaks of each Owner in the given League, to get more than 1 streak stat at once.
+
+        Example:
+            streaks = StreakAllTimeCalculator.getStreaks(league)
+            streaks.toIdDict(streaks.longestWinStreak)  # {"someOwnerId": 9, ...}
+        """
+        return cls._getStreaks(
+            league, AllTimeFilters.getForLeague(league, **kwargs), **kwargs
+        )
+
+    @classmethod
+    @validateLeague
+    def getLongestWinStreak(cls, league: League, **kwargs) -> dict[str, int]:
+        """
+        Returns the most wins in a row for each Owner in the given League.
+
+        Example response:
+            {
+            "someOwnerId": 9,
+            "someOtherOwnerId": 4,
+            "yetAnotherOwnerId": 2,
+            ...
+            }
+        """
+        return cls.__getStreak(league, "longestWinStreak", **kwargs)
+
+    @classmethod
+    @validateLeague
+    def getLongestLossStreak(cls, league: League, **kwargs) -> dict[str, int]:
+        """
+        Returns the most losses in a row for each Owner in the given League.
+
+        Example response:
+            {
+            "someOwnerId": 3,
+            "someOtherOwnerId": 5,
+            "yetAnotherOwnerId": 11,
+            ...
+            }
+        """
+        return cls.__getStreak(league, "longestLossStreak", **kwargs)
+
+    @classmethod
+    @validateLeague
+    def getCurrentStreak(cls, league: League, **kwargs) -> dict[str, int]:
+        """
+        Returns the streak each Owner is on at the end of the given League (positive for wins, negative for losses, 0 after a tie).
+
+        Example response:
+            {
+            "someOwnerId": 3,
+            "someOtherOwnerId": -2,
+            "yetAnotherOwnerId": 0,
+            ...
+            }
+        """
+        return cls.__getStreak(league, "currentStreak", **kwargs)
+
+    @classmethod
+    @validateLeague
+    def getLongestStreakAboveLeagueMedian(
+        cls, league: League, **kwargs
+    ) -> dict[str, int]:
+        """
+        Returns the most scores in a row above their week's league median for each Owner in the given League.
+
+        Example response:
+            {
+            "someOwnerId": 7,
+            "someOtherOwnerId": 3,
+            "yetAnotherOwnerId": 2,
+            ...
+            }
+        """
+        return cls.__getStreak(league, "longestStreakAboveMedian", **kwargs)
@@ -0,0 +1,135 @@
+from typing import Optional
+
+import numpy
+
+from leeger.calculator.parent.AllTimeCalculator import AllTimeCalculator
+from leeger.calculator.year_calculator.AWALYearCalculator import AWALYearCalculator
+from leeger.calculator.year_calculator.GameOutcomeYearCalculator import (
+    GameOutcomeYearCalculator,
+)
+from leeger.calculator.year_calculator.PointsScoredYearCalculator import (
+    PointsScoredYearCalculator,
+)
+from leeger.calculator.year_calculator.StrengthOfScheduleYearCalculator import (
+    StrengthOfScheduleYearCalculator,
+)
+from leeger.decorator.validators import validateLeague
+from leeger.model.filter import AllTimeFilters
+from leeger.model.league.League import League
+from leeger.util.Deci import Deci
+from leeger.util.navigator.LeagueNavigator import LeagueNavigator
+from leeger.util.navigator.YearNavigator import YearNavigator
+
+
+class StrengthOfScheduleAllTimeCalculator(AllTimeCalculator):
+    """
+    Used to calculate all Strength of Schedule stats for Owners.
+
+    Each opponent's stat is their team's stat in the Year the game was played (in the same range),
+    so an Owner's Strength of Schedule is the average of that over every game they played in every Year.
+    """
+
+    @classmethod
+    def __getOpponentsAverage(
+        cls, league: League, yearCalculatorFunction: callable, **kwargs
+    ) -> dict[str, Optional[Deci]]:
+        leagueIndex = LeagueNavigator.getLeagueIndex(league)
+        ownerIds = LeagueNavigator.getAllOwnerIds(league)
+        ownerIdToIndex = {ownerId: i for i, ownerId in enumerate(ownerIds)}
+        yearFiltersByYear = cls._allTimeFiltersToYearFilters(
+            league, AllTimeFilters.getForLeague(league, **kwargs)
+        )
+        teamIdAndStatByYear = cls._getAllResultDictsByYear(
+            league, yearCalculatorFunction, **kwargs
+        )
+
+        opponentStatTotals = numpy.zeros(len(ownerIds), dtype=object)
+        gamesPlayed = numpy.zeros(len(ownerIds), dtype=numpy.int64)
+        for yearNumber, teamIdAndStat in teamIdAndStatByYear.items():
+            year = leagueIndex.getYearByYearNumber(int(yearNumber))
+            yearFrame = YearNavigator.getYearFrame(year)
+            teamIndexToOwnerIndex = numpy.array(
+                [
+                    ownerIdToIndex[leagueIndex.getOwnerIdByTeamId(teamId)]
+                    for teamId in yearFrame.teamIds
+                ],
+                dtype=numpy.int64,
+            )
+            yearOpponentStatTotals, yearGamesPlayed = (
+                StrengthOfScheduleYearCalculator._getOpponentStatTotals(
+                    year, yearFiltersByYear[str(yearNumber)], teamIdAndStat, **kwargs
+                )
+            )
+            # an Owner only has 1 team in a Year
+            opponentStatTotals[teamIndexToOwnerIndex] += yearOpponentStatTotals
+            gamesPlayed[teamIndexToOwnerIndex] += yearGamesPlayed
+
+        return {
+            ownerId: None if games == 0 else Deci(opponentStatTotal) / Deci(games)
+            for ownerId, opponentStatTotal, games in zip(
+                ownerIds, opponentStatTotals.tolist(), gamesPlayed.tolist()
+            )
+        }
+
+    @classmethod
+    @validateLeague
+    def getOpponentsAveragePointsScoredPerGame(
+        cls, league: League, **kwargs
+    ) -> dict[str, Optional[Deci]]:
+        """
+        Returns the average Points Scored per game of every opponent each Owner played in the given League.
+        Returns None for an Owner if they have no games played in the range.
+
+        Example response:
+            {
+            "someOwnerId": Deci("101.7"),
+            "someOtherOwnerId": Deci("96.2"),
+            "yetAnotherOwnerId": Deci("99.1"),
+            ...
+            }
+        """
+        return cls.__getOpponentsAverage(
+            league, PointsScoredYearCalculator.getPointsScoredPerGame, **kwargs
+        )
+
+    @classmethod
+    @validateLeague
+    def getOpponentsAverageAWALPerGame(
+        cls, league: League, **kwargs
+    ) -> dict[str, Optional[Deci]]:
+        """
+        Returns the average AWAL per game of every opponent each Owner played in the given League.
+        Returns None for an Owner if they have no games played in the range.
+
+        Example response:
+            {
+            "someOwnerId": Deci("0.52"),
+            "someOtherOwnerId": Deci("0.47"),
+            "yetAnotherOwnerId": Deci("0.49"),
+            ...
+            }
+        """
+        return cls.__getOpponentsAverage(
+            league, AWALYearCalculator.getAWALPerGame, **kwargs
+        )
+
+    @classmethod
+    @validateLeague
+    def getOpponentsAverageWinPercentage(
+        cls, league: League, **kwargs
+    ) -> dict[str, Optional[Deci]]:
+        """
+        Returns the average win percentage of every opponent each Owner played in the given League.
+        Returns None for an Owner if they have no games played in the range.
+
+        Example response:
+            {
+            "someOwnerId": Deci("0.55"),
+            "someOtherOwnerId": Deci("0.43"),
+            "yetAnotherOwnerId": Deci("0.5"),
+            ...
+            }
+        """
+        return cls.__getOpponentsAverage(
+            league, GameOutcomeYearCalculator.getWinPercentage, **kwargs
+        )
@@ -1,7 +1,10 @@
 from .AWALAllTimeCalculator import AWALAllTimeCalculator
 from .GameOutcomeAllTimeCalculator import GameOutcomeAllTimeCalculator
+from .HeadToHeadAllTimeCalculator import HeadToHeadAllTimeCalculator
 from .PlusMinusAllTimeCalculator import PlusMinusAllTimeCalculator
 from .PointsScoredAllTimeCalculator import PointsScoredAllTimeCalculator
+from .RecordAllTimeCalculator import RecordAllTimeCalculator
+from .RollingWindowAllTimeCalculator import RollingWindowAllTimeCalculator
 from .ScoringShareAllTimeCalculator import ScoringShareAllTimeCalculator
 from .ScoringStandardDeviationAllTimeCalculator import (
     ScoringStandardDeviationAllTimeCalculator,
@@ -9,4 +12,6 @@ from .ScoringStandardDeviationAllTimeCalculator import (
 from .SingleScoreAllTimeCalculator import SingleScoreAllTimeCalculator
 from .SmartWinsAllTimeCalculator import SmartWinsAllTimeCalculator
 from .SSLAllTimeCalculator import SSLAllTimeCalculator
+from .StreakAllTimeCalculator import StreakAllTimeCalculator
+from .StrengthOfScheduleAllTimeCalculator import StrengthOfScheduleAllTimeCalculator
 from .TeamSummaryAllTimeCalculator import TeamSummaryAllTimeCalculator
@@ -0,0 +1,333 @@
+from typing import Any, Optional
+
+from leeger.calculator.all_time_calculator.AWALAllTimeCalculator import (
+    AWALAllTimeCalculator,
+)
+from leeger.calculator.all_time_calculator.GameOutcomeAllTimeCalculator import (
+    GameOutcomeAllTimeCalculator,
+)
+from leeger.calculator.all_time_calculator.PlusMinusAllTimeCalculator import (
+    PlusMinusAllTimeCalculator,
+)
+from leeger.calculator.all_time_calculator.PointsScoredAllTimeCalculator import (
+    PointsScoredAllTimeCalculator,
+)
+from leeger.calculator.all_time_calculator.ScoringShareAllTimeCalculator import (
+    ScoringShareAllTimeCalculator,
+)
+from leeger.calculator.all_time_calculator.ScoringStandardDeviationAllTimeCalculator import (
+    ScoringStandardDeviationAllTimeCalculator,
+)
+from leeger.calculator.all_time_calculator.SingleScoreAllTimeCalculator import (
+    SingleScoreAllTimeCalculator,
+)
+from leeger.calculator.all_time_calculator.SmartWinsAllTimeCalculator import (
+    SmartWinsAllTimeCalculator,
+)
+from leeger.calculator.all_time_calculator.SSLAllTimeCalculator import (
+    SSLAllTimeCalculator,
+)
+from leeger.calculator.all_time_calculator.TeamSummaryAllTimeCalculator import (
+    TeamSummaryAllTimeCalculator,
+)
+from leeger.calculator.engine.StatEngine import StatEngine
+from leeger.calculator.engine.StatRegistry import StatRegistry
+from leeger.model.league.League import League
+from leeger.model.stat.AllTimeStatSheet import AllTimeStatSheet
+from leeger.util.Deci import Deci
+from leeger.util.YearExecutor import YearExecutor
+from leeger.validate import leagueValidation
+
+
+class AllTimeStatEngine(StatEngine):
+    """
+    Used to calculate All-Time stats for a League.
+
+    The League is validated once, instead of once per stat.
+    Every stat is registered with the values it is calculated from,
+    so asking for any group of stats only calculates the values those stats need, and each of those values only once.
+    Each stat is calculated with the All-Time calculator method it matches, so the results are exactly the same.
+    """
+
+    STAT_REGISTRY = StatRegistry()
+    LEAGUE_MEDIAN_STAT_NAMES = [
+        "totalGames",
+        "leagueMedianWins",
+        "opponentLeagueMedianWins",
+    ]
+
+    def __init__(self, league: League, **kwargs):
+        super().__init__()
+        if "validate" not in kwargs or kwargs["validate"] is True:
+            leagueValidation.runAllChecks(league)
+        self.__league = league
+        # the League has already been validated, so the calculators don't need to validate it again
+        self.__kwargs = kwargs | {"validate": False}
+
+    def getAllTimeStatSheet(self) -> AllTimeStatSheet:
+        """
+        Returns an AllTimeStatSheet for the League this engine was created with.
+        """
+        statNames = [
+            statName
+            for statName in self.getStatNames()
+            if statName not in self.LEAGUE_MEDIAN_STAT_NAMES
+        ]
+        # check for optional stats
+        if any(
+            year.yearSettings.leagueMedianGames is True for year in self.__league.years
+        ):
+            statNames += self.LEAGUE_MEDIAN_STAT_NAMES
+
+        statNameAndStat = {
+            statName: None for statName in self.LEAGUE_MEDIAN_STAT_NAMES
+        } | self.getStats(statNames)
+        return AllTimeStatSheet(**statNameAndStat)
+
+    def getStats(self, statNames: Optional[list[str]] = None) -> dict[str, Any]:
+        """
+        Returns the given stats (or every stat if none are given), keyed by stat name.
+        If Years are calculated in other processes, the same processes are shared between every stat.
+        """
+        kwargs = self.__kwargs
+        with YearExecutor.getExecutor(**kwargs) as executor:
+            if executor is not None:
+                self.__kwargs = kwargs | {"executor": executor}
+            try:
+                return super().getStats(statNames)
+            finally:
+                self.__kwargs = kwargs
+
+    ################
+    # TEAM SUMMARY #
+    ################
+
+    @STAT_REGISTRY.stat("gamesPlayed")
+    def __calculateGamesPlayed(self) -> dict[str, Optional[int]]:
+        return TeamSummaryAllTimeCalculator.getGamesPlayed(
+            self.__league, **self.__kwargs
+        )
+
+    @STAT_REGISTRY.stat("totalGames")
+    def __calculateTotalGames(self) -> dict[str, Optional[int]]:
+        return TeamSummaryAllTimeCalculator.getTotalGames(
+            self.__league, **self.__kwargs
+        )
+
+    ################
+    # GAME OUTCOME #
+    ################
+
+    @STAT_REGISTRY.stat("wins")
+    def __calculateWins(self) -> dict[str, Optional[int]]:
+        return GameOutcomeAllTimeCalculator.getWins(self.__league, **self.__kwargs)
+
+    @STAT_REGISTRY.stat("losses")
+    def __calculateLosses(self) -> dict[str, Optional[int]]:
+        return GameOutcomeAllTimeCalculator.getLosses(self.__league, **self.__kwargs)
+
+    @STAT_REGISTRY.stat("ties")
+    def __calculateTies(self) -> dict[str, Optional[int]]:
+        return GameOutcomeAllTimeCalculator.getTies(self.__league, **self.__kwargs)
+
+    @STAT_REGISTRY.stat("winPercentage")
+    def __calculateWinPercentage(self) -> dict[str, Optional[Deci]]:
+        return GameOutcomeAllTimeCalculator.getWinPercentage(
+            self.__league, **self.__kwargs
+        )
+
+    @STAT_REGISTRY.stat("wal")
+    def __calculateWal(self) -> dict[str, Optional[Deci]]:
+        return GameOutcomeAllTimeCalculator.getWAL(self.__league, **self.__kwargs)
+
+    @STAT_REGISTRY.stat("walPerGame")
+    def __calculateWalPerGame(self) -> dict[str, Optional[Deci]]:
+        return GameOutcomeAllTimeCalculator.getWALPerGame(
+            self.__league, **self.__kwargs
+        )
+
+    @STAT_REGISTRY.stat("leagueMedianWins")
+    def __calculateLeagueMedianWins(self) -> dict[str, Optional[Deci]]:
+        return GameOutcomeAllTimeCalculator.getLeagueMedianWins(
+            self.__league, **self.__kwargs
+        )
+
+    @STAT_REGISTRY.stat("opponentLeagueMedianWins")
+    def __calculateOpponentLeagueMedianWins(self) -> dict[str, Optional[Deci]]:
+        return GameOutcomeAllTimeCalculator.getOpponentLeagueMedianWins(
+            self.__league, **self.__kwargs
+        )
+
+    ########
+    # AWAL #
+    ########
+
+    @STAT_REGISTRY.stat("awal")
+    def __calculateAwal(self) -> dict[str, Optional[Deci]]:
+        return AWALAllTimeCalculator.getAWAL(self.__league, **self.__kwargs)
+
+    @STAT_REGISTRY.stat("awalPerGame")
+    def __calculateAwalPerGame(self) -> dict[str, Optional[Deci]]:
+        return AWALAllTimeCalculator.getAWALPerGame(self.__league, **self.__kwargs)
+
+    @STAT_REGISTRY.stat("opponentAWAL")
+    def __calculateOpponentAWAL(self) -> dict[str, Optional[Deci]]:
+        return AWALAllTimeCalculator.getOpponentAWAL(self.__league, **self.__kwargs)
+
+    @STAT_REGISTRY.stat("opponentAWALPerGame")
+    def __calculateOpponentAWALPerGame(self) -> dict[str, Optional[Deci]]:
+        return AWALAllTimeCalculator.getOpponentAWALPerGame(
+            self.__league, **self.__kwargs
+        )
+
+    ##############
+    # SMART WINS #
+    ##############
+
+    @STAT_REGISTRY.stat("smartWins")
+    def __calculateSmartWins(self) -> dict[str, Optional[Deci]]:
+        return SmartWinsAllTimeCalculator.getSmartWins(self.__league, **self.__kwargs)
+
+    @STAT_REGISTRY.stat("smartWinsPerGame")
+    def __calculateSmartWinsPerGame(self) -> dict[str, Optional[Deci]]:
+        return SmartWinsAllTimeCalculator.getSmartWinsPerGame(
+            self.__league, **self.__kwargs
+        )
+
+    @STAT_REGISTRY.stat("opponentSmartWins")
+    def __calculateOpponentSmartWins(self) -> dict[str, Optional[Deci]]:
+        return SmartWinsAllTimeCalculator.getOpponentSmartWins(
+            self.__league, **self.__kwargs
+        )
+
+    @STAT_REGISTRY.stat("opponentSmartWinsPerGame")
+    def __calculateOpponentSmartWinsPerGame(self) -> dict[str, Optional[Deci]]:
+        return SmartWinsAllTimeCalculator.getOpponentSmartWinsPerGame(
+            self.__league, **self.__kwargs
+        )
+
+    #################
+    # POINTS SCORED #
+    #################
+
+    @STAT_REGISTRY.stat("pointsScored")
+    def __calculatePointsScored(self) -> dict[str, Optional[Deci]]:
+        return PointsScoredAllTimeCalculator.getPointsScored(
+            self.__league, **self.__kwargs
+        )
+
+    @STAT_REGISTRY.stat("pointsScoredPerGame")
+    def __calculatePointsScoredPerGame(self) -> dict[str, Optional[Deci]]:
+        return PointsScoredAllTimeCalculator.getPointsScoredPerGame(
+            self.__league, **self.__kwargs
+        )
+
+    @STAT_REGISTRY.stat("opponentPointsScored")
+    def __calculateOpponentPointsScored(self) -> dict[str, Optional[Deci]]:
+        return PointsScoredAllTimeCalculator.getOpponentPointsScored(
+            self.__league, **self.__kwargs
+        )
+
+    @STAT_REGISTRY.stat("opponentPointsScoredPerGame")
+    def __calculateOpponentPointsScoredPerGame(self) -> dict[str, Optional[Deci]]:
+        return PointsScoredAllTimeCalculator.getOpponentPointsScoredPerGame(
+            self.__league, **self.__kwargs
+        )
+
+    #################
+    # SCORING SHARE #
+    #################
+
+    @STAT_REGISTRY.stat("scoringShare")
+    def __calculateScoringShare(self) -> dict[str, Optional[Deci]]:
+        return ScoringShareAllTimeCalculator.getScoringShare(
+            self.__league, **self.__kwargs
+        )
+
+    @STAT_REGISTRY.stat("opponentScoringShare")
+    def __calculateOpponentScoringShare(self) -> dict[str, Optional[Deci]]:
+        return ScoringShareAllTimeCalculator.getOpponentScoringShare(
+            self.__league, **self.__kwargs
+        )
+
+    @STAT_REGISTRY.stat("maxScoringShare")
+    def __calculateMaxScoringShare(self) -> dict[str, Optional[Deci]]:
+        return ScoringShareAllTimeCalculator.getMaxScoringShare(
+            self.__league, **self.__kwargs
+        )
+
+    @STAT_REGISTRY.stat("minScoringShare")
+    def __calculateMinScoringShare(self) -> dict[str, Optional[Deci]]:
+        return ScoringShareAllTimeCalculator.getMinScoringShare(
+            self.__league, **self.__kwargs
+        )
+
+    ################
+    # SINGLE SCORE #
+    ################
+
+    @STAT_REGISTRY.stat("maxScore")
+    def __calculateMaxScore(self) -> dict[str, Optional[float | int]]:
+        return SingleScoreAllTimeCalculator.getMaxScore(self.__league, **self.__kwargs)
+
+    @STAT_REGISTRY.stat("minScore")
+    def __calculateMinScore(self) -> dict[str, Optional[float | int]]:
+        return SingleScoreAllTimeCalculator.getMinScore(self.__league, **self.__kwargs)
+
+    ##############################
+    # SCORING STANDARD DEVIATION #
+    ##############################
+
+    @STAT_REGISTRY.stat("scoringStandardDeviation")
+    def __calculateScoringStandardDeviation(self) -> dict[str, Optional[Deci]]:
+        return ScoringStandardDeviationAllTimeCalculator.getScoringStandardDeviation(
+            self.__league, **self.__kwargs
+        )
+
+    ##############
+    # PLUS MINUS #
+    ##############
+
+    @STAT_REGISTRY.stat("plusMinus")
+    def __calculatePlusMinus(self) -> dict[str, Optional[Deci]]:
+        return PlusMinusAllTimeCalculator.getPlusMinus(self.__league, **self.__kwargs)
+
+    #######
+    # SSL #
+    #######
+
+    @STAT_REGISTRY.intermediate("adjustedTeamScoreAndTeamSuccess")
+    def __calculateAdjustedTeamScoreAndTeamSuccess(
+        self,
+    ) -> tuple[dict[str, Optional[Deci]], dict[str, Optional[Deci]]]:
+        return SSLAllTimeCalculator._getAdjustedTeamScoreAndTeamSuccess(
+            self.__league, **self.__kwargs
+        )
+
+    @STAT_REGISTRY.stat(
+        "adjustedTeamScore", inputs=("adjustedTeamScoreAndTeamSuccess",)
+    )
+    def __calculateAdjustedTeamScore(
+        self, adjustedTeamScoreAndTeamSuccess: tuple
+    ) -> dict[str, Optional[Deci]]:
+        return adjustedTeamScoreAndTeamSuccess[0]
+
+    @STAT_REGISTRY.stat(
+        "adjustedTeamSuccess", inputs=("adjustedTeamScoreAndTeamSuccess",)
+    )
+    def __calculateAdjustedTeamSuccess(
+        self, adjustedTeamScoreAndTeamSuccess: tuple
+    ) -> dict[str, Optional[Deci]]:
+        return adjustedTeamScoreAndTeamSuccess[1]
+
+    @STAT_REGISTRY.stat(
+        "adjustedTeamLuck", inputs=("adjustedTeamScore", "adjustedTeamSuccess")
+    )
+    def __calculateAdjustedTeamLuck(
+        self,
+        ownerIdAndAdjustedTeamScore: dict[str, Optional[Deci]],
+        ownerIdAndAdjustedTeamSuccess: dict[str, Optional[Deci]],
+    ) -> dict[str, Optional[Deci]]:
+        return SSLAllTimeCalculator._getAdjustedTeamLuckFromStats(
+            self.__league, ownerIdAndAdjustedTeamScore, ownerIdAndAdjustedTeamSuccess
+        )
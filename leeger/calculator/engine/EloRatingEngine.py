@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import numpy
+
+from leeger.enum.MatchupType import MatchupType
+from leeger.exception.DoesNotExistException import DoesNotExistException
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.util.navigator.MatchupNavigator import MatchupNavigator
+from leeger.validate import leagueValidation
+
+
+class EloRatingEngine:
+    """
+    Used to keep an Elo rating for every Owner, updated one Week at a time.
+
+    Weeks are added in the order they were played, and adding a Week only updates the ratings of the Owners that played in it,
+    so ratings can be kept up to date during a Year without going back through every Week before it.
+    The ratings after each added Week are kept as snapshots (one row per Week, one column per Owner).
+
+    Matchups are decided the same way GameOutcomeYearCalculator decides them:
+    IGNORE Matchups are skipped, tiebreakers decide tied scores and each multi-week matchup is a single game.
+    A multi-week matchup is rated from the weeks of it that have been added so far and is re-rated as each later week of it is added,
+    so once every week of it has been added, it counts as one game with the combined scores.
+    """
+
+    def __init__(
+        self,
+        *,
+        initialRating: float = 1500.0,
+        kFactor: float = 32.0,
+        yearRegression: float = 0.0,
+    ):
+        """
+        initialRating is the rating every Owner starts with.
+        kFactor is the most a rating can change from a single game.
+        yearRegression is how much (from 0 to 1) each rating moves back towards initialRating at the start of each Year.
+        """
+        self.__validateNumber(initialRating, "initialRating")
+        if self.__validateNumber(kFactor, "kFactor") <= 0:
+            raise ValueError("'kFactor' must be greater than 0.")
+        if not 0 <= self.__validateNumber(yearRegression, "yearRegression") <= 1:
+            raise ValueError("'yearRegression' must be between 0 and 1.")
+        self.__initialRating = float(initialRating)
+        self.__kFactor = float(kFactor)
+        self.__yearRegression = float(yearRegression)
+
+        self.__ownerIds: list[str] = list()
+        self.__ownerIdToIndex: dict[str, int] = dict()
+        self.__ratings = numpy.empty(0, dtype=numpy.float64)
+        self.__yearNumber: Optional[int] = None
+        self.__weekNumber: Optional[int] = None
+        # multi-week matchup ID -> (the matchups added so far, the ratings change given to team A's Owner so far)
+        self.__multiWeekMatchups: dict[str, tuple[list[Matchup], float]] = dict()
+        # multi-week matchup ID -> team A and team B's Owner ratings before the multi-week matchup started
+        self.__multiWeekMatchupRatings: dict[str, tuple[float, float]] = dict()
+        # snapshot rows are grown by doubling, so adding a Week doesn't copy every snapshot before it
+        self.__numberOfSnapshots = 0
+        self.__snapshotWeeks = numpy.empty((0, 2), dtype=numpy.int32)
+        self.__snapshotRatings = numpy.empty((0, 0), dtype=numpy.float64)
+
+    @staticmethod
+    def __validateNumber(value: Any, name: str) -> float:
+        if type(value) not in (int, float):
+            raise ValueError(
+                f"'{name}' must be type 'int' or 'float', not '{type(value).__name__}'."
+            )
+        return value
+
+    @classmethod
+    def fromLeague(cls, league: League, **kwargs) -> EloRatingEngine:
+        """
+        Returns an EloRatingEngine with every Week in the given League added.
+        Takes the same settings as EloRatingEngine() as keyword arguments.
+        """
+        validate = kwargs.pop("validate", True)
+        if validate is True:
+            leagueValidation.runAllChecks(league)
+        eloRatingEngine = cls(**kwargs)
+        for year in league.years:
+            eloRatingEngine.addYear(year)
+        return eloRatingEngine
+
+    @property
+    def ownerIds(self) -> tuple[str, ...]:
+        return tuple(self.__ownerIds)
+
+    @property
+    def snapshotYearNumbers(self) -> numpy.ndarray:
+        return self.__snapshotWeeks[: self.__numberOfSnapshots, 0]
+
+    @property
+    def snapshotWeekNumbers(self) -> numpy.ndarray:
+        return self.__snapshotWeeks[: self.__numberOfSnapshots, 1]
+
+    @property
+    def snapshotRatings(self) -> numpy.ndarray:
+        """
+        The ratings after each added Week (rows) for each Owner (columns, in the order of ownerIds).
+        An Owner's rating is NaN for Weeks that were added before their first game.
+        """
+        return self.__snapshotRatings[
+            : self.__numberOfSnapshots, : len(self.__ownerIds)
+        ]
+
+    def addYear(self, year: Year) -> None:
+        """
+        Adds every Week in the given Year.
+        """
+        for week in year.weeks:
+            self.addWeek(year, week)
+
+    def addWeek(self, year: Year, week: Week) -> None:
+        """
+        Updates the ratings of every Owner that played in the given Week of the given Year.
+        Weeks must be added in the order they were played.
+        """
+        if self.__yearNumber is None or year.yearNumber > self.__yearNumber:
+            self.__startYear(year.yearNumber)
+        elif (
+            year.yearNumber < self.__yearNumber or week.weekNumber <= self.__weekNumber
+        ):
+            raise ValueError(
+                f"Week {week.weekNumber} of Year {year.yearNumber} can't be added after week {self.__weekNumber} of Year {self.__yearNumber}."
+            )
+        self.__weekNumber = week.weekNumber
+
+        teamIdToOwnerId = {team.id: team.ownerId for team in year.teams}
+        teamAOwnerIndexes = list()
+        teamBOwnerIndexes = list()
+        teamAOutcomes = list()
+        for matchup in week.matchups:
+            if matchup.matchupType == MatchupType.IGNORE:
+                continue
+            teamAOwnerIndex = self.__getOrAddOwnerIndex(
+                teamIdToOwnerId[matchup.teamAId]
+            )
+            teamBOwnerIndex = self.__getOrAddOwnerIndex(
+                teamIdToOwnerId[matchup.teamBId]
+            )
+            if matchup.multiWeekMatchupId is None:
+                teamAOwnerIndexes.append(teamAOwnerIndex)
+                teamBOwnerIndexes.append(teamBOwnerIndex)
+                teamAOutcomes.append(self.__getTeamAOutcome(matchup))
+            else:
+                self.__rateMultiWeekMatchup(matchup, teamAOwnerIndex, teamBOwnerIndex)
+
+        # each Owner plays once a week, so every game in the week can be rated at once
+        teamAOwnerIndexes = numpy.array(teamAOwnerIndexes, dtype=numpy.int64)
+        teamBOwnerIndexes = numpy.array(teamBOwnerIndexes, dtype=numpy.int64)
+        teamARatingChanges = self.__getTeamARatingChanges(
+            self.__ratings[teamAOwnerIndexes],
+            self.__ratings[teamBOwnerIndexes],
+            numpy.array(teamAOutcomes, dtype=numpy.float64),
+        )
+        self.__ratings[teamAOwnerIndexes] += teamARatingChanges
+        self.__ratings[teamBOwnerIndexes] -= teamARatingChanges
+
+        self.__addSnapshot(year.yearNumber, week.weekNumber)
+
+    def getRating(self, ownerId: str) -> float:
+        if ownerId not in self.__ownerIdToIndex:
+            raise DoesNotExistException(
+                f"Owner with ID {ownerId} has not played in any Week added to this EloRatingEngine."
+            )
+        return float(self.__ratings[self.__ownerIdToIndex[ownerId]])
+
+    def getRatings(self) -> dict[str, float]:
+        """
+        Returns the current rating of every Owner that has played in an added Week.
+
+        Example response:
+            {
+            "someOwnerId": 1572.4,
+            "someOtherOwnerId": 1431.9,
+            "yetAnotherOwnerId": 1495.7,
+            ...
+            }
+        """
+        return dict(zip(self.__ownerIds, self.__ratings.tolist()))
+
+    def getRatingsAfterWeek(self, yearNumber: int, weekNumber: int) -> dict[str, float]:
+        """
+        Returns the rating of every Owner that had played by the end of the given week of the given Year.
+        """
+        snapshotIndexes = numpy.flatnonzero(
+            (self.snapshotYearNumbers == yearNumber)
+            & (self.snapshotWeekNumbers == weekNumber)
+        )
+        if len(snapshotIndexes) == 0:
+            raise DoesNotExistException(
+                f"Week {weekNumber} of Year {yearNumber} has not been added to this EloRatingEngine."
+            )
+        return {
+            ownerId: rating
+            for ownerId, rating in zip(
+                self.__ownerIds, self.snapshotRatings[snapshotIndexes[0]].tolist()
+            )
+            if not numpy.isnan(rating)
+        }
+
+    def __startYear(self, yearNumber: int) -> None:
+        # multi-week matchups never span Years
+        self.__multiWeekMatchups.clear()
+        self.__multiWeekMatchupRatings.clear()
+        if self.__yearNumber is not None:
+            self.__ratings -= self.__yearRegression * (
+                self.__ratings - self.__initialRating
+            )
+        self.__yearNumber = yearNumber
+        self.__weekNumber = None
+
+    def __getOrAddOwnerIndex(self, ownerId: str) -> int:
+        if ownerId not in self.__ownerIdToIndex:
+            self.__ownerIdToIndex[ownerId] = len(self.__ownerIds)
+            self.__ownerIds.append(ownerId)
+            self.__ratings = numpy.append(self.__ratings, self.__initialRating)
+        return self.__ownerIdToIndex[ownerId]
+
+    @staticmethod
+    def __getTeamAOutcome(matchup: Matchup) -> float:
+        """
+        Returns 1 if team A won, 0 if team B won and 0.5 if the Matchup was a tie.
+        """
+        winningTeamId = MatchupNavigator.getTeamIdOfMatchupWinner(matchup)
+        if winningTeamId is None:
+            return 0.5
+        return 1.0 if winningTeamId == matchup.teamAId else 0.0
+
+    def __getTeamARatingChanges(
+        self,
+        teamARatings: numpy.ndarray,
+        teamBRatings: numpy.ndarray,
+        teamAOutcomes: numpy.ndarray,
+    ) -> numpy.ndarray:
+        teamAExpectedOutcomes = 1 / (1 + 10 ** ((teamBRatings - teamARatings) / 400))
+        return self.__kFactor * (teamAOutcomes - teamAExpectedOutcomes)
+
+    def __rateMultiWeekMatchup(
+        self, matchup: Matchup, teamAOwnerIndex: int, teamBOwnerIndex: int
+    ) -> None:
+        """
+        Rates the multi-week matchup the given Matchup is part of from every week of it added so far,
+        replacing the ratings change it gave before this week.
+        """
+        mwmid = matchup.multiWeekMatchupId
+        if mwmid not in self.__multiWeekMatchups:
+            self.__multiWeekMatchups[mwmid] = (list(), 0.0)
+            self.__multiWeekMatchupRatings[mwmid] = (
+                float(self.__ratings[teamAOwnerIndex]),
+                float(self.__ratings[teamBOwnerIndex]),
+            )
+        matchups, previousTeamARatingChange = self.__multiWeekMatchups[mwmid]
+        matchups.append(matchup)
+        teamARating, teamBRating = self.__multiWeekMatchupRatings[mwmid]
+        teamARatingChange = float(
+            self.__getTeamARatingChanges(
+                numpy.array([teamARating]),
+                numpy.array([teamBRating]),
+                numpy.array(
+                    [
+                        self.__getTeamAOutcome(
+                            MatchupNavigator.simplifyMultiWeekMatchups(matchups)
+                        )
+                    ]
+                ),
+            )[0]
+        )
+        # these Owners haven't played anyone else since the multi-week matchup started, so the old change can be swapped out
+        self.__ratings[teamAOwnerIndex] += teamARatingChange - previousTeamARatingChange
+        self.__ratings[teamBOwnerIndex] -= teamARatingChange - previousTeamARatingChange
+        self.__multiWeekMatchups[mwmid] = (matchups, teamARatingChange)
+
+    def __addSnapshot(self, yearNumber: int, weekNumber: int) -> None:
+        rowCapacity, columnCapacity = self.__snapshotRatings.shape
+        numberOfOwners = len(self.__ownerIds)
+        if self.__numberOfSnapshots == rowCapacity or numberOfOwners > columnCapacity:
+            if self.__numberOfSnapshots == rowCapacity:
+                rowCapacity = max(16, 2 * rowCapacity)
+            snapshotWeeks = numpy.empty((rowCapacity, 2), dtype=numpy.int32)
+            snapshotWeeks[: self.__numberOfSnapshots] = self.__snapshotWeeks[
+                : self.__numberOfSnapshots
+            ]
+            snapshotRatings = numpy.full(
+                (rowCapacity, max(numberOfOwners, columnCapacity)), numpy.nan
+            )
+            snapshotRatings[: self.__numberOfSnapshots, :columnCapacity] = (
+                self.__snapshotRatings[: self.__numberOfSnapshots]
+            )
+            self.__snapshotWeeks = snapshotWeeks
+            self.__snapshotRatings = snapshotRatings
+        self.__snapshotWeeks[self.__numberOfSnapshots] = (yearNumber, weekNumber)
+        self.__snapshotRatings[self.__numberOfSnapshots, :numberOfOwners] = (
+            self.__ratings
+        )
+        self.__numberOfSnapshots += 1
@@ -0,0 +1,44 @@
+from typing import Any, ClassVar, Optional
+
+from leeger.calculator.engine.StatRegistry import StatRegistry
+
+
+class StatEngine:
+    """
+    Should be inherited by all stat engines.
+
+    Every engine has a StatRegistry that describes each stat it can calculate and the values that stat is calculated from.
+    Only the values needed for the requested stats are calculated, each value is only calculated once per engine
+    and values are calculated in an order where every input is ready before it is needed.
+    """
+
+    STAT_REGISTRY: ClassVar[StatRegistry]
+
+    def __init__(self):
+        # value name -> calculated value
+        self.__calculated: dict[str, Any] = dict()
+
+    @classmethod
+    def getStatNames(cls) -> list[str]:
+        """
+        Returns the name of every stat this engine can calculate.
+        """
+        return cls.STAT_REGISTRY.getStatNames()
+
+    def getStats(self, statNames: Optional[list[str]] = None) -> dict[str, Any]:
+        """
+        Returns the given stats (or every stat if none are given), keyed by stat name.
+        """
+        statNames = self.getStatNames() if statNames is None else list(statNames)
+        for node in self.STAT_REGISTRY.getCalculationOrder(statNames):
+            if node.name not in self.__calculated:
+                self.__calculated[node.name] = node.calculate(
+                    self, *[self.__calculated[inputName] for inputName in node.inputs]
+                )
+        return {statName: self.__calculated[statName] for statName in statNames}
+
+    def _setValue(self, name: str, value: Any) -> None:
+        """
+        Sets the value with the given name, so it is used instead of being calculated.
+        """
+        self.__calculated[name] = value
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+@dataclass(kw_only=True, frozen=True)
+class StatNode:
+    """
+    Used to describe how a single value in a StatRegistry is calculated.
+
+    name: The name the value is registered under.
+    inputs: The names of the values this value is calculated from.
+    calculate: Called with the engine calculating the value, followed by the value of each input (in the order of inputs).
+    isStat: Whether this value is a stat that can be requested, or only a value that is shared between stats.
+    """
+
+    name: str
+    inputs: tuple[str, ...]
+    calculate: Callable[..., Any]
+    isStat: bool
@@ -0,0 +1,85 @@
+from typing import Callable
+
+from leeger.calculator.engine.StatNode import StatNode
+
+
+class StatRegistry:
+    """
+    Used to hold every value a stat engine knows how to calculate and what each value is calculated from.
+
+    Values are registered with the stat() and intermediate() decorators:
+
+        @STAT_REGISTRY.stat("winsPerGame", inputs=("wins", "gamesPlayed"))
+        def __calculateWinsPerGame(self, wins, gamesPlayed):
+            ...
+    """
+
+    def __init__(self):
+        self.__nodes: dict[str, StatNode] = dict()
+
+    def stat(self, name: str, *, inputs: tuple[str, ...] = ()) -> Callable:
+        """
+        Registers the decorated function as the way to calculate the stat with the given name.
+        """
+        return self.__register(name, inputs=inputs, isStat=True)
+
+    def intermediate(self, name: str, *, inputs: tuple[str, ...] = ()) -> Callable:
+        """
+        Registers the decorated function as the way to calculate a value that is shared between stats, but is not a stat itself.
+        """
+        return self.__register(name, inputs=inputs, isStat=False)
+
+    def __register(
+        self, name: str, *, inputs: tuple[str, ...], isStat: bool
+    ) -> Callable:
+        if name in self.__nodes:
+            raise ValueError(f"'{name}' has already been registered.")
+
+        def decorator(function: Callable) -> Callable:
+            self.__nodes[name] = StatNode(
+                name=name, inputs=tuple(inputs), calculate=function, isStat=isStat
+            )
+            return function
+
+        return decorator
+
+    def getStatNames(self) -> list[str]:
+        """
+        Returns the name of every stat that can be requested, in the order they were registered.
+        """
+        return [node.name for node in self.__nodes.values() if node.isStat]
+
+    def getNode(self, name: str) -> StatNode:
+        if name not in self.__nodes:
+            raise ValueError(f"'{name}' is not a registered stat.")
+        return self.__nodes[name]
+
+    def getCalculationOrder(self, statNames: list[str]) -> list[StatNode]:
+        """
+        Returns every node needed to calculate the given stats, ordered so each node comes after all of its inputs.
+        Each node is only returned once, no matter how many stats need it.
+        """
+        for statName in statNames:
+            if not self.getNode(statName).isStat:
+                raise ValueError(f"'{statName}' is not a registered stat.")
+
+        calculationOrder: list[StatNode] = list()
+        ordered: set[str] = set()
+        visiting: set[str] = set()
+
+        def visit(name: str) -> None:
+            if name in ordered:
+                return
+            if name in visiting:
+                raise ValueError(f"'{name}' depends on itself.")
+            visiting.add(name)
+            node = self.getNode(name)
+            for inputName in node.inputs:
+                visit(inputName)
+            visiting.remove(name)
+            ordered.add(name)
+            calculationOrder.append(node)
+
+        for statName in statNames:
+            visit(statName)
+        return calculationOrder
@@ -0,0 +1,904 @@
+import functools
+from typing import Any, Callable, Optional
+
+from leeger.calculator.engine.StatEngine import StatEngine
+from leeger.calculator.engine.StatRegistry import StatRegistry
+from leeger.calculator.year_calculator.AWALYearCalculator import AWALYearCalculator
+from leeger.calculator.year_calculator.GameOutcomeYearCalculator import (
+    GameOutcomeYearCalculator,
+)
+from leeger.calculator.year_calculator.PlusMinusYearCalculator import (
+    PlusMinusYearCalculator,
+)
+from leeger.calculator.year_calculator.PointsScoredYearCalculator import (
+    PointsScoredYearCalculator,
+)
+from leeger.calculator.year_calculator.ScoringShareYearCalculator import (
+    ScoringShareYearCalculator,
+)
+from leeger.calculator.year_calculator.ScoringStandardDeviationYearCalculator import (
+    ScoringStandardDeviationYearCalculator,
+)
+from leeger.calculator.year_calculator.SingleScoreYearCalculator import (
+    SingleScoreYearCalculator,
+)
+from leeger.calculator.year_calculator.SmartWinsYearCalculator import (
+    SmartWinsYearCalculator,
+)
+from leeger.calculator.year_calculator.SSLYearCalculator import SSLYearCalculator
+from leeger.model.filter import YearFilters
+from leeger.model.league.Year import Year
+from leeger.model.stat.YearStatSheet import YearStatSheet
+from leeger.util.Deci import Deci
+from leeger.util.GeneralUtil import GeneralUtil
+from leeger.util.navigator.YearNavigator import YearNavigator
+from leeger.util.NumericSettings import NumericSettings
+from leeger.validate import yearValidation
+
+
+class YearStatEngine(StatEngine):
+    """
+    Used to calculate stats for a Year.
+
+    The Year is validated once and the filters are parsed once.
+    Every stat is registered with the values it is calculated from (games played, wins, AWAL, points scored, etc.),
+    so asking for any group of stats only calculates the values those stats need, and each of those values only once.
+    Each stat is calculated the same way as the Year calculator method it matches, so the results are exactly the same.
+    """
+
+    STAT_REGISTRY = StatRegistry()
+    LEAGUE_MEDIAN_STAT_NAMES = [
+        "totalGames",
+        "leagueMedianWins",
+        "opponentLeagueMedianWins",
+    ]
+    # intermediate values that getStatProgression() calculates for every week at once, and the calculator method that does it
+    __INTERMEDIATE_NAME_AND_CALCULATE_AFTER_EACH_WEEK: dict[str, Callable] = {
+        "leagueMedianWinsFromWeeks": functools.partial(
+            GameOutcomeYearCalculator._getLeagueMedianWinsFromWeeksAfterEachWeek,
+            opponentScores=False,
+        ),
+        "opponentLeagueMedianWinsFromWeeks": functools.partial(
+            GameOutcomeYearCalculator._getLeagueMedianWinsFromWeeksAfterEachWeek,
+            opponentScores=True,
+        ),
+        "awalFromWeeks": functools.partial(
+            AWALYearCalculator._getAWALFromWeeksAfterEachWeek, opponentScores=False
+        ),
+        "opponentAWALFromWeeks": functools.partial(
+            AWALYearCalculator._getAWALFromWeeksAfterEachWeek, opponentScores=True
+        ),
+        "smartWinsByTeam": functools.partial(
+            SmartWinsYearCalculator._getSmartWinsByTeamAfterEachWeek,
+            opponentScores=False,
+        ),
+        "opponentSmartWinsByTeam": functools.partial(
+            SmartWinsYearCalculator._getSmartWinsByTeamAfterEachWeek,
+            opponentScores=True,
+        ),
+        "pointsScoredByTeam": functools.partial(
+            PointsScoredYearCalculator._getPointsScoredByTeamAfterEachWeek,
+            opponentScores=False,
+        ),
+        "opponentPointsScoredByTeam": functools.partial(
+            PointsScoredYearCalculator._getPointsScoredByTeamAfterEachWeek,
+            opponentScores=True,
+        ),
+        "maxScoringShareByTeam": ScoringShareYearCalculator._getMaxScoringShareByTeamAfterEachWeek,
+        "minScoringShareByTeam": ScoringShareYearCalculator._getMinScoringShareByTeamAfterEachWeek,
+        "maxScoreByTeam": functools.partial(
+            SingleScoreYearCalculator._getSingleScoresAfterEachWeek, maxScore=True
+        ),
+        "minScoreByTeam": functools.partial(
+            SingleScoreYearCalculator._getSingleScoresAfterEachWeek, maxScore=False
+        ),
+        "scoringStandardDeviationByTeam": ScoringStandardDeviationYearCalculator._getScoringStandardDeviationByTeamAfterEachWeek,
+    }
+
+    def __init__(self, year: Year, **kwargs):
+        super().__init__()
+        if "validate" not in kwargs or kwargs["validate"] is True:
+            yearValidation.runAllChecks(year)
+        self.__year = year
+        self.__kwargs = kwargs
+        self.__filters = YearFilters.getForYear(year, **kwargs)
+        self.__teamIds = YearNavigator.getAllTeamIds(year)
+
+    def getYearStatSheet(
+        self, *, ownerNames: Optional[list] = None, years: Optional[list] = None
+    ) -> YearStatSheet:
+        """
+        Returns a YearStatSheet for the Year this engine was created with.
+        """
+        statNames = [
+            statName
+            for statName in self.getStatNames()
+            if statName not in self.LEAGUE_MEDIAN_STAT_NAMES
+        ]
+        # check for optional stats
+        if self.__year.yearSettings.leagueMedianGames is True:
+            statNames += self.LEAGUE_MEDIAN_STAT_NAMES
+
+        statNameAndStat = {
+            statName: None for statName in self.LEAGUE_MEDIAN_STAT_NAMES
+        } | self.getStats(statNames)
+        return YearStatSheet(**statNameAndStat, ownerNames=ownerNames, years=years)
+
+    @classmethod
+    def getStatProgression(
+        cls, year: Year, statNames: Optional[list[str]] = None, **kwargs
+    ) -> dict[str, dict[str, list]]:
+        """
+        Returns the given stats (or every stat if none are given) after each week in the range, keyed by stat name, then team ID.
+        Index i of each team's list is the stat from weekNumberStart through week weekNumberStart + i,
+        which is exactly what the Year calculators return when given that week as weekNumberEnd.
+
+        The Year is validated once and the filters are parsed once.
+        Every value that needs to look at each score is calculated for every week at once, so each score is only looked at once:
+            - Points scored, AWAL and league median wins are running totals.
+            - Smart Wins are running totals, but multi-week matchups are combined again for each week (their scores depend on which of their weeks are in the range).
+            - Max/min scores and max/min scoring shares are each team's running max/min.
+            - Each team's scores are collected as the weeks go by, but the scoring standard deviation itself is calculated again for each week
+              (every deviation depends on the mean of all of a team's scores).
+        Games played and game outcomes for each week are looked up from running totals that are only built once per Year.
+        Every other stat is calculated from those values for each week, just like a YearStatEngine would.
+
+        Example response:
+            {
+            "wins": {
+                "someTeamId": [1, 1, 2, ...],
+                "someOtherTeamId": [0, 1, 1, ...],
+                ...
+                },
+            ...
+            }
+        """
+        if "validate" not in kwargs or kwargs["validate"] is True:
+            yearValidation.runAllChecks(year)
+        filters = YearFilters.getForYear(year, **kwargs)
+        statNames = cls.getStatNames() if statNames is None else list(statNames)
+        teamIds = YearNavigator.getAllTeamIds(year)
+
+        intermediateNameAndValueAfterEachWeek = {
+            node.name: cls.__INTERMEDIATE_NAME_AND_CALCULATE_AFTER_EACH_WEEK[node.name](
+                year, filters, **kwargs
+            )
+            for node in cls.STAT_REGISTRY.getCalculationOrder(statNames)
+            if node.name in cls.__INTERMEDIATE_NAME_AND_CALCULATE_AFTER_EACH_WEEK
+        }
+        statNameAndProgression = {
+            statName: {teamId: list() for teamId in teamIds} for statName in statNames
+        }
+        for i, weekNumberEnd in enumerate(
+            range(filters.weekNumberStart, filters.weekNumberEnd + 1)
+        ):
+            weekKwargs = kwargs | {"weekNumberEnd": weekNumberEnd, "validate": False}
+            yearStatEngine = cls(year, **weekKwargs)
+            for (
+                intermediateName,
+                valueAfterEachWeek,
+            ) in intermediateNameAndValueAfterEachWeek.items():
+                yearStatEngine._setValue(intermediateName, valueAfterEachWeek[i])
+            for statName, teamIdAndStat in yearStatEngine.getStats(statNames).items():
+                for teamId in teamIds:
+                    statNameAndProgression[statName][teamId].append(
+                        teamIdAndStat[teamId]
+                    )
+        return statNameAndProgression
+
+    ###########
+    # HELPERS #
+    ###########
+
+    def __checkMultiWeekMatchupsAreIncluded(self) -> None:
+        if not self.__filters.includeMultiWeekMatchups:
+            raise ValueError(
+                "Multi-Week matchups must be included in this calculation."
+            )
+
+    def __calculateNumberOfGamesPlayed(
+        self,
+        *,
+        countMultiWeekMatchupsAsOneGame: bool = False,
+        countLeagueMedianGamesAsTwoGames: bool = False,
+    ) -> dict[str, int]:
+        return YearNavigator.getNumberOfGamesPlayed(
+            self.__year,
+            self.__filters,
+            countMultiWeekMatchupsAsOneGame=countMultiWeekMatchupsAsOneGame,
+            countLeagueMedianGamesAsTwoGames=countLeagueMedianGamesAsTwoGames,
+        )
+
+    @staticmethod
+    def __setToNoneIfNoGamesPlayed(
+        responseDict: dict[str, Any], teamIdAndNumberOfGamesPlayed: dict[str, int]
+    ) -> dict:
+        """
+        Works the same as YearCalculator._setToNoneIfNoGamesPlayed(), but games played is only calculated once.
+        """
+        for teamId in responseDict:
+            if teamIdAndNumberOfGamesPlayed[teamId] == 0:
+                responseDict[teamId] = None
+        return responseDict
+
+    def __divideByGamesPlayed(
+        self,
+        teamIdAndStat: dict[str, Optional[Deci]],
+        teamIdAndNumberOfGamesPlayed: dict[str, int],
+    ) -> dict[str, Optional[Deci]]:
+        """
+        Returns the given stat per game, or None for teams with no games played.
+        """
+        teamIdAndStatPerGame = dict()
+        for teamId in self.__teamIds:
+            if teamIdAndNumberOfGamesPlayed[teamId] == 0:
+                teamIdAndStatPerGame[teamId] = None
+            else:
+                teamIdAndStatPerGame[teamId] = (
+                    teamIdAndStat[teamId] / teamIdAndNumberOfGamesPlayed[teamId]
+                )
+        return teamIdAndStatPerGame
+
+    ################
+    # GAMES PLAYED #
+    ################
+
+    @STAT_REGISTRY.intermediate("numberOfGamesPlayed")
+    def __calculateGamesPlayedCounts(self) -> dict[str, int]:
+        return self.__calculateNumberOfGamesPlayed()
+
+    @STAT_REGISTRY.intermediate("numberOfGamesPlayedWithMultiWeekMatchupsAsOneGame")
+    def __calculateGamesPlayedCountsWithMultiWeekMatchupsAsOneGame(
+        self,
+    ) -> dict[str, int]:
+        return self.__calculateNumberOfGamesPlayed(countMultiWeekMatchupsAsOneGame=True)
+
+    @STAT_REGISTRY.intermediate("numberOfGamesPlayedWithLeagueMedianGamesAsTwoGames")
+    def __calculateGamesPlayedCountsWithLeagueMedianGamesAsTwoGames(
+        self,
+    ) -> dict[str, int]:
+        return self.__calculateNumberOfGamesPlayed(
+            countLeagueMedianGamesAsTwoGames=True
+        )
+
+    @STAT_REGISTRY.intermediate(
+        "numberOfGamesPlayedWithMultiWeekMatchupsAsOneGameAndLeagueMedianGamesAsTwoGames"
+    )
+    def __calculateGamesPlayedCountsWithMultiWeekMatchupsAsOneGameAndLeagueMedianGamesAsTwoGames(
+        self,
+    ) -> dict[str, int]:
+        return self.__calculateNumberOfGamesPlayed(
+            countMultiWeekMatchupsAsOneGame=True,
+            countLeagueMedianGamesAsTwoGames=True,
+        )
+
+    ################
+    # TEAM SUMMARY #
+    ################
+
+    @STAT_REGISTRY.stat(
+        "gamesPlayed", inputs=("numberOfGamesPlayedWithMultiWeekMatchupsAsOneGame",)
+    )
+    def __calculateGamesPlayed(
+        self, teamIdAndNumberOfGamesPlayed: dict[str, int]
+    ) -> dict[str, int]:
+        self.__checkMultiWeekMatchupsAreIncluded()
+        return dict(teamIdAndNumberOfGamesPlayed)
+
+    @STAT_REGISTRY.stat(
+        "totalGames", inputs=("numberOfGamesPlayedWithLeagueMedianGamesAsTwoGames",)
+    )
+    def __calculateTotalGames(
+        self, teamIdAndNumberOfGamesPlayed: dict[str, int]
+    ) -> dict[str, int]:
+        return dict(teamIdAndNumberOfGamesPlayed)
+
+    ################
+    # GAME OUTCOME #
+    ################
+
+    @STAT_REGISTRY.intermediate("winsLossesAndTies")
+    def __calculateWinsLossesAndTies(
+        self,
+    ) -> tuple[dict[str, int], dict[str, int], dict[str, int]]:
+        return GameOutcomeYearCalculator._getWinsLossesAndTies(
+            self.__year, self.__filters, **self.__kwargs
+        )
+
+    @STAT_REGISTRY.stat("wins", inputs=("winsLossesAndTies", "numberOfGamesPlayed"))
+    def __calculateWins(
+        self, winsLossesAndTies: tuple, teamIdAndNumberOfGamesPlayed: dict[str, int]
+    ) -> dict[str, Optional[int]]:
+        return self.__setToNoneIfNoGamesPlayed(
+            dict(winsLossesAndTies[0]), teamIdAndNumberOfGamesPlayed
+        )
+
+    @STAT_REGISTRY.stat("losses", inputs=("winsLossesAndTies", "numberOfGamesPlayed"))
+    def __calculateLosses(
+        self, winsLossesAndTies: tuple, teamIdAndNumberOfGamesPlayed: dict[str, int]
+    ) -> dict[str, Optional[int]]:
+        return self.__setToNoneIfNoGamesPlayed(
+            dict(winsLossesAndTies[1]), teamIdAndNumberOfGamesPlayed
+        )
+
+    @STAT_REGISTRY.stat("ties", inputs=("winsLossesAndTies", "numberOfGamesPlayed"))
+    def __calculateTies(
+        self, winsLossesAndTies: tuple, teamIdAndNumberOfGamesPlayed: dict[str, int]
+    ) -> dict[str, Optional[int]]:
+        return self.__setToNoneIfNoGamesPlayed(
+            dict(winsLossesAndTies[2]), teamIdAndNumberOfGamesPlayed
+        )
+
+    @STAT_REGISTRY.intermediate("leagueMedianWinsFromWeeks")
+    def __calculateLeagueMedianWinsFromWeeks(self) -> dict[str, Deci]:
+        return GameOutcomeYearCalculator._getLeagueMedianWinsFromWeeks(
+            self.__year, self.__filters, opponentScores=False
+        )
+
+    @STAT_REGISTRY.intermediate("opponentLeagueMedianWinsFromWeeks")
+    def __calculateOpponentLeagueMedianWinsFromWeeks(self) -> dict[str, Deci]:
+        return GameOutcomeYearCalculator._getLeagueMedianWinsFromWeeks(
+            self.__year, self.__filters, opponentScores=True
+        )
+
+    def __calculateLeagueMedianWinsForScores(
+        self,
+        teamIdAndLeagueMedianWinsFromWeeks: dict[str, Deci],
+        teamIdAndNumberOfGamesPlayed: dict[str, int],
+    ) -> dict[str, Optional[Deci]]:
+        teamIdAndLeagueMedianWins = dict(teamIdAndLeagueMedianWinsFromWeeks)
+        if not self.__year.yearSettings.leagueMedianGames:
+            return teamIdAndLeagueMedianWins
+        return self.__setToNoneIfNoGamesPlayed(
+            teamIdAndLeagueMedianWins, teamIdAndNumberOfGamesPlayed
+        )
+
+    @STAT_REGISTRY.stat(
+        "leagueMedianWins", inputs=("leagueMedianWinsFromWeeks", "numberOfGamesPlayed")
+    )
+    def __calculateLeagueMedianWins(
+        self,
+        teamIdAndLeagueMedianWinsFromWeeks: dict[str, Deci],
+        teamIdAndNumberOfGamesPlayed: dict[str, int],
+    ) -> dict[str, Optional[Deci]]:
+        return self.__calculateLeagueMedianWinsForScores(
+            teamIdAndLeagueMedianWinsFromWeeks, teamIdAndNumberOfGamesPlayed
+        )
+
+    @STAT_REGISTRY.stat(
+        "opponentLeagueMedianWins",
+        inputs=("opponentLeagueMedianWinsFromWeeks", "numberOfGamesPlayed"),
+    )
+    def __calculateOpponentLeagueMedianWins(
+        self,
+        teamIdAndOpponentLeagueMedianWinsFromWeeks: dict[str, Deci],
+        teamIdAndNumberOfGamesPlayed: dict[str, int],
+    ) -> dict[str, Optional[Deci]]:
+        return self.__calculateLeagueMedianWinsForScores(
+            teamIdAndOpponentLeagueMedianWinsFromWeeks, teamIdAndNumberOfGamesPlayed
+        )
+
+    @STAT_REGISTRY.stat(
+        "winPercentage",
+        inputs=(
+            "wins",
+            "losses",
+            "ties",
+            "leagueMedianWins",
+            "numberOfGamesPlayedWithMultiWeekMatchupsAsOneGameAndLeagueMedianGamesAsTwoGames",
+        ),
+    )
+    def __calculateWinPercentage(
+        self,
+        teamIdAndWins: dict[str, Optional[int]],
+        teamIdAndLosses: dict[str, Optional[int]],
+        teamIdAndTies: dict[str, Optional[int]],
+        teamIdAndLeagueMedianWins: dict[str, Optional[Deci]],
+        teamIdAndNumberOfGamesPlayed: dict[str, int],
+    ) -> dict[str, Optional[Deci]]:
+        teamIdAndWinPercentage = dict()
+        for teamId in self.__teamIds:
+            numberOfWins = teamIdAndWins[teamId]
+            numberOfLosses = teamIdAndLosses[teamId]
+            numberOfTies = teamIdAndTies[teamId]
+            numberOfLeagueMedianWins = teamIdAndLeagueMedianWins[teamId]
+            if None in (
+                numberOfWins,
+                numberOfLosses,
+                numberOfTies,
+                numberOfLeagueMedianWins,
+            ):
+                teamIdAndWinPercentage[teamId] = None
+            else:
+                numberOfGamesPlayed = numberOfWins + numberOfLosses + numberOfTies
+                totalWins = numberOfWins
+                if self.__year.yearSettings.leagueMedianGames:
+                    # add another game played for each regular season game if league median games is on in year settings
+                    numberOfGamesPlayed = teamIdAndNumberOfGamesPlayed[teamId]
+                    totalWins += numberOfLeagueMedianWins
+                teamIdAndWinPercentage[teamId] = (
+                    Deci(totalWins) + (Deci("0.5") * Deci(numberOfTies))
+                ) / Deci(numberOfGamesPlayed)
+        return teamIdAndWinPercentage
+
+    @STAT_REGISTRY.stat("wal", inputs=("wins", "ties", "leagueMedianWins"))
+    def __calculateWAL(
+        self,
+        teamIdAndWins: dict[str, Optional[int]],
+        teamIdAndTies: dict[str, Optional[int]],
+        teamIdAndLeagueMedianWins: dict[str, Optional[Deci]],
+    ) -> dict[str, Optional[Deci]]:
+        teamIdAndWAL = dict()
+        for teamId in self.__teamIds:
+            wins = teamIdAndWins[teamId]
+            ties = teamIdAndTies[teamId]
+            leagueMedianWins = teamIdAndLeagueMedianWins[teamId]
+            if None in (wins, ties):
+                teamIdAndWAL[teamId] = None
+            else:
+                teamIdAndWAL[teamId] = Deci(wins) + (Deci("0.5") * Deci(ties))
+
+            if (
+                self.__year.yearSettings.leagueMedianGames is True
+                and leagueMedianWins is not None
+            ):
+                if teamIdAndWAL[teamId] is None:
+                    teamIdAndWAL[teamId] = Deci(leagueMedianWins)
+                else:
+                    teamIdAndWAL[teamId] += Deci(leagueMedianWins)
+        return teamIdAndWAL
+
+    @STAT_REGISTRY.stat(
+        "walPerGame",
+        inputs=(
+            "wal",
+            "numberOfGamesPlayedWithMultiWeekMatchupsAsOneGameAndLeagueMedianGamesAsTwoGames",
+            "numberOfGamesPlayed",
+        ),
+    )
+    def __calculateWALPerGame(
+        self,
+        teamIdAndWAL: dict[str, Optional[Deci]],
+        teamIdAndNumberOfGamesPlayed: dict[str, int],
+        teamIdAndNumberOfGamesPlayedWithNoAdjustments: dict[str, int],
+    ) -> dict[str, Optional[Deci]]:
+        teamIdAndWALPerGame = dict()
+        for teamId in self.__teamIds:
+            # to avoid division by zero, we'll just set the WAL per game to 0 if the team has no games played
+            if teamIdAndNumberOfGamesPlayed[teamId] == 0:
+                teamIdAndWALPerGame[teamId] = Deci("0")
+            else:
+                teamIdAndWALPerGame[teamId] = (
+                    teamIdAndWAL[teamId] / teamIdAndNumberOfGamesPlayed[teamId]
+                )
+        return self.__setToNoneIfNoGamesPlayed(
+            teamIdAndWALPerGame, teamIdAndNumberOfGamesPlayedWithNoAdjustments
+        )
+
+    ########
+    # AWAL #
+    ########
+
+    @STAT_REGISTRY.intermediate("awalFromWeeks")
+    def __calculateAWALFromWeeks(self) -> dict[str, Deci]:
+        return AWALYearCalculator._getAWALFromWeeks(
+            self.__year, self.__filters, opponentScores=False, **self.__kwargs
+        )
+
+    @STAT_REGISTRY.intermediate("opponentAWALFromWeeks")
+    def __calculateOpponentAWALFromWeeks(self) -> dict[str, Deci]:
+        return AWALYearCalculator._getAWALFromWeeks(
+            self.__year, self.__filters, opponentScores=True, **self.__kwargs
+        )
+
+    def __calculateAWALForScores(
+        self,
+        teamIdAndAWALFromWeeks: dict[str, Deci],
+        teamIdAndLeagueMedianWins: dict[str, Optional[Deci]],
+        teamIdAndNumberOfGamesPlayed: dict[str, int],
+    ) -> dict[str, Optional[Deci]]:
+        teamIdAndAWAL = dict(teamIdAndAWALFromWeeks)
+        # add league median wins if applicable
+        if self.__year.yearSettings.leagueMedianGames:
+            for teamId in self.__teamIds:
+                teamIdAndAWAL[teamId] = GeneralUtil.safeSum(
+                    teamIdAndAWAL[teamId], teamIdAndLeagueMedianWins[teamId]
+                )
+        return self.__setToNoneIfNoGamesPlayed(
+            teamIdAndAWAL, teamIdAndNumberOfGamesPlayed
+        )
+
+    @STAT_REGISTRY.stat(
+        "awal", inputs=("awalFromWeeks", "leagueMedianWins", "numberOfGamesPlayed")
+    )
+    def __calculateAWAL(
+        self,
+        teamIdAndAWALFromWeeks: dict[str, Deci],
+        teamIdAndLeagueMedianWins: dict[str, Optional[Deci]],
+        teamIdAndNumberOfGamesPlayed: dict[str, int],
+    ) -> dict[str, Optional[Deci]]:
+        return self.__calculateAWALForScores(
+            teamIdAndAWALFromWeeks,
+            teamIdAndLeagueMedianWins,
+            teamIdAndNumberOfGamesPlayed,
+        )
+
+    @STAT_REGISTRY.stat(
+        "awalPerGame",
+        inputs=("awal", "numberOfGamesPlayedWithLeagueMedianGamesAsTwoGames"),
+    )
+    def __calculateAWALPerGame(
+        self,
+        teamIdAndAWAL: dict[str, Optional[Deci]],
+        teamIdAndNumberOfGamesPlayed: dict[str, int],
+    ) -> dict[str, Optional[Deci]]:
+        return self.__divideByGamesPlayed(teamIdAndAWAL, teamIdAndNumberOfGamesPlayed)
+
+    @STAT_REGISTRY.stat(
+        "opponentAWAL",
+        inputs=(
+            "opponentAWALFromWeeks",
+            "opponentLeagueMedianWins",
+            "numberOfGamesPlayed",
+        ),
+    )
+    def __calculateOpponentAWAL(
+        self,
+        teamIdAndOpponentAWALFromWeeks: dict[str, Deci],
+        teamIdAndOpponentLeagueMedianWins: dict[str, Optional[Deci]],
+        teamIdAndNumberOfGamesPlayed: dict[str, int],
+    ) -> dict[str, Optional[Deci]]:
+        return self.__calculateAWALForScores(
+            teamIdAndOpponentAWALFromWeeks,
+            teamIdAndOpponentLeagueMedianWins,
+            teamIdAndNumberOfGamesPlayed,
+        )
+
+    @STAT_REGISTRY.stat(
+        "opponentAWALPerGame",
+        inputs=("opponentAWAL", "numberOfGamesPlayedWithLeagueMedianGamesAsTwoGames"),
+    )
+    def __calculateOpponentAWALPerGame(
+        self,
+        teamIdAndOpponentAWAL: dict[str, Optional[Deci]],
+        teamIdAndNumberOfGamesPlayed: dict[str, int],
+    ) -> dict[str, Optional[Deci]]:
+        return self.__divideByGamesPlayed(
+            teamIdAndOpponentAWAL, teamIdAndNumberOfGamesPlayed
+        )
+
+    ##############
+    # SMART WINS #
+    ##############
+
+    @STAT_REGISTRY.intermediate("smartWinsByTeam")
+    def __calculateSmartWinsByTeam(self) -> dict[str, Deci]:
+        return SmartWinsYearCalculator._getSmartWinsByTeam(
+            self.__year, self.__filters, opponentScores=False, **self.__kwargs
+        )
+
+    @STAT_REGISTRY.stat("smartWins", inputs=("smartWinsByTeam", "numberOfGamesPlayed"))
+    def __calculateSmartWins(
+        self,
+        teamIdAndSmartWins: dict[str, Deci],
+        teamIdAndNumberOfGamesPlayed: dict[str, int],
+    ) -> dict[str, Optional[Deci]]:
+        return self.__setToNoneIfNoGamesPlayed(
+            dict(teamIdAndSmartWins), teamIdAndNumberOfGamesPlayed
+        )
+
+    @STAT_REGISTRY.stat(
+        "smartWinsPerGame",
+        inputs=("smartWins", "numberOfGamesPlayedWithMultiWeekMatchupsAsOneGame"),
+    )
+    def __calculateSmartWinsPerGame(
+        self,
+        teamIdAndSmartWins: dict[str, Optional[Deci]],
+        teamIdAndNumberOfGamesPlayed: dict[str, int],
+    ) -> dict[str, Optional[Deci]]:
+        return self.__divideByGamesPlayed(
+            teamIdAndSmartWins, teamIdAndNumberOfGamesPlayed
+        )
+
+    @STAT_REGISTRY.intermediate("opponentSmartWinsByTeam")
+    def __calculateOpponentSmartWinsByTeam(self) -> dict[str, Deci]:
+        return SmartWinsYearCalculator._getSmartWinsByTeam(
+            self.__year, self.__filters, opponentScores=True, **self.__kwargs
+        )
+
+    @STAT_REGISTRY.stat(
+        "opponentSmartWins", inputs=("opponentSmartWinsByTeam", "numberOfGamesPlayed")
+    )
+    def __calculateOpponentSmartWins(
+        self,
+        teamIdAndOpponentSmartWins: dict[str, Deci],
+        teamIdAndNumberOfGamesPlayed: dict[str, int],
+    ) -> dict[str, Optional[Deci]]:
+        return self.__setToNoneIfNoGamesPlayed(
+            dict(teamIdAndOpponentSmartWins), teamIdAndNumberOfGamesPlayed
+        )
+
+    @STAT_REGISTRY.stat(
+        "opponentSmartWinsPerGame",
+        inputs=(
+            "opponentSmartWins",
+            "numberOfGamesPlayedWithMultiWeekMatchupsAsOneGame",
+        ),
+    )
+    def __calculateOpponentSmartWinsPerGame(
+        self,
+        teamIdAndOpponentSmartWins: dict[str, Optional[Deci]],
+        teamIdAndNumberOfGamesPlayed: dict[str, int],
+    ) -> dict[str, Optional[Deci]]:
+        return self.__divideByGamesPlayed(
+            teamIdAndOpponentSmartWins, teamIdAndNumberOfGamesPlayed
+        )
+
+    #################
+    # POINTS SCORED #
+    #################
+
+    @STAT_REGISTRY.intermediate("pointsScoredByTeam")
+    def __calculatePointsScoredByTeam(self) -> dict[str, Deci]:
+        return PointsScoredYearCalculator._getPointsScoredByTeam(
+            self.__year, self.__filters, opponentScores=False, **self.__kwargs
+        )
+
+    @STAT_REGISTRY.stat(
+        "pointsScored", inputs=("pointsScoredByTeam", "numberOfGamesPlayed")
+    )
+    def __calculatePointsScored(
+        self,
+        teamIdAndPointsScored: dict[str, Deci],
+        teamIdAndNumberOfGamesPlayed: dict[str, int],
+    ) -> dict[str, Optional[Deci]]:
+        return self.__setToNoneIfNoGamesPlayed(
+            dict(teamIdAndPointsScored), teamIdAndNumberOfGamesPlayed
+        )
+
+    @STAT_REGISTRY.stat(
+        "pointsScoredPerGame", inputs=("pointsScored", "numberOfGamesPlayed")
+    )
+    def __calculatePointsScoredPerGame(
+        self,
+        teamIdAndPointsScored: dict[str, Optional[Deci]],
+        teamIdAndNumberOfGamesPlayed: dict[str, int],
+    ) -> dict[str, Optional[Deci]]:
+        return self.__divideByGamesPlayed(
+            teamIdAndPointsScored, teamIdAndNumberOfGamesPlayed
+        )
+
+    @STAT_REGISTRY.intermediate("opponentPointsScoredByTeam")
+    def __calculateOpponentPointsScoredByTeam(self) -> dict[str, Deci]:
+        return PointsScoredYearCalculator._getPointsScoredByTeam(
+            self.__year, self.__filters, opponentScores=True, **self.__kwargs
+        )
+
+    @STAT_REGISTRY.stat(
+        "opponentPointsScored",
+        inputs=("opponentPointsScoredByTeam", "numberOfGamesPlayed"),
+    )
+    def __calculateOpponentPointsScored(
+        self,
+        teamIdAndOpponentPointsScored: dict[str, Deci],
+        teamIdAndNumberOfGamesPlayed: dict[str, int],
+    ) -> dict[str, Optional[Deci]]:
+        return self.__setToNoneIfNoGamesPlayed(
+            dict(teamIdAndOpponentPointsScored), teamIdAndNumberOfGamesPlayed
+        )
+
+    @STAT_REGISTRY.stat(
+        "opponentPointsScoredPerGame",
+        inputs=("opponentPointsScored", "numberOfGamesPlayed"),
+    )
+    def __calculateOpponentPointsScoredPerGame(
+        self,
+        teamIdAndOpponentPointsScored: dict[str, Optional[Deci]],
+        teamIdAndNumberOfGamesPlayed: dict[str, int],
+    ) -> dict[str, Optional[Deci]]:
+        return self.__divideByGamesPlayed(
+            teamIdAndOpponentPointsScored, teamIdAndNumberOfGamesPlayed
+        )
+
+    #################
+    # SCORING SHARE #
+    #################
+
+    def __calculateScoringShareFromPointsScored(
+        self, teamIdAndPointsScored: dict[str, Optional[Deci]]
+    ) -> dict[str, Optional[Deci]]:
+        allScores = GeneralUtil.filter(value=None, list_=teamIdAndPointsScored.values())
+        totalPointsScoredInYear = sum(allScores)
+        teamIdAndScoringShare = dict()
+        for teamId in self.__teamIds:
+            if len(allScores) == 0 or teamIdAndPointsScored[teamId] is None:
+                teamIdAndScoringShare[teamId] = None
+            else:
+                # avoid division by 0
+                if totalPointsScoredInYear == 0:
+                    teamIdAndScoringShare[teamId] = Deci("0")
+                else:
+                    teamIdAndScoringShare[teamId] = (
+                        teamIdAndPointsScored[teamId] / totalPointsScoredInYear
+                    ) * Deci(100)
+        return teamIdAndScoringShare
+
+    @STAT_REGISTRY.stat("scoringShare", inputs=("pointsScored",))
+    def __calculateScoringShare(
+        self, teamIdAndPointsScored: dict[str, Optional[Deci]]
+    ) -> dict[str, Optional[Deci]]:
+        return self.__calculateScoringShareFromPointsScored(teamIdAndPointsScored)
+
+    @STAT_REGISTRY.stat("opponentScoringShare", inputs=("opponentPointsScored",))
+    def __calculateOpponentScoringShare(
+        self, teamIdAndOpponentPointsScored: dict[str, Optional[Deci]]
+    ) -> dict[str, Optional[Deci]]:
+        return self.__calculateScoringShareFromPointsScored(
+            teamIdAndOpponentPointsScored
+        )
+
+    @STAT_REGISTRY.intermediate("maxScoringShareByTeam")
+    def __calculateMaxScoringShareByTeam(self) -> dict[str, Deci]:
+        return ScoringShareYearCalculator._getMaxScoringShareByTeam(
+            self.__year, self.__filters, **self.__kwargs
+        )
+
+    @STAT_REGISTRY.stat(
+        "maxScoringShare", inputs=("maxScoringShareByTeam", "numberOfGamesPlayed")
+    )
+    def __calculateMaxScoringShare(
+        self,
+        teamIdAndMaxScoringShare: dict[str, Deci],
+        teamIdAndNumberOfGamesPlayed: dict[str, int],
+    ) -> dict[str, Optional[Deci]]:
+        return self.__setToNoneIfNoGamesPlayed(
+            dict(teamIdAndMaxScoringShare), teamIdAndNumberOfGamesPlayed
+        )
+
+    @STAT_REGISTRY.intermediate("minScoringShareByTeam")
+    def __calculateMinScoringShareByTeam(self) -> dict[str, Optional[Deci]]:
+        return ScoringShareYearCalculator._getMinScoringShareByTeam(
+            self.__year, self.__filters, **self.__kwargs
+        )
+
+    @STAT_REGISTRY.stat(
+        "minScoringShare", inputs=("minScoringShareByTeam", "numberOfGamesPlayed")
+    )
+    def __calculateMinScoringShare(
+        self,
+        teamIdAndMinScoringShare: dict[str, Optional[Deci]],
+        teamIdAndNumberOfGamesPlayed: dict[str, int],
+    ) -> dict[str, Optional[Deci]]:
+        return self.__setToNoneIfNoGamesPlayed(
+            dict(teamIdAndMinScoringShare), teamIdAndNumberOfGamesPlayed
+        )
+
+    ################
+    # SINGLE SCORE #
+    ################
+
+    @STAT_REGISTRY.intermediate("maxScoreByTeam")
+    def __calculateMaxScoreByTeam(self) -> dict[str, Optional[float | int]]:
+        return SingleScoreYearCalculator._getSingleScores(
+            self.__year, self.__filters, maxScore=True, **self.__kwargs
+        )
+
+    @STAT_REGISTRY.stat("maxScore", inputs=("maxScoreByTeam",))
+    def __calculateMaxScore(
+        self, teamIdAndMaxScore: dict[str, Optional[float | int]]
+    ) -> dict[str, Optional[float | int]]:
+        return dict(teamIdAndMaxScore)
+
+    @STAT_REGISTRY.intermediate("minScoreByTeam")
+    def __calculateMinScoreByTeam(self) -> dict[str, Optional[float | int]]:
+        return SingleScoreYearCalculator._getSingleScores(
+            self.__year, self.__filters, maxScore=False, **self.__kwargs
+        )
+
+    @STAT_REGISTRY.stat("minScore", inputs=("minScoreByTeam",))
+    def __calculateMinScore(
+        self, teamIdAndMinScore: dict[str, Optional[float | int]]
+    ) -> dict[str, Optional[float | int]]:
+        return dict(teamIdAndMinScore)
+
+    ##############################
+    # SCORING STANDARD DEVIATION #
+    ##############################
+
+    @STAT_REGISTRY.intermediate("scoringStandardDeviationByTeam")
+    def __calculateScoringStandardDeviationByTeam(self) -> dict[str, Optional[Deci]]:
+        return (
+            ScoringStandardDeviationYearCalculator._getScoringStandardDeviationByTeam(
+                self.__year, self.__filters, **self.__kwargs
+            )
+        )
+
+    @STAT_REGISTRY.stat(
+        "scoringStandardDeviation", inputs=("scoringStandardDeviationByTeam",)
+    )
+    def __calculateScoringStandardDeviation(
+        self, teamIdAndScoringStandardDeviation: dict[str, Optional[Deci]]
+    ) -> dict[str, Optional[Deci]]:
+        self.__checkMultiWeekMatchupsAreIncluded()
+        return dict(teamIdAndScoringStandardDeviation)
+
+    ##############
+    # PLUS MINUS #
+    ##############
+
+    @STAT_REGISTRY.stat(
+        "plusMinus",
+        inputs=("pointsScored", "opponentPointsScored", "numberOfGamesPlayed"),
+    )
+    def __calculatePlusMinus(
+        self,
+        teamIdAndPointsScored: dict[str, Optional[Deci]],
+        teamIdAndOpponentPointsScored: dict[str, Optional[Deci]],
+        teamIdAndNumberOfGamesPlayed: dict[str, int],
+    ) -> dict[str, Optional[Deci]]:
+        if NumericSettings.useFixedPoint(**self.__kwargs):
+            return self.__setToNoneIfNoGamesPlayed(
+                PlusMinusYearCalculator._getPlusMinusWithFixedPoint(
+                    self.__year, self.__filters, **self.__kwargs
+                ),
+                teamIdAndNumberOfGamesPlayed,
+            )
+
+        teamIdAndPlusMinus = dict()
+        for teamId in self.__teamIds:
+            pointsScored = teamIdAndPointsScored[teamId]
+            opponentPointsScored = teamIdAndOpponentPointsScored[teamId]
+            if None in (pointsScored, opponentPointsScored):
+                teamIdAndPlusMinus[teamId] = None
+            else:
+                teamIdAndPlusMinus[teamId] = pointsScored - opponentPointsScored
+        return teamIdAndPlusMinus
+
+    #######
+    # SSL #
+    #######
+
+    def __calculateTeamScoreFromStats(
+        self,
+        teamIdAndWinsPerGame: dict[str, Optional[Deci]],
+        teamIdAndScoringShare: dict[str, Optional[Deci]],
+        teamIdAndMaxScore: dict[str, Optional[float | int]],
+        teamIdAndMinScore: dict[str, Optional[float | int]],
+    ) -> dict[str, Optional[Deci]]:
+        return {
+            teamId: SSLYearCalculator._getTeamScoreFromStats(
+                teamIdAndWinsPerGame[teamId],
+                teamIdAndScoringShare[teamId],
+                teamIdAndMaxScore[teamId],
+                teamIdAndMinScore[teamId],
+            )
+            for teamId in self.__teamIds
+        }
+
+    @STAT_REGISTRY.stat(
+        "teamScore", inputs=("awalPerGame", "scoringShare", "maxScore", "minScore")
+    )
+    def __calculateTeamScore(self, *stats: dict) -> dict[str, Optional[Deci]]:
+        return self.__calculateTeamScoreFromStats(*stats)
+
+    @STAT_REGISTRY.stat(
+        "teamSuccess", inputs=("walPerGame", "scoringShare", "maxScore", "minScore")
+    )
+    def __calculateTeamSuccess(self, *stats: dict) -> dict[str, Optional[Deci]]:
+        return self.__calculateTeamScoreFromStats(*stats)
+
+    @STAT_REGISTRY.stat("teamLuck", inputs=("teamScore", "teamSuccess"))
+    def __calculateTeamLuck(
+        self,
+        teamIdAndTeamScore: dict[str, Optional[Deci]],
+        teamIdAndTeamSuccess: dict[str, Optional[Deci]],
+    ) -> dict[str, Optional[Deci]]:
+        teamIdAndTeamLuck = dict()
+        for teamId in self.__teamIds:
+            teamScore = teamIdAndTeamScore[teamId]
+            teamSuccess = teamIdAndTeamSuccess[teamId]
+            if None in (teamScore, teamSuccess):
+                teamIdAndTeamLuck[teamId] = None
+            else:
+                teamIdAndTeamLuck[teamId] = teamSuccess - teamScore
+        return teamIdAndTeamLuck
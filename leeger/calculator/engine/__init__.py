@@ -0,0 +1,6 @@
+from .AllTimeStatEngine import AllTimeStatEngine
+from .EloRatingEngine import EloRatingEngine
+from .StatEngine import StatEngine
+from .StatNode import StatNode
+from .StatRegistry import StatRegistry
+from .YearStatEngine import YearStatEngine
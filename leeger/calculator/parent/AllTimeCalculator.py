@@ -1,12 +1,15 @@
 from typing import Optional
 
+from leeger.calculator.parent.YearCalculator import YearCalculator
 from leeger.model.filter import YearFilters
 from leeger.model.filter.AllTimeFilters import AllTimeFilters
+from leeger.model.frame.ScoresAggregate import ScoresAggregate
 from leeger.model.league.League import League
 from leeger.model.league.Matchup import Matchup
 from leeger.util.Deci import Deci
 from leeger.util.navigator import MatchupNavigator
 from leeger.util.navigator.LeagueNavigator import LeagueNavigator
+from leeger.util.YearExecutor import YearExecutor
 
 
 class AllTimeCalculator:
@@ -33,8 +36,20 @@ class AllTimeCalculator:
         NOTE2: If ALL results for an Owner are None, the response will have None for that Owner. If only SOME results are None, then the None results will be ignored.
         """
 
-        allResultDicts = cls.__getAllResultDicts(league, function, **kwargs)
+        return cls._combineResults(
+            league, cls.__getAllResultDicts(league, function, **kwargs)
+        )
 
+    @classmethod
+    def _combineResults(
+        cls,
+        league: League,
+        allResultDicts: list[dict[str, Optional[int | float | Deci]]],
+    ) -> dict[str, Optional[int | float | Deci]]:
+        """
+        Sums the given results (keyed by team ID) for each Owner in the given League, in the order they are given.
+        If ALL results for an Owner are None, the response will have None for that Owner. If only SOME results are None, then the None results will be ignored.
+        """
         # this will keep track of whether an Owner has had a non-None result
         ownerIdAndWhetherOwnerHasHadAValidResult: dict[str, bool] = dict()
 
@@ -46,15 +61,16 @@ class AllTimeCalculator:
             )
             ownerIdAndWhetherOwnerHasHadAValidResult[ownerId] = False
 
+        leagueIndex = LeagueNavigator.getLeagueIndex(league)
         for resultDict in allResultDicts:
             # go through each team ID and value to get the owner ID and add to result
             for teamId in resultDict.keys():
                 # check if this is a valid result
                 if resultDict[teamId] is None:
                     continue
-                team = LeagueNavigator.getTeamById(league, teamId)
-                result[team.ownerId] += resultDict[teamId]
-                ownerIdAndWhetherOwnerHasHadAValidResult[team.ownerId] = True
+                ownerId = leagueIndex.getOwnerIdByTeamId(teamId)
+                result[ownerId] += resultDict[teamId]
+                ownerIdAndWhetherOwnerHasHadAValidResult[ownerId] = True
 
         # set None for each Owner that did not have a single valid result
         for ownerId in ownerIdAndWhetherOwnerHasHadAValidResult:
@@ -107,24 +123,9 @@ class AllTimeCalculator:
                     # this year is in our year range, include every week in this year
                     yearWeekNumberStartWeekNumberEnd.append((year, 1, len(year.weeks)))
 
-        allResultDicts: list[dict] = list()
-
-        for yse in yearWeekNumberStartWeekNumberEnd:
-            currentYear = yse[0]
-            currentWeekNumberStart = yse[1]
-            currentWeekNumberEnd = yse[2]
-            allResultDicts.append(
-                function(
-                    currentYear,
-                    onlyChampionship=allTimeFilters.onlyChampionship,
-                    onlyPostSeason=allTimeFilters.onlyPostSeason,
-                    onlyRegularSeason=allTimeFilters.onlyRegularSeason,
-                    weekNumberStart=currentWeekNumberStart,
-                    weekNumberEnd=currentWeekNumberEnd,
-                    validate=kwargs.get("validate", True),
-                )
-            )
-        return allResultDicts
+        return cls.__callForEachYear(
+            function, yearWeekNumberStartWeekNumberEnd, allTimeFilters, **kwargs
+        )
 
     @classmethod
     def _getAllResultDictsByYear(
@@ -170,22 +171,61 @@ class AllTimeCalculator:
                     # this year is in our year range, include every week in this year
                     yearWeekNumberStartWeekNumberEnd.append((year, 1, len(year.weeks)))
 
+        allResults = cls.__callForEachYear(
+            function, yearWeekNumberStartWeekNumberEnd, allTimeFilters, **kwargs
+        )
         allResultDicts: dict[str, dict] = dict()
+        for yse, result in zip(yearWeekNumberStartWeekNumberEnd, allResults):
+            allResultDicts[yse[0].yearNumber] = result
+        return allResultDicts
 
+    @classmethod
+    def __callForEachYear(
+        cls,
+        function: callable,
+        yearWeekNumberStartWeekNumberEnd: list[tuple],
+        allTimeFilters: AllTimeFilters,
+        **kwargs,
+    ) -> list:
+        """
+        Returns the results of calling the given callable with each given Year and week range, in the given order.
+        The Years are calculated in other processes if the "workers" or "executor" keyword argument is given.
+        """
+        yearsAndKwargs: list[tuple] = list()
         for yse in yearWeekNumberStartWeekNumberEnd:
             currentYear = yse[0]
             currentWeekNumberStart = yse[1]
             currentWeekNumberEnd = yse[2]
-            allResultDicts[currentYear.yearNumber] = function(
-                currentYear,
-                onlyChampionship=allTimeFilters.onlyChampionship,
-                onlyPostSeason=allTimeFilters.onlyPostSeason,
-                onlyRegularSeason=allTimeFilters.onlyRegularSeason,
-                weekNumberStart=currentWeekNumberStart,
-                weekNumberEnd=currentWeekNumberEnd,
-                validate=kwargs.get("validate", True),
+            yearsAndKwargs.append(
+                (
+                    currentYear,
+                    {
+                        "onlyChampionship": allTimeFilters.onlyChampionship,
+                        "onlyPostSeason": allTimeFilters.onlyPostSeason,
+                        "onlyRegularSeason": allTimeFilters.onlyRegularSeason,
+                        "weekNumberStart": currentWeekNumberStart,
+                        "weekNumberEnd": currentWeekNumberEnd,
+                        "validate": kwargs.get("validate", True),
+                        "numericBackend": kwargs.get("numericBackend"),
+                        "fixedPointScale": kwargs.get("fixedPointScale"),
+                    },
+                )
             )
-        return allResultDicts
+        return YearExecutor.callForEachYear(function, yearsAndKwargs, **kwargs)
+
+    @classmethod
+    def _getScoresAggregate(cls, league: League, **kwargs) -> ScoresAggregate:
+        """
+        Returns a ScoresAggregate (keyed by Owner ID) for the Matchups in the given League that are remaining after the filters in kwargs are applied.
+        Multi-week matchups are combined into a single Matchup.
+        The ScoresAggregate of each Year is only built once, so this is merged from the ScoresAggregates that have already been built for each Year.
+        """
+        yearNumberAndScoresAggregate = cls._getAllResultDictsByYear(
+            league, YearCalculator._getScoresAggregate, **kwargs
+        )
+        return ScoresAggregate.merge(
+            list(yearNumberAndScoresAggregate.values())
+        ).mapIds(LeagueNavigator.getLeagueIndex(league).teamIdToOwnerId)
 
     @classmethod
     def _getAllFilteredMatchups(
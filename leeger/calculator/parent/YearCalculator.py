@@ -1,6 +1,7 @@
 from typing import Any
 
 from leeger.model.filter.YearFilters import YearFilters
+from leeger.model.frame.ScoresAggregate import ScoresAggregate
 from leeger.model.league.Matchup import Matchup
 from leeger.model.league.Year import Year
 from leeger.util.navigator.YearNavigator import YearNavigator
@@ -11,6 +12,15 @@ class YearCalculator:
     Should be inherited by all Year calculators
     """
 
+    @classmethod
+    def _getScoresAggregate(cls, year: Year, **kwargs) -> ScoresAggregate:
+        """
+        Returns a ScoresAggregate (keyed by team ID) for the Matchups in the given Year that are remaining after the filters in kwargs are applied.
+        Multi-week matchups are combined into a single Matchup.
+        """
+        filters = YearFilters.getForYear(year, **kwargs)
+        return YearNavigator.getYearFrame(year).getScoresAggregate(filters)
+
     @classmethod
     def _getAllFilteredMatchups(
         cls, year: Year, yearFilters: YearFilters, **kwargs
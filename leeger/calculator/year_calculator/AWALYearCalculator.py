@@ -1,5 +1,7 @@
 from typing import Optional
 
+import numpy
+
 from leeger.calculator.parent.YearCalculator import YearCalculator
 from leeger.calculator.year_calculator.GameOutcomeYearCalculator import (
     GameOutcomeYearCalculator,
@@ -12,6 +14,7 @@ from leeger.util.Deci import Deci
 from leeger.util.GeneralUtil import GeneralUtil
 from leeger.util.navigator.WeekNavigator import WeekNavigator
 from leeger.util.navigator.YearNavigator import YearNavigator
+from leeger.util.NumericSettings import NumericSettings
 
 
 class AWALYearCalculator(YearCalculator):
@@ -19,6 +22,153 @@ class AWALYearCalculator(YearCalculator):
     Used to calculate all AWAL stats.
     """
 
+    @staticmethod
+    def __getAWALOfEachScore(
+        teamsOutscored: numpy.ndarray,
+        teamsTied: numpy.ndarray,
+        scoresInWeek: numpy.ndarray,
+        **kwargs,
+    ) -> numpy.ndarray | list[Deci]:
+        """
+        Returns the AWAL earned by each score (as 64-bit floats if the float backend is used).
+        """
+        if NumericSettings.useFloat(**kwargs):
+            opponentsInWeek = scoresInWeek - 1
+            return teamsOutscored * (1 / opponentsInWeek) + teamsTied * (
+                0.5 / opponentsInWeek
+            )
+
+        # many scores will earn the same AWAL in a week, so only calculate each unique result once
+        outscoredTiedAndOpponentsToAWAL: dict[tuple[int, int, int], Deci] = dict()
+        allAWAL = list()
+        for outscoredTiedAndOpponents in zip(
+            teamsOutscored.tolist(), teamsTied.tolist(), (scoresInWeek - 1).tolist()
+        ):
+            awal = outscoredTiedAndOpponentsToAWAL.get(outscoredTiedAndOpponents)
+            if awal is None:
+                outscored, tied, opponentsInWeek = outscoredTiedAndOpponents
+                awal = (Deci(outscored) * (Deci(1) / Deci(opponentsInWeek))) + (
+                    Deci(tied) * (Deci(0.5) / Deci(opponentsInWeek))
+                )
+                outscoredTiedAndOpponentsToAWAL[outscoredTiedAndOpponents] = awal
+            allAWAL.append(awal)
+        return allAWAL
+
+    @classmethod
+    def _getAWALFromWeeks(
+        cls, year: Year, filters: YearFilters, *, opponentScores: bool, **kwargs
+    ) -> dict[str, Deci]:
+        """
+        Returns the AWAL each team (or each team's opponent) earned in the weeks remaining after the given filters are applied.
+        League median wins are not included.
+        """
+        yearFrame = YearNavigator.getYearFrame(year)
+        teamIndexes, teamsOutscored, teamsTied, scoresInWeek = (
+            yearFrame.getWeekRankings(filters).getRankingOfEachScore(
+                opponentScores=opponentScores
+            )
+        )
+        allAWAL = cls.__getAWALOfEachScore(
+            teamsOutscored, teamsTied, scoresInWeek, **kwargs
+        )
+
+        if NumericSettings.useFloat(**kwargs):
+            return yearFrame.toTeamIdDict(
+                [
+                    Deci(awal)
+                    for awal in yearFrame.countByTeam(teamIndexes, allAWAL).tolist()
+                ]
+            )
+
+        teamIdAndAWAL = dict()
+        for teamId in yearFrame.teamIds:
+            teamIdAndAWAL[teamId] = Deci(0)
+        for teamIndex, awal in zip(teamIndexes.tolist(), allAWAL):
+            teamIdAndAWAL[yearFrame.teamIds[teamIndex]] += awal
+        return teamIdAndAWAL
+
+    @classmethod
+    def _getAWALOfEachWeek(
+        cls, year: Year, filters: YearFilters, *, opponentScores: bool, **kwargs
+    ) -> list[list[tuple[int, float | Deci]]]:
+        """
+        Returns the team index and AWAL of each score (or each opponent's score) in each week from the start to the end of the given filters, in the order they were played.
+        AWAL is a 64-bit float if the float backend is used.
+        Adding up a team's AWAL in order (starting from 0) gives exactly what _getAWALFromWeeks() returns for those weeks.
+        """
+        yearFrame = YearNavigator.getYearFrame(year)
+        weekRankings = yearFrame.getWeekRankings(filters)
+        teamIndexes, teamsOutscored, teamsTied, scoresInWeek = (
+            weekRankings.getRankingOfEachScore(opponentScores=opponentScores)
+        )
+        playedByEachWeek = yearFrame.countPlayedByEachWeek(
+            numpy.repeat(weekRankings.weekIndex[weekRankings.weekPosition], 2),
+            filters.weekNumberStart,
+            filters.weekNumberEnd,
+        )
+        allAWAL = cls.__getAWALOfEachScore(
+            teamsOutscored, teamsTied, scoresInWeek, **kwargs
+        )
+        if NumericSettings.useFloat(**kwargs):
+            allAWAL = allAWAL.tolist()
+        teamIndexes = teamIndexes.tolist()
+
+        awalOfEachWeek = list()
+        played = 0
+        for playedByWeek in playedByEachWeek:
+            awalOfEachWeek.append(
+                list(
+                    zip(teamIndexes[played:playedByWeek], allAWAL[played:playedByWeek])
+                )
+            )
+            played = playedByWeek
+        return awalOfEachWeek
+
+    @classmethod
+    def _getAWALFromWeeksAfterEachWeek(
+        cls, year: Year, filters: YearFilters, *, opponentScores: bool, **kwargs
+    ) -> list[dict[str, Deci]]:
+        """
+        Returns what _getAWALFromWeeks() returns for each week from the start to the end of the given filters as the last week.
+        Each score's AWAL only depends on its own week, so every score is only looked at once.
+        """
+        yearFrame = YearNavigator.getYearFrame(year)
+        weekRankings = yearFrame.getWeekRankings(filters)
+        teamIndexes, teamsOutscored, teamsTied, scoresInWeek = (
+            weekRankings.getRankingOfEachScore(opponentScores=opponentScores)
+        )
+        playedByEachWeek = yearFrame.countPlayedByEachWeek(
+            numpy.repeat(weekRankings.weekIndex[weekRankings.weekPosition], 2),
+            filters.weekNumberStart,
+            filters.weekNumberEnd,
+        )
+        allAWAL = cls.__getAWALOfEachScore(
+            teamsOutscored, teamsTied, scoresInWeek, **kwargs
+        )
+
+        if NumericSettings.useFloat(**kwargs):
+            return [
+                yearFrame.toTeamIdDict([Deci(awal) for awal in awalByTeam.tolist()])
+                for awalByTeam in yearFrame.countByTeamAfterEachWeek(
+                    teamIndexes, playedByEachWeek, allAWAL
+                )
+            ]
+
+        teamIdAndAWALAfterEachWeek = list()
+        teamIdAndAWAL = dict()
+        for teamId in yearFrame.teamIds:
+            teamIdAndAWAL[teamId] = Deci(0)
+        teamIndexes = teamIndexes.tolist()
+        played = 0
+        for playedByWeek in playedByEachWeek:
+            for teamIndex, awal in zip(
+                teamIndexes[played:playedByWeek], allAWAL[played:playedByWeek]
+            ):
+                teamIdAndAWAL[yearFrame.teamIds[teamIndex]] += awal
+            teamIdAndAWALAfterEachWeek.append(dict(teamIdAndAWAL))
+            played = playedByWeek
+        return teamIdAndAWALAfterEachWeek
+
     @classmethod
     @validateYear
     def getAWAL(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
@@ -47,44 +197,10 @@ class AWALYearCalculator(YearCalculator):
         """
         filters = YearFilters.getForYear(year, **kwargs)
 
-        teamIdAndAWAL = dict()
+        teamIdAndAWAL = cls._getAWALFromWeeks(
+            year, filters, opponentScores=False, **kwargs
+        )
         allTeamIds = YearNavigator.getAllTeamIds(year)
-        for teamId in allTeamIds:
-            teamIdAndAWAL[teamId] = Deci(0)
-
-        for i in range(filters.weekNumberStart - 1, filters.weekNumberEnd):
-            week = year.weeks[i]
-            opponentsInWeek = (
-                WeekNavigator.getNumberOfValidTeamsInWeek(
-                    week, WeekFilters(includeMatchupTypes=filters.includeMatchupTypes)
-                )
-                - 1
-            )
-            teamsOutscored = dict()
-            teamsTied = dict()
-            for teamId in allTeamIds:
-                teamsOutscored[teamId] = 0
-                teamsTied[teamId] = 0
-            allTeamIdsAndScoresForWeek = WeekNavigator.getTeamIdsAndScores(
-                week, WeekFilters(includeMatchupTypes=filters.includeMatchupTypes)
-            )
-            allScores = allTeamIdsAndScoresForWeek.values()
-
-            for teamId in allTeamIdsAndScoresForWeek.keys():
-                teamsOutscored[teamId] = 0
-                teamsTied[teamId] = 0
-                score = allTeamIdsAndScoresForWeek[teamId]
-                for s in allScores:
-                    if score > s:
-                        teamsOutscored[teamId] += 1
-                    if score == s:
-                        teamsTied[teamId] += 1
-                # remove 1 from the teamsTied tracker since we will always find a tie for this team's score in the list of all scores in the week
-                teamsTied[teamId] -= 1
-                # calculate the AWAL for each team for this week
-                teamIdAndAWAL[teamId] += (
-                    Deci(teamsOutscored[teamId]) * (Deci(1) / Deci(opponentsInWeek))
-                ) + (Deci(teamsTied[teamId]) * (Deci(0.5) / Deci(opponentsInWeek)))
 
         # add league median wins if applicable
         if year.yearSettings.leagueMedianGames:
@@ -152,46 +268,10 @@ class AWALYearCalculator(YearCalculator):
         """
         filters = YearFilters.getForYear(year, **kwargs)
 
-        teamIdAndOpponentAWAL = dict()
+        teamIdAndOpponentAWAL = cls._getAWALFromWeeks(
+            year, filters, opponentScores=True, **kwargs
+        )
         allTeamIds = YearNavigator.getAllTeamIds(year)
-        for teamId in allTeamIds:
-            teamIdAndOpponentAWAL[teamId] = Deci(0)
-
-        for i in range(filters.weekNumberStart - 1, filters.weekNumberEnd):
-            week = year.weeks[i]
-            opponentsInWeek = (
-                WeekNavigator.getNumberOfValidTeamsInWeek(
-                    week, WeekFilters(includeMatchupTypes=filters.includeMatchupTypes)
-                )
-                - 1
-            )
-            teamsOutscored = dict()
-            teamsTied = dict()
-            for teamId in allTeamIds:
-                teamsOutscored[teamId] = 0
-                teamsTied[teamId] = 0
-            allTeamIdsAndOpponentScoresForWeek = (
-                WeekNavigator.getTeamIdsAndOpponentScores(
-                    week, WeekFilters(includeMatchupTypes=filters.includeMatchupTypes)
-                )
-            )
-            allScores = allTeamIdsAndOpponentScoresForWeek.values()
-
-            for teamId in allTeamIdsAndOpponentScoresForWeek.keys():
-                teamsOutscored[teamId] = 0
-                teamsTied[teamId] = 0
-                score = allTeamIdsAndOpponentScoresForWeek[teamId]
-                for s in allScores:
-                    if score > s:
-                        teamsOutscored[teamId] += 1
-                    if score == s:
-                        teamsTied[teamId] += 1
-                # remove 1 from the teamsTied tracker since we will always find a tie for this team's score in the list of all scores in the week
-                teamsTied[teamId] -= 1
-                # calculate the AWAL for each team's opponent for this week
-                teamIdAndOpponentAWAL[teamId] += (
-                    Deci(teamsOutscored[teamId]) * (Deci(1) / Deci(opponentsInWeek))
-                ) + (Deci(teamsTied[teamId]) * (Deci(0.5) / Deci(opponentsInWeek)))
 
         # add league median wins if applicable
         if year.yearSettings.leagueMedianGames:
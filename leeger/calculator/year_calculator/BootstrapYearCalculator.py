@@ -0,0 +1,198 @@
+from typing import Any, Optional
+
+import numpy
+
+from leeger.calculator.parent.YearCalculator import YearCalculator
+from leeger.calculator.year_calculator.AWALYearCalculator import AWALYearCalculator
+from leeger.calculator.year_calculator.PointsScoredYearCalculator import (
+    PointsScoredYearCalculator,
+)
+from leeger.calculator.year_calculator.SmartWinsYearCalculator import (
+    SmartWinsYearCalculator,
+)
+from leeger.calculator.year_calculator.SSLYearCalculator import SSLYearCalculator
+from leeger.decorator.validators import validateYear
+from leeger.enum.MatchupType import MatchupType
+from leeger.model.filter import YearFilters
+from leeger.model.league.Year import Year
+from leeger.model.stat.BootstrapConfidenceIntervals import (
+    BootstrapConfidenceIntervals,
+)
+from leeger.model.stat.ConfidenceInterval import ConfidenceInterval
+from leeger.util.Deci import Deci
+from leeger.util.GeneralUtil import GeneralUtil
+from leeger.util.navigator.YearNavigator import YearNavigator
+from leeger.util.StatBootstrapper import StatBootstrapper
+
+
+class BootstrapYearCalculator(YearCalculator):
+    """
+    Used to calculate bootstrap confidence intervals for per game team stats.
+
+    Each team's games are resampled with replacement many times, and the stat is found for every resample.
+    The interval is the range the middle (confidence level) share of those resampled stats fall in.
+    Every resample is drawn at once as NumPy array operations with a seedable random number generator,
+    instead of building and calculating a new Year for each one.
+    """
+
+    @staticmethod
+    def __validateConfidenceLevel(confidenceLevel: Any) -> float:
+        if type(confidenceLevel) is not float:
+            raise ValueError(
+                f"'confidenceLevel' must be type 'float', not '{type(confidenceLevel).__name__}'."
+            )
+        if not 0 < confidenceLevel < 1:
+            raise ValueError("'confidenceLevel' must be between 0 and 1.")
+        return confidenceLevel
+
+    @classmethod
+    def __getStatBootstrapper(
+        cls, year: Year, filters: YearFilters
+    ) -> StatBootstrapper:
+        """
+        Returns a StatBootstrapper for every score in the Matchups remaining after the given filters are applied.
+        """
+        yearFrame = YearNavigator.getYearFrame(year)
+        weekRankings = yearFrame.getWeekRankings(filters)
+        scoreTeamIndexes, scoresBeat, scoresTied, scoresInWeek = (
+            weekRankings.getRankingOfEachScore()
+        )
+        rows = numpy.repeat(weekRankings.rows, 2)
+        scores = numpy.column_stack(
+            (
+                yearFrame.teamAScore[weekRankings.rows],
+                yearFrame.teamBScore[weekRankings.rows],
+            )
+        ).ravel()
+        awal = (scoresBeat + scoresTied / 2) / (scoresInWeek - 1)
+        awalGames = numpy.ones(len(scores))
+        if yearFrame.leagueMedianGames:
+            # regular season games also count as a league median game, and league median wins are only given in regular season weeks
+            weekPositions = numpy.repeat(weekRankings.weekPosition, 2)
+            leagueMedianScores = weekRankings.medianScore[weekPositions]
+            isRegularSeasonWeek = yearFrame.regularSeasonWeeks[
+                weekRankings.weekIndex[weekPositions]
+            ]
+            awal = awal + isRegularSeasonWeek * (
+                (scores > leagueMedianScores) + (scores == leagueMedianScores) / 2
+            )
+            awalGames = awalGames + (
+                yearFrame.matchupTypeCode[rows]
+                == yearFrame.MATCHUP_TYPE_CODES[MatchupType.REGULAR_SEASON]
+            )
+
+        simplifiedMatchups = yearFrame.simplifyMultiWeekMatchups(
+            yearFrame.getRows(filters)
+        )
+        gameTeamIndexes = numpy.column_stack(
+            (simplifiedMatchups.teamAIndex, simplifiedMatchups.teamBIndex)
+        ).ravel()
+        gameScores = numpy.column_stack(
+            (simplifiedMatchups.teamAScoreValue, simplifiedMatchups.teamBScoreValue)
+        ).ravel()
+        smartWins = YearNavigator.getSortedScores(year).getSmartWinsAsFloats(
+            gameScores.tolist()
+        )
+
+        return StatBootstrapper(
+            numberOfTeams=yearFrame.numberOfTeams,
+            scoreTeamIndexes=scoreTeamIndexes,
+            scores=scores.astype(numpy.float64),
+            awal=awal,
+            awalGames=awalGames,
+            gameTeamIndexes=gameTeamIndexes,
+            smartWins=smartWins,
+            teamScoreMultipliers=(
+                SSLYearCalculator.AWAL_AND_WAL_PER_GAME_MULTIPLIER,
+                SSLYearCalculator.SCORING_SHARE_MULTIPLIER,
+                SSLYearCalculator.MAX_AND_MIN_SCORE_MULTIPLIER,
+            ),
+        )
+
+    @classmethod
+    @validateYear
+    def getConfidenceIntervals(
+        cls,
+        year: Year,
+        numberOfResamples: int = 10_000,
+        *,
+        confidenceLevel: float = 0.95,
+        seed: Optional[int] = None,
+        workers: int = 1,
+        **kwargs,
+    ) -> BootstrapConfidenceIntervals:
+        """
+        Returns the Points Scored per game, AWAL per game, Smart Wins per game and Team Score of each team in the given Year,
+        each with a bootstrap confidence interval.
+
+        Each estimate is exactly what the calculator for that stat returns.
+        Each interval is found from numberOfResamples resamples of the team's games, where multi-week matchups are resampled as a single game
+        for Smart Wins per game (the same way they are counted for that stat).
+        Team Score resamples are found with every other team's scores as they actually were.
+        Give a seed to get the same results every time, and give more than 1 worker to run the resamples in that many processes.
+        The results for a seed are the same no matter how many workers are used.
+
+        Example response:
+            BootstrapConfidenceIntervals(
+                numberOfResamples=10000,
+                confidenceLevel=Deci("0.95"),
+                pointsScoredPerGame={"someTeamId": ConfidenceInterval(estimate=Deci("112.4"), lower=Deci("103.9"), upper=Deci("120.8")), ...},
+                awalPerGame={"someTeamId": ConfidenceInterval(estimate=Deci("0.61"), lower=Deci("0.47"), upper=Deci("0.74")), ...},
+                smartWinsPerGame={"someTeamId": ConfidenceInterval(estimate=Deci("0.59"), lower=Deci("0.45"), upper=Deci("0.72")), ...},
+                teamScore={"someTeamId": ConfidenceInterval(estimate=Deci("88.3"), lower=Deci("74.1"), upper=Deci("101.6")), ...},
+            )
+        """
+        numberOfResamples = GeneralUtil.validatePositiveInt(
+            numberOfResamples, "numberOfResamples"
+        )
+        workers = GeneralUtil.validatePositiveInt(workers, "workers")
+        confidenceLevel = cls.__validateConfidenceLevel(confidenceLevel)
+        yearFrame = YearNavigator.getYearFrame(year)
+        filters = YearFilters.getForYear(year, **kwargs)
+
+        resampledStats = cls.__getStatBootstrapper(year, filters).simulate(
+            numberOfResamples, seed=seed, workers=workers
+        )
+        kwargs["validate"] = False
+        estimates = (
+            PointsScoredYearCalculator.getPointsScoredPerGame(year, **kwargs),
+            AWALYearCalculator.getAWALPerGame(year, **kwargs),
+            SmartWinsYearCalculator.getSmartWinsPerGame(year, **kwargs),
+            SSLYearCalculator.getTeamScore(year, **kwargs),
+        )
+
+        def toConfidenceIntervals(
+            teamIdAndEstimate: dict[str, Optional[Deci]], resamples: numpy.ndarray
+        ) -> dict[str, Optional[ConfidenceInterval]]:
+            lowerBounds, upperBounds = numpy.quantile(
+                resamples,
+                [(1 - confidenceLevel) / 2, (1 + confidenceLevel) / 2],
+                axis=0,
+            ).tolist()
+            return {
+                teamId: (
+                    None
+                    if teamIdAndEstimate[teamId] is None
+                    else ConfidenceInterval(
+                        estimate=teamIdAndEstimate[teamId],
+                        lower=Deci(lowerBound),
+                        upper=Deci(upperBound),
+                    )
+                )
+                for teamId, lowerBound, upperBound in zip(
+                    yearFrame.teamIds, lowerBounds, upperBounds
+                )
+            }
+
+        pointsScoredPerGame, awalPerGame, smartWinsPerGame, teamScore = (
+            toConfidenceIntervals(teamIdAndEstimate, resamples)
+            for teamIdAndEstimate, resamples in zip(estimates, resampledStats)
+        )
+        return BootstrapConfidenceIntervals(
+            numberOfResamples=numberOfResamples,
+            confidenceLevel=Deci(confidenceLevel),
+            pointsScoredPerGame=pointsScoredPerGame,
+            awalPerGame=awalPerGame,
+            smartWinsPerGame=smartWinsPerGame,
+            teamScore=teamScore,
+        )
@@ -1,5 +1,7 @@
 from typing import Optional
 
+import numpy
+
 from leeger.calculator.parent.YearCalculator import YearCalculator
 from leeger.decorator.validators import validateYear
 from leeger.model.filter import YearFilters
@@ -8,6 +10,7 @@ from leeger.model.league.Year import Year
 from leeger.util.Deci import Deci
 from leeger.util.navigator.MatchupNavigator import MatchupNavigator
 from leeger.util.navigator.YearNavigator import YearNavigator
+from leeger.util.NumericSettings import NumericSettings
 
 
 class GameOutcomeYearCalculator(YearCalculator):
@@ -15,6 +18,153 @@ class GameOutcomeYearCalculator(YearCalculator):
     Used to calculate all game outcomes.
     """
 
+    @staticmethod
+    def __getLeagueMedianOutcomeOfEachScore(
+        year: Year, filters: YearFilters, *, opponentScores: bool
+    ) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the team index, week index, whether it was a league median win and whether it was a league median tie
+        for every score (or every opponent's score) in the weeks remaining after the given filters are applied.
+        Scores are in the order they were played, with team A's score coming before team B's score.
+        """
+        yearFrame = YearNavigator.getYearFrame(year)
+        weekRankings = yearFrame.getWeekRankings(filters)
+        teamIndexes = numpy.column_stack(
+            (weekRankings.teamAIndex, weekRankings.teamBIndex)
+        ).ravel()
+        scores = numpy.column_stack(
+            (
+                yearFrame.teamBScore[weekRankings.rows],
+                yearFrame.teamAScore[weekRankings.rows],
+            )
+            if opponentScores
+            else (
+                yearFrame.teamAScore[weekRankings.rows],
+                yearFrame.teamBScore[weekRankings.rows],
+            )
+        ).ravel()
+        weekPositions = numpy.repeat(weekRankings.weekPosition, 2)
+        weekIndexes = weekRankings.weekIndex[weekPositions]
+        leagueMedianScores = weekRankings.medianScore[weekPositions]
+        # this calculation is only run for regular season weeks
+        isRegularSeasonWeek = yearFrame.regularSeasonWeeks[weekIndexes]
+
+        # teams with a score greater than the league median get a win
+        # team with a score equal to the league median get a tie
+        return (
+            teamIndexes,
+            weekIndexes,
+            isRegularSeasonWeek & (scores > leagueMedianScores),
+            isRegularSeasonWeek & (scores == leagueMedianScores),
+        )
+
+    @staticmethod
+    def _getLeagueMedianWinsFromCounts(
+        year: Year, leagueMedianWins: list[int], leagueMedianTies: list[int]
+    ) -> dict[str, Deci]:
+        """
+        Returns the league median wins for each team from the number of league median wins and ties each team (ordered by team index) has.
+        """
+        yearFrame = YearNavigator.getYearFrame(year)
+        teamIdAndLeagueMedianWins = dict()
+        for teamId, wins, ties in zip(
+            yearFrame.teamIds, leagueMedianWins, leagueMedianTies
+        ):
+            teamIdAndLeagueMedianWins[teamId] = Deci("0") + Deci(wins)
+            # only add ties if there are any, so the result looks the same as adding 0.5 for each tie
+            if ties > 0:
+                teamIdAndLeagueMedianWins[teamId] += Deci("0.5") * ties
+        return teamIdAndLeagueMedianWins
+
+    @classmethod
+    def _getLeagueMedianWinsFromWeeks(
+        cls, year: Year, filters: YearFilters, *, opponentScores: bool
+    ) -> dict[str, Deci]:
+        """
+        Returns the league median wins each team (or each team's opponent) earned in the regular season weeks remaining after the given filters are applied.
+        """
+        yearFrame = YearNavigator.getYearFrame(year)
+        if not year.yearSettings.leagueMedianGames:
+            return {teamId: Deci("0") for teamId in yearFrame.teamIds}
+
+        teamIndexes, _, isWin, isTie = cls.__getLeagueMedianOutcomeOfEachScore(
+            year, filters, opponentScores=opponentScores
+        )
+        return cls._getLeagueMedianWinsFromCounts(
+            year,
+            yearFrame.countByTeam(teamIndexes[isWin]).tolist(),
+            yearFrame.countByTeam(teamIndexes[isTie]).tolist(),
+        )
+
+    @classmethod
+    def _getLeagueMedianWinsAndTiesAfterEachWeek(
+        cls, year: Year, filters: YearFilters, *, opponentScores: bool
+    ) -> tuple[list[list[int]], list[list[int]]]:
+        """
+        Returns the number of league median wins and the number of league median ties each team (or each team's opponent) has (ordered by team index)
+        for each week from the start to the end of the given filters as the last week.
+        Only used for Years with league median games.
+        """
+        yearFrame = YearNavigator.getYearFrame(year)
+        teamIndexes, weekIndexes, isWin, isTie = (
+            cls.__getLeagueMedianOutcomeOfEachScore(
+                year, filters, opponentScores=opponentScores
+            )
+        )
+        leagueMedianWinsAfterEachWeek, leagueMedianTiesAfterEachWeek = (
+            yearFrame.countByTeamAfterEachWeek(
+                teamIndexes[isOutcome],
+                yearFrame.countPlayedByEachWeek(
+                    weekIndexes[isOutcome],
+                    filters.weekNumberStart,
+                    filters.weekNumberEnd,
+                ),
+            ).tolist()
+            for isOutcome in (isWin, isTie)
+        )
+        return leagueMedianWinsAfterEachWeek, leagueMedianTiesAfterEachWeek
+
+    @classmethod
+    def _getLeagueMedianWinsFromWeeksAfterEachWeek(
+        cls, year: Year, filters: YearFilters, *, opponentScores: bool, **kwargs
+    ) -> list[dict[str, Deci]]:
+        """
+        Returns what _getLeagueMedianWinsFromWeeks() returns for each week from the start to the end of the given filters as the last week.
+        """
+        yearFrame = YearNavigator.getYearFrame(year)
+        weekNumbers = range(filters.weekNumberStart, filters.weekNumberEnd + 1)
+        if not year.yearSettings.leagueMedianGames:
+            return [
+                {teamId: Deci("0") for teamId in yearFrame.teamIds} for _ in weekNumbers
+            ]
+
+        return [
+            cls._getLeagueMedianWinsFromCounts(year, leagueMedianWins, leagueMedianTies)
+            for leagueMedianWins, leagueMedianTies in zip(
+                *cls._getLeagueMedianWinsAndTiesAfterEachWeek(
+                    year, filters, opponentScores=opponentScores
+                )
+            )
+        ]
+
+    @classmethod
+    def _getWinsLossesAndTies(
+        cls, year: Year, filters: YearFilters, **kwargs
+    ) -> tuple[dict[str, int], dict[str, int], dict[str, int]]:
+        """
+        Returns the number of wins, losses and ties for each team in the Matchups remaining after the given filters are applied.
+        """
+        yearFrame = YearNavigator.getYearFrame(year)
+        # multi-week matchups are combined into single Matchups
+        wins, losses, ties = yearFrame.countOutcomesByTeam(
+            filters, fixedPointScale=NumericSettings.getFixedPointScaleIfUsed(**kwargs)
+        )
+        return (
+            yearFrame.toTeamIdDict(wins.tolist()),
+            yearFrame.toTeamIdDict(losses.tolist()),
+            yearFrame.toTeamIdDict(ties.tolist()),
+        )
+
     @classmethod
     @validateYear
     def getWins(cls, year: Year, **kwargs) -> dict[str, Optional[int]]:
@@ -32,38 +182,7 @@ class GameOutcomeYearCalculator(YearCalculator):
         """
         filters = YearFilters.getForYear(year, **kwargs)
 
-        teamIdAndWins = dict()
-        for teamId in YearNavigator.getAllTeamIds(year):
-            teamIdAndWins[teamId] = 0
-
-        # keep track of all matchups to count towards this calculation
-        allMatchups = list()
-        # keep track of scores and tiebreakers for multi-week matchups
-        multiWeekMatchupIdToMatchupListMap: dict[str, list[Matchup]] = dict()
-
-        for i in range(filters.weekNumberStart - 1, filters.weekNumberEnd):
-            week = year.weeks[i]
-            for matchup in week.matchups:
-                if matchup.matchupType in filters.includeMatchupTypes:
-                    mwmid = matchup.multiWeekMatchupId
-                    if mwmid is not None:
-                        # multi-week matchup
-                        if mwmid in multiWeekMatchupIdToMatchupListMap:
-                            multiWeekMatchupIdToMatchupListMap[mwmid].append(matchup)
-                        else:
-                            multiWeekMatchupIdToMatchupListMap[mwmid] = [matchup]
-                    else:
-                        # non multi-week matchup
-                        allMatchups.append(matchup)
-
-        # simplify multi-week matchups into single Matchups
-        for matchupList in multiWeekMatchupIdToMatchupListMap.values():
-            allMatchups.append(MatchupNavigator.simplifyMultiWeekMatchups(matchupList))
-        for matchup in allMatchups:
-            # get winner team ID (if this wasn't a tie)
-            winnerTeamId = MatchupNavigator.getTeamIdOfMatchupWinner(matchup)
-            if winnerTeamId is not None:
-                teamIdAndWins[winnerTeamId] += 1
+        teamIdAndWins = cls._getWinsLossesAndTies(year, filters, **kwargs)[0]
         cls._setToNoneIfNoGamesPlayed(teamIdAndWins, year, filters, **kwargs)
         return teamIdAndWins
 
@@ -84,43 +203,7 @@ class GameOutcomeYearCalculator(YearCalculator):
         """
         filters = YearFilters.getForYear(year, **kwargs)
 
-        teamIdAndLosses = dict()
-        for teamId in YearNavigator.getAllTeamIds(year):
-            teamIdAndLosses[teamId] = 0
-
-        # keep track of all matchups to count towards this calculation
-        allMatchups = list()
-        # keep track of scores and tiebreakers for multi-week matchups
-        multiWeekMatchupIdToMatchupListMap: dict[str, list[Matchup]] = dict()
-
-        for i in range(filters.weekNumberStart - 1, filters.weekNumberEnd):
-            week = year.weeks[i]
-            for matchup in week.matchups:
-                if matchup.matchupType in filters.includeMatchupTypes:
-                    mwmid = matchup.multiWeekMatchupId
-                    if mwmid is not None:
-                        # multi-week matchup
-                        if mwmid in multiWeekMatchupIdToMatchupListMap:
-                            multiWeekMatchupIdToMatchupListMap[mwmid].append(matchup)
-                        else:
-                            multiWeekMatchupIdToMatchupListMap[mwmid] = [matchup]
-                    else:
-                        # non multi-week matchup
-                        allMatchups.append(matchup)
-
-        # simplify multi-week matchups into single Matchups
-        for matchupList in multiWeekMatchupIdToMatchupListMap.values():
-            allMatchups.append(MatchupNavigator.simplifyMultiWeekMatchups(matchupList))
-        for matchup in allMatchups:
-            # get loser team ID (if this wasn't a tie)
-            winnerTeamId = MatchupNavigator.getTeamIdOfMatchupWinner(matchup)
-            if winnerTeamId is not None:
-                loserTeamId = (
-                    matchup.teamAId
-                    if winnerTeamId == matchup.teamBId
-                    else matchup.teamBId
-                )
-                teamIdAndLosses[loserTeamId] += 1
+        teamIdAndLosses = cls._getWinsLossesAndTies(year, filters, **kwargs)[1]
         cls._setToNoneIfNoGamesPlayed(teamIdAndLosses, year, filters, **kwargs)
         return teamIdAndLosses
 
@@ -141,36 +224,7 @@ class GameOutcomeYearCalculator(YearCalculator):
         """
         filters = YearFilters.getForYear(year, **kwargs)
 
-        teamIdAndTies = dict()
-        for teamId in YearNavigator.getAllTeamIds(year):
-            teamIdAndTies[teamId] = 0
-
-        # keep track of all matchups to count towards this calculation
-        allMatchups = list()
-        # keep track of scores and tiebreakers for multi-week matchups
-        multiWeekMatchupIdToMatchupListMap: dict[str, list[Matchup]] = dict()
-
-        for i in range(filters.weekNumberStart - 1, filters.weekNumberEnd):
-            week = year.weeks[i]
-            for matchup in week.matchups:
-                if matchup.matchupType in filters.includeMatchupTypes:
-                    mwmid = matchup.multiWeekMatchupId
-                    if mwmid is not None:
-                        # multi-week matchup
-                        if mwmid in multiWeekMatchupIdToMatchupListMap:
-                            multiWeekMatchupIdToMatchupListMap[mwmid].append(matchup)
-                        else:
-                            multiWeekMatchupIdToMatchupListMap[mwmid] = [matchup]
-                    else:
-                        # non multi-week matchup
-                        allMatchups.append(matchup)
-        # simplify multi-week matchups into single Matchups
-        for matchupList in multiWeekMatchupIdToMatchupListMap.values():
-            allMatchups.append(MatchupNavigator.simplifyMultiWeekMatchups(matchupList))
-        for matchup in allMatchups:
-            if MatchupNavigator.getTeamIdOfMatchupWinner(matchup) is None:
-                teamIdAndTies[matchup.teamAId] += 1
-                teamIdAndTies[matchup.teamBId] += 1
+        teamIdAndTies = cls._getWinsLossesAndTies(year, filters, **kwargs)[2]
         cls._setToNoneIfNoGamesPlayed(teamIdAndTies, year, filters, **kwargs)
         return teamIdAndTies
 
@@ -337,37 +391,13 @@ class GameOutcomeYearCalculator(YearCalculator):
         """
         filters = YearFilters.getForYear(year, **kwargs)
 
-        teamIdAndLeagueMedianWins = dict()
-        for teamId in YearNavigator.getAllTeamIds(year):
-            teamIdAndLeagueMedianWins[teamId] = Deci("0")
+        teamIdAndLeagueMedianWins = cls._getLeagueMedianWinsFromWeeks(
+            year, filters, opponentScores=False
+        )
 
         if not year.yearSettings.leagueMedianGames:
             return teamIdAndLeagueMedianWins
 
-        for i in range(filters.weekNumberStart - 1, filters.weekNumberEnd):
-            week = year.weeks[i]
-            if week.isRegularSeasonWeek:
-                week_matchups = list()
-                teamIdAndScoreList: list[tuple[str, float | int]] = list()
-                for matchup in week.matchups:
-                    if matchup.matchupType in filters.includeMatchupTypes:
-                        week_matchups.append(matchup)
-                        teamIdAndScoreList.append((matchup.teamAId, matchup.teamAScore))
-                        teamIdAndScoreList.append((matchup.teamBId, matchup.teamBScore))
-
-                if len(week_matchups) > 0:
-                    leagueMedianScore = MatchupNavigator.getMedianScore(week_matchups)
-
-                    # sort by score highest -> lowest
-                    teamIdAndScoreList.sort(key=lambda x: x[1], reverse=True)
-                    # teams with a score greater than the league median get a win
-                    # team with a score equal to the league median get a tie
-                    for teamId, score in teamIdAndScoreList:
-                        if score > leagueMedianScore:
-                            teamIdAndLeagueMedianWins[teamId] += Deci("1")
-                        elif score == leagueMedianScore:
-                            teamIdAndLeagueMedianWins[teamId] += Deci("0.5")
-
         cls._setToNoneIfNoGamesPlayed(
             teamIdAndLeagueMedianWins, year, filters, **kwargs
         )
@@ -395,41 +425,13 @@ class GameOutcomeYearCalculator(YearCalculator):
         """
         filters = YearFilters.getForYear(year, **kwargs)
 
-        teamIdAndOpponentLeagueMedianWins = dict()
-        for teamId in YearNavigator.getAllTeamIds(year):
-            teamIdAndOpponentLeagueMedianWins[teamId] = Deci("0")
+        teamIdAndOpponentLeagueMedianWins = cls._getLeagueMedianWinsFromWeeks(
+            year, filters, opponentScores=True
+        )
 
         if not year.yearSettings.leagueMedianGames:
             return teamIdAndOpponentLeagueMedianWins
 
-        for i in range(filters.weekNumberStart - 1, filters.weekNumberEnd):
-            week = year.weeks[i]
-            if week.isRegularSeasonWeek:
-                week_matchups = list()
-                teamIdAndOpponentScoreList: list[tuple[str, float | int]] = list()
-                for matchup in week.matchups:
-                    if matchup.matchupType in filters.includeMatchupTypes:
-                        week_matchups.append(matchup)
-                        teamIdAndOpponentScoreList.append(
-                            (matchup.teamAId, matchup.teamBScore)
-                        )
-                        teamIdAndOpponentScoreList.append(
-                            (matchup.teamBId, matchup.teamAScore)
-                        )
-
-                if len(week_matchups) > 0:
-                    leagueMedianScore = MatchupNavigator.getMedianScore(week_matchups)
-
-                    # sort by score highest -> lowest
-                    teamIdAndOpponentScoreList.sort(key=lambda x: x[1], reverse=True)
-                    # teams with a score greater than the league median get a win
-                    # team with a score equal to the league median get a tie
-                    for teamId, score in teamIdAndOpponentScoreList:
-                        if score > leagueMedianScore:
-                            teamIdAndOpponentLeagueMedianWins[teamId] += Deci("1")
-                        elif score == leagueMedianScore:
-                            teamIdAndOpponentLeagueMedianWins[teamId] += Deci("0.5")
-
         cls._setToNoneIfNoGamesPlayed(
             teamIdAndOpponentLeagueMedianWins, year, filters, **kwargs
         )
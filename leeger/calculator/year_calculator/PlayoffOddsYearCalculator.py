@@ -0,0 +1,238 @@
+from typing import Optional
+
+import numpy
+
+from leeger.calculator.parent.YearCalculator import YearCalculator
+from leeger.calculator.year_calculator.GameOutcomeYearCalculator import (
+    GameOutcomeYearCalculator,
+)
+from leeger.calculator.year_calculator.PointsScoredYearCalculator import (
+    PointsScoredYearCalculator,
+)
+from leeger.calculator.year_calculator.ScoringStandardDeviationYearCalculator import (
+    ScoringStandardDeviationYearCalculator,
+)
+from leeger.decorator.validators import validateYear
+from leeger.model.filter import YearFilters
+from leeger.model.league.Year import Year
+from leeger.model.stat.PlayoffOdds import PlayoffOdds
+from leeger.util.Deci import Deci
+from leeger.util.GeneralUtil import GeneralUtil
+from leeger.util.navigator.YearNavigator import YearNavigator
+from leeger.util.NumericSettings import NumericSettings
+from leeger.util.SeasonSimulator import SeasonSimulator
+
+
+class PlayoffOddsYearCalculator(YearCalculator):
+    """
+    Used to calculate the playoff, bye and championship odds of each team in a Year that is still being played.
+
+    The Year only needs to have the weeks that have been played, and only its regular season weeks are counted.
+    The rest of the regular season is given as a schedule, and every remaining game (and playoff game) is simulated
+    by drawing each team's score from a normal distribution with their Points Scored per game and Scoring Standard Deviation so far.
+    If the Year has league median games, each remaining regular season week also has a league median game for every team that plays in it.
+    Every simulation is run at once as NumPy array operations with a seedable random number generator.
+    """
+
+    @classmethod
+    def __validateBracket(
+        cls, numberOfPlayoffTeams: int, numberOfByes: int, numberOfTeams: int
+    ) -> None:
+        GeneralUtil.validatePositiveInt(numberOfPlayoffTeams, "numberOfPlayoffTeams")
+        if numberOfPlayoffTeams > numberOfTeams:
+            raise ValueError(
+                f"'numberOfPlayoffTeams' can't be more than the number of teams ({numberOfTeams})."
+            )
+        if type(numberOfByes) is not int:
+            raise ValueError(
+                f"'numberOfByes' must be type 'int', not '{type(numberOfByes).__name__}'."
+            )
+        # after the first round, the number of teams left has to be halved every round
+        teamsInSecondRound = numberOfByes + (numberOfPlayoffTeams - numberOfByes) / 2
+        if (
+            not 0 <= numberOfByes < numberOfPlayoffTeams
+            or not teamsInSecondRound.is_integer()
+            or int(teamsInSecondRound) & (int(teamsInSecondRound) - 1) != 0
+        ):
+            raise ValueError(
+                f"{numberOfPlayoffTeams} playoff teams with {numberOfByes} byes can't be played as a single-elimination bracket."
+            )
+
+    @classmethod
+    def __getRemainingSchedule(
+        cls, year: Year, remainingSchedule: list[list[tuple[str, str]]]
+    ) -> tuple[list[numpy.ndarray], list[numpy.ndarray]]:
+        """
+        Returns the team A and team B indexes of the games in each week of the given schedule.
+        """
+        yearIndex = YearNavigator.getYearIndex(year)
+        yearFrame = YearNavigator.getYearFrame(year)
+        remainingTeamAIndexes = list()
+        remainingTeamBIndexes = list()
+        for i, week in enumerate(remainingSchedule):
+            teamIndexes = list()
+            for game in week:
+                for teamId in game:
+                    # raises a DoesNotExistException if the team isn't in the Year
+                    yearIndex.getTeamById(teamId)
+                teamIndexes.append([yearFrame.teamIdToIndex[teamId] for teamId in game])
+            if len(
+                {teamIndex for game in teamIndexes for teamIndex in game}
+            ) != 2 * len(teamIndexes):
+                raise ValueError(
+                    f"A team can't play more than once in week {i + 1} of the remaining schedule."
+                )
+            teamIndexes = numpy.array(teamIndexes, dtype=numpy.int64).reshape(-1, 2)
+            remainingTeamAIndexes.append(teamIndexes[:, 0])
+            remainingTeamBIndexes.append(teamIndexes[:, 1])
+        return remainingTeamAIndexes, remainingTeamBIndexes
+
+    @classmethod
+    def __getScoreDistributions(
+        cls, year: Year, **kwargs
+    ) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the mean score and score standard deviation of each team, ordered by team index.
+        Teams without any games played are given the average of the teams that have.
+        """
+        kwargs["validate"] = False
+        yearFrame = YearNavigator.getYearFrame(year)
+        pointsScoredPerGame = PointsScoredYearCalculator.getPointsScoredPerGame(
+            year, **kwargs
+        )
+        scoringStandardDeviation = (
+            ScoringStandardDeviationYearCalculator.getScoringStandardDeviation(
+                year, **kwargs
+            )
+        )
+        meanScores = numpy.array(
+            [
+                numpy.nan
+                if pointsScoredPerGame[teamId] is None
+                else float(pointsScoredPerGame[teamId])
+                for teamId in yearFrame.teamIds
+            ]
+        )
+        scoreStandardDeviations = numpy.array(
+            [
+                numpy.nan
+                if scoringStandardDeviation[teamId] is None
+                else float(scoringStandardDeviation[teamId])
+                for teamId in yearFrame.teamIds
+            ]
+        )
+        if numpy.isnan(meanScores).all():
+            raise ValueError("No games have been played in the given Year.")
+        meanScores[numpy.isnan(meanScores)] = numpy.nanmean(meanScores)
+        scoreStandardDeviations[numpy.isnan(scoreStandardDeviations)] = numpy.nanmean(
+            scoreStandardDeviations
+        )
+        return meanScores, scoreStandardDeviations
+
+    @staticmethod
+    def __getLeagueMedianHalfWins(year: Year, **kwargs) -> numpy.ndarray:
+        """
+        Returns the half wins (2 for a win, 1 for a tie) each team (ordered by team index) has from league median games so far.
+        """
+        kwargs["validate"] = False
+        yearFrame = YearNavigator.getYearFrame(year)
+        leagueMedianWins = GameOutcomeYearCalculator.getLeagueMedianWins(year, **kwargs)
+        return numpy.array(
+            [
+                0
+                if leagueMedianWins[teamId] is None
+                else int(leagueMedianWins[teamId] * 2)
+                for teamId in yearFrame.teamIds
+            ],
+            dtype=numpy.int64,
+        )
+
+    @classmethod
+    @validateYear
+    def getPlayoffOdds(
+        cls,
+        year: Year,
+        remainingSchedule: list[list[tuple[str, str]]],
+        numberOfPlayoffTeams: int,
+        numberOfSimulations: int = 10_000,
+        *,
+        numberOfByes: int = 0,
+        seed: Optional[int] = None,
+        workers: int = 1,
+        **kwargs,
+    ) -> PlayoffOdds:
+        """
+        Returns the playoff, bye and championship odds of each team in the given Year.
+
+        remainingSchedule has a list for each regular season week that has not been played yet, with a (teamAId, teamBId) tuple for each game that week.
+        Standings only count regular season weeks, so any filters given in kwargs are applied to the regular season.
+        Final standings are ordered by wins (a tie counts as half a win, and league median wins are included), then by points scored.
+        The top numberOfPlayoffTeams teams make the playoffs and the top numberOfByes of them get a bye in the first round.
+        Give a seed to get the same results every time, and give more than 1 worker to run the simulations in that many processes.
+        The results for a seed are the same no matter how many workers are used.
+
+        Example response:
+            PlayoffOdds(
+                numberOfSimulations=10000,
+                expectedWins={"someTeamId": Deci("8.9521"), ...},
+                playoffOdds={"someTeamId": Deci("0.8134"), ...},
+                byeOdds={"someTeamId": Deci("0.3377"), ...},
+                championshipOdds={"someTeamId": Deci("0.1905"), ...},
+            )
+        """
+        # playoff games don't count towards the standings
+        kwargs["onlyRegularSeason"] = True
+        yearFrame = YearNavigator.getYearFrame(year)
+        numberOfSimulations = GeneralUtil.validatePositiveInt(
+            numberOfSimulations, "numberOfSimulations"
+        )
+        workers = GeneralUtil.validatePositiveInt(workers, "workers")
+        cls.__validateBracket(
+            numberOfPlayoffTeams, numberOfByes, yearFrame.numberOfTeams
+        )
+        remainingTeamAIndexes, remainingTeamBIndexes = cls.__getRemainingSchedule(
+            year, remainingSchedule
+        )
+        filters = YearFilters.getForYear(year, **kwargs)
+        meanScores, scoreStandardDeviations = cls.__getScoreDistributions(
+            year, **kwargs
+        )
+
+        wins, _, ties = yearFrame.countOutcomesByTeam(
+            filters, fixedPointScale=NumericSettings.getFixedPointScaleIfUsed(**kwargs)
+        )
+        halfWins = (2 * wins + ties).astype(numpy.int64)
+        if yearFrame.leagueMedianGames:
+            halfWins += cls.__getLeagueMedianHalfWins(year, **kwargs)
+        seasonSimulator = SeasonSimulator(
+            meanScores=meanScores,
+            scoreStandardDeviations=scoreStandardDeviations,
+            halfWins=halfWins,
+            pointsScored=yearFrame.sumScoresByTeam(yearFrame.getRows(filters)),
+            remainingTeamAIndexes=remainingTeamAIndexes,
+            remainingTeamBIndexes=remainingTeamBIndexes,
+            numberOfPlayoffTeams=numberOfPlayoffTeams,
+            numberOfByes=numberOfByes,
+            leagueMedianGames=yearFrame.leagueMedianGames,
+        )
+        playoffCounts, byeCounts, championshipCounts, halfWinTotals = (
+            seasonSimulator.simulate(numberOfSimulations, seed=seed, workers=workers)
+        )
+
+        def toOdds(counts: numpy.ndarray) -> dict[str, Deci]:
+            return yearFrame.toTeamIdDict(
+                [Deci(count) / Deci(numberOfSimulations) for count in counts.tolist()]
+            )
+
+        return PlayoffOdds(
+            numberOfSimulations=numberOfSimulations,
+            expectedWins=yearFrame.toTeamIdDict(
+                [
+                    Deci(halfWinTotal) / Deci(2 * numberOfSimulations)
+                    for halfWinTotal in halfWinTotals.tolist()
+                ]
+            ),
+            playoffOdds=toOdds(playoffCounts),
+            byeOdds=toOdds(byeCounts),
+            championshipOdds=toOdds(championshipCounts),
+        )
@@ -5,9 +5,12 @@ from leeger.calculator.year_calculator.PointsScoredYearCalculator import (
     PointsScoredYearCalculator,
 )
 from leeger.decorator.validators import validateYear
+from leeger.model.filter import YearFilters
 from leeger.model.league.Year import Year
 from leeger.util.Deci import Deci
+from leeger.util.FixedPoint import FixedPoint
 from leeger.util.navigator.YearNavigator import YearNavigator
+from leeger.util.NumericSettings import NumericSettings
 
 
 class PlusMinusYearCalculator(YearCalculator):
@@ -15,6 +18,26 @@ class PlusMinusYearCalculator(YearCalculator):
     Used to calculate all plus/minuses.
     """
 
+    @classmethod
+    def _getPlusMinusWithFixedPoint(
+        cls, year: Year, filters: YearFilters, **kwargs
+    ) -> dict[str, Deci]:
+        """
+        Returns the Plus/Minus for each team in the Matchups remaining after the given filters are applied, using fixed-point integers.
+        """
+        # the difference is taken before converting back to Deci, so each team only needs 1 conversion
+        scale = NumericSettings.getFixedPointScale(**kwargs)
+        yearFrame = YearNavigator.getYearFrame(year)
+        plusMinuses = yearFrame.sumFixedPointScoresInRangeByTeam(
+            filters, scale
+        ) - yearFrame.sumFixedPointScoresInRangeByTeam(
+            filters, scale, opponentScores=True
+        )
+
+        return yearFrame.toTeamIdDict(
+            [FixedPoint.toDeci(plusMinus, scale) for plusMinus in plusMinuses.tolist()]
+        )
+
     @classmethod
     @validateYear
     def getPlusMinus(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
@@ -37,6 +60,13 @@ class PlusMinusYearCalculator(YearCalculator):
             ...
             }
         """
+        if NumericSettings.useFixedPoint(**kwargs):
+            filters = YearFilters.getForYear(year, **kwargs)
+            teamIdAndPlusMinus = cls._getPlusMinusWithFixedPoint(
+                year, filters, **kwargs
+            )
+            cls._setToNoneIfNoGamesPlayed(teamIdAndPlusMinus, year, filters, **kwargs)
+            return teamIdAndPlusMinus
 
         teamIdAndPlusMinus = dict()
         teamIdAndPointsScored = PointsScoredYearCalculator.getPointsScored(
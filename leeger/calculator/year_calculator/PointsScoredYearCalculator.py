@@ -1,3 +1,4 @@
+import dataclasses
 from typing import Optional
 
 from leeger.calculator.parent.YearCalculator import YearCalculator
@@ -5,7 +6,9 @@ from leeger.decorator.validators import validateYear
 from leeger.model.filter import YearFilters
 from leeger.model.league.Year import Year
 from leeger.util.Deci import Deci
+from leeger.util.FixedPoint import FixedPoint
 from leeger.util.navigator.YearNavigator import YearNavigator
+from leeger.util.NumericSettings import NumericSettings
 
 
 class PointsScoredYearCalculator(YearCalculator):
@@ -13,6 +16,134 @@ class PointsScoredYearCalculator(YearCalculator):
     Used to calculate all points scored.
     """
 
+    @classmethod
+    def _getPointsScoredByTeam(
+        cls, year: Year, filters: YearFilters, *, opponentScores: bool, **kwargs
+    ) -> dict[str, Deci]:
+        yearFrame = YearNavigator.getYearFrame(year)
+        if NumericSettings.useFixedPoint(**kwargs):
+            scale = NumericSettings.getFixedPointScale(**kwargs)
+            return yearFrame.toTeamIdDict(
+                [
+                    FixedPoint.toDeci(pointsScored, scale)
+                    for pointsScored in yearFrame.sumFixedPointScoresInRangeByTeam(
+                        filters, scale, opponentScores=opponentScores
+                    ).tolist()
+                ]
+            )
+        rows = yearFrame.getRows(filters)
+        if NumericSettings.useFloat(**kwargs):
+            return yearFrame.toTeamIdDict(
+                [
+                    Deci(pointsScored)
+                    for pointsScored in yearFrame.sumScoresByTeam(
+                        rows, opponentScores=opponentScores
+                    ).tolist()
+                ]
+            )
+
+        allPointsScored = yearFrame.sumDecimalScoresInRangeByTeam(
+            filters, opponentScores=opponentScores
+        )
+        if allPointsScored is not None:
+            return yearFrame.toTeamIdDict(allPointsScored)
+
+        allPointsScored = list()
+        for scores in yearFrame.getScoresByTeam(rows, opponentScores=opponentScores):
+            # scores are added one at a time so the result is exactly the same no matter how many scores there are
+            pointsScored = Deci(0)
+            for score in scores:
+                pointsScored += Deci(score)
+            allPointsScored.append(pointsScored)
+        return yearFrame.toTeamIdDict(allPointsScored)
+
+    @classmethod
+    def _getPointsScoredByTeamAfterEachWeek(
+        cls, year: Year, filters: YearFilters, *, opponentScores: bool, **kwargs
+    ) -> list[dict[str, Deci]]:
+        """
+        Returns what _getPointsScoredByTeam() returns for each week from the start to the end of the given filters as the last week.
+        Fixed-point and exact Decimal points scored already come from running totals,
+        otherwise every score is only looked at once and added to running totals.
+        """
+        yearFrame = YearNavigator.getYearFrame(year)
+        useFloat = NumericSettings.useFloat(**kwargs)
+        if not useFloat and (
+            NumericSettings.useFixedPoint(**kwargs)
+            or yearFrame.sumDecimalScoresInRangeByTeam(
+                filters, opponentScores=opponentScores
+            )
+            is not None
+        ):
+            return [
+                cls._getPointsScoredByTeam(
+                    year,
+                    dataclasses.replace(filters, weekNumberEnd=weekNumberEnd),
+                    opponentScores=opponentScores,
+                    **kwargs,
+                )
+                for weekNumberEnd in range(
+                    filters.weekNumberStart, filters.weekNumberEnd + 1
+                )
+            ]
+
+        rows = yearFrame.getRows(filters)
+        playedByEachWeek = yearFrame.countPlayedByEachWeek(
+            yearFrame.weekIndex[rows], filters.weekNumberStart, filters.weekNumberEnd
+        )
+        teamAIndex = yearFrame.teamAIndex[rows]
+        teamBIndex = yearFrame.teamBIndex[rows]
+        teamAScore, teamBScore = (
+            (yearFrame.teamAScore[rows], yearFrame.teamBScore[rows])
+            if useFloat
+            else (yearFrame.teamAScoreValue[rows], yearFrame.teamBScoreValue[rows])
+        )
+        if opponentScores:
+            teamAScore, teamBScore = teamBScore, teamAScore
+
+        if useFloat:
+            # the same as sumScoresByTeam(), team A and team B scores are added up separately
+            return [
+                yearFrame.toTeamIdDict(
+                    [Deci(pointsScored) for pointsScored in pointsScoredByTeam]
+                )
+                for pointsScoredByTeam in (
+                    yearFrame.countByTeamAfterEachWeek(
+                        teamAIndex, playedByEachWeek, teamAScore
+                    )
+                    + yearFrame.countByTeamAfterEachWeek(
+                        teamBIndex, playedByEachWeek, teamBScore
+                    )
+                ).tolist()
+            ]
+
+        teamIdAndPointsScoredAfterEachWeek = list()
+        pointsScoredByTeam = [Deci(0)] * yearFrame.numberOfTeams
+        matchups = list(
+            zip(
+                teamAIndex.tolist(),
+                teamBIndex.tolist(),
+                teamAScore.tolist(),
+                teamBScore.tolist(),
+            )
+        )
+        played = 0
+        for playedByWeek in playedByEachWeek:
+            # scores are added one at a time so the result is exactly the same no matter how many scores there are
+            for (
+                matchupTeamAIndex,
+                matchupTeamBIndex,
+                matchupTeamAScore,
+                matchupTeamBScore,
+            ) in matchups[played:playedByWeek]:
+                pointsScoredByTeam[matchupTeamAIndex] += Deci(matchupTeamAScore)
+                pointsScoredByTeam[matchupTeamBIndex] += Deci(matchupTeamBScore)
+            teamIdAndPointsScoredAfterEachWeek.append(
+                yearFrame.toTeamIdDict(pointsScoredByTeam)
+            )
+            played = playedByWeek
+        return teamIdAndPointsScoredAfterEachWeek
+
     @classmethod
     @validateYear
     def getPointsScored(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
@@ -30,16 +161,9 @@ class PointsScoredYearCalculator(YearCalculator):
         """
         filters = YearFilters.getForYear(year, **kwargs)
 
-        teamIdAndPointsScored = dict()
-        for teamId in YearNavigator.getAllTeamIds(year):
-            teamIdAndPointsScored[teamId] = Deci(0)
-
-        for i in range(filters.weekNumberStart - 1, filters.weekNumberEnd):
-            week = year.weeks[i]
-            for matchup in week.matchups:
-                if matchup.matchupType in filters.includeMatchupTypes:
-                    teamIdAndPointsScored[matchup.teamAId] += Deci(matchup.teamAScore)
-                    teamIdAndPointsScored[matchup.teamBId] += Deci(matchup.teamBScore)
+        teamIdAndPointsScored = cls._getPointsScoredByTeam(
+            year, filters, opponentScores=False, **kwargs
+        )
 
         cls._setToNoneIfNoGamesPlayed(teamIdAndPointsScored, year, filters, **kwargs)
         return teamIdAndPointsScored
@@ -95,20 +219,9 @@ class PointsScoredYearCalculator(YearCalculator):
         """
         filters = YearFilters.getForYear(year, **kwargs)
 
-        teamIdAndOpponentPointsScored = dict()
-        for teamId in YearNavigator.getAllTeamIds(year):
-            teamIdAndOpponentPointsScored[teamId] = Deci(0)
-
-        for i in range(filters.weekNumberStart - 1, filters.weekNumberEnd):
-            week = year.weeks[i]
-            for matchup in week.matchups:
-                if matchup.matchupType in filters.includeMatchupTypes:
-                    teamIdAndOpponentPointsScored[matchup.teamAId] += Deci(
-                        matchup.teamBScore
-                    )
-                    teamIdAndOpponentPointsScored[matchup.teamBId] += Deci(
-                        matchup.teamAScore
-                    )
+        teamIdAndOpponentPointsScored = cls._getPointsScoredByTeam(
+            year, filters, opponentScores=True, **kwargs
+        )
 
         cls._setToNoneIfNoGamesPlayed(
             teamIdAndOpponentPointsScored, year, filters, **kwargs
@@ -0,0 +1,371 @@
+import dataclasses
+from typing import Any, Optional
+
+from leeger.calculator.parent.YearCalculator import YearCalculator
+from leeger.calculator.year_calculator.AWALYearCalculator import AWALYearCalculator
+from leeger.calculator.year_calculator.GameOutcomeYearCalculator import (
+    GameOutcomeYearCalculator,
+)
+from leeger.calculator.year_calculator.PointsScoredYearCalculator import (
+    PointsScoredYearCalculator,
+)
+from leeger.calculator.year_calculator.ScoringStandardDeviationYearCalculator import (
+    ScoringStandardDeviationYearCalculator,
+)
+from leeger.decorator.validators import validateYear
+from leeger.model.filter import YearFilters
+from leeger.model.league.Year import Year
+from leeger.util.Deci import Deci
+from leeger.util.GeneralUtil import GeneralUtil
+from leeger.util.MonotonicQueue import MonotonicQueue
+from leeger.util.navigator.YearNavigator import YearNavigator
+from leeger.util.NumericSettings import NumericSettings
+
+
+class RollingWindowYearCalculator(YearCalculator):
+    """
+    Used to calculate stats over the trailing N weeks for every week in a Year.
+
+    Every method returns a list for each team, where index i is the stat for the window that ends at week weekNumberStart + i.
+    Each window is the last windowSize weeks up to and including that week (and never starts before weekNumberStart),
+    and the stat for each window is exactly what the matching Year calculator returns for that week range.
+
+    The Year is validated once and the filters are parsed once.
+    Windows are built from running totals and weekly values that are only calculated once per Year, instead of calling a Year calculator for each window.
+    Counts and sums that are exact are found by subtracting running totals,
+    and AWAL (which is rounded each week) is found by adding up each week's AWAL in the window.
+    """
+
+    @classmethod
+    def _getWindowFilters(
+        cls, filters: YearFilters, windowSize: int
+    ) -> list[YearFilters]:
+        """
+        Returns the filters for the window that ends at each week in the given filters.
+        """
+        return [
+            dataclasses.replace(
+                filters,
+                weekNumberStart=max(
+                    filters.weekNumberStart, weekNumberEnd - windowSize + 1
+                ),
+                weekNumberEnd=weekNumberEnd,
+            )
+            for weekNumberEnd in range(
+                filters.weekNumberStart, filters.weekNumberEnd + 1
+            )
+        ]
+
+    @classmethod
+    def _getPointsScoredInWindow(
+        cls, year: Year, filters: YearFilters, **kwargs
+    ) -> dict[str, Optional[Deci]]:
+        """
+        Returns the same thing as PointsScoredYearCalculator.getPointsScored() for the given filters.
+        """
+        teamIdAndPointsScored = PointsScoredYearCalculator._getPointsScoredByTeam(
+            year, filters, opponentScores=False, **kwargs
+        )
+        cls._setToNoneIfNoGamesPlayed(teamIdAndPointsScored, year, filters)
+        return teamIdAndPointsScored
+
+    @classmethod
+    def _getAWALInWindow(
+        cls, year: Year, filters: YearFilters, **kwargs
+    ) -> dict[str, Optional[Deci]]:
+        """
+        Returns the same thing as AWALYearCalculator.getAWAL() for the given filters.
+        """
+        teamIdAndAWAL = AWALYearCalculator._getAWALFromWeeks(
+            year, filters, opponentScores=False, **kwargs
+        )
+        # add league median wins if applicable
+        if year.yearSettings.leagueMedianGames:
+            teamIdAndLeagueMedianWins = (
+                GameOutcomeYearCalculator._getLeagueMedianWinsFromWeeks(
+                    year, filters, opponentScores=False
+                )
+            )
+            cls._setToNoneIfNoGamesPlayed(teamIdAndLeagueMedianWins, year, filters)
+            for teamId in teamIdAndAWAL:
+                teamIdAndAWAL[teamId] = GeneralUtil.safeSum(
+                    teamIdAndAWAL[teamId], teamIdAndLeagueMedianWins[teamId]
+                )
+        cls._setToNoneIfNoGamesPlayed(teamIdAndAWAL, year, filters)
+        return teamIdAndAWAL
+
+    @staticmethod
+    def __divideByGamesPlayed(
+        teamIdAndStat: dict[str, Optional[Deci]],
+        teamIdAndNumberOfGamesPlayed: dict[str, int],
+    ) -> dict[str, Optional[Deci]]:
+        teamIdAndStatPerGame = dict()
+        for teamId in teamIdAndStat:
+            if teamIdAndNumberOfGamesPlayed[teamId] == 0:
+                teamIdAndStatPerGame[teamId] = None
+            else:
+                teamIdAndStatPerGame[teamId] = (
+                    teamIdAndStat[teamId] / teamIdAndNumberOfGamesPlayed[teamId]
+                )
+        return teamIdAndStatPerGame
+
+    @staticmethod
+    def __toTeamIdAndWindows(
+        year: Year, windowResults: list[dict[str, Any]]
+    ) -> dict[str, list]:
+        return {
+            teamId: [windowResult[teamId] for windowResult in windowResults]
+            for teamId in YearNavigator.getAllTeamIds(year)
+        }
+
+    @classmethod
+    @validateYear
+    def getRollingPointsScoredPerGame(
+        cls, year: Year, windowSize: int, **kwargs
+    ) -> dict[str, list[Optional[Deci]]]:
+        """
+        Returns the Points Scored per game over the last windowSize weeks, for each week and each team in the given Year.
+        Points scored and games played for each window are found by subtracting running totals.
+        Returns None for a Team in a window they have no games played in.
+
+        Example response:
+            {
+            "someTeamId": [Deci("100.7"), Deci("110.2"), Deci("105.1"), ...],
+            "someOtherTeamId": [Deci("141.2"), Deci("120.5"), None, ...],
+            ...
+            }
+        """
+        GeneralUtil.validatePositiveInt(windowSize, "windowSize")
+        filters = YearFilters.getForYear(year, **kwargs)
+
+        windowResults = list()
+        for windowFilters in cls._getWindowFilters(filters, windowSize):
+            windowResults.append(
+                cls.__divideByGamesPlayed(
+                    cls._getPointsScoredInWindow(year, windowFilters, **kwargs),
+                    YearNavigator.getNumberOfGamesPlayed(year, windowFilters),
+                )
+            )
+        return cls.__toTeamIdAndWindows(year, windowResults)
+
+    @classmethod
+    @validateYear
+    def getRollingAWALPerGame(
+        cls, year: Year, windowSize: int, **kwargs
+    ) -> dict[str, list[Optional[Deci]]]:
+        """
+        Returns the Adjusted Wins Against the League per game over the last windowSize weeks, for each week and each team in the given Year.
+        The AWAL each score earned in its own week is calculated once for the whole Year, and each window adds up the AWAL from its weeks.
+        League median wins for each window are found by subtracting running totals.
+        Returns None for a Team in a window they have no games played in.
+
+        Example response:
+            {
+            "someTeamId": [Deci("0.7"), Deci("0.55"), Deci("0.6"), ...],
+            "someOtherTeamId": [Deci("0.2"), Deci("0.3"), None, ...],
+            ...
+            }
+        """
+        GeneralUtil.validatePositiveInt(windowSize, "windowSize")
+        filters = YearFilters.getForYear(year, **kwargs)
+        yearFrame = YearNavigator.getYearFrame(year)
+        useFloat = NumericSettings.useFloat(**kwargs)
+        awalOfEachWeek = AWALYearCalculator._getAWALOfEachWeek(
+            year, filters, opponentScores=False, **kwargs
+        )
+        if year.yearSettings.leagueMedianGames:
+            leagueMedianWinsAfterEachWeek, leagueMedianTiesAfterEachWeek = (
+                GameOutcomeYearCalculator._getLeagueMedianWinsAndTiesAfterEachWeek(
+                    year, filters, opponentScores=False
+                )
+            )
+            noLeagueMedianGames = [0] * yearFrame.numberOfTeams
+
+        windowResults = list()
+        for windowFilters in cls._getWindowFilters(filters, windowSize):
+            firstWeek = windowFilters.weekNumberStart - filters.weekNumberStart
+            lastWeek = windowFilters.weekNumberEnd - filters.weekNumberStart
+            # each week's AWAL is rounded, so subtracting running totals wouldn't always give what AWALYearCalculator gives
+            # instead, the AWAL from the weeks in the window is added up in the same order AWALYearCalculator adds it up
+            awalByTeam = [0.0 if useFloat else Deci(0)] * yearFrame.numberOfTeams
+            for weekAWAL in awalOfEachWeek[firstWeek : lastWeek + 1]:
+                for teamIndex, awal in weekAWAL:
+                    awalByTeam[teamIndex] += awal
+            teamIdAndAWAL = yearFrame.toTeamIdDict(
+                [Deci(awal) for awal in awalByTeam] if useFloat else awalByTeam
+            )
+            # add league median wins if applicable
+            if year.yearSettings.leagueMedianGames:
+                # league median wins and ties are counts, so they are found by subtracting running totals
+                winsBefore, tiesBefore = (
+                    (
+                        leagueMedianWinsAfterEachWeek[firstWeek - 1],
+                        leagueMedianTiesAfterEachWeek[firstWeek - 1],
+                    )
+                    if firstWeek > 0
+                    else (noLeagueMedianGames, noLeagueMedianGames)
+                )
+                teamIdAndLeagueMedianWins = (
+                    GameOutcomeYearCalculator._getLeagueMedianWinsFromCounts(
+                        year,
+                        [
+                            winsAfter - before
+                            for winsAfter, before in zip(
+                                leagueMedianWinsAfterEachWeek[lastWeek], winsBefore
+                            )
+                        ],
+                        [
+                            tiesAfter - before
+                            for tiesAfter, before in zip(
+                                leagueMedianTiesAfterEachWeek[lastWeek], tiesBefore
+                            )
+                        ],
+                    )
+                )
+                cls._setToNoneIfNoGamesPlayed(
+                    teamIdAndLeagueMedianWins, year, windowFilters
+                )
+                for teamId in teamIdAndAWAL:
+                    teamIdAndAWAL[teamId] = GeneralUtil.safeSum(
+                        teamIdAndAWAL[teamId], teamIdAndLeagueMedianWins[teamId]
+                    )
+            cls._setToNoneIfNoGamesPlayed(teamIdAndAWAL, year, windowFilters)
+            windowResults.append(
+                cls.__divideByGamesPlayed(
+                    teamIdAndAWAL,
+                    YearNavigator.getNumberOfGamesPlayed(
+                        year, windowFilters, countLeagueMedianGamesAsTwoGames=True
+                    ),
+                )
+            )
+        return cls.__toTeamIdAndWindows(year, windowResults)
+
+    @classmethod
+    def __getRollingSingleScores(
+        cls, year: Year, windowSize: int, *, maxScore: bool, **kwargs
+    ) -> dict[str, list[Optional[float | int]]]:
+        filters = YearFilters.getForYear(year, **kwargs)
+        yearFrame = YearNavigator.getYearFrame(year)
+        rows = yearFrame.getRows(filters)
+        # scores are compared the same way SingleScoreYearCalculator compares them
+        if NumericSettings.useFixedPoint(**kwargs):
+            teamAKey, teamBKey = yearFrame.getFixedPointScores(
+                NumericSettings.getFixedPointScale(**kwargs), rows
+            )
+        else:
+            teamAKey = yearFrame.teamAScoreValue[rows]
+            teamBKey = yearFrame.teamBScoreValue[rows]
+
+        # each side of each row as (week number, team index, score, comparison key), in the order they were played
+        sides = list(
+            zip(
+                (yearFrame.weekIndex[rows] + 1).tolist(),
+                yearFrame.teamAIndex[rows].tolist(),
+                yearFrame.teamBIndex[rows].tolist(),
+                yearFrame.teamAScoreValue[rows].tolist(),
+                yearFrame.teamBScoreValue[rows].tolist(),
+                teamAKey.tolist(),
+                teamBKey.tolist(),
+            )
+        )
+        monotonicQueues = [
+            MonotonicQueue(maxValue=maxScore) for _ in range(yearFrame.numberOfTeams)
+        ]
+        singleScores = [list() for _ in range(yearFrame.numberOfTeams)]
+        sidePosition = 0
+        for windowFilters in cls._getWindowFilters(filters, windowSize):
+            # push the scores from the week this window ends at
+            while (
+                sidePosition < len(sides)
+                and sides[sidePosition][0] <= windowFilters.weekNumberEnd
+            ):
+                (
+                    weekNumber,
+                    teamAIndex,
+                    teamBIndex,
+                    teamAScore,
+                    teamBScore,
+                    teamAScoreKey,
+                    teamBScoreKey,
+                ) = sides[sidePosition]
+                monotonicQueues[teamAIndex].push(weekNumber, teamAScore, teamAScoreKey)
+                monotonicQueues[teamBIndex].push(weekNumber, teamBScore, teamBScoreKey)
+                sidePosition += 1
+            for teamIndex, monotonicQueue in enumerate(monotonicQueues):
+                monotonicQueue.dropBefore(windowFilters.weekNumberStart)
+                singleScores[teamIndex].append(monotonicQueue.getFront())
+        return yearFrame.toTeamIdDict(singleScores)
+
+    @classmethod
+    @validateYear
+    def getRollingMaxScore(
+        cls, year: Year, windowSize: int, **kwargs
+    ) -> dict[str, list[Optional[float | int]]]:
+        """
+        Returns the Max Score over the last windowSize weeks, for each week and each team in the given Year.
+        Uses a monotonic queue for each team, so each score is only looked at when it enters and leaves the window.
+        Returns None for a Team in a window they have no games played in.
+
+        Example response:
+            {
+            "someTeamId": [100.7, 111, 111, ...],
+            "someOtherTeamId": [112.2, 112.2, None, ...],
+            ...
+            }
+        """
+        GeneralUtil.validatePositiveInt(windowSize, "windowSize")
+        return cls.__getRollingSingleScores(year, windowSize, maxScore=True, **kwargs)
+
+    @classmethod
+    @validateYear
+    def getRollingMinScore(
+        cls, year: Year, windowSize: int, **kwargs
+    ) -> dict[str, list[Optional[float | int]]]:
+        """
+        Returns the Min Score over the last windowSize weeks, for each week and each team in the given Year.
+        Uses a monotonic queue for each team, so each score is only looked at when it enters and leaves the window.
+        Returns None for a Team in a window they have no games played in.
+
+        Example response:
+            {
+            "someTeamId": [78.6, 78.6, 90, ...],
+            "someOtherTeamId": [102, 88.1, None, ...],
+            ...
+            }
+        """
+        GeneralUtil.validatePositiveInt(windowSize, "windowSize")
+        return cls.__getRollingSingleScores(year, windowSize, maxScore=False, **kwargs)
+
+    @classmethod
+    @validateYear
+    def getRollingScoringStandardDeviation(
+        cls, year: Year, windowSize: int, **kwargs
+    ) -> dict[str, list[Optional[Deci]]]:
+        """
+        Returns the Scoring Standard Deviation over the last windowSize weeks, for each week and each team in the given Year.
+        The standard deviation is taken from the scores in each window (a running sum of squares would not give the same result),
+        so this only saves validating the Year and parsing the filters for each window.
+        Returns None for a Team in a window they have no games played in.
+
+        Example response:
+            {
+            "someTeamId": [Deci("10.7"), Deci("11.3"), Deci("8.2"), ...],
+            "someOtherTeamId": [Deci("11.2"), Deci("0"), None, ...],
+            ...
+            }
+        """
+        GeneralUtil.validatePositiveInt(windowSize, "windowSize")
+        filters = YearFilters.getForYear(year, **kwargs)
+        if not filters.includeMultiWeekMatchups:
+            raise ValueError(
+                "Multi-Week matchups must be included in this calculation."
+            )
+
+        windowResults = list()
+        for windowFilters in cls._getWindowFilters(filters, windowSize):
+            windowResults.append(
+                ScoringStandardDeviationYearCalculator._getScoringStandardDeviationByTeam(
+                    year, windowFilters, **kwargs
+                )
+            )
+        return cls.__toTeamIdAndWindows(year, windowResults)
@@ -35,9 +35,90 @@ class SSLYearCalculator(YearCalculator):
     This stat is more accurate with larger sample sizes (the more games played, the better).
     """
 
-    __AWAL_AND_WAL_PER_GAME_MULTIPLIER: float = 100.0
-    __SCORING_SHARE_MULTIPLIER: float = 2.0
-    __MAX_AND_MIN_SCORE_MULTIPLIER: float = 0.05
+    AWAL_AND_WAL_PER_GAME_MULTIPLIER: float = 100.0
+    SCORING_SHARE_MULTIPLIER: float = 2.0
+    MAX_AND_MIN_SCORE_MULTIPLIER: float = 0.05
+
+    @classmethod
+    def _getTeamScoreFromStats(
+        cls,
+        winsPerGame: Optional[Deci],
+        scoringShare: Optional[Deci],
+        maxScore: Optional[float | int],
+        minScore: Optional[float | int],
+    ) -> Optional[Deci]:
+        """
+        Returns ((Wins Per Game) * aMultiplier) + (Scoring Share * bMultiplier) + ((Max Score + Min Score) * cMultiplier).
+        This is Team Score when given AWAL per game and Team Success when given WAL per game.
+        Returns None if any stat used to calculate this is None.
+        """
+        # check if all stats could be found
+        if None in (winsPerGame, scoringShare, maxScore, minScore):
+            return None
+        return (
+            (winsPerGame * Deci(cls.AWAL_AND_WAL_PER_GAME_MULTIPLIER))
+            + (scoringShare * Deci(cls.SCORING_SHARE_MULTIPLIER))
+            + (
+                (Deci(maxScore) + Deci(minScore))
+                * Deci(cls.MAX_AND_MIN_SCORE_MULTIPLIER)
+            )
+        )
+
+    @classmethod
+    def __getScoringShareAndSingleScores(
+        cls, year: Year, **kwargs
+    ) -> tuple[dict[str, Optional[Deci]], dict, dict]:
+        """
+        Returns the Scoring Share, Max Score and Min Score for each team in the given Year.
+        These are used by both Team Score and Team Success, so they are calculated once for the whole Year.
+        """
+        return (
+            ScoringShareYearCalculator.getScoringShare(year, **kwargs),
+            SingleScoreYearCalculator.getMaxScore(year, **kwargs),
+            SingleScoreYearCalculator.getMinScore(year, **kwargs),
+        )
+
+    @classmethod
+    def __getTeamScoresFromStats(
+        cls,
+        year: Year,
+        teamIdAndWinsPerGame: dict[str, Optional[Deci]],
+        teamIdAndScoringShare: dict[str, Optional[Deci]],
+        teamIdAndMaxScore: dict[str, Optional[float | int]],
+        teamIdAndMinScore: dict[str, Optional[float | int]],
+    ) -> dict[str, Optional[Deci]]:
+        return {
+            teamId: cls._getTeamScoreFromStats(
+                teamIdAndWinsPerGame[teamId],
+                teamIdAndScoringShare[teamId],
+                teamIdAndMaxScore[teamId],
+                teamIdAndMinScore[teamId],
+            )
+            for teamId in YearNavigator.getAllTeamIds(year)
+        }
+
+    @classmethod
+    def _getTeamScoreAndTeamSuccess(
+        cls, year: Year, **kwargs
+    ) -> tuple[dict[str, Optional[Deci]], dict[str, Optional[Deci]]]:
+        """
+        Returns (Team Score, Team Success) for each team in the given Year.
+        Scoring Share, Max Score and Min Score are only calculated once and used for both.
+        """
+        scoringShareAndSingleScores = cls.__getScoringShareAndSingleScores(
+            year, **kwargs
+        )
+        teamIdAndTeamScore = cls.__getTeamScoresFromStats(
+            year,
+            AWALYearCalculator.getAWALPerGame(year, **kwargs),
+            *scoringShareAndSingleScores,
+        )
+        teamIdAndTeamSuccess = cls.__getTeamScoresFromStats(
+            year,
+            GameOutcomeYearCalculator.getWALPerGame(year, **kwargs),
+            *scoringShareAndSingleScores,
+        )
+        return teamIdAndTeamScore, teamIdAndTeamSuccess
 
     @classmethod
     @validateYear
@@ -60,28 +141,11 @@ class SSLYearCalculator(YearCalculator):
             }
         """
 
-        teamIdAndTeamScore = dict()
-        for teamId in YearNavigator.getAllTeamIds(year):
-            awalPerGame = AWALYearCalculator.getAWALPerGame(year, **kwargs)[teamId]
-            scoringShare = ScoringShareYearCalculator.getScoringShare(year, **kwargs)[
-                teamId
-            ]
-            maxScore = SingleScoreYearCalculator.getMaxScore(year, **kwargs)[teamId]
-            minScore = SingleScoreYearCalculator.getMinScore(year, **kwargs)[teamId]
-
-            # check if all stats could be found
-            if None in (awalPerGame, scoringShare, maxScore, minScore):
-                teamIdAndTeamScore[teamId] = None
-            else:
-                teamIdAndTeamScore[teamId] = (
-                    (awalPerGame * Deci(cls.__AWAL_AND_WAL_PER_GAME_MULTIPLIER))
-                    + (scoringShare * Deci(cls.__SCORING_SHARE_MULTIPLIER))
-                    + (
-                        (Deci(maxScore) + Deci(minScore))
-                        * Deci(cls.__MAX_AND_MIN_SCORE_MULTIPLIER)
-                    )
-                )
-        return teamIdAndTeamScore
+        return cls.__getTeamScoresFromStats(
+            year,
+            AWALYearCalculator.getAWALPerGame(year, **kwargs),
+            *cls.__getScoringShareAndSingleScores(year, **kwargs),
+        )
 
     @classmethod
     @validateYear
@@ -104,29 +168,11 @@ class SSLYearCalculator(YearCalculator):
             }
         """
 
-        teamIdAndTeamSuccess = dict()
-        for teamId in YearNavigator.getAllTeamIds(year):
-            walPerGame = GameOutcomeYearCalculator.getWALPerGame(year, **kwargs)[teamId]
-            scoringShare = ScoringShareYearCalculator.getScoringShare(year, **kwargs)[
-                teamId
-            ]
-            maxScore = SingleScoreYearCalculator.getMaxScore(year, **kwargs)[teamId]
-            minScore = SingleScoreYearCalculator.getMinScore(year, **kwargs)[teamId]
-
-            # check if all stats could be found
-            if None in (walPerGame, scoringShare, maxScore, minScore):
-                teamIdAndTeamSuccess[teamId] = None
-            else:
-                teamIdAndTeamSuccess[teamId] = (
-                    (walPerGame * Deci(cls.__AWAL_AND_WAL_PER_GAME_MULTIPLIER))
-                    + (scoringShare * Deci(cls.__SCORING_SHARE_MULTIPLIER))
-                    + (
-                        (Deci(maxScore) + Deci(minScore))
-                        * Deci(cls.__MAX_AND_MIN_SCORE_MULTIPLIER)
-                    )
-                )
-
-        return teamIdAndTeamSuccess
+        return cls.__getTeamScoresFromStats(
+            year,
+            GameOutcomeYearCalculator.getWALPerGame(year, **kwargs),
+            *cls.__getScoringShareAndSingleScores(year, **kwargs),
+        )
 
     @classmethod
     @validateYear
@@ -149,10 +195,13 @@ class SSLYearCalculator(YearCalculator):
             }
         """
 
+        teamIdAndTeamScore, teamIdAndTeamSuccess = cls._getTeamScoreAndTeamSuccess(
+            year, **kwargs
+        )
         teamIdAndTeamLuck = dict()
         for teamId in YearNavigator.getAllTeamIds(year):
-            teamScore = cls.getTeamScore(year, **kwargs)[teamId]
-            teamSuccess = cls.getTeamSuccess(year, **kwargs)[teamId]
+            teamScore = teamIdAndTeamScore[teamId]
+            teamSuccess = teamIdAndTeamSuccess[teamId]
 
             if None in (teamScore, teamSuccess):
                 teamIdAndTeamLuck[teamId] = None
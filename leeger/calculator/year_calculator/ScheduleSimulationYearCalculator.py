@@ -0,0 +1,193 @@
+from typing import Optional
+
+import numpy
+
+from leeger.calculator.parent.YearCalculator import YearCalculator
+from leeger.calculator.year_calculator.GameOutcomeYearCalculator import (
+    GameOutcomeYearCalculator,
+)
+from leeger.decorator.validators import validateYear
+from leeger.model.filter import YearFilters
+from leeger.model.league.Year import Year
+from leeger.model.stat.ScheduleSimulation import ScheduleSimulation
+from leeger.util.Deci import Deci
+from leeger.util.GeneralUtil import GeneralUtil
+from leeger.util.navigator.YearNavigator import YearNavigator
+from leeger.util.ScheduleSimulator import ScheduleSimulator
+
+
+class ScheduleSimulationYearCalculator(YearCalculator):
+    """
+    Used to calculate how lucky each team's schedule was by simulating random schedules.
+
+    This is a simulation-based companion to AWAL and SSL:
+    each week, the teams that played that week are paired up at random and keep the score they actually had,
+    so the only thing that changes from simulation to simulation is who played who.
+    Each multi-week matchup counts as a single game, and is only paired up with other multi-week matchups over the same weeks.
+    In Years with league median games, each team's league median wins don't depend on the schedule, so they are added to every simulation.
+    Expected wins are a team's AWAL from single-week games, plus their league median wins and their expected wins from multi-week matchups.
+    Every simulation is run at once as NumPy array operations with a seedable random number generator.
+    """
+
+    @staticmethod
+    def __getLeagueMedianHalfWins(year: Year, **kwargs) -> numpy.ndarray:
+        """
+        Returns the half wins (2 for a win, 1 for a tie) each team (ordered by team index) has from league median games.
+        """
+        kwargs["validate"] = False
+        yearFrame = YearNavigator.getYearFrame(year)
+        leagueMedianWins = GameOutcomeYearCalculator.getLeagueMedianWins(year, **kwargs)
+        return numpy.array(
+            [
+                0
+                if leagueMedianWins[teamId] is None
+                else int(leagueMedianWins[teamId] * 2)
+                for teamId in yearFrame.teamIds
+            ],
+            dtype=numpy.int64,
+        )
+
+    @classmethod
+    def _getScheduleSimulator(
+        cls, year: Year, filters: YearFilters, **kwargs
+    ) -> ScheduleSimulator:
+        """
+        Returns a ScheduleSimulator for the scores in the weeks remaining after the given filters are applied.
+        Each multi-week matchup is combined into a single game,
+        and its teams are only paired up with the teams in other multi-week matchups that were played over the same weeks.
+        """
+        yearFrame = YearNavigator.getYearFrame(year)
+        rows = yearFrame.getRows(filters)
+        isMultiWeekMatchup = yearFrame.multiWeekMatchupGroup[rows] != -1
+        singleRows = rows[~isMultiWeekMatchup]
+        weekIndex = yearFrame.weekIndex[singleRows]
+        weekTeamIndexes = list()
+        weekScores = list()
+        for week in numpy.unique(weekIndex).tolist():
+            weekRows = singleRows[weekIndex == week]
+            weekTeamIndexes.append(
+                numpy.concatenate(
+                    (yearFrame.teamAIndex[weekRows], yearFrame.teamBIndex[weekRows])
+                )
+            )
+            weekScores.append(
+                numpy.concatenate(
+                    (yearFrame.teamAScore[weekRows], yearFrame.teamBScore[weekRows])
+                )
+            )
+
+        multiWeekRows = rows[isMultiWeekMatchup]
+        if len(multiWeekRows) > 0:
+            simplifiedMatchups = yearFrame.simplifyMultiWeekMatchups(multiWeekRows)
+            groups = yearFrame.multiWeekMatchupGroup[multiWeekRows]
+            # in the same order as the combined matchups
+            uniqueGroups, firstIndexes = numpy.unique(groups, return_index=True)
+            uniqueGroups = uniqueGroups[numpy.argsort(firstIndexes, kind="stable")]
+            weekSpans = [
+                (
+                    int(yearFrame.weekIndex[multiWeekRows[groups == group]].min()),
+                    int(yearFrame.weekIndex[multiWeekRows[groups == group]].max()),
+                )
+                for group in uniqueGroups.tolist()
+            ]
+            for weekSpan in sorted(set(weekSpans)):
+                inWeekSpan = numpy.array([span == weekSpan for span in weekSpans])
+                weekTeamIndexes.append(
+                    numpy.concatenate(
+                        (
+                            simplifiedMatchups.teamAIndex[inWeekSpan],
+                            simplifiedMatchups.teamBIndex[inWeekSpan],
+                        )
+                    )
+                )
+                weekScores.append(
+                    numpy.concatenate(
+                        (
+                            simplifiedMatchups.teamAScore[inWeekSpan],
+                            simplifiedMatchups.teamBScore[inWeekSpan],
+                        )
+                    )
+                )
+
+        return ScheduleSimulator(
+            yearFrame.numberOfTeams,
+            weekTeamIndexes,
+            weekScores,
+            fixedHalfWins=cls.__getLeagueMedianHalfWins(year, **kwargs)
+            if yearFrame.leagueMedianGames
+            else None,
+        )
+
+    @classmethod
+    @validateYear
+    def simulateSchedules(
+        cls,
+        year: Year,
+        numberOfSimulations: int = 10_000,
+        *,
+        seed: Optional[int] = None,
+        workers: int = 1,
+        **kwargs,
+    ) -> ScheduleSimulation:
+        """
+        Returns the distribution of wins and final standing for each team in the given Year over the given number of random schedules.
+        Only regular season weeks are simulated, unless onlyPostSeason or onlyChampionship is given.
+        A tie counts as half a win, and league median wins are included.
+        Standings are ordered by wins, then by points scored.
+        Give a seed to get the same results every time, and give more than 1 worker to run the simulations in that many processes.
+        The results for a seed are the same no matter how many workers are used.
+
+        Example response:
+            ScheduleSimulation(
+                numberOfSimulations=10000,
+                expectedWins={"someTeamId": Deci("7.9435"), ...},
+                expectedStanding={"someTeamId": Deci("3.1021"), ...},
+                winDistribution={"someTeamId": {Deci("4"): 12, Deci("4.5"): 3, ...}, ...},
+                standingDistribution={"someTeamId": [2831, 2210, ...], ...},
+            )
+        """
+        numberOfSimulations = GeneralUtil.validatePositiveInt(
+            numberOfSimulations, "numberOfSimulations"
+        )
+        workers = GeneralUtil.validatePositiveInt(workers, "workers")
+        if not kwargs.get("onlyPostSeason") and not kwargs.get("onlyChampionship"):
+            # playoff pairings aren't random, so they aren't part of a team's schedule luck
+            kwargs["onlyRegularSeason"] = True
+        filters = YearFilters.getForYear(year, **kwargs)
+        yearFrame = YearNavigator.getYearFrame(year)
+
+        scheduleSimulator = cls._getScheduleSimulator(year, filters, **kwargs)
+        halfWinCounts, standingCounts = scheduleSimulator.simulate(
+            numberOfSimulations, seed=seed, workers=workers
+        )
+
+        halfWins = numpy.arange(scheduleSimulator.maxHalfWins + 1)
+        standings = numpy.arange(1, yearFrame.numberOfTeams + 1)
+        expectedWins = list()
+        expectedStanding = list()
+        winDistribution = list()
+        for teamHalfWinCounts, teamStandingCounts in zip(
+            halfWinCounts.tolist(), standingCounts.tolist()
+        ):
+            expectedWins.append(
+                Deci(int(numpy.dot(halfWins, teamHalfWinCounts)))
+                / Deci(2 * numberOfSimulations)
+            )
+            expectedStanding.append(
+                Deci(int(numpy.dot(standings, teamStandingCounts)))
+                / Deci(numberOfSimulations)
+            )
+            winDistribution.append(
+                {
+                    Deci(teamHalfWins) / Deci(2): count
+                    for teamHalfWins, count in enumerate(teamHalfWinCounts)
+                    if count > 0
+                }
+            )
+        return ScheduleSimulation(
+            numberOfSimulations=numberOfSimulations,
+            expectedWins=yearFrame.toTeamIdDict(expectedWins),
+            expectedStanding=yearFrame.toTeamIdDict(expectedStanding),
+            winDistribution=yearFrame.toTeamIdDict(winDistribution),
+            standingDistribution=yearFrame.toTeamIdDict(standingCounts.tolist()),
+        )
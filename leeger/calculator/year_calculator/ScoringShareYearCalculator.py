@@ -1,5 +1,7 @@
 from typing import Optional
 
+import numpy
+
 from leeger.calculator.parent.YearCalculator import YearCalculator
 from leeger.calculator.year_calculator.PointsScoredYearCalculator import (
     PointsScoredYearCalculator,
@@ -11,6 +13,7 @@ from leeger.util.Deci import Deci
 from leeger.util.GeneralUtil import GeneralUtil
 from leeger.util.navigator import WeekNavigator
 from leeger.util.navigator.YearNavigator import YearNavigator
+from leeger.util.NumericSettings import NumericSettings
 
 
 class ScoringShareYearCalculator(YearCalculator):
@@ -18,6 +21,284 @@ class ScoringShareYearCalculator(YearCalculator):
     Used to calculate all scoring shares.
     """
 
+    @classmethod
+    def __getWeeklyScoringShares(
+        cls, year: Year, filters: YearFilters
+    ) -> list[tuple[str, Optional[Deci]]]:
+        """
+        Returns the Team ID and the share of that week's scoring for every score in the weeks remaining after the given filters are applied.
+        Scores are in the order they were played.
+        The scoring share will be None if no points were scored in that week.
+        """
+        yearFrame = YearNavigator.getYearFrame(year)
+        weekRankings = yearFrame.getWeekRankings(filters)
+
+        totalPointsScoredInEachWeek = [
+            Deci(totalPointsScoredInWeek) if totalPointsScoredInWeek != 0 else None
+            for totalPointsScoredInWeek in weekRankings.totalScore
+        ]
+
+        teamIdsAndScoringShares = list()
+        for teamAIndex, teamBIndex, teamAScore, teamBScore, weekPosition in zip(
+            weekRankings.teamAIndex.tolist(),
+            weekRankings.teamBIndex.tolist(),
+            yearFrame.teamAScoreValue[weekRankings.rows].tolist(),
+            yearFrame.teamBScoreValue[weekRankings.rows].tolist(),
+            weekRankings.weekPosition.tolist(),
+        ):
+            totalPointsScoredInWeek = totalPointsScoredInEachWeek[weekPosition]
+            for teamIndex, score in (
+                (teamAIndex, teamAScore),
+                (teamBIndex, teamBScore),
+            ):
+                scoringShare = None
+                if totalPointsScoredInWeek is not None:
+                    scoringShare = (Deci(score) / totalPointsScoredInWeek) * Deci("100")
+                teamIdsAndScoringShares.append(
+                    (yearFrame.teamIds[teamIndex], scoringShare)
+                )
+        return teamIdsAndScoringShares
+
+    @classmethod
+    def __getWeeklyScoringSharesAsFloats(
+        cls, year: Year, filters: YearFilters
+    ) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the team index, the share of that week's scoring and whether any points were scored that week for every score
+        in the weeks remaining after the given filters are applied.
+        Scoring shares are 64-bit floats and are 0 for weeks where no points were scored.
+        """
+        yearFrame = YearNavigator.getYearFrame(year)
+        weekRankings = yearFrame.getWeekRankings(filters)
+        teamIndexes = numpy.column_stack(
+            (weekRankings.teamAIndex, weekRankings.teamBIndex)
+        ).ravel()
+        scores = numpy.column_stack(
+            (
+                yearFrame.teamAScore[weekRankings.rows],
+                yearFrame.teamBScore[weekRankings.rows],
+            )
+        ).ravel()
+        totalPointsScoredInWeek = numpy.array(
+            weekRankings.totalScore, dtype=numpy.float64
+        )[numpy.repeat(weekRankings.weekPosition, 2)]
+        weekHasPoints = totalPointsScoredInWeek != 0
+        scoringShares = numpy.zeros(len(scores))
+        scoringShares[weekHasPoints] = (
+            scores[weekHasPoints] / totalPointsScoredInWeek[weekHasPoints]
+        ) * 100
+        return teamIndexes, scoringShares, weekHasPoints
+
+    @classmethod
+    def _getMaxScoringShareByTeam(
+        cls, year: Year, filters: YearFilters, **kwargs
+    ) -> dict[str, Deci]:
+        """
+        Returns the Max Scoring Share for each team in the weeks remaining after the given filters are applied.
+        """
+        teamIdAndMaxScoringShare = dict()
+        for teamId in YearNavigator.getAllTeamIds(year):
+            teamIdAndMaxScoringShare[teamId] = Deci(0)
+
+        if NumericSettings.useFloat(**kwargs):
+            yearFrame = YearNavigator.getYearFrame(year)
+            teamIndexes, scoringShares, weekHasPoints = (
+                cls.__getWeeklyScoringSharesAsFloats(year, filters)
+            )
+            maxScoringShares = numpy.zeros(yearFrame.numberOfTeams)
+            # avoid division by 0
+            numpy.maximum.at(
+                maxScoringShares,
+                teamIndexes[weekHasPoints],
+                scoringShares[weekHasPoints],
+            )
+            for teamId, maxScoringShare in zip(
+                yearFrame.teamIds, maxScoringShares.tolist()
+            ):
+                teamIdAndMaxScoringShare[teamId] = Deci(maxScoringShare)
+        else:
+            for teamId, scoringShare in cls.__getWeeklyScoringShares(year, filters):
+                # avoid division by 0
+                if scoringShare is not None:
+                    teamIdAndMaxScoringShare[teamId] = max(
+                        scoringShare, teamIdAndMaxScoringShare[teamId]
+                    )
+        return teamIdAndMaxScoringShare
+
+    @classmethod
+    def _getMinScoringShareByTeam(
+        cls, year: Year, filters: YearFilters, **kwargs
+    ) -> dict[str, Optional[Deci]]:
+        """
+        Returns the Min Scoring Share for each team in the weeks remaining after the given filters are applied.
+        """
+        teamIdAndMinScoringShare = dict()
+        for teamId in YearNavigator.getAllTeamIds(year):
+            teamIdAndMinScoringShare[teamId] = None
+
+        if NumericSettings.useFloat(**kwargs):
+            yearFrame = YearNavigator.getYearFrame(year)
+            teamIndexes, scoringShares, weekHasPoints = (
+                cls.__getWeeklyScoringSharesAsFloats(year, filters)
+            )
+            minScoringShares = numpy.full(yearFrame.numberOfTeams, numpy.inf)
+            numpy.minimum.at(
+                minScoringShares,
+                teamIndexes[weekHasPoints],
+                scoringShares[weekHasPoints],
+            )
+            # avoid division by 0
+            if not weekHasPoints.all():
+                minScoringShares = numpy.minimum(minScoringShares, 0)
+            for teamId, minScoringShare in zip(
+                yearFrame.teamIds, minScoringShares.tolist()
+            ):
+                if minScoringShare != numpy.inf:
+                    teamIdAndMinScoringShare[teamId] = Deci(minScoringShare)
+        else:
+            for teamId, scoringShare in cls.__getWeeklyScoringShares(year, filters):
+                # avoid division by 0
+                if scoringShare is None:
+                    for anyTeamId in YearNavigator.getAllTeamIds(year):
+                        teamIdAndMinScoringShare[anyTeamId] = Deci("0")
+                elif teamIdAndMinScoringShare[teamId] is None:
+                    teamIdAndMinScoringShare[teamId] = scoringShare
+                else:
+                    teamIdAndMinScoringShare[teamId] = min(
+                        scoringShare, teamIdAndMinScoringShare[teamId]
+                    )
+        return teamIdAndMinScoringShare
+
+    @classmethod
+    def __getScoresPlayedByEachWeek(cls, year: Year, filters: YearFilters) -> list[int]:
+        """
+        Returns how many of the scores returned by __getWeeklyScoringShares() (or __getWeeklyScoringSharesAsFloats())
+        were played by the end of each week from the start to the end of the given filters.
+        """
+        yearFrame = YearNavigator.getYearFrame(year)
+        weekRankings = yearFrame.getWeekRankings(filters)
+        return yearFrame.countPlayedByEachWeek(
+            numpy.repeat(weekRankings.weekIndex[weekRankings.weekPosition], 2),
+            filters.weekNumberStart,
+            filters.weekNumberEnd,
+        )
+
+    @classmethod
+    def _getMaxScoringShareByTeamAfterEachWeek(
+        cls, year: Year, filters: YearFilters, **kwargs
+    ) -> list[dict[str, Deci]]:
+        """
+        Returns what _getMaxScoringShareByTeam() returns for each week from the start to the end of the given filters as the last week.
+        Every score is only looked at once and used to update each team's running max.
+        """
+        teamIdAndMaxScoringShareAfterEachWeek = list()
+        playedByEachWeek = cls.__getScoresPlayedByEachWeek(year, filters)
+        played = 0
+
+        if NumericSettings.useFloat(**kwargs):
+            yearFrame = YearNavigator.getYearFrame(year)
+            teamIndexes, scoringShares, weekHasPoints = (
+                cls.__getWeeklyScoringSharesAsFloats(year, filters)
+            )
+            maxScoringShares = numpy.zeros(yearFrame.numberOfTeams)
+            for playedByWeek in playedByEachWeek:
+                # avoid division by 0
+                hasPoints = weekHasPoints[played:playedByWeek]
+                numpy.maximum.at(
+                    maxScoringShares,
+                    teamIndexes[played:playedByWeek][hasPoints],
+                    scoringShares[played:playedByWeek][hasPoints],
+                )
+                teamIdAndMaxScoringShareAfterEachWeek.append(
+                    yearFrame.toTeamIdDict(
+                        [
+                            Deci(maxScoringShare)
+                            for maxScoringShare in maxScoringShares.tolist()
+                        ]
+                    )
+                )
+                played = playedByWeek
+            return teamIdAndMaxScoringShareAfterEachWeek
+
+        teamIdAndMaxScoringShare = dict()
+        for teamId in YearNavigator.getAllTeamIds(year):
+            teamIdAndMaxScoringShare[teamId] = Deci(0)
+        teamIdsAndScoringShares = cls.__getWeeklyScoringShares(year, filters)
+        for playedByWeek in playedByEachWeek:
+            for teamId, scoringShare in teamIdsAndScoringShares[played:playedByWeek]:
+                # avoid division by 0
+                if scoringShare is not None:
+                    teamIdAndMaxScoringShare[teamId] = max(
+                        scoringShare, teamIdAndMaxScoringShare[teamId]
+                    )
+            teamIdAndMaxScoringShareAfterEachWeek.append(dict(teamIdAndMaxScoringShare))
+            played = playedByWeek
+        return teamIdAndMaxScoringShareAfterEachWeek
+
+    @classmethod
+    def _getMinScoringShareByTeamAfterEachWeek(
+        cls, year: Year, filters: YearFilters, **kwargs
+    ) -> list[dict[str, Optional[Deci]]]:
+        """
+        Returns what _getMinScoringShareByTeam() returns for each week from the start to the end of the given filters as the last week.
+        Every score is only looked at once and used to update each team's running min.
+        """
+        teamIdAndMinScoringShareAfterEachWeek = list()
+        playedByEachWeek = cls.__getScoresPlayedByEachWeek(year, filters)
+        played = 0
+
+        if NumericSettings.useFloat(**kwargs):
+            yearFrame = YearNavigator.getYearFrame(year)
+            teamIndexes, scoringShares, weekHasPoints = (
+                cls.__getWeeklyScoringSharesAsFloats(year, filters)
+            )
+            minScoringShares = numpy.full(yearFrame.numberOfTeams, numpy.inf)
+            anyWeekWithoutPoints = False
+            for playedByWeek in playedByEachWeek:
+                hasPoints = weekHasPoints[played:playedByWeek]
+                numpy.minimum.at(
+                    minScoringShares,
+                    teamIndexes[played:playedByWeek][hasPoints],
+                    scoringShares[played:playedByWeek][hasPoints],
+                )
+                # avoid division by 0
+                if not hasPoints.all():
+                    anyWeekWithoutPoints = True
+                if anyWeekWithoutPoints:
+                    minScoringShares = numpy.minimum(minScoringShares, 0)
+                teamIdAndMinScoringShareAfterEachWeek.append(
+                    yearFrame.toTeamIdDict(
+                        [
+                            Deci(minScoringShare)
+                            if minScoringShare != numpy.inf
+                            else None
+                            for minScoringShare in minScoringShares.tolist()
+                        ]
+                    )
+                )
+                played = playedByWeek
+            return teamIdAndMinScoringShareAfterEachWeek
+
+        teamIdAndMinScoringShare = dict()
+        for teamId in YearNavigator.getAllTeamIds(year):
+            teamIdAndMinScoringShare[teamId] = None
+        teamIdsAndScoringShares = cls.__getWeeklyScoringShares(year, filters)
+        for playedByWeek in playedByEachWeek:
+            for teamId, scoringShare in teamIdsAndScoringShares[played:playedByWeek]:
+                # avoid division by 0
+                if scoringShare is None:
+                    for anyTeamId in YearNavigator.getAllTeamIds(year):
+                        teamIdAndMinScoringShare[anyTeamId] = Deci("0")
+                elif teamIdAndMinScoringShare[teamId] is None:
+                    teamIdAndMinScoringShare[teamId] = scoringShare
+                else:
+                    teamIdAndMinScoringShare[teamId] = min(
+                        scoringShare, teamIdAndMinScoringShare[teamId]
+                    )
+            teamIdAndMinScoringShareAfterEachWeek.append(dict(teamIdAndMinScoringShare))
+            played = playedByWeek
+        return teamIdAndMinScoringShareAfterEachWeek
+
     @classmethod
     @validateYear
     def getScoringShare(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
@@ -124,36 +405,9 @@ class ScoringShareYearCalculator(YearCalculator):
 
         filters = YearFilters.getForYear(year, **kwargs)
 
-        teamIdAndMaxScoringShare = dict()
-        for teamId in YearNavigator.getAllTeamIds(year):
-            teamIdAndMaxScoringShare[teamId] = Deci(0)
-
-        for i in range(filters.weekNumberStart - 1, filters.weekNumberEnd):
-            week = year.weeks[i]
-            totalPointsScoredInWeek = sum(
-                WeekNavigator.getTeamIdsAndScores(
-                    week, WeekFilters(includeMatchupTypes=filters.includeMatchupTypes)
-                ).values()
-            )
-            # avoid division by 0
-            if totalPointsScoredInWeek == 0:
-                continue
-            else:
-                for matchup in week.matchups:
-                    if matchup.matchupType in filters.includeMatchupTypes:
-                        teamAScoringShare = (
-                            Deci(matchup.teamAScore) / Deci(totalPointsScoredInWeek)
-                        ) * Deci("100")
-                        teamBScoringShare = (
-                            Deci(matchup.teamBScore) / Deci(totalPointsScoredInWeek)
-                        ) * Deci("100")
-                        teamIdAndMaxScoringShare[matchup.teamAId] = max(
-                            teamAScoringShare, teamIdAndMaxScoringShare[matchup.teamAId]
-                        )
-                        teamIdAndMaxScoringShare[matchup.teamBId] = max(
-                            teamBScoringShare, teamIdAndMaxScoringShare[matchup.teamBId]
-                        )
-
+        teamIdAndMaxScoringShare = cls._getMaxScoringShareByTeam(
+            year, filters, **kwargs
+        )
         cls._setToNoneIfNoGamesPlayed(teamIdAndMaxScoringShare, year, filters, **kwargs)
         return teamIdAndMaxScoringShare
 
@@ -175,42 +429,8 @@ class ScoringShareYearCalculator(YearCalculator):
 
         filters = YearFilters.getForYear(year, **kwargs)
 
-        teamIdAndMinScoringShare = dict()
-        for teamId in YearNavigator.getAllTeamIds(year):
-            teamIdAndMinScoringShare[teamId] = None
-
-        for i in range(filters.weekNumberStart - 1, filters.weekNumberEnd):
-            week = year.weeks[i]
-            totalPointsScoredInWeek = sum(
-                WeekNavigator.getTeamIdsAndScores(
-                    week, WeekFilters(includeMatchupTypes=filters.includeMatchupTypes)
-                ).values()
-            )
-            for matchup in week.matchups:
-                if matchup.matchupType in filters.includeMatchupTypes:
-                    # avoid division by 0
-                    if totalPointsScoredInWeek == 0:
-                        for teamId in YearNavigator.getAllTeamIds(year):
-                            teamIdAndMinScoringShare[teamId] = Deci("0")
-                        continue
-                    teamAScoringShare = (
-                        Deci(matchup.teamAScore) / Deci(totalPointsScoredInWeek)
-                    ) * Deci("100")
-                    teamBScoringShare = (
-                        Deci(matchup.teamBScore) / Deci(totalPointsScoredInWeek)
-                    ) * Deci("100")
-                    if teamIdAndMinScoringShare[matchup.teamAId] is None:
-                        teamIdAndMinScoringShare[matchup.teamAId] = teamAScoringShare
-                    else:
-                        teamIdAndMinScoringShare[matchup.teamAId] = min(
-                            teamAScoringShare, teamIdAndMinScoringShare[matchup.teamAId]
-                        )
-                    if teamIdAndMinScoringShare[matchup.teamBId] is None:
-                        teamIdAndMinScoringShare[matchup.teamBId] = teamBScoringShare
-                    else:
-                        teamIdAndMinScoringShare[matchup.teamBId] = min(
-                            teamBScoringShare, teamIdAndMinScoringShare[matchup.teamBId]
-                        )
-
+        teamIdAndMinScoringShare = cls._getMinScoringShareByTeam(
+            year, filters, **kwargs
+        )
         cls._setToNoneIfNoGamesPlayed(teamIdAndMinScoringShare, year, filters, **kwargs)
         return teamIdAndMinScoringShare
@@ -5,9 +5,11 @@ import numpy
 from leeger.calculator.parent.YearCalculator import YearCalculator
 from leeger.decorator.validators import validateYear
 from leeger.model.filter import YearFilters
+from leeger.model.frame.SimplifiedMatchups import SimplifiedMatchups
 from leeger.model.league.Year import Year
 from leeger.util.Deci import Deci
 from leeger.util.navigator.YearNavigator import YearNavigator
+from leeger.util.NumericSettings import NumericSettings
 
 
 class ScoringStandardDeviationYearCalculator(YearCalculator):
@@ -15,6 +17,140 @@ class ScoringStandardDeviationYearCalculator(YearCalculator):
     Used to calculate all scoring standard deviations.
     """
 
+    @staticmethod
+    def __getScoresByTeam(
+        year: Year, simplifiedMatchups: SimplifiedMatchups, **kwargs
+    ) -> list[list[float | Deci]]:
+        """
+        Returns a list of the scores used to calculate the Scoring Standard Deviation for each team (ordered by team index) in the given Matchups.
+        """
+        yearFrame = YearNavigator.getYearFrame(year)
+        if NumericSettings.useFloat(**kwargs):
+            return yearFrame.groupScoresByTeam(
+                simplifiedMatchups.teamAIndex,
+                simplifiedMatchups.teamBIndex,
+                simplifiedMatchups.teamAScore,
+                simplifiedMatchups.teamBScore,
+            )
+        return [
+            [Deci(score) for score in scores]
+            for scores in yearFrame.groupScoresByTeam(
+                simplifiedMatchups.teamAIndex,
+                simplifiedMatchups.teamBIndex,
+                simplifiedMatchups.teamAScoreValue,
+                simplifiedMatchups.teamBScoreValue,
+            )
+        ]
+
+    @staticmethod
+    def __getScoringStandardDeviationFromScores(
+        year: Year, scoresByTeam: list[list[float | Deci]]
+    ) -> dict[str, Optional[Deci]]:
+        teamIdAndScores = YearNavigator.getYearFrame(year).toTeamIdDict(scoresByTeam)
+        allTeamIds = YearNavigator.getAllTeamIds(year)
+
+        teamIdAndScoringStandardDeviation = dict()
+        for teamId in allTeamIds:
+            if len(teamIdAndScores[teamId]) > 0:
+                # the Team has scores in this range
+                teamIdAndScoringStandardDeviation[teamId] = Deci(
+                    numpy.std(teamIdAndScores[teamId])
+                )
+            else:
+                # no scores for this Team in this range, return None for them
+                teamIdAndScoringStandardDeviation[teamId] = None
+
+        return teamIdAndScoringStandardDeviation
+
+    @classmethod
+    def _getScoringStandardDeviationByTeam(
+        cls, year: Year, filters: YearFilters, **kwargs
+    ) -> dict[str, Optional[Deci]]:
+        """
+        Returns the Scoring Standard Deviation for each team in the Matchups remaining after the given filters are applied.
+        """
+        yearFrame = YearNavigator.getYearFrame(year)
+        return cls.__getScoringStandardDeviationFromScores(
+            year,
+            cls.__getScoresByTeam(
+                year,
+                yearFrame.simplifyMultiWeekMatchups(yearFrame.getRows(filters)),
+                **kwargs,
+            ),
+        )
+
+    @classmethod
+    def _getScoringStandardDeviationByTeamAfterEachWeek(
+        cls, year: Year, filters: YearFilters, **kwargs
+    ) -> list[dict[str, Optional[Deci]]]:
+        """
+        Returns what _getScoringStandardDeviationByTeam() returns for each week from the start to the end of the given filters as the last week.
+
+        Each team's scores are collected as the weeks go by, so every Matchup that is not part of a multi-week matchup is only looked at once.
+        A multi-week matchup's scores depend on which of its weeks are in the range,
+        so multi-week matchups are combined again for each week (just like _getScoringStandardDeviationByTeam(), they come after every other Matchup).
+        Every deviation depends on the mean of all of a team's scores, so the standard deviation itself is calculated again for each week.
+        """
+        yearFrame = YearNavigator.getYearFrame(year)
+        rows = yearFrame.getRows(filters)
+        isMultiWeekMatchup = yearFrame.multiWeekMatchupGroup[rows] != -1
+        singleRows = rows[~isMultiWeekMatchup]
+        multiWeekRows = rows[isMultiWeekMatchup]
+        singleMatchups = yearFrame.simplifyMultiWeekMatchups(singleRows)
+        singleScoresByTeam = cls.__getScoresByTeam(year, singleMatchups, **kwargs)
+        # which of each team's scores come from each row, so each team's scores can be collected week by week
+        scoreNumbers = [0] * yearFrame.numberOfTeams
+        teamIndexesAndScoreNumbers = list()
+        for teamAIndex, teamBIndex in zip(
+            singleMatchups.teamAIndex.tolist(), singleMatchups.teamBIndex.tolist()
+        ):
+            for teamIndex in (teamAIndex, teamBIndex):
+                teamIndexesAndScoreNumbers.append((teamIndex, scoreNumbers[teamIndex]))
+                scoreNumbers[teamIndex] += 1
+
+        teamIdAndScoringStandardDeviationAfterEachWeek = list()
+        scoresByTeam = [list() for _ in range(yearFrame.numberOfTeams)]
+        played = 0
+        for playedByWeek, multiWeekRowsPlayed in zip(
+            yearFrame.countPlayedByEachWeek(
+                yearFrame.weekIndex[singleRows],
+                filters.weekNumberStart,
+                filters.weekNumberEnd,
+            ),
+            yearFrame.countPlayedByEachWeek(
+                yearFrame.weekIndex[multiWeekRows],
+                filters.weekNumberStart,
+                filters.weekNumberEnd,
+            ),
+        ):
+            for teamIndex, scoreNumber in teamIndexesAndScoreNumbers[
+                2 * played : 2 * playedByWeek
+            ]:
+                scoresByTeam[teamIndex].append(
+                    singleScoresByTeam[teamIndex][scoreNumber]
+                )
+            played = playedByWeek
+
+            scoresByTeamInWeek = scoresByTeam
+            if multiWeekRowsPlayed > 0:
+                scoresByTeamInWeek = [
+                    scores + multiWeekScores
+                    for scores, multiWeekScores in zip(
+                        scoresByTeam,
+                        cls.__getScoresByTeam(
+                            year,
+                            yearFrame.simplifyMultiWeekMatchups(
+                                multiWeekRows[:multiWeekRowsPlayed]
+                            ),
+                            **kwargs,
+                        ),
+                    )
+                ]
+            teamIdAndScoringStandardDeviationAfterEachWeek.append(
+                cls.__getScoringStandardDeviationFromScores(year, scoresByTeamInWeek)
+            )
+        return teamIdAndScoringStandardDeviationAfterEachWeek
+
     @classmethod
     @validateYear
     def getScoringStandardDeviation(
@@ -44,25 +180,9 @@ class ScoringStandardDeviationYearCalculator(YearCalculator):
         """
         filters = YearFilters.getForYear(year, **kwargs)
 
-        teamIdAndScores = dict()
-        allTeamIds = YearNavigator.getAllTeamIds(year)
-        for teamId in allTeamIds:
-            teamIdAndScores[teamId] = list()
-
-        allMatchups = YearNavigator.getAllSimplifiedMatchupsInYear(year, filters)
-        for matchup in allMatchups:
-            teamIdAndScores[matchup.teamAId].append(Deci(matchup.teamAScore))
-            teamIdAndScores[matchup.teamBId].append(Deci(matchup.teamBScore))
+        if not filters.includeMultiWeekMatchups:
+            raise ValueError(
+                "Multi-Week matchups must be included in this calculation."
+            )
 
-        teamIdAndScoringStandardDeviation = dict()
-        for teamId in allTeamIds:
-            if len(teamIdAndScores[teamId]) > 0:
-                # the Team has scores in this range
-                teamIdAndScoringStandardDeviation[teamId] = Deci(
-                    numpy.std(teamIdAndScores[teamId])
-                )
-            else:
-                # no scores for this Team in this range, return None for them
-                teamIdAndScoringStandardDeviation[teamId] = None
-
-        return teamIdAndScoringStandardDeviation
+        return cls._getScoringStandardDeviationByTeam(year, filters, **kwargs)
@@ -1,10 +1,13 @@
 from typing import Optional
 
+import numpy
+
 from leeger.calculator.parent.YearCalculator import YearCalculator
 from leeger.decorator.validators import validateYear
 from leeger.model.filter import YearFilters
 from leeger.model.league.Year import Year
 from leeger.util.navigator.YearNavigator import YearNavigator
+from leeger.util.NumericSettings import NumericSettings
 
 
 class SingleScoreYearCalculator(YearCalculator):
@@ -12,6 +15,128 @@ class SingleScoreYearCalculator(YearCalculator):
     Used to calculate all single score stats.
     """
 
+    @classmethod
+    def __getSingleScoresWithFixedPoint(
+        cls, year: Year, filters: YearFilters, *, maxScore: bool, **kwargs
+    ) -> dict[str, Optional[float | int]]:
+        """
+        Returns the max (or min) score for each team, comparing scores as fixed-point integers.
+        The original score is returned, not the fixed-point integer.
+        """
+        scale = NumericSettings.getFixedPointScale(**kwargs)
+        yearFrame = YearNavigator.getYearFrame(year)
+        rows = yearFrame.getRows(filters)
+        teamAScore, teamBScore = yearFrame.getFixedPointScores(scale, rows)
+
+        teamIndexes = numpy.column_stack(
+            (yearFrame.teamAIndex[rows], yearFrame.teamBIndex[rows])
+        ).ravel()
+        fixedPointScores = numpy.column_stack((teamAScore, teamBScore)).ravel()
+        scoreValues = numpy.empty(len(teamIndexes), dtype=object)
+        scoreValues[0::2] = yearFrame.teamAScoreValue[rows]
+        scoreValues[1::2] = yearFrame.teamBScoreValue[rows]
+
+        # sorted by team, then by score (best first)
+        # lexsort() is stable, so the first score played is kept if there is a tie, just like max() and min()
+        order = numpy.lexsort(
+            (-fixedPointScores if maxScore else fixedPointScores, teamIndexes)
+        )
+        teamIndexesWithScores, firstIndexes = numpy.unique(
+            teamIndexes[order], return_index=True
+        )
+        singleScores = [None] * yearFrame.numberOfTeams
+        for teamIndex, singleScore in zip(
+            teamIndexesWithScores.tolist(), scoreValues[order[firstIndexes]].tolist()
+        ):
+            singleScores[teamIndex] = singleScore
+        return yearFrame.toTeamIdDict(singleScores)
+
+    @classmethod
+    def _getSingleScores(
+        cls, year: Year, filters: YearFilters, *, maxScore: bool, **kwargs
+    ) -> dict[str, Optional[float | int]]:
+        """
+        Returns the max (or min) score for each team in the Matchups remaining after the given filters are applied.
+        """
+        if NumericSettings.useFixedPoint(**kwargs):
+            return cls.__getSingleScoresWithFixedPoint(
+                year, filters, maxScore=maxScore, **kwargs
+            )
+
+        yearFrame = YearNavigator.getYearFrame(year)
+        # max() and min() keep the first score they see if there is a tie
+        function = max if maxScore else min
+        return yearFrame.toTeamIdDict(
+            [
+                function(scores) if len(scores) > 0 else None
+                for scores in yearFrame.getScoresByTeam(yearFrame.getRows(filters))
+            ]
+        )
+
+    @classmethod
+    def _getSingleScoresAfterEachWeek(
+        cls, year: Year, filters: YearFilters, *, maxScore: bool, **kwargs
+    ) -> list[dict[str, Optional[float | int]]]:
+        """
+        Returns what _getSingleScores() returns for each week from the start to the end of the given filters as the last week.
+        Every score is only looked at once and used to update each team's running max (or min).
+        """
+        yearFrame = YearNavigator.getYearFrame(year)
+        rows = yearFrame.getRows(filters)
+        playedByEachWeek = yearFrame.countPlayedByEachWeek(
+            yearFrame.weekIndex[rows], filters.weekNumberStart, filters.weekNumberEnd
+        )
+        teamAScoreValue = yearFrame.teamAScoreValue[rows].tolist()
+        teamBScoreValue = yearFrame.teamBScoreValue[rows].tolist()
+        # the values the scores are compared with
+        teamAScore, teamBScore = teamAScoreValue, teamBScoreValue
+        if NumericSettings.useFixedPoint(**kwargs):
+            teamAScore, teamBScore = (
+                fixedPointScores.tolist()
+                for fixedPointScores in yearFrame.getFixedPointScores(
+                    NumericSettings.getFixedPointScale(**kwargs), rows
+                )
+            )
+        scores = list(
+            zip(
+                yearFrame.teamAIndex[rows].tolist(),
+                yearFrame.teamBIndex[rows].tolist(),
+                zip(teamAScore, teamAScoreValue),
+                zip(teamBScore, teamBScoreValue),
+            )
+        )
+
+        teamIdAndSingleScoreAfterEachWeek = list()
+        # (the value compared, the original score) for each team
+        singleScores = [None] * yearFrame.numberOfTeams
+        played = 0
+        for playedByWeek in playedByEachWeek:
+            for teamAIndex, teamBIndex, teamAScores, teamBScores in scores[
+                played:playedByWeek
+            ]:
+                for teamIndex, (score, scoreValue) in (
+                    (teamAIndex, teamAScores),
+                    (teamBIndex, teamBScores),
+                ):
+                    singleScore = singleScores[teamIndex]
+                    # the first score played is kept if there is a tie, just like max() and min()
+                    if (
+                        singleScore is None
+                        or (maxScore and score > singleScore[0])
+                        or (not maxScore and score < singleScore[0])
+                    ):
+                        singleScores[teamIndex] = (score, scoreValue)
+            teamIdAndSingleScoreAfterEachWeek.append(
+                yearFrame.toTeamIdDict(
+                    [
+                        None if singleScore is None else singleScore[1]
+                        for singleScore in singleScores
+                    ]
+                )
+            )
+            played = playedByWeek
+        return teamIdAndSingleScoreAfterEachWeek
+
     @classmethod
     @validateYear
     def getMaxScore(cls, year: Year, **kwargs) -> dict[str, Optional[float | int]]:
@@ -29,23 +154,7 @@ class SingleScoreYearCalculator(YearCalculator):
         """
         filters = YearFilters.getForYear(year, **kwargs)
 
-        teamIdAndMaxScore = dict()
-
-        allMatchups = cls._getAllFilteredMatchups(year, filters)
-
-        for teamId in YearNavigator.getAllTeamIds(year):
-            teamIdAndMaxScore[teamId] = None
-
-        for matchup in allMatchups:
-            aPreviousMaxScore = teamIdAndMaxScore[matchup.teamAId]
-            if aPreviousMaxScore is None or matchup.teamAScore > aPreviousMaxScore:
-                teamIdAndMaxScore[matchup.teamAId] = matchup.teamAScore
-
-            bPreviousMaxScore = teamIdAndMaxScore[matchup.teamBId]
-            if bPreviousMaxScore is None or matchup.teamBScore > bPreviousMaxScore:
-                teamIdAndMaxScore[matchup.teamBId] = matchup.teamBScore
-
-        return teamIdAndMaxScore
+        return cls._getSingleScores(year, filters, maxScore=True, **kwargs)
 
     @classmethod
     @validateYear
@@ -64,20 +173,4 @@ class SingleScoreYearCalculator(YearCalculator):
         """
         filters = YearFilters.getForYear(year, **kwargs)
 
-        teamIdAndMinScore = dict()
-
-        allMatchups = cls._getAllFilteredMatchups(year, filters)
-
-        for teamId in YearNavigator.getAllTeamIds(year):
-            teamIdAndMinScore[teamId] = None
-
-        for matchup in allMatchups:
-            aPreviousMinScore = teamIdAndMinScore[matchup.teamAId]
-            if aPreviousMinScore is None or matchup.teamAScore < aPreviousMinScore:
-                teamIdAndMinScore[matchup.teamAId] = matchup.teamAScore
-
-            bPreviousMinScore = teamIdAndMinScore[matchup.teamBId]
-            if bPreviousMinScore is None or matchup.teamBScore < bPreviousMinScore:
-                teamIdAndMinScore[matchup.teamBId] = matchup.teamBScore
-
-        return teamIdAndMinScore
+        return cls._getSingleScores(year, filters, maxScore=False, **kwargs)
@@ -1,11 +1,15 @@
 from typing import Optional
 
+import numpy
+
 from leeger.calculator.parent.YearCalculator import YearCalculator
 from leeger.decorator.validators import validateYear
 from leeger.model.filter import YearFilters
+from leeger.model.frame.SimplifiedMatchups import SimplifiedMatchups
 from leeger.model.league.Year import Year
 from leeger.util.Deci import Deci
 from leeger.util.navigator.YearNavigator import YearNavigator
+from leeger.util.NumericSettings import NumericSettings
 
 
 class SmartWinsYearCalculator(YearCalculator):
@@ -13,6 +17,142 @@ class SmartWinsYearCalculator(YearCalculator):
     Used to calculate all Smart Wins stats.
     """
 
+    @staticmethod
+    def __getSmartWinsOfEachScore(
+        year: Year,
+        simplifiedMatchups: SimplifiedMatchups,
+        *,
+        opponentScores: bool,
+        **kwargs,
+    ) -> tuple[numpy.ndarray, numpy.ndarray | list[Deci]]:
+        """
+        Returns the team index and the Smart Wins (as 64-bit floats if the float backend is used) of every score (or every opponent's score) in the given Matchups.
+        Team A's score comes right before team B's score for each Matchup.
+        """
+        teamIndexes = numpy.column_stack(
+            (simplifiedMatchups.teamAIndex, simplifiedMatchups.teamBIndex)
+        ).ravel()
+        scores = numpy.column_stack(
+            (simplifiedMatchups.teamBScoreValue, simplifiedMatchups.teamAScoreValue)
+            if opponentScores
+            else (
+                simplifiedMatchups.teamAScoreValue,
+                simplifiedMatchups.teamBScoreValue,
+            )
+        ).ravel()
+
+        allScores = YearNavigator.getSortedScores(year)
+        if NumericSettings.useFloat(**kwargs):
+            return teamIndexes, allScores.getSmartWinsAsFloats(scores.tolist())
+        return teamIndexes, allScores.getSmartWins(scores.tolist())
+
+    @classmethod
+    def _getSmartWinsByTeam(
+        cls, year: Year, filters: YearFilters, *, opponentScores: bool, **kwargs
+    ) -> dict[str, Deci]:
+        """
+        Returns the Smart Wins each team (or each team's opponent) earned in the Matchups remaining after the given filters are applied.
+        """
+        # get all scores we want to include in our smart wins calculation
+        yearFrame = YearNavigator.getYearFrame(year)
+        teamIndexes, allSmartWins = cls.__getSmartWinsOfEachScore(
+            year,
+            yearFrame.simplifyMultiWeekMatchups(yearFrame.getRows(filters)),
+            opponentScores=opponentScores,
+            **kwargs,
+        )
+
+        teamIdAndSmartWins = dict()
+        allTeamIds = YearNavigator.getAllTeamIds(year)
+        for teamId in allTeamIds:
+            teamIdAndSmartWins[teamId] = Deci(0)
+
+        if NumericSettings.useFloat(**kwargs):
+            smartWins = yearFrame.countByTeam(teamIndexes, allSmartWins)
+            for teamId, teamSmartWins in zip(yearFrame.teamIds, smartWins.tolist()):
+                teamIdAndSmartWins[teamId] = Deci(teamSmartWins)
+        else:
+            for teamIndex, smartWins in zip(teamIndexes.tolist(), allSmartWins):
+                teamIdAndSmartWins[yearFrame.teamIds[teamIndex]] += smartWins
+        return teamIdAndSmartWins
+
+    @classmethod
+    def _getSmartWinsByTeamAfterEachWeek(
+        cls, year: Year, filters: YearFilters, *, opponentScores: bool, **kwargs
+    ) -> list[dict[str, Deci]]:
+        """
+        Returns what _getSmartWinsByTeam() returns for each week from the start to the end of the given filters as the last week.
+
+        Every score is compared against every score in the Year, so a score's Smart Wins don't depend on the range.
+        Matchups that are not part of a multi-week matchup are only looked at once and added to running totals.
+        A multi-week matchup's scores depend on which of its weeks are in the range,
+        so multi-week matchups are combined again for each week (just like _getSmartWinsByTeam(), they are added after every other Matchup).
+        """
+        yearFrame = YearNavigator.getYearFrame(year)
+        useFloat = NumericSettings.useFloat(**kwargs)
+        rows = yearFrame.getRows(filters)
+        isMultiWeekMatchup = yearFrame.multiWeekMatchupGroup[rows] != -1
+        singleRows = rows[~isMultiWeekMatchup]
+        multiWeekRows = rows[isMultiWeekMatchup]
+        multiWeekRowsPlayedByEachWeek = yearFrame.countPlayedByEachWeek(
+            yearFrame.weekIndex[multiWeekRows],
+            filters.weekNumberStart,
+            filters.weekNumberEnd,
+        )
+        teamIndexes, allSmartWins = cls.__getSmartWinsOfEachScore(
+            year,
+            yearFrame.simplifyMultiWeekMatchups(singleRows),
+            opponentScores=opponentScores,
+            **kwargs,
+        )
+        playedByEachWeek = yearFrame.countPlayedByEachWeek(
+            numpy.repeat(yearFrame.weekIndex[singleRows], 2),
+            filters.weekNumberStart,
+            filters.weekNumberEnd,
+        )
+
+        if useFloat:
+            runningSmartWins = yearFrame.countByTeamAfterEachWeek(
+                teamIndexes, playedByEachWeek, allSmartWins
+            ).tolist()
+        else:
+            runningSmartWins = list()
+            smartWinsByTeam = [Deci(0)] * yearFrame.numberOfTeams
+            teamIndexes = teamIndexes.tolist()
+            played = 0
+            for playedByWeek in playedByEachWeek:
+                for teamIndex, smartWins in zip(
+                    teamIndexes[played:playedByWeek], allSmartWins[played:playedByWeek]
+                ):
+                    smartWinsByTeam[teamIndex] += smartWins
+                runningSmartWins.append(list(smartWinsByTeam))
+                played = playedByWeek
+
+        teamIdAndSmartWinsAfterEachWeek = list()
+        for smartWinsByTeam, multiWeekRowsPlayed in zip(
+            runningSmartWins, multiWeekRowsPlayedByEachWeek
+        ):
+            if multiWeekRowsPlayed > 0:
+                for teamIndex, smartWins in zip(
+                    *cls.__getSmartWinsOfEachScore(
+                        year,
+                        yearFrame.simplifyMultiWeekMatchups(
+                            multiWeekRows[:multiWeekRowsPlayed]
+                        ),
+                        opponentScores=opponentScores,
+                        **kwargs,
+                    )
+                ):
+                    smartWinsByTeam[teamIndex] += smartWins
+            teamIdAndSmartWinsAfterEachWeek.append(
+                yearFrame.toTeamIdDict(
+                    [Deci(smartWins) for smartWins in smartWinsByTeam]
+                    if useFloat
+                    else smartWinsByTeam
+                )
+            )
+        return teamIdAndSmartWinsAfterEachWeek
+
     @classmethod
     @validateYear
     def getSmartWins(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
@@ -37,51 +177,11 @@ class SmartWinsYearCalculator(YearCalculator):
             }
         """
 
-        ####################
-        # Helper functions #
-        ####################
-        def getNumberOfScoresBeatAndTied(
-            score: float | int, scores: list[float | int]
-        ) -> list[int, int]:
-            scoresBeatAndTied = [0, 0]
-            for s in scores:
-                if score > s:
-                    scoresBeatAndTied[0] += 1
-                elif score == s:
-                    scoresBeatAndTied[1] += 1
-            # remove 1 from the scores tied tracker since we will always find a tie for this teams score in the list of all scores
-            scoresBeatAndTied[1] -= 1
-            return scoresBeatAndTied
-
-        ####################
-        ####################
-        ####################
-
         filters = YearFilters.getForYear(year, **kwargs)
 
-        # get all scores we want to include in our smart wins calculation
-        teamIdsAndScores = list()
-
-        allMatchups = YearNavigator.getAllSimplifiedMatchupsInYear(year, filters)
-
-        for matchup in allMatchups:
-            teamIdsAndScores.append((matchup.teamAId, matchup.teamAScore))
-            teamIdsAndScores.append((matchup.teamBId, matchup.teamBScore))
-
-        teamIdAndSmartWins = dict()
-        allTeamIds = YearNavigator.getAllTeamIds(year)
-        for teamId in allTeamIds:
-            teamIdAndSmartWins[teamId] = Deci(0)
-
-        allScores = YearNavigator.getAllScoresInYear(
-            year, simplifyMultiWeekMatchups=True
+        teamIdAndSmartWins = cls._getSmartWinsByTeam(
+            year, filters, opponentScores=False, **kwargs
         )
-        for teamId, score in teamIdsAndScores:
-            scoresBeat, scoresTied = getNumberOfScoresBeatAndTied(score, allScores)
-            smartWins = (scoresBeat + (scoresTied / Deci("2"))) / (
-                len(allScores) - Deci("1")
-            )
-            teamIdAndSmartWins[teamId] += smartWins
 
         cls._setToNoneIfNoGamesPlayed(teamIdAndSmartWins, year, filters, **kwargs)
         return teamIdAndSmartWins
@@ -137,51 +237,11 @@ class SmartWinsYearCalculator(YearCalculator):
             }
         """
 
-        ####################
-        # Helper functions #
-        ####################
-        def getNumberOfScoresBeatAndTied(
-            score: float | int, scores: list[float | int]
-        ) -> list[int, int]:
-            scoresBeatAndTied = [0, 0]
-            for s in scores:
-                if score > s:
-                    scoresBeatAndTied[0] += 1
-                elif score == s:
-                    scoresBeatAndTied[1] += 1
-            # remove 1 from the scores tied tracker since we will always find a tie for this teams score in the list of all scores
-            scoresBeatAndTied[1] -= 1
-            return scoresBeatAndTied
-
-        ####################
-        ####################
-        ####################
-
         filters = YearFilters.getForYear(year, **kwargs)
 
-        # get all scores we want to include in our smart wins calculation
-        teamIdsAndScores = list()
-
-        allMatchups = YearNavigator.getAllSimplifiedMatchupsInYear(year, filters)
-
-        for matchup in allMatchups:
-            teamIdsAndScores.append((matchup.teamAId, matchup.teamBScore))
-            teamIdsAndScores.append((matchup.teamBId, matchup.teamAScore))
-
-        teamIdAndOpponentSmartWins = dict()
-        allTeamIds = YearNavigator.getAllTeamIds(year)
-        for teamId in allTeamIds:
-            teamIdAndOpponentSmartWins[teamId] = Deci(0)
-
-        allScores = YearNavigator.getAllScoresInYear(
-            year, simplifyMultiWeekMatchups=True
+        teamIdAndOpponentSmartWins = cls._getSmartWinsByTeam(
+            year, filters, opponentScores=True, **kwargs
         )
-        for teamId, score in teamIdsAndScores:
-            scoresBeat, scoresTied = getNumberOfScoresBeatAndTied(score, allScores)
-            smartWins = (scoresBeat + (scoresTied / Deci("2"))) / (
-                len(allScores) - Deci("1")
-            )
-            teamIdAndOpponentSmartWins[teamId] += smartWins
 
         cls._setToNoneIfNoGamesPlayed(
             teamIdAndOpponentSmartWins, year, filters, **kwargs
@@ -0,0 +1,115 @@
+from leeger.calculator.parent.YearCalculator import YearCalculator
+from leeger.decorator.validators import validateYear
+from leeger.model.filter import YearFilters
+from leeger.model.frame.Streaks import Streaks
+from leeger.model.league.Year import Year
+from leeger.util.navigator.YearNavigator import YearNavigator
+from leeger.util.NumericSettings import NumericSettings
+
+
+class StreakYearCalculator(YearCalculator):
+    """
+    Used to calculate all streak stats.
+    Multi-week matchups count as one game, decided in the last week of it in the range.
+    """
+
+    @classmethod
+    def _getStreaks(cls, year: Year, filters: YearFilters, **kwargs) -> Streaks:
+        """
+        Returns the Streaks of each team in the Matchups remaining after the given filters are applied.
+        """
+        yearFrame = YearNavigator.getYearFrame(year)
+        return Streaks.build(
+            list(yearFrame.teamIds),
+            *yearFrame.getOutcomesInOrderPlayed(
+                yearFrame.getRows(filters),
+                fixedPointScale=NumericSettings.getFixedPointScaleIfUsed(**kwargs),
+            ),
+            *yearFrame.getScoresAboveMedianInOrderPlayed(filters),
+        )
+
+    @classmethod
+    def __getStreak(cls, year: Year, streakName: str, **kwargs) -> dict[str, int]:
+        """
+        Returns the streak with the given name (a Streaks field, i.e. "longestWinStreak") for each team in the given Year.
+        """
+        streaks = cls._getStreaks(
+            year, YearFilters.getForYear(year, **kwargs), **kwargs
+        )
+        return streaks.toIdDict(getattr(streaks, streakName))
+
+    @classmethod
+    @validateYear
+    def getStreaks(cls, year: Year, **kwargs) -> Streaks:
+        """
+        Returns the Streaks of each team in the given Year, to get more than 1 streak stat at once.
+
+        Example:
+            streaks = StreakYearCalculator.getStreaks(year)
+            streaks.toIdDict(streaks.longestWinStreak)  # {"someTeamId": 4, ...}
+        """
+        return cls._getStreaks(year, YearFilters.getForYear(year, **kwargs), **kwargs)
+
+    @classmethod
+    @validateYear
+    def getLongestWinStreak(cls, year: Year, **kwargs) -> dict[str, int]:
+        """
+        Returns the most wins in a row for each team in the given Year.
+
+        Example response:
+            {
+            "someTeamId": 4,
+            "someOtherTeamId": 2,
+            "yetAnotherTeamId": 0,
+            ...
+            }
+        """
+        return cls.__getStreak(year, "longestWinStreak", **kwargs)
+
+    @classmethod
+    @validateYear
+    def getLongestLossStreak(cls, year: Year, **kwargs) -> dict[str, int]:
+        """
+        Returns the most losses in a row for each team in the given Year.
+
+        Example response:
+            {
+            "someTeamId": 1,
+            "someOtherTeamId": 3,
+            "yetAnotherTeamId": 6,
+            ...
+            }
+        """
+        return cls.__getStreak(year, "longestLossStreak", **kwargs)
+
+    @classmethod
+    @validateYear
+    def getCurrentStreak(cls, year: Year, **kwargs) -> dict[str, int]:
+        """
+        Returns the streak each team is on at the end of the given Year (positive for wins, negative for losses, 0 after a tie).
+
+        Example response:
+            {
+            "someTeamId": 3,
+            "someOtherTeamId": -2,
+            "yetAnotherTeamId": 0,
+            ...
+            }
+        """
+        return cls.__getStreak(year, "currentStreak", **kwargs)
+
+    @classmethod
+    @validateYear
+    def getLongestStreakAboveLeagueMedian(cls, year: Year, **kwargs) -> dict[str, int]:
+        """
+        Returns the most scores in a row above their week's league median for each team in the given Year.
+
+        Example response:
+            {
+            "someTeamId": 5,
+            "someOtherTeamId": 2,
+            "yetAnotherTeamId": 1,
+            ...
+            }
+        """
+        return cls.__getStreak(year, "longestStreakAboveMedian", **kwargs)
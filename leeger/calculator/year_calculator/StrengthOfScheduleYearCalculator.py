@@ -0,0 +1,142 @@
+from typing import Optional
+
+import numpy
+
+from leeger.calculator.parent.YearCalculator import YearCalculator
+from leeger.calculator.year_calculator.AWALYearCalculator import AWALYearCalculator
+from leeger.calculator.year_calculator.GameOutcomeYearCalculator import (
+    GameOutcomeYearCalculator,
+)
+from leeger.calculator.year_calculator.PointsScoredYearCalculator import (
+    PointsScoredYearCalculator,
+)
+from leeger.decorator.validators import validateYear
+from leeger.model.filter import YearFilters
+from leeger.model.league.Year import Year
+from leeger.util.Deci import Deci
+from leeger.util.navigator.YearNavigator import YearNavigator
+from leeger.util.NumericSettings import NumericSettings
+
+
+class StrengthOfScheduleYearCalculator(YearCalculator):
+    """
+    Used to calculate all Strength of Schedule stats.
+
+    Strength of Schedule is the average of a stat over every opponent a team played, where an opponent is counted once for each game against them.
+    Each opponent's stat is their stat in the same range, and a multi-week matchup counts as 1 game.
+    Every team's Strength of Schedule is found at once by multiplying the (teams x teams) matrix of games played against each team by the stat of each team.
+    """
+
+    @classmethod
+    def _getOpponentStatTotals(
+        cls,
+        year: Year,
+        filters: YearFilters,
+        teamIdAndStat: dict[str, Optional[Deci]],
+        **kwargs,
+    ) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the given stat added up over every game's opponent and the number of games played for each team (ordered by team index).
+        """
+        yearFrame = YearNavigator.getYearFrame(year)
+        gamesAgainstEachTeam = yearFrame.countGamesAgainstEachTeam(
+            yearFrame.getRows(filters)
+        )
+        # teams without a stat have no games in the range, so they are never multiplied by more than 0 games
+        stats = [
+            Deci(0) if teamIdAndStat[teamId] is None else teamIdAndStat[teamId]
+            for teamId in yearFrame.teamIds
+        ]
+        if NumericSettings.useFloat(**kwargs):
+            opponentStatTotals = gamesAgainstEachTeam @ numpy.array(
+                stats, dtype=numpy.float64
+            )
+        else:
+            statsColumn = numpy.empty(len(stats), dtype=object)
+            statsColumn[:] = stats
+            opponentStatTotals = gamesAgainstEachTeam.astype(object) @ statsColumn
+        return opponentStatTotals, gamesAgainstEachTeam.sum(axis=1)
+
+    @classmethod
+    def __getOpponentsAverage(
+        cls, year: Year, teamIdAndStat: dict[str, Optional[Deci]], **kwargs
+    ) -> dict[str, Optional[Deci]]:
+        opponentStatTotals, gamesPlayed = cls._getOpponentStatTotals(
+            year, YearFilters.getForYear(year, **kwargs), teamIdAndStat, **kwargs
+        )
+        return YearNavigator.getYearFrame(year).toTeamIdDict(
+            [
+                None if games == 0 else Deci(opponentStatTotal) / Deci(games)
+                for opponentStatTotal, games in zip(
+                    opponentStatTotals.tolist(), gamesPlayed.tolist()
+                )
+            ]
+        )
+
+    @classmethod
+    @validateYear
+    def getOpponentsAveragePointsScoredPerGame(
+        cls, year: Year, **kwargs
+    ) -> dict[str, Optional[Deci]]:
+        """
+        Returns the average Points Scored per game of every opponent each team played in the given Year.
+        Returns None for a Team if they have no games played in the range.
+
+        Example response:
+            {
+            "someTeamId": Deci("101.7"),
+            "someOtherTeamId": Deci("96.2"),
+            "yetAnotherTeamId": Deci("99.1"),
+            ...
+            }
+        """
+        kwargs["validate"] = False
+        return cls.__getOpponentsAverage(
+            year,
+            PointsScoredYearCalculator.getPointsScoredPerGame(year, **kwargs),
+            **kwargs,
+        )
+
+    @classmethod
+    @validateYear
+    def getOpponentsAverageAWALPerGame(
+        cls, year: Year, **kwargs
+    ) -> dict[str, Optional[Deci]]:
+        """
+        Returns the average AWAL per game of every opponent each team played in the given Year.
+        Returns None for a Team if they have no games played in the range.
+
+        Example response:
+            {
+            "someTeamId": Deci("0.52"),
+            "someOtherTeamId": Deci("0.47"),
+            "yetAnotherTeamId": Deci("0.49"),
+            ...
+            }
+        """
+        kwargs["validate"] = False
+        return cls.__getOpponentsAverage(
+            year, AWALYearCalculator.getAWALPerGame(year, **kwargs), **kwargs
+        )
+
+    @classmethod
+    @validateYear
+    def getOpponentsAverageWinPercentage(
+        cls, year: Year, **kwargs
+    ) -> dict[str, Optional[Deci]]:
+        """
+        Returns the average win percentage of every opponent each team played in the given Year.
+        Returns None for a Team if they have no games played in the range.
+
+        Example response:
+            {
+            "someTeamId": Deci("0.55"),
+            "someOtherTeamId": Deci("0.43"),
+            "yetAnotherTeamId": Deci("0.5"),
+            ...
+            }
+        """
+        kwargs["validate"] = False
+        return cls.__getOpponentsAverage(
+            year, GameOutcomeYearCalculator.getWinPercentage(year, **kwargs), **kwargs
+        )
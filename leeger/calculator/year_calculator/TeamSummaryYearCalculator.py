@@ -19,18 +19,18 @@ class TeamSummaryYearCalculator(YearCalculator):
         Returns the number of games played for each team in the given year.
         """
         filters = YearFilters.getForYear(year, **kwargs)
-        simplifiedMatchups = YearNavigator.getAllSimplifiedMatchupsInYear(year, filters)
-
-        teamIdAndGamesPlayed = dict()
-
-        for teamId in YearNavigator.getAllTeamIds(year):
-            teamIdAndGamesPlayed[teamId] = 0
-
-        for matchup in simplifiedMatchups:
-            teamIdAndGamesPlayed[matchup.teamAId] += 1
-            teamIdAndGamesPlayed[matchup.teamBId] += 1
+        if not filters.includeMultiWeekMatchups:
+            raise ValueError(
+                "Multi-Week matchups must be included in this calculation."
+            )
+
+        yearFrame = YearNavigator.getYearFrame(year)
+        # each multi-week matchup counts as a single game
+        gamesPlayed = yearFrame.countGamesByTeam(
+            filters, countMultiWeekMatchupsAsOneGame=True
+        )
 
-        return teamIdAndGamesPlayed
+        return yearFrame.toTeamIdDict(gamesPlayed.tolist())
 
     @classmethod
     @validateYear
@@ -1,7 +1,11 @@
 from .AWALYearCalculator import AWALYearCalculator
+from .BootstrapYearCalculator import BootstrapYearCalculator
 from .GameOutcomeYearCalculator import GameOutcomeYearCalculator
+from .PlayoffOddsYearCalculator import PlayoffOddsYearCalculator
 from .PlusMinusYearCalculator import PlusMinusYearCalculator
 from .PointsScoredYearCalculator import PointsScoredYearCalculator
+from .RollingWindowYearCalculator import RollingWindowYearCalculator
+from .ScheduleSimulationYearCalculator import ScheduleSimulationYearCalculator
 from .ScoringShareYearCalculator import ScoringShareYearCalculator
 from .ScoringStandardDeviationYearCalculator import (
     ScoringStandardDeviationYearCalculator,
@@ -9,4 +13,6 @@ from .ScoringStandardDeviationYearCalculator import (
 from .SingleScoreYearCalculator import SingleScoreYearCalculator
 from .SmartWinsYearCalculator import SmartWinsYearCalculator
 from .SSLYearCalculator import SSLYearCalculator
+from .StreakYearCalculator import StreakYearCalculator
+from .StrengthOfScheduleYearCalculator import StrengthOfScheduleYearCalculator
 from .TeamSummaryYearCalculator import TeamSummaryYearCalculator
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from enum import Enum, unique
+
+
+@unique
+class NumericBackend(Enum):
+    """
+    Used to hold the different ways numbers can be handled inside of calculations.
+
+    DECIMAL: Exact decimal math is used everywhere (default).
+    FLOAT: 64-bit floats are used inside of calculations and only converted to Deci when results are returned.
+    FIXED_POINT: Scores are scaled to 64-bit integers inside of calculations and only converted to Deci when results are returned.
+    """
+
+    DECIMAL = "DECIMAL"
+    FLOAT = "FLOAT"
+    FIXED_POINT = "FIXED_POINT"
+
+    @classmethod
+    def fromStr(cls, s: str) -> NumericBackend:
+        s_upper = s.upper()
+        if s_upper == "DECIMAL":
+            return NumericBackend.DECIMAL
+        elif s_upper == "FLOAT":
+            return NumericBackend.FLOAT
+        elif s_upper == "FIXED_POINT":
+            return NumericBackend.FIXED_POINT
+        raise ValueError(f"'{s}' is not a valid NumericBackend.")
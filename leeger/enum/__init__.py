@@ -1 +1,2 @@
 from .MatchupType import MatchupType
+from .NumericBackend import NumericBackend
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import itertools
+from abc import ABC
+from dataclasses import dataclass
+from typing import Any, Optional
+
+# shared by every model so a version is never reused, even across different model instances
+_VERSION_COUNTER = itertools.count(1)
+# moves whenever an attribute is set on a model that is part of a version key
+_WATCHED_MODIFICATIONS = [0]
+
+
+@dataclass
+class Versioned(ABC):
+    """
+    Model classes should inherit this in order to keep track of when they are modified.
+    Every time an attribute is set on a model, that model is given a new version.
+
+    A version key is found by walking every nested model and is remembered along with the lists that were walked.
+    It is only walked again if an attribute has been set on a model that was walked or one of those lists has been modified in place.
+
+    A model can also list the types of nested models that make up its structure in _STRUCTURE_MODEL_TYPES.
+    """
+
+    # the types of nested models whose modifications change the structure key of this model
+    _STRUCTURE_MODEL_TYPES = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        self.__dict__["_Versioned__version"] = next(_VERSION_COUNTER)
+        if "_Versioned__watched" in self.__dict__:
+            _WATCHED_MODIFICATIONS[0] += 1
+
+    def __getstate__(self) -> dict:
+        # remembered version keys are not copied, a copy is walked again the first time it is needed
+        state = dict(self.__dict__)
+        state.pop("_Versioned__watched", None)
+        state.pop("_Versioned__versionKeys", None)
+        return state
+
+    @property
+    def version(self) -> int:
+        return self.__dict__.get("_Versioned__version", 0)
+
+    def getVersionKey(self) -> tuple[int, ...]:
+        """
+        Returns a key that will change whenever *this* model or any model nested in it is modified.
+        A nested model is any model that is an attribute of *this* model or is inside a list that is an attribute of *this* model.
+        Adding, removing or reordering nested models will also change the key.
+        """
+        return self.__getRememberedVersionKey(None)
+
+    def getStructureKey(self) -> tuple[int, ...]:
+        """
+        Returns a key that will change whenever *this* model or any nested model with a type in _STRUCTURE_MODEL_TYPES is modified.
+        Adding, removing or reordering those nested models will also change the key.
+        """
+        return self.__getRememberedVersionKey(self._STRUCTURE_MODEL_TYPES)
+
+    def __getRememberedVersionKey(self, modelTypes: Optional[tuple]) -> tuple[int, ...]:
+        """
+        Returns the version key of the given nested model types (or every nested model if None is given).
+        """
+        versionKeys = self.__dict__.setdefault("_Versioned__versionKeys", dict())
+        remembered = versionKeys.get(modelTypes)
+        if (
+            remembered is not None
+            and remembered[0] == _WATCHED_MODIFICATIONS[0]
+            and remembered[3] == self.__getListsKey(remembered[1])
+        ):
+            return remembered[5]
+
+        walkedModels, walkedLists = self.__walk(modelTypes)
+        walkedKey = tuple(
+            itertools.chain.from_iterable(
+                (id(model), model.version) for model in walkedModels
+            )
+        )
+        if remembered is not None and remembered[4] == walkedKey:
+            # nothing that is part of the key was modified
+            versionKey = remembered[5]
+        else:
+            versionKey = (id(self), next(_VERSION_COUNTER))
+        versionKeys[modelTypes] = (
+            _WATCHED_MODIFICATIONS[0],
+            walkedLists,
+            # the items are kept so their ids can't be reused while they are part of the lists key
+            tuple(itertools.chain.from_iterable(walkedLists)),
+            self.__getListsKey(walkedLists),
+            walkedKey,
+            versionKey,
+        )
+        return versionKey
+
+    @staticmethod
+    def __getListsKey(lists: list[list]) -> tuple[tuple[int, ...], tuple[int, ...]]:
+        """
+        Returns a key that will change whenever an item is added to, removed from or replaced in one of the given lists.
+        """
+        return tuple(map(len, lists)), tuple(
+            map(id, itertools.chain.from_iterable(lists))
+        )
+
+    def __walk(self, modelTypes: Optional[tuple]) -> tuple[list[Versioned], list[list]]:
+        """
+        Returns every nested model with one of the given types (or every nested model if None is given) and every list attribute of those models.
+        Each of those models is watched, so setting an attribute on it will cause remembered version keys to be checked again.
+        """
+        walkedModels = list()
+        walkedLists = list()
+        modelsToWalk = [self]
+        while modelsToWalk:
+            model = modelsToWalk.pop()
+            model.__dict__["_Versioned__watched"] = True
+            walkedModels.append(model)
+            for name, value in model.__dict__.items():
+                if name.startswith("_Versioned__"):
+                    continue
+                values = (value,)
+                if isinstance(value, list):
+                    walkedLists.append(value)
+                    values = value
+                for item in values:
+                    if isinstance(item, Versioned) and (
+                        modelTypes is None or isinstance(item, modelTypes)
+                    ):
+                        modelsToWalk.append(item)
+        return walkedModels, walkedLists
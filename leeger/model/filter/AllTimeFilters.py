@@ -56,7 +56,7 @@ class AllTimeFilters:
         from leeger.util.GeneralUtil import GeneralUtil
         from leeger.util.navigator import LeagueNavigator
 
-        kwargsCopy = copy.deepcopy(kwargs)
+        kwargsCopy = copy.copy(kwargs)  # shallow, since kwargs may hold an Executor
         onlyChampionship = kwargsCopy.pop("onlyChampionship", False)
         onlyPostSeason = kwargsCopy.pop("onlyPostSeason", False)
         onlyRegularSeason = kwargsCopy.pop("onlyRegularSeason", False)
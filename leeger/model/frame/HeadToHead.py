@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import numpy
+
+from leeger.exception.DoesNotExistException import DoesNotExistException
+from leeger.model.frame.YearFrame import YearFrame
+from leeger.util.Deci import Deci
+
+
+@dataclass(kw_only=True, frozen=True, eq=False)
+class HeadToHead:
+    """
+    Used to house every Owner's record against every other Owner in a League.
+
+    Each stat is a matrix with one row and one column per Owner (in the order of ownerIds),
+    where [i, j] is the stat for Owner i in their games against Owner j.
+    So any head-to-head lookup is a single index into a matrix.
+
+    Multi-week matchups are combined into a single Matchup for wins, losses, ties and games played,
+    the same way GameOutcomeAllTimeCalculator counts them.
+    Points scored are the exact sum of every score, the same way PointsScoredAllTimeCalculator sums them.
+    """
+
+    ownerIds: tuple[str, ...]
+    ownerIdToIndex: dict[str, int]
+    wins: numpy.ndarray
+    losses: numpy.ndarray
+    ties: numpy.ndarray
+    gamesPlayed: numpy.ndarray
+    pointsScored: numpy.ndarray  # Decis
+
+    @staticmethod
+    def build(
+        ownerIds: list[str],
+        yearFramesRowsAndOwnerIds: list[tuple[YearFrame, numpy.ndarray, list[str]]],
+        fixedPointScale: Optional[int] = None,
+    ) -> HeadToHead:
+        """
+        Builds a HeadToHead from the given rows of each given YearFrame.
+        Each YearFrame comes with the Owner ID of each of its teams (ordered by team index).
+        Outcomes are decided by comparing scores as fixed-point integers if a fixed-point scale is given.
+        """
+        ownerIdToIndex = {ownerId: i for i, ownerId in enumerate(ownerIds)}
+        shape = (len(ownerIds), len(ownerIds))
+        wins = numpy.zeros(shape, dtype=numpy.int64)
+        ties = numpy.zeros(shape, dtype=numpy.int64)
+        pointsScored = numpy.full(shape, Deci(0), dtype=object)
+
+        for yearFrame, rows, teamOwnerIds in yearFramesRowsAndOwnerIds:
+            teamIndexToOwnerIndex = numpy.array(
+                [ownerIdToIndex[ownerId] for ownerId in teamOwnerIds], dtype=numpy.int64
+            )
+
+            # multi-week matchups are combined into single Matchups for outcomes
+            simplifiedMatchups = yearFrame.simplifyMultiWeekMatchups(
+                rows, fixedPointScale=fixedPointScale
+            )
+            teamAOwnerIndex = teamIndexToOwnerIndex[simplifiedMatchups.teamAIndex]
+            teamBOwnerIndex = teamIndexToOwnerIndex[simplifiedMatchups.teamBIndex]
+            teamAWon, teamBWon, tied = simplifiedMatchups.getOutcomes()
+            numpy.add.at(
+                wins, (teamAOwnerIndex[teamAWon], teamBOwnerIndex[teamAWon]), 1
+            )
+            numpy.add.at(
+                wins, (teamBOwnerIndex[teamBWon], teamAOwnerIndex[teamBWon]), 1
+            )
+            numpy.add.at(ties, (teamAOwnerIndex[tied], teamBOwnerIndex[tied]), 1)
+            numpy.add.at(ties, (teamBOwnerIndex[tied], teamAOwnerIndex[tied]), 1)
+
+            # every score is added as it was played, so sums are exact
+            teamAOwnerIndex = teamIndexToOwnerIndex[yearFrame.teamAIndex[rows]]
+            teamBOwnerIndex = teamIndexToOwnerIndex[yearFrame.teamBIndex[rows]]
+            numpy.add.at(
+                pointsScored,
+                (teamAOwnerIndex, teamBOwnerIndex),
+                HeadToHead.__toDeciArray(yearFrame.teamAScoreValue[rows]),
+            )
+            numpy.add.at(
+                pointsScored,
+                (teamBOwnerIndex, teamAOwnerIndex),
+                HeadToHead.__toDeciArray(yearFrame.teamBScoreValue[rows]),
+            )
+
+        # Owner i's losses against Owner j are Owner j's wins against Owner i
+        losses = wins.T.copy()
+        return HeadToHead(
+            ownerIds=tuple(ownerIds),
+            ownerIdToIndex=ownerIdToIndex,
+            wins=wins,
+            losses=losses,
+            ties=ties,
+            gamesPlayed=wins + losses + ties,
+            pointsScored=pointsScored,
+        )
+
+    @staticmethod
+    def __toDeciArray(scoreValues: numpy.ndarray) -> numpy.ndarray:
+        deciArray = numpy.empty(len(scoreValues), dtype=object)
+        deciArray[:] = [Deci(scoreValue) for scoreValue in scoreValues.tolist()]
+        return deciArray
+
+    def __getIndexes(self, ownerId: str, opponentOwnerId: str) -> tuple[int, int]:
+        for ownerId_ in (ownerId, opponentOwnerId):
+            if ownerId_ not in self.ownerIdToIndex:
+                raise DoesNotExistException(
+                    f"Owner with ID {ownerId_} does not exist in the given League."
+                )
+        return self.ownerIdToIndex[ownerId], self.ownerIdToIndex[opponentOwnerId]
+
+    def getWins(self, ownerId: str, opponentOwnerId: str) -> int:
+        return int(self.wins[self.__getIndexes(ownerId, opponentOwnerId)])
+
+    def getLosses(self, ownerId: str, opponentOwnerId: str) -> int:
+        return int(self.losses[self.__getIndexes(ownerId, opponentOwnerId)])
+
+    def getTies(self, ownerId: str, opponentOwnerId: str) -> int:
+        return int(self.ties[self.__getIndexes(ownerId, opponentOwnerId)])
+
+    def getGamesPlayed(self, ownerId: str, opponentOwnerId: str) -> int:
+        return int(self.gamesPlayed[self.__getIndexes(ownerId, opponentOwnerId)])
+
+    def getPointsScored(self, ownerId: str, opponentOwnerId: str) -> Deci:
+        return self.pointsScored[self.__getIndexes(ownerId, opponentOwnerId)]
+
+    def getOpponentPointsScored(self, ownerId: str, opponentOwnerId: str) -> Deci:
+        ownerIndex, opponentOwnerIndex = self.__getIndexes(ownerId, opponentOwnerId)
+        return self.pointsScored[opponentOwnerIndex, ownerIndex]
+
+    def getRivalryTable(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """
+        Returns every Owner's record against every Owner they have played, keyed by Owner ID, then opponent Owner ID.
+
+        Example response:
+            {
+            "someOwnerId": {
+                "someOtherOwnerId": {
+                    "wins": 4,
+                    "losses": 2,
+                    "ties": 0,
+                    "gamesPlayed": 6,
+                    "pointsScored": Deci("612.4"),
+                    "opponentPointsScored": Deci("587.9"),
+                    },
+                ...
+                },
+            ...
+            }
+        """
+        rivalryTable: dict[str, dict[str, dict[str, Any]]] = {
+            ownerId: dict() for ownerId in self.ownerIds
+        }
+        ownerIndexes, opponentOwnerIndexes = numpy.nonzero(self.gamesPlayed)
+        for i, j in zip(ownerIndexes.tolist(), opponentOwnerIndexes.tolist()):
+            rivalryTable[self.ownerIds[i]][self.ownerIds[j]] = {
+                "wins": int(self.wins[i, j]),
+                "losses": int(self.losses[i, j]),
+                "ties": int(self.ties[i, j]),
+                "gamesPlayed": int(self.gamesPlayed[i, j]),
+                "pointsScored": self.pointsScored[i, j],
+                "opponentPointsScored": self.pointsScored[j, i],
+            }
+        return rivalryTable
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from leeger.exception.DoesNotExistException import DoesNotExistException
+from leeger.model.league.League import League
+from leeger.model.league.Owner import Owner
+from leeger.model.league.Team import Team
+from leeger.model.league.Year import Year
+
+
+@dataclass(kw_only=True, frozen=True, eq=False)
+class LeagueIndex:
+    """
+    Lookup tables for the Owners, Years and Teams in a League.
+
+    Each lookup is a dictionary, so finding a model does not require searching through the League.
+    If IDs (or year numbers) are repeated, the first model in the League is the one that is found.
+
+    Use LeagueNavigator.getLeagueIndex() to get a LeagueIndex that is only built again when the League's Owners, Years or Teams change.
+    """
+
+    owners: dict[str, Owner]
+    years: dict[int, Year]
+    teams: dict[str, Team]
+    teamIdToOwnerId: dict[str, str]
+
+    @staticmethod
+    def fromLeague(league: League) -> LeagueIndex:
+        owners: dict[str, Owner] = dict()
+        for owner in league.owners:
+            owners.setdefault(owner.id, owner)
+        years: dict[int, Year] = dict()
+        teams: dict[str, Team] = dict()
+        for year in league.years:
+            years.setdefault(year.yearNumber, year)
+            for team in year.teams:
+                teams.setdefault(team.id, team)
+        return LeagueIndex(
+            owners=owners,
+            years=years,
+            teams=teams,
+            teamIdToOwnerId={teamId: team.ownerId for teamId, team in teams.items()},
+        )
+
+    @staticmethod
+    def getStructureKey(league: League) -> tuple[int, ...]:
+        """
+        Returns a key that will change whenever the League or any of its Owners, Years or Teams are modified, added, removed or reordered.
+        Weeks and Matchups are not checked, since nothing in a LeagueIndex depends on them.
+        """
+        return league.getStructureKey()
+
+    def getOwnerById(self, ownerId: str) -> Owner:
+        if ownerId not in self.owners:
+            raise DoesNotExistException(
+                f"Owner with ID {ownerId} does not exist in the given League."
+            )
+        return self.owners[ownerId]
+
+    def getYearByYearNumber(self, yearNumber: int) -> Year:
+        if yearNumber not in self.years:
+            raise DoesNotExistException(
+                f"Year {yearNumber} does not exist in the given League."
+            )
+        return self.years[yearNumber]
+
+    def getTeamById(self, teamId: str) -> Team:
+        if teamId not in self.teams:
+            raise DoesNotExistException(
+                f"Team with ID {teamId} does not exist in the given League."
+            )
+        return self.teams[teamId]
+
+    def getOwnerIdByTeamId(self, teamId: str) -> str:
+        if teamId not in self.teamIdToOwnerId:
+            raise DoesNotExistException(
+                f"Team with ID {teamId} does not exist in the given League."
+            )
+        return self.teamIdToOwnerId[teamId]
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy
+
+from leeger.model.frame.YearFrame import YearFrame
+
+
+@dataclass(kw_only=True, frozen=True, eq=False)
+class MatchupColumns:
+    """
+    Used to house Matchups from multiple YearFrames as a single group of columns (e.g. every Matchup in a range of Years).
+    Index i of every column describes the same Matchup, in the order the YearFrames and rows were given.
+    Each Matchup is kept as it was played (multi-week matchups are not combined).
+    """
+
+    yearFrames: tuple[YearFrame, ...]
+    yearFramePosition: numpy.ndarray  # index in yearFrames
+    row: numpy.ndarray  # row in that YearFrame
+    teamAKey: numpy.ndarray  # used for comparisons
+    teamBKey: numpy.ndarray  # used for comparisons
+    teamAScoreValue: numpy.ndarray  # the original int/float scores
+    teamBScoreValue: numpy.ndarray  # the original int/float scores
+    teamAWon: numpy.ndarray
+    teamBWon: numpy.ndarray
+
+    def __len__(self) -> int:
+        return len(self.row)
+
+    @staticmethod
+    def build(
+        yearFramesAndRows: list[tuple[YearFrame, numpy.ndarray]],
+        fixedPointScale: Optional[int] = None,
+    ) -> MatchupColumns:
+        """
+        Builds MatchupColumns from the given rows of each given YearFrame.
+        Scores are compared as 64-bit floats, or as fixed-point integers if a fixed-point scale is given.
+        """
+        yearFrames = tuple(yearFrame for yearFrame, _ in yearFramesAndRows)
+
+        def concatenate(getColumn: callable, dtype) -> numpy.ndarray:
+            return numpy.concatenate(
+                [numpy.empty(0, dtype=dtype)]
+                + [getColumn(yearFrame)[rows] for yearFrame, rows in yearFramesAndRows]
+            )
+
+        def getKeys(
+            yearFrame: YearFrame, rows: numpy.ndarray
+        ) -> tuple[numpy.ndarray, numpy.ndarray]:
+            if fixedPointScale is None:
+                return yearFrame.teamAScore[rows], yearFrame.teamBScore[rows]
+            return yearFrame.getFixedPointScores(fixedPointScale, rows)
+
+        keyDtype = numpy.float64 if fixedPointScale is None else numpy.int64
+        keys = [getKeys(yearFrame, rows) for yearFrame, rows in yearFramesAndRows]
+        teamAKey = numpy.concatenate(
+            [numpy.empty(0, dtype=keyDtype)] + [teamAKey for teamAKey, _ in keys]
+        )
+        teamBKey = numpy.concatenate(
+            [numpy.empty(0, dtype=keyDtype)] + [teamBKey for _, teamBKey in keys]
+        )
+        teamAHasTiebreaker = concatenate(
+            lambda yearFrame: yearFrame.teamAHasTiebreaker, bool
+        )
+        teamBHasTiebreaker = concatenate(
+            lambda yearFrame: yearFrame.teamBHasTiebreaker, bool
+        )
+        # uses the same logic as MatchupNavigator.getTeamIdOfMatchupWinner()
+        scoresTied = teamAKey == teamBKey
+        teamAWon = (teamAKey > teamBKey) | (scoresTied & teamAHasTiebreaker)
+        teamBWon = ~teamAWon & (
+            (teamBKey > teamAKey) | (scoresTied & teamBHasTiebreaker)
+        )
+        return MatchupColumns(
+            yearFrames=yearFrames,
+            yearFramePosition=numpy.concatenate(
+                [numpy.empty(0, dtype=numpy.int64)]
+                + [
+                    numpy.full(len(rows), i, dtype=numpy.int64)
+                    for i, (_, rows) in enumerate(yearFramesAndRows)
+                ]
+            ),
+            row=numpy.concatenate(
+                [numpy.empty(0, dtype=numpy.int64)]
+                + [rows for _, rows in yearFramesAndRows]
+            ),
+            teamAKey=teamAKey,
+            teamBKey=teamBKey,
+            teamAScoreValue=concatenate(
+                lambda yearFrame: yearFrame.teamAScoreValue, object
+            ),
+            teamBScoreValue=concatenate(
+                lambda yearFrame: yearFrame.teamBScoreValue, object
+            ),
+            teamAWon=teamAWon,
+            teamBWon=teamBWon,
+        )
+
+    def getYearFrameAndRow(self, position: int) -> tuple[YearFrame, int]:
+        """
+        Returns the YearFrame and row the Matchup at the given position came from.
+        """
+        return (
+            self.yearFrames[int(self.yearFramePosition[position])],
+            int(self.row[position]),
+        )
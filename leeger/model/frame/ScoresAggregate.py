@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(kw_only=True, frozen=True, eq=False)
+class ScoresAggregate:
+    """
+    Used to house the scores from a group of Matchups in a form that can be merged with the scores from other Matchups.
+    Stats that can't be summed across Years (like Scoring Standard Deviation and Smart Wins) are calculated from a merged ScoresAggregate.
+
+    Each side of each Matchup that is not part of a multi-week matchup is kept as the ID it belongs to (a team or Owner ID), its score and its opponent's score.
+    Index i of ids, scores and opponentScores describes the same side of a Matchup, with team A's side coming before team B's side.
+
+    Matchups that are part of a multi-week matchup are kept as they were played (index i of each multiWeekMatchup field describes the same Matchup),
+    and are only combined into a single Matchup once ScoresAggregates have been merged, so a multi-week matchup is combined from every Matchup it has in the merged ScoresAggregates.
+    Combined multi-week matchups come after every other Matchup (in the order they were first played),
+    which is the order AllTimeCalculator._getAllFilteredMatchups() returns Matchups in.
+    """
+
+    ids: tuple[str, ...]
+    scores: tuple[float | int, ...]
+    opponentScores: tuple[float | int, ...]
+    multiWeekMatchupIds: tuple[str, ...]
+    multiWeekMatchupTeamAIds: tuple[str, ...]
+    multiWeekMatchupTeamBIds: tuple[str, ...]
+    multiWeekMatchupTeamAScores: tuple[float | int, ...]
+    multiWeekMatchupTeamBScores: tuple[float | int, ...]
+
+    @staticmethod
+    def merge(scoresAggregates: list[ScoresAggregate]) -> ScoresAggregate:
+        """
+        Merges the given ScoresAggregates (in the order they are given) into a single ScoresAggregate.
+        """
+
+        def concatenate(fieldName: str) -> tuple:
+            return tuple(
+                value
+                for scoresAggregate in scoresAggregates
+                for value in getattr(scoresAggregate, fieldName)
+            )
+
+        return ScoresAggregate(
+            ids=concatenate("ids"),
+            scores=concatenate("scores"),
+            opponentScores=concatenate("opponentScores"),
+            multiWeekMatchupIds=concatenate("multiWeekMatchupIds"),
+            multiWeekMatchupTeamAIds=concatenate("multiWeekMatchupTeamAIds"),
+            multiWeekMatchupTeamBIds=concatenate("multiWeekMatchupTeamBIds"),
+            multiWeekMatchupTeamAScores=concatenate("multiWeekMatchupTeamAScores"),
+            multiWeekMatchupTeamBScores=concatenate("multiWeekMatchupTeamBScores"),
+        )
+
+    def mapIds(self, idToNewId: dict[str, str]) -> ScoresAggregate:
+        """
+        Returns this ScoresAggregate with each ID replaced by the ID it maps to in the given dict.
+        (e.g. to replace team IDs with the ID of the Owner of each team)
+        """
+        return ScoresAggregate(
+            ids=tuple(idToNewId[id_] for id_ in self.ids),
+            scores=self.scores,
+            opponentScores=self.opponentScores,
+            multiWeekMatchupIds=self.multiWeekMatchupIds,
+            multiWeekMatchupTeamAIds=tuple(
+                idToNewId[id_] for id_ in self.multiWeekMatchupTeamAIds
+            ),
+            multiWeekMatchupTeamBIds=tuple(
+                idToNewId[id_] for id_ in self.multiWeekMatchupTeamBIds
+            ),
+            multiWeekMatchupTeamAScores=self.multiWeekMatchupTeamAScores,
+            multiWeekMatchupTeamBScores=self.multiWeekMatchupTeamBScores,
+        )
+
+    def getIdsAndScores(
+        self, *, opponentScores: bool = False
+    ) -> tuple[list[str], list[float | int]]:
+        """
+        Returns the ID and score of every side of every Matchup, with each multi-week matchup combined into a single Matchup.
+        If opponentScores is True, the score of each side's opponent is returned instead.
+        Uses the same logic as MatchupNavigator.simplifyMultiWeekMatchups().
+        """
+        ids = list(self.ids)
+        scores = list(self.opponentScores if opponentScores else self.scores)
+
+        # multi-week matchup ID -> [team A ID, team B ID, team A score, team B score]
+        multiWeekMatchupIdToCombinedMatchup: dict[str, list] = dict()
+        for multiWeekMatchupId, teamAId, teamBId, teamAScore, teamBScore in zip(
+            self.multiWeekMatchupIds,
+            self.multiWeekMatchupTeamAIds,
+            self.multiWeekMatchupTeamBIds,
+            self.multiWeekMatchupTeamAScores,
+            self.multiWeekMatchupTeamBScores,
+        ):
+            combinedMatchup = multiWeekMatchupIdToCombinedMatchup.setdefault(
+                multiWeekMatchupId, [teamAId, teamBId, 0, 0]
+            )
+            combinedMatchup[2] += teamAScore
+            combinedMatchup[3] += teamBScore
+
+        for (
+            teamAId,
+            teamBId,
+            teamAScore,
+            teamBScore,
+        ) in multiWeekMatchupIdToCombinedMatchup.values():
+            ids += [teamAId, teamBId]
+            scores += (
+                [teamBScore, teamAScore] if opponentScores else [teamAScore, teamBScore]
+            )
+        return ids, scores
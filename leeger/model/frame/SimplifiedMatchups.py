@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy
+
+
+@dataclass(kw_only=True, frozen=True, eq=False)
+class SimplifiedMatchups:
+    """
+    Used to house Matchups from a YearFrame where each multi-week matchup has been combined into a single Matchup.
+    Index i of every array describes the same Matchup.
+
+    Matchups that are not multi-week matchups come first (in the order they were played).
+    Combined multi-week matchups come after (in the order they were first played).
+    This is the same order that YearNavigator.getAllSimplifiedMatchupsInYear() returns Matchups in.
+
+    If they were combined with a fixed-point scale, the scores used for comparisons are fixed-point integers,
+    so a multi-week matchup's combined score is exact and ties are found exactly.
+    """
+
+    teamAIndex: numpy.ndarray
+    teamBIndex: numpy.ndarray
+    teamAScore: numpy.ndarray  # float64 (or fixed-point int64), used for comparisons
+    teamBScore: numpy.ndarray  # float64 (or fixed-point int64), used for comparisons
+    teamAScoreValue: numpy.ndarray  # the original int/float scores
+    teamBScoreValue: numpy.ndarray  # the original int/float scores
+    teamAHasTiebreaker: numpy.ndarray
+    teamBHasTiebreaker: numpy.ndarray
+    matchupTypeCode: numpy.ndarray
+
+    def __len__(self) -> int:
+        return len(self.teamAIndex)
+
+    def getOutcomes(self) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Returns whether team A won, whether team B won and whether the Matchup was a tie for each Matchup.
+        Uses the same logic as MatchupNavigator.getTeamIdOfMatchupWinner().
+        """
+        scoresTied = self.teamAScore == self.teamBScore
+        teamAWon = (self.teamAScore > self.teamBScore) | (
+            scoresTied & self.teamAHasTiebreaker
+        )
+        teamBWon = ~teamAWon & (
+            (self.teamBScore > self.teamAScore) | (scoresTied & self.teamBHasTiebreaker)
+        )
+        return teamAWon, teamBWon, ~(teamAWon | teamBWon)
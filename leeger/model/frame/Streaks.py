@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy
+
+
+@dataclass(kw_only=True, frozen=True, eq=False)
+class Streaks:
+    """
+    Used to house the streaks of every team (or Owner) in a group of games.
+
+    Each array has one value per team (or Owner), in the order of ids.
+    A current streak is positive for a win streak, negative for a losing streak and 0 if the last game was a tie (or there are no games).
+    """
+
+    ids: tuple[str, ...]
+    longestWinStreak: numpy.ndarray
+    longestLossStreak: numpy.ndarray
+    currentStreak: numpy.ndarray
+    longestStreakAboveMedian: numpy.ndarray
+
+    @staticmethod
+    def build(
+        ids: list[str],
+        gameIdIndex: numpy.ndarray,
+        gameOutcome: numpy.ndarray,
+        scoreIdIndex: numpy.ndarray,
+        scoreAboveMedian: numpy.ndarray,
+    ) -> Streaks:
+        """
+        Builds Streaks from the outcome (1 for a win, -1 for a loss, 0 for a tie) of every game
+        and whether every score was above the median score of its week.
+        Games and scores are each given as one array for every team (or Owner) together,
+        and must be in the order they were played.
+        """
+        numberOfIds = len(ids)
+        runIdIndex, runOutcome, runLength = Streaks.__getRuns(gameIdIndex, gameOutcome)
+        longestWinStreak = Streaks.__getLongestRuns(
+            numberOfIds, runIdIndex, runLength, runOutcome == 1
+        )
+        longestLossStreak = Streaks.__getLongestRuns(
+            numberOfIds, runIdIndex, runLength, runOutcome == -1
+        )
+        # runs are grouped by id, so each id's current streak is its last run
+        isLastRun = numpy.ones(len(runIdIndex), dtype=bool)
+        isLastRun[:-1] = runIdIndex[1:] != runIdIndex[:-1]
+        currentStreak = numpy.zeros(numberOfIds, dtype=numpy.int64)
+        currentStreak[runIdIndex[isLastRun]] = (
+            runOutcome[isLastRun].astype(numpy.int64) * runLength[isLastRun]
+        )
+
+        runIdIndex, runAboveMedian, runLength = Streaks.__getRuns(
+            scoreIdIndex, scoreAboveMedian
+        )
+        longestStreakAboveMedian = Streaks.__getLongestRuns(
+            numberOfIds, runIdIndex, runLength, runAboveMedian
+        )
+
+        return Streaks(
+            ids=tuple(ids),
+            longestWinStreak=longestWinStreak,
+            longestLossStreak=longestLossStreak,
+            currentStreak=currentStreak,
+            longestStreakAboveMedian=longestStreakAboveMedian,
+        )
+
+    @staticmethod
+    def __getRuns(
+        idIndex: numpy.ndarray, values: numpy.ndarray
+    ) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Run-length encodes the given values of each id.
+        Returns the id index, value and length of every run, grouped by id and in the order they were played.
+        """
+        # a stable sort keeps each id's values in the order they were played
+        order = numpy.argsort(idIndex, kind="stable")
+        idIndex = idIndex[order]
+        values = values[order]
+        newRun = numpy.ones(len(order), dtype=bool)
+        newRun[1:] = (idIndex[1:] != idIndex[:-1]) | (values[1:] != values[:-1])
+        runStart = numpy.flatnonzero(newRun)
+        runLength = numpy.diff(numpy.append(runStart, len(order)))
+        return idIndex[runStart], values[runStart], runLength
+
+    @staticmethod
+    def __getLongestRuns(
+        numberOfIds: int,
+        runIdIndex: numpy.ndarray,
+        runLength: numpy.ndarray,
+        mask: numpy.ndarray,
+    ) -> numpy.ndarray:
+        """
+        Returns the longest of the runs in the given mask for each id.
+        """
+        longestRuns = numpy.zeros(numberOfIds, dtype=numpy.int64)
+        numpy.maximum.at(longestRuns, runIdIndex[mask], runLength[mask])
+        return longestRuns
+
+    def toIdDict(self, values: numpy.ndarray) -> dict[str, int]:
+        """
+        Takes an array with 1 value per id (in the order of ids) and returns it as a dict keyed by id.
+        """
+        return dict(zip(self.ids, values.tolist()))
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import decimal
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy
+
+from leeger.util.Deci import Deci
+
+
+@dataclass(kw_only=True, frozen=True, eq=False)
+class WeekRangeIndex:
+    """
+    Used to house running totals (by week) of each team's additive stats in a group of YearFrame rows,
+    so the total for any range of weeks is the running total at the end of the range minus the running total before the start of the range.
+
+    Row i of each running total is the total after the first i weeks (so row 0 is all zeroes) and column j is the total for team index j.
+
+    A multi-week matchup's outcome depends on which of its weeks are in the range, so it can't be split into weeks like this.
+    Outcomes only have running totals for rows that are not part of a multi-week matchup,
+    and the (few) multi-week matchup rows are kept so they can be looked at for each range.
+
+    There is one WeekRangeIndex for each Year (and group of matchup types), not one for a whole League,
+    so an All-Time range is answered with one range total for each Year in it.
+    AWAL is not kept here, since each week's AWAL is rounded and the difference of two running totals of it
+    would not always be the same as adding up the weeks in a range.
+    """
+
+    # one value per row, the rows the running totals were built from
+    rows: numpy.ndarray
+    weekIndex: numpy.ndarray
+    teamAIndex: numpy.ndarray
+    teamBIndex: numpy.ndarray
+    isMultiWeekMatchup: numpy.ndarray
+    # running totals, one row per week (plus a row of zeroes) and one column per team
+    gamesPlayed: numpy.ndarray
+    regularSeasonGamesPlayed: numpy.ndarray
+    wins: numpy.ndarray  # rows that are not part of a multi-week matchup
+    losses: numpy.ndarray  # rows that are not part of a multi-week matchup
+    ties: numpy.ndarray  # rows that are not part of a multi-week matchup
+    # exact Decimal running totals, None if a running total could not be kept exactly
+    pointsScored: Optional[numpy.ndarray]
+    opponentPointsScored: Optional[numpy.ndarray]
+    # running count of scores by decimal places (one value per number of decimal places in the last dimension)
+    pointsScoredDecimalPlaces: numpy.ndarray
+    opponentPointsScoredDecimalPlaces: numpy.ndarray
+    # fixed-point running totals that have already been built, keyed by scale
+    __fixedPointPointsScoredCache: dict[int, tuple[numpy.ndarray, numpy.ndarray]] = (
+        field(default_factory=dict, init=False, repr=False)
+    )
+
+    @staticmethod
+    def build(
+        rows: numpy.ndarray,
+        numberOfWeeks: int,
+        numberOfTeams: int,
+        weekIndex: numpy.ndarray,
+        teamAIndex: numpy.ndarray,
+        teamBIndex: numpy.ndarray,
+        teamAScoreValue: numpy.ndarray,
+        teamBScoreValue: numpy.ndarray,
+        isRegularSeason: numpy.ndarray,
+        isMultiWeekMatchup: numpy.ndarray,
+        outcomes: tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray],
+    ) -> WeekRangeIndex:
+        """
+        Builds a WeekRangeIndex from YearFrame columns that have already been narrowed down to the given rows.
+        Rows must be in the order they were played.
+        outcomes is (team A won, team B won, tied) for each of the given rows.
+        """
+        teamAWon, teamBWon, tied = outcomes
+        isSingleRow = ~isMultiWeekMatchup
+
+        def runningTotal(
+            teamAWeights: numpy.ndarray, teamBWeights: numpy.ndarray
+        ) -> numpy.ndarray:
+            totals = numpy.zeros((numberOfWeeks + 1, numberOfTeams), dtype=numpy.int64)
+            numpy.add.at(totals, (weekIndex + 1, teamAIndex), teamAWeights)
+            numpy.add.at(totals, (weekIndex + 1, teamBIndex), teamBWeights)
+            return numpy.cumsum(totals, axis=0)
+
+        allRows = numpy.ones(len(rows), dtype=numpy.int64)
+        regularSeasonRows = isRegularSeason.astype(numpy.int64)
+        teamAPlaces = WeekRangeIndex.__getDecimalPlaces(teamAScoreValue)
+        teamBPlaces = WeekRangeIndex.__getDecimalPlaces(teamBScoreValue)
+
+        def runningDecimalPlaces(
+            teamAPlaces: numpy.ndarray, teamBPlaces: numpy.ndarray
+        ) -> numpy.ndarray:
+            maxPlaces = int(max(teamAPlaces.max(initial=0), teamBPlaces.max(initial=0)))
+            counts = numpy.zeros(
+                (numberOfWeeks + 1, numberOfTeams, maxPlaces + 1), dtype=numpy.int64
+            )
+            numpy.add.at(counts, (weekIndex + 1, teamAIndex, teamAPlaces), 1)
+            numpy.add.at(counts, (weekIndex + 1, teamBIndex, teamBPlaces), 1)
+            return numpy.cumsum(counts, axis=0)
+
+        return WeekRangeIndex(
+            rows=rows,
+            weekIndex=weekIndex,
+            teamAIndex=teamAIndex,
+            teamBIndex=teamBIndex,
+            isMultiWeekMatchup=isMultiWeekMatchup,
+            gamesPlayed=runningTotal(allRows, allRows),
+            regularSeasonGamesPlayed=runningTotal(regularSeasonRows, regularSeasonRows),
+            wins=runningTotal(teamAWon & isSingleRow, teamBWon & isSingleRow),
+            losses=runningTotal(teamBWon & isSingleRow, teamAWon & isSingleRow),
+            ties=runningTotal(tied & isSingleRow, tied & isSingleRow),
+            pointsScored=WeekRangeIndex.__getRunningDecimalTotal(
+                numberOfWeeks,
+                numberOfTeams,
+                weekIndex,
+                teamAIndex,
+                teamBIndex,
+                teamAScoreValue,
+                teamBScoreValue,
+            ),
+            opponentPointsScored=WeekRangeIndex.__getRunningDecimalTotal(
+                numberOfWeeks,
+                numberOfTeams,
+                weekIndex,
+                teamAIndex,
+                teamBIndex,
+                teamBScoreValue,
+                teamAScoreValue,
+            ),
+            pointsScoredDecimalPlaces=runningDecimalPlaces(teamAPlaces, teamBPlaces),
+            opponentPointsScoredDecimalPlaces=runningDecimalPlaces(
+                teamBPlaces, teamAPlaces
+            ),
+        )
+
+    @staticmethod
+    def __getDecimalPlaces(scoreValues: numpy.ndarray) -> numpy.ndarray:
+        """
+        Returns the number of decimal places each score has as a Deci.
+        """
+        return numpy.array(
+            [
+                max(0, -Deci(score).as_tuple().exponent)
+                for score in scoreValues.tolist()
+            ],
+            dtype=numpy.int64,
+        )
+
+    @staticmethod
+    def __getRunningDecimalTotal(
+        numberOfWeeks: int,
+        numberOfTeams: int,
+        weekIndex: numpy.ndarray,
+        teamAIndex: numpy.ndarray,
+        teamBIndex: numpy.ndarray,
+        teamAScoreValue: numpy.ndarray,
+        teamBScoreValue: numpy.ndarray,
+    ) -> Optional[numpy.ndarray]:
+        """
+        Returns the running total of the team A and team B scores as Decimals.
+        Returns None if a running total can't be kept exactly with the current Decimal precision,
+        since the difference between two rounded running totals may not be the same as adding up the scores in a range.
+        """
+        totals = numpy.empty((numberOfWeeks + 1, numberOfTeams), dtype=object)
+        totals[:] = Deci(0)
+        context = decimal.getcontext().copy()
+        context.traps[decimal.Inexact] = True
+        try:
+            with decimal.localcontext(context):
+                for week, teamAIndex_, teamBIndex_, teamAScore, teamBScore in zip(
+                    (weekIndex + 1).tolist(),
+                    teamAIndex.tolist(),
+                    teamBIndex.tolist(),
+                    teamAScoreValue.tolist(),
+                    teamBScoreValue.tolist(),
+                ):
+                    totals[week, teamAIndex_] += Deci(teamAScore)
+                    totals[week, teamBIndex_] += Deci(teamBScore)
+                for week in range(1, numberOfWeeks + 1):
+                    totals[week] += totals[week - 1]
+        except decimal.Inexact:
+            return None
+        return totals
+
+    def getRangeTotal(
+        self, runningTotal: numpy.ndarray, weekNumberStart: int, weekNumberEnd: int
+    ) -> numpy.ndarray:
+        """
+        Returns the total for each team (ordered by team index) from the given running total between the given weeks (inclusive).
+        """
+        return runningTotal[weekNumberEnd] - runningTotal[weekNumberStart - 1]
+
+    def getMultiWeekMatchupRowsInRange(
+        self, weekNumberStart: int, weekNumberEnd: int
+    ) -> numpy.ndarray:
+        """
+        Returns the rows this WeekRangeIndex was built from that are part of a multi-week matchup and are between the given weeks (inclusive).
+        """
+        # rows are in the order they were played, so the rows in the range are next to each other
+        start, end = numpy.searchsorted(
+            self.weekIndex, [weekNumberStart - 1, weekNumberEnd]
+        ).tolist()
+        return self.rows[start:end][self.isMultiWeekMatchup[start:end]]
+
+    def getDecimalPointsScoredInRange(
+        self, weekNumberStart: int, weekNumberEnd: int, *, opponentScores: bool = False
+    ) -> Optional[list[decimal.Decimal]]:
+        """
+        Returns the points scored for each team (ordered by team index) between the given weeks (inclusive),
+        exactly as if each score in the range had been added one at a time to Deci(0).
+        If opponentScores is True, the points scored by each team's opponents are returned instead.
+        Returns None if there is no exact running total to use.
+        """
+        runningTotal = (
+            self.opponentPointsScored if opponentScores else self.pointsScored
+        )
+        if runningTotal is None:
+            return None
+        runningDecimalPlaces = (
+            self.opponentPointsScoredDecimalPlaces
+            if opponentScores
+            else self.pointsScoredDecimalPlaces
+        )
+        # a sum of Decimals has as many decimal places as the score with the most decimal places in it
+        decimalPlacesInRange = self.getRangeTotal(
+            runningDecimalPlaces, weekNumberStart, weekNumberEnd
+        )
+        maxDecimalPlaces = numpy.where(
+            decimalPlacesInRange > 0,
+            numpy.arange(decimalPlacesInRange.shape[-1]),
+            0,
+        ).max(axis=-1, initial=0)
+        pointsScored = list()
+        for total, decimalPlaces in zip(
+            self.getRangeTotal(runningTotal, weekNumberStart, weekNumberEnd).tolist(),
+            maxDecimalPlaces.tolist(),
+        ):
+            pointsScored.append(total.quantize(Deci(1).scaleb(-decimalPlaces)))
+        return pointsScored
+
+    def getFixedPointPointsScoredInRange(
+        self,
+        weekNumberStart: int,
+        weekNumberEnd: int,
+        scale: int,
+        fixedPointScores: tuple[numpy.ndarray, numpy.ndarray],
+        *,
+        opponentScores: bool = False,
+    ) -> numpy.ndarray:
+        """
+        Returns the exact points scored for each team (ordered by team index) between the given weeks (inclusive) as 64-bit fixed-point integers with the given scale.
+        fixedPointScores is the YearFrame's team A and team B score columns with the given scale, which are only used the first time each scale is used.
+        If opponentScores is True, the points scored by each team's opponents are returned instead.
+        """
+        if scale not in self.__fixedPointPointsScoredCache:
+            teamAScore = fixedPointScores[0][self.rows]
+            teamBScore = fixedPointScores[1][self.rows]
+
+            def runningTotal(
+                teamAScore: numpy.ndarray, teamBScore: numpy.ndarray
+            ) -> numpy.ndarray:
+                totals = numpy.zeros(self.gamesPlayed.shape, dtype=numpy.int64)
+                numpy.add.at(totals, (self.weekIndex + 1, self.teamAIndex), teamAScore)
+                numpy.add.at(totals, (self.weekIndex + 1, self.teamBIndex), teamBScore)
+                return numpy.cumsum(totals, axis=0)
+
+            self.__fixedPointPointsScoredCache[scale] = (
+                runningTotal(teamAScore, teamBScore),
+                runningTotal(teamBScore, teamAScore),
+            )
+        pointsScored, opponentPointsScored = self.__fixedPointPointsScoredCache[scale]
+        return self.getRangeTotal(
+            opponentPointsScored if opponentScores else pointsScored,
+            weekNumberStart,
+            weekNumberEnd,
+        )
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy
+
+
+@dataclass(kw_only=True, frozen=True, eq=False)
+class WeekRankings:
+    """
+    Used to house how every score in a group of YearFrame rows ranks against the other scores in the same week.
+
+    Per-matchup arrays line up with the YearFrame rows the rankings were built from.
+    Per-week arrays only include weeks that have at least 1 of those rows, in the order the weeks were played.
+
+    Since every score in a week belongs to exactly 1 team, a team's opponent's ranking is found by looking at the other side of the matchup.
+    """
+
+    rows: numpy.ndarray
+    # one value per matchup
+    teamAIndex: numpy.ndarray
+    teamBIndex: numpy.ndarray
+    weekPosition: numpy.ndarray  # index into the per-week arrays
+    teamAScoresBeat: numpy.ndarray
+    teamAScoresTied: numpy.ndarray
+    teamBScoresBeat: numpy.ndarray
+    teamBScoresTied: numpy.ndarray
+    # one value per week
+    weekIndex: numpy.ndarray  # index into Year.weeks
+    numberOfScores: numpy.ndarray
+    medianScore: numpy.ndarray
+    totalScore: tuple[float | int, ...]
+
+    @staticmethod
+    def build(
+        rows: numpy.ndarray,
+        weekIndex: numpy.ndarray,
+        teamAIndex: numpy.ndarray,
+        teamBIndex: numpy.ndarray,
+        teamAScore: numpy.ndarray,
+        teamBScore: numpy.ndarray,
+        teamAScoreValue: numpy.ndarray,
+        teamBScoreValue: numpy.ndarray,
+    ) -> WeekRankings:
+        """
+        Builds WeekRankings from YearFrame columns that have already been narrowed down to the given rows.
+        Rows must be in the order they were played, so each week's scores are next to each other.
+        """
+        # every score is an entry, team A's score comes right before team B's score for each matchup
+        entryWeekIndex = numpy.repeat(weekIndex, 2)
+        entryScore = numpy.column_stack((teamAScore, teamBScore)).ravel()
+        entryScoreValue = numpy.empty(len(entryScore), dtype=object)
+        entryScoreValue[0::2] = teamAScoreValue
+        entryScoreValue[1::2] = teamBScoreValue
+
+        uniqueWeekIndex, weekStart, numberOfScores = numpy.unique(
+            entryWeekIndex, return_index=True, return_counts=True
+        )
+        entryWeekPosition = numpy.searchsorted(uniqueWeekIndex, entryWeekIndex)
+
+        # sort by week, then score, so equal scores in the same week are next to each other
+        order = numpy.lexsort((entryScore, entryWeekIndex))
+        sortedWeekPosition = entryWeekPosition[order]
+        sortedScore = entryScore[order]
+        newRun = numpy.ones(len(order), dtype=bool)
+        newRun[1:] = (sortedWeekPosition[1:] != sortedWeekPosition[:-1]) | (
+            sortedScore[1:] != sortedScore[:-1]
+        )
+        runId = numpy.cumsum(newRun) - 1
+        runLength = numpy.bincount(runId)
+        runStart = numpy.cumsum(runLength) - runLength
+
+        entryScoresBeat = numpy.empty(len(order), dtype=numpy.int64)
+        entryScoresBeat[order] = runStart[runId] - weekStart[sortedWeekPosition]
+        entryScoresTied = numpy.empty(len(order), dtype=numpy.int64)
+        # a score will always tie itself, so that tie isn't counted
+        entryScoresTied[order] = runLength[runId] - 1
+
+        # the median is the middle score (or the mean of the 2 middle scores) of each week
+        lowerMiddle = weekStart + (numberOfScores - 1) // 2
+        upperMiddle = weekStart + numberOfScores // 2
+        medianScore = (sortedScore[lowerMiddle] + sortedScore[upperMiddle]) / 2
+
+        # add up each week's scores one at a time (in the order they were played) so the total is exactly what sum() would give
+        totalScore = numpy.bincount(
+            entryWeekPosition, weights=entryScore, minlength=len(uniqueWeekIndex)
+        )
+        weekHasFloatScore = numpy.bincount(
+            entryWeekPosition,
+            weights=[isinstance(score, float) for score in entryScoreValue],
+            minlength=len(uniqueWeekIndex),
+        ).astype(bool)
+
+        return WeekRankings(
+            rows=rows,
+            teamAIndex=teamAIndex,
+            teamBIndex=teamBIndex,
+            weekPosition=entryWeekPosition[0::2],
+            teamAScoresBeat=entryScoresBeat[0::2],
+            teamAScoresTied=entryScoresTied[0::2],
+            teamBScoresBeat=entryScoresBeat[1::2],
+            teamBScoresTied=entryScoresTied[1::2],
+            weekIndex=uniqueWeekIndex,
+            numberOfScores=numberOfScores,
+            medianScore=medianScore,
+            totalScore=tuple(
+                total if hasFloat else int(total)
+                for total, hasFloat in zip(
+                    totalScore.tolist(), weekHasFloatScore.tolist()
+                )
+            ),
+        )
+
+    def getWeeks(self, weekNumberStart: int, weekNumberEnd: int) -> WeekRankings:
+        """
+        Returns these WeekRankings with only the weeks between the given weeks (inclusive).
+        A score is only ranked against the other scores in its week,
+        so this is the same as building WeekRankings from only the rows in those weeks.
+        """
+        # weeks and rows are in the order they were played, so the ones in the range are next to each other
+        weekStart, weekEnd = numpy.searchsorted(
+            self.weekIndex, [weekNumberStart - 1, weekNumberEnd]
+        ).tolist()
+        start, end = numpy.searchsorted(
+            self.weekPosition, [weekStart, weekEnd]
+        ).tolist()
+        return WeekRankings(
+            rows=self.rows[start:end],
+            teamAIndex=self.teamAIndex[start:end],
+            teamBIndex=self.teamBIndex[start:end],
+            weekPosition=self.weekPosition[start:end] - weekStart,
+            teamAScoresBeat=self.teamAScoresBeat[start:end],
+            teamAScoresTied=self.teamAScoresTied[start:end],
+            teamBScoresBeat=self.teamBScoresBeat[start:end],
+            teamBScoresTied=self.teamBScoresTied[start:end],
+            weekIndex=self.weekIndex[weekStart:weekEnd],
+            numberOfScores=self.numberOfScores[weekStart:weekEnd],
+            medianScore=self.medianScore[weekStart:weekEnd],
+            totalScore=self.totalScore[weekStart:weekEnd],
+        )
+
+    def getRankingOfEachScore(
+        self, *, opponentScores: bool = False
+    ) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the team index, scores beat, scores tied and number of scores in the week for every score.
+        Scores are in the order they were played, with team A's score coming before team B's score.
+        If opponentScores is True, each team is given the ranking of their opponent's score instead.
+        """
+        teamIndex = numpy.column_stack((self.teamAIndex, self.teamBIndex)).ravel()
+        if opponentScores:
+            scoresBeat = (self.teamBScoresBeat, self.teamAScoresBeat)
+            scoresTied = (self.teamBScoresTied, self.teamAScoresTied)
+        else:
+            scoresBeat = (self.teamAScoresBeat, self.teamBScoresBeat)
+            scoresTied = (self.teamAScoresTied, self.teamBScoresTied)
+        return (
+            teamIndex,
+            numpy.column_stack(scoresBeat).ravel(),
+            numpy.column_stack(scoresTied).ravel(),
+            self.numberOfScores[numpy.repeat(self.weekPosition, 2)],
+        )
@@ -0,0 +1,826 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import ClassVar, Optional
+
+import numpy
+
+from leeger.enum.MatchupType import MatchupType
+from leeger.model.filter.YearFilters import YearFilters
+from leeger.model.frame.ScoresAggregate import ScoresAggregate
+from leeger.model.frame.SimplifiedMatchups import SimplifiedMatchups
+from leeger.model.frame.WeekRangeIndex import WeekRangeIndex
+from leeger.model.frame.WeekRankings import WeekRankings
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Year import Year
+from leeger.util.FixedPoint import FixedPoint
+from leeger.util.SortedScores import SortedScores
+
+
+@dataclass(kw_only=True, frozen=True, eq=False)
+class YearFrame:
+    """
+    A columnar representation of every Matchup in a Year.
+
+    Each Matchup in the Year is a row and each column is a NumPy array, so index i of every column describes the same Matchup.
+    Rows are in the same order Matchups appear in the Year (by week, then by position in the week).
+
+    Teams are referred to by their index in teamIds.
+    Weeks are referred to by their index in Year.weeks.
+    Multi-week matchups are referred to by their index in multiWeekMatchupIds, a row that is not part of a multi-week matchup has a group of -1.
+
+    Use YearNavigator.getYearFrame() to get a YearFrame that is only built once per Year.
+    """
+
+    MATCHUP_TYPE_CODES: ClassVar[dict[MatchupType, int]] = {
+        MatchupType.REGULAR_SEASON: 0,
+        MatchupType.PLAYOFF: 1,
+        MatchupType.CHAMPIONSHIP: 2,
+        MatchupType.IGNORE: 3,
+    }
+
+    yearNumber: int
+    leagueMedianGames: bool
+    teamIds: tuple[str, ...]
+    teamIdToIndex: dict[str, int]
+    multiWeekMatchupIds: tuple[str, ...]
+    matchups: tuple[Matchup, ...]
+    # one value per week
+    weekNumbers: numpy.ndarray
+    regularSeasonWeeks: numpy.ndarray
+    # one value per matchup
+    weekIndex: numpy.ndarray
+    teamAIndex: numpy.ndarray
+    teamBIndex: numpy.ndarray
+    teamAScore: numpy.ndarray  # float64, used for comparisons
+    teamBScore: numpy.ndarray  # float64, used for comparisons
+    teamAScoreValue: numpy.ndarray  # the original int/float scores
+    teamBScoreValue: numpy.ndarray  # the original int/float scores
+    matchupTypeCode: numpy.ndarray
+    teamAHasTiebreaker: numpy.ndarray
+    teamBHasTiebreaker: numpy.ndarray
+    multiWeekMatchupGroup: numpy.ndarray
+    # WeekRankings that have already been built, keyed by the filters used to build them
+    __weekRankingsCache: dict[tuple, WeekRankings] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # ScoresAggregates that have already been built, keyed by the filters used to build them
+    __scoresAggregateCache: dict[tuple, ScoresAggregate] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # the SortedScores of every score in the Year, once it has been built
+    __sortedScoresCache: list[SortedScores] = field(
+        default_factory=list, init=False, repr=False
+    )
+    # WeekRangeIndexes that have already been built, keyed by the matchup types used to build them
+    __weekRangeIndexCache: dict[tuple, WeekRangeIndex] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # fixed-point team A and team B score columns (and which rows can't be fixed-point) that have already been built, keyed by scale
+    __fixedPointScoresCache: dict[
+        int, tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+    ] = field(default_factory=dict, init=False, repr=False)
+
+    @property
+    def numberOfTeams(self) -> int:
+        return len(self.teamIds)
+
+    @property
+    def numberOfWeeks(self) -> int:
+        return len(self.weekNumbers)
+
+    @staticmethod
+    def fromYear(year: Year) -> YearFrame:
+        """
+        Builds a YearFrame from the given Year with a single pass over its Matchups.
+        """
+        teamIds = tuple(team.id for team in year.teams)
+        teamIdToIndex = {teamId: i for i, teamId in enumerate(teamIds)}
+        multiWeekMatchupIdToGroup: dict[str, int] = dict()
+
+        matchups = list()
+        weekIndex = list()
+        teamAIndex = list()
+        teamBIndex = list()
+        teamAScoreValue = list()
+        teamBScoreValue = list()
+        matchupTypeCode = list()
+        teamAHasTiebreaker = list()
+        teamBHasTiebreaker = list()
+        multiWeekMatchupGroup = list()
+
+        for i, week in enumerate(year.weeks):
+            for matchup in week.matchups:
+                matchups.append(matchup)
+                weekIndex.append(i)
+                teamAIndex.append(teamIdToIndex[matchup.teamAId])
+                teamBIndex.append(teamIdToIndex[matchup.teamBId])
+                teamAScoreValue.append(matchup.teamAScore)
+                teamBScoreValue.append(matchup.teamBScore)
+                matchupTypeCode.append(
+                    YearFrame.MATCHUP_TYPE_CODES[matchup.matchupType]
+                )
+                teamAHasTiebreaker.append(bool(matchup.teamAHasTiebreaker))
+                teamBHasTiebreaker.append(bool(matchup.teamBHasTiebreaker))
+                mwmid = matchup.multiWeekMatchupId
+                if mwmid is None:
+                    multiWeekMatchupGroup.append(-1)
+                else:
+                    multiWeekMatchupGroup.append(
+                        multiWeekMatchupIdToGroup.setdefault(
+                            mwmid, len(multiWeekMatchupIdToGroup)
+                        )
+                    )
+
+        def objectArray(values: list) -> numpy.ndarray:
+            # built element by element so NumPy never tries to convert the values
+            array = numpy.empty(len(values), dtype=object)
+            array[:] = values
+            return array
+
+        return YearFrame(
+            yearNumber=year.yearNumber,
+            leagueMedianGames=bool(year.yearSettings.leagueMedianGames),
+            teamIds=teamIds,
+            teamIdToIndex=teamIdToIndex,
+            multiWeekMatchupIds=tuple(multiWeekMatchupIdToGroup.keys()),
+            matchups=tuple(matchups),
+            weekNumbers=numpy.array(
+                [week.weekNumber for week in year.weeks], dtype=numpy.int32
+            ),
+            regularSeasonWeeks=numpy.array(
+                [week.isRegularSeasonWeek for week in year.weeks], dtype=bool
+            ),
+            weekIndex=numpy.array(weekIndex, dtype=numpy.int32),
+            teamAIndex=numpy.array(teamAIndex, dtype=numpy.int32),
+            teamBIndex=numpy.array(teamBIndex, dtype=numpy.int32),
+            teamAScore=numpy.array(teamAScoreValue, dtype=numpy.float64),
+            teamBScore=numpy.array(teamBScoreValue, dtype=numpy.float64),
+            teamAScoreValue=objectArray(teamAScoreValue),
+            teamBScoreValue=objectArray(teamBScoreValue),
+            matchupTypeCode=numpy.array(matchupTypeCode, dtype=numpy.int8),
+            teamAHasTiebreaker=numpy.array(teamAHasTiebreaker, dtype=bool),
+            teamBHasTiebreaker=numpy.array(teamBHasTiebreaker, dtype=bool),
+            multiWeekMatchupGroup=numpy.array(multiWeekMatchupGroup, dtype=numpy.int32),
+        )
+
+    def toTeamIdDict(self, values: list) -> dict:
+        """
+        Takes a list with 1 value per team (ordered by team index) and returns it as a dict keyed by team ID.
+        """
+        return dict(zip(self.teamIds, values))
+
+    def getMatchupTypeCodes(self, matchupTypes: list[MatchupType]) -> numpy.ndarray:
+        return numpy.array(
+            [self.MATCHUP_TYPE_CODES[matchupType] for matchupType in matchupTypes],
+            dtype=numpy.int8,
+        )
+
+    def getRows(
+        self, yearFilters: YearFilters, *, excludeMultiWeekMatchups: bool = False
+    ) -> numpy.ndarray:
+        """
+        Returns the index of every row that is remaining after the given filters are applied.
+        """
+        mask = (
+            (self.weekIndex >= yearFilters.weekNumberStart - 1)
+            & (self.weekIndex < yearFilters.weekNumberEnd)
+            & numpy.isin(
+                self.matchupTypeCode,
+                self.getMatchupTypeCodes(yearFilters.includeMatchupTypes),
+            )
+        )
+        if excludeMultiWeekMatchups:
+            mask &= self.multiWeekMatchupGroup == -1
+        return numpy.flatnonzero(mask)
+
+    def getFirstRowOfEachMultiWeekMatchup(self, rows: numpy.ndarray) -> numpy.ndarray:
+        """
+        Returns a mask for the given rows that is True for rows that are not part of a multi-week matchup
+        and for the first of the given rows in each multi-week matchup.
+        """
+        groups = self.multiWeekMatchupGroup[rows]
+        mask = groups == -1
+        _, firstIndexes = numpy.unique(groups, return_index=True)
+        mask[firstIndexes] = True
+        return mask
+
+    def simplifyMultiWeekMatchups(
+        self, rows: numpy.ndarray, *, fixedPointScale: Optional[int] = None
+    ) -> SimplifiedMatchups:
+        """
+        Returns the given rows with each multi-week matchup combined into a single Matchup.
+        Uses the same logic as MatchupNavigator.simplifyMultiWeekMatchups().
+        If a fixed-point scale is given, scores are compared as fixed-point integers,
+        and each week's score is made a fixed-point integer before a multi-week matchup's scores are added up.
+        """
+        groups = self.multiWeekMatchupGroup[rows]
+        singleRows = rows[groups == -1]
+        multiWeekRows = rows[groups != -1]
+        multiWeekGroups = groups[groups != -1]
+        # order combined matchups by the first time they appear in the given rows
+        uniqueGroups, firstIndexes = numpy.unique(multiWeekGroups, return_index=True)
+        order = numpy.argsort(firstIndexes, kind="stable")
+        uniqueGroups = uniqueGroups[order]
+        firstRows = multiWeekRows[firstIndexes[order]]
+
+        combinedTeamAScoreValue = list()
+        combinedTeamBScoreValue = list()
+        for group in uniqueGroups.tolist():
+            groupRows = multiWeekRows[multiWeekGroups == group]
+            combinedTeamAScoreValue.append(sum(self.teamAScoreValue[groupRows]))
+            combinedTeamBScoreValue.append(sum(self.teamBScoreValue[groupRows]))
+
+        teamAScoreValue = numpy.empty(len(singleRows) + len(firstRows), dtype=object)
+        teamAScoreValue[: len(singleRows)] = self.teamAScoreValue[singleRows]
+        teamAScoreValue[len(singleRows) :] = combinedTeamAScoreValue
+        teamBScoreValue = numpy.empty(len(singleRows) + len(firstRows), dtype=object)
+        teamBScoreValue[: len(singleRows)] = self.teamBScoreValue[singleRows]
+        teamBScoreValue[len(singleRows) :] = combinedTeamBScoreValue
+
+        if fixedPointScale is None:
+            teamAScore = teamAScoreValue.astype(numpy.float64)
+            teamBScore = teamBScoreValue.astype(numpy.float64)
+        else:
+            teamAFixedPointScore, teamBFixedPointScore = self.getFixedPointScores(
+                fixedPointScale, rows
+            )
+            teamAScore, teamBScore = (
+                numpy.concatenate(
+                    (
+                        fixedPointScore[groups == -1],
+                        self.__sumByMultiWeekMatchup(
+                            fixedPointScore[groups != -1],
+                            multiWeekGroups,
+                            uniqueGroups,
+                        ),
+                    )
+                )
+                for fixedPointScore in (teamAFixedPointScore, teamBFixedPointScore)
+            )
+
+        # every other column is taken from the first matchup of a multi-week matchup
+        columnRows = numpy.concatenate((singleRows, firstRows))
+        return SimplifiedMatchups(
+            teamAIndex=self.teamAIndex[columnRows],
+            teamBIndex=self.teamBIndex[columnRows],
+            teamAScore=teamAScore,
+            teamBScore=teamBScore,
+            teamAScoreValue=teamAScoreValue,
+            teamBScoreValue=teamBScoreValue,
+            teamAHasTiebreaker=self.teamAHasTiebreaker[columnRows],
+            teamBHasTiebreaker=self.teamBHasTiebreaker[columnRows],
+            matchupTypeCode=self.matchupTypeCode[columnRows],
+        )
+
+    @staticmethod
+    def __sumByMultiWeekMatchup(
+        values: numpy.ndarray, multiWeekGroups: numpy.ndarray, groups: numpy.ndarray
+    ) -> numpy.ndarray:
+        """
+        Returns the sum of the given int64 values (one per multi-week matchup row) for each of the given multi-week matchup groups, in the given order.
+        """
+        sums = numpy.zeros(len(groups), dtype=numpy.int64)
+        groupPosition = numpy.empty(int(groups.max(initial=-1)) + 1, dtype=numpy.int64)
+        groupPosition[groups] = numpy.arange(len(groups))
+        numpy.add.at(sums, groupPosition[multiWeekGroups], values)
+        return sums
+
+    def getOutcomesInOrderPlayed(
+        self, rows: numpy.ndarray, *, fixedPointScale: Optional[int] = None
+    ) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the team index and outcome (1 for a win, -1 for a loss, 0 for a tie) of every game in the given rows, in the order they were decided.
+        Each multi-week matchup is combined into a single game that is decided in the last of its given rows.
+        Team A's outcome comes right before team B's outcome for each game.
+        If a fixed-point scale is given, scores are compared as fixed-point integers.
+        """
+        groups = self.multiWeekMatchupGroup[rows]
+        isMultiWeekMatchup = groups != -1
+        multiWeekGroups = groups[isMultiWeekMatchup]
+        # line up with the order simplifyMultiWeekMatchups() returns combined matchups in
+        _, firstIndexes = numpy.unique(multiWeekGroups, return_index=True)
+        _, lastIndexesReversed = numpy.unique(multiWeekGroups[::-1], return_index=True)
+        lastIndexes = len(multiWeekGroups) - 1 - lastIndexesReversed
+        decidedAt = numpy.concatenate(
+            (
+                numpy.flatnonzero(~isMultiWeekMatchup),
+                numpy.flatnonzero(isMultiWeekMatchup)[
+                    lastIndexes[numpy.argsort(firstIndexes, kind="stable")]
+                ],
+            )
+        )
+        order = numpy.argsort(decidedAt, kind="stable")
+
+        simplifiedMatchups = self.simplifyMultiWeekMatchups(
+            rows, fixedPointScale=fixedPointScale
+        )
+        teamAWon, teamBWon, _ = simplifiedMatchups.getOutcomes()
+        teamAOutcome = teamAWon.astype(numpy.int8) - teamBWon.astype(numpy.int8)
+        teamIndex = numpy.column_stack(
+            (
+                simplifiedMatchups.teamAIndex[order],
+                simplifiedMatchups.teamBIndex[order],
+            )
+        ).ravel()
+        outcome = numpy.column_stack(
+            (teamAOutcome[order], -teamAOutcome[order])
+        ).ravel()
+        return teamIndex, outcome
+
+    def getScoresAboveMedianInOrderPlayed(
+        self, yearFilters: YearFilters
+    ) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the team index of every score remaining after the given filters are applied (in the order they were played)
+        and whether that score was above the median score of its week.
+        Team A's score comes right before team B's score for each matchup.
+        """
+        weekRankings = self.getWeekRankings(yearFilters)
+        medianScore = weekRankings.medianScore[weekRankings.weekPosition]
+        teamIndex = numpy.column_stack(
+            (weekRankings.teamAIndex, weekRankings.teamBIndex)
+        ).ravel()
+        aboveMedian = numpy.column_stack(
+            (
+                self.teamAScore[weekRankings.rows] > medianScore,
+                self.teamBScore[weekRankings.rows] > medianScore,
+            )
+        ).ravel()
+        return teamIndex, aboveMedian
+
+    def countByTeam(
+        self, teamIndexes: numpy.ndarray, weights: numpy.ndarray = None
+    ) -> numpy.ndarray:
+        """
+        Returns the number of times each team index appears in the given team indexes (optionally weighted).
+        """
+        return numpy.bincount(
+            teamIndexes, weights=weights, minlength=self.numberOfTeams
+        )
+
+    @staticmethod
+    def countPlayedByEachWeek(
+        weekIndex: numpy.ndarray, weekNumberStart: int, weekNumberEnd: int
+    ) -> list[int]:
+        """
+        Takes the week index of things that are in the order they were played
+        and returns how many of them were played by the end of each week from weekNumberStart to weekNumberEnd.
+        """
+        # the week at index i is week number i + 1, so everything before week number n has a week index less than n
+        return numpy.searchsorted(
+            weekIndex, numpy.arange(weekNumberStart, weekNumberEnd + 1), side="left"
+        ).tolist()
+
+    def countByTeamAfterEachWeek(
+        self,
+        teamIndexes: numpy.ndarray,
+        playedByEachWeek: list[int],
+        weights: numpy.ndarray = None,
+    ) -> numpy.ndarray:
+        """
+        Returns what countByTeam() returns for the team indexes (and weights) played by the end of each week,
+        with one row per week in playedByEachWeek (see countPlayedByEachWeek()) and one column per team index.
+        """
+        if len(playedByEachWeek) == 1:
+            played = playedByEachWeek[0]
+            return self.countByTeam(
+                teamIndexes[:played], None if weights is None else weights[:played]
+            )[numpy.newaxis]
+        if weights is None:
+            # the first week each team index was played by
+            firstWeek = numpy.searchsorted(
+                playedByEachWeek, numpy.arange(len(teamIndexes)), side="right"
+            )
+            counts = numpy.zeros(
+                (len(playedByEachWeek) + 1, self.numberOfTeams), dtype=numpy.int64
+            )
+            numpy.add.at(counts, (firstWeek, teamIndexes), 1)
+            return numpy.cumsum(counts, axis=0)[:-1]
+
+        sums = numpy.zeros((len(playedByEachWeek), self.numberOfTeams))
+        for teamIndex in range(self.numberOfTeams):
+            positions = numpy.flatnonzero(teamIndexes == teamIndex)
+            # countByTeam() adds each weight one at a time starting from 0, so a running sum from 0 gives exactly the same totals
+            runningSum = numpy.cumsum(numpy.concatenate(([0.0], weights[positions])))
+            sums[:, teamIndex] = runningSum[
+                numpy.searchsorted(positions, playedByEachWeek)
+            ]
+        return sums
+
+    def countGamesAgainstEachTeam(self, rows: numpy.ndarray) -> numpy.ndarray:
+        """
+        Returns a (teams x teams) matrix of the number of games each team (rows) played against each other team (columns) in the given rows.
+        The matrix is symmetric, and a multi-week matchup counts as 1 game.
+        """
+        simplifiedMatchups = self.simplifyMultiWeekMatchups(rows)
+        gamesAgainstEachTeam = numpy.zeros(
+            (self.numberOfTeams, self.numberOfTeams), dtype=numpy.int64
+        )
+        numpy.add.at(
+            gamesAgainstEachTeam,
+            (simplifiedMatchups.teamAIndex, simplifiedMatchups.teamBIndex),
+            1,
+        )
+        return gamesAgainstEachTeam + gamesAgainstEachTeam.T
+
+    def groupScoresByTeam(
+        self,
+        teamAIndex: numpy.ndarray,
+        teamBIndex: numpy.ndarray,
+        teamAScoreValue: numpy.ndarray,
+        teamBScoreValue: numpy.ndarray,
+    ) -> list[list[float | int]]:
+        """
+        Takes matching team index and score columns and returns a list of scores for each team (ordered by team index).
+        Each team's scores are in the order they appear in the columns, with team A's score coming before team B's score.
+        """
+        teamIndexes = numpy.column_stack((teamAIndex, teamBIndex)).ravel()
+        scores = numpy.empty(len(teamIndexes), dtype=object)
+        scores[0::2] = teamAScoreValue
+        scores[1::2] = teamBScoreValue
+        order = numpy.argsort(teamIndexes, kind="stable")
+        splitAt = numpy.cumsum(self.countByTeam(teamIndexes))[:-1]
+        return [
+            teamScores.tolist() for teamScores in numpy.split(scores[order], splitAt)
+        ]
+
+    def getScoresByTeam(
+        self, rows: numpy.ndarray, *, opponentScores: bool = False
+    ) -> list[list[float | int]]:
+        """
+        Returns a list of scores for each team (ordered by team index) from the given rows.
+        Scores are in the order they were played.
+        If opponentScores is True, the scores of each team's opponents are returned instead.
+        """
+        teamAScoreValue = self.teamAScoreValue[rows]
+        teamBScoreValue = self.teamBScoreValue[rows]
+        if opponentScores:
+            teamAScoreValue, teamBScoreValue = teamBScoreValue, teamAScoreValue
+        return self.groupScoresByTeam(
+            self.teamAIndex[rows],
+            self.teamBIndex[rows],
+            teamAScoreValue,
+            teamBScoreValue,
+        )
+
+    def sumScoresByTeam(
+        self, rows: numpy.ndarray, *, opponentScores: bool = False
+    ) -> numpy.ndarray:
+        """
+        Returns the sum of the scores for each team (ordered by team index) from the given rows as 64-bit floats.
+        If opponentScores is True, the sum of the scores of each team's opponents is returned instead.
+        """
+        teamAScore = self.teamAScore[rows]
+        teamBScore = self.teamBScore[rows]
+        if opponentScores:
+            teamAScore, teamBScore = teamBScore, teamAScore
+        return self.countByTeam(self.teamAIndex[rows], teamAScore) + self.countByTeam(
+            self.teamBIndex[rows], teamBScore
+        )
+
+    def __getAllFixedPointScores(
+        self, scale: int
+    ) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the team A and team B score columns as 64-bit fixed-point integers with the given scale,
+        and whether each row has a score that can't be a fixed-point integer with the given scale (those scores are 0 in the columns).
+        These columns are only built once for each scale.
+        """
+        if scale not in self.__fixedPointScoresCache:
+            teamAScore = numpy.zeros(len(self.teamAScoreValue), dtype=numpy.int64)
+            teamBScore = numpy.zeros(len(self.teamBScoreValue), dtype=numpy.int64)
+            isNotFixedPoint = numpy.zeros(len(self.teamAScoreValue), dtype=bool)
+            for row, (teamAScoreValue, teamBScoreValue) in enumerate(
+                zip(self.teamAScoreValue.tolist(), self.teamBScoreValue.tolist())
+            ):
+                try:
+                    teamAScore[row] = FixedPoint.toFixedPoint(teamAScoreValue, scale)
+                    teamBScore[row] = FixedPoint.toFixedPoint(teamBScoreValue, scale)
+                except ValueError:
+                    teamAScore[row] = teamBScore[row] = 0
+                    isNotFixedPoint[row] = True
+            self.__fixedPointScoresCache[scale] = (
+                teamAScore,
+                teamBScore,
+                isNotFixedPoint,
+            )
+        return self.__fixedPointScoresCache[scale]
+
+    def getFixedPointScores(
+        self, scale: int, rows: numpy.ndarray
+    ) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the team A and team B scores of the given rows as 64-bit fixed-point integers with the given scale.
+        Raises a ValueError if a score in the given rows can't be a fixed-point integer with the given scale.
+        Scores in other rows don't need to be.
+        """
+        teamAScore, teamBScore, isNotFixedPoint = self.__getAllFixedPointScores(scale)
+        self.__validateFixedPointRows(rows, scale, isNotFixedPoint)
+        return teamAScore[rows], teamBScore[rows]
+
+    def __validateFixedPointRows(
+        self, rows: numpy.ndarray, scale: int, isNotFixedPoint: numpy.ndarray
+    ) -> None:
+        notFixedPointRows = rows[isNotFixedPoint[rows]]
+        if len(notFixedPointRows) > 0:
+            # raises the ValueError for the first score that can't be a fixed-point integer
+            row = int(notFixedPointRows[0])
+            FixedPoint.toFixedPoint(self.teamAScoreValue[row], scale)
+            FixedPoint.toFixedPoint(self.teamBScoreValue[row], scale)
+
+    def sumFixedPointScoresByTeam(
+        self, rows: numpy.ndarray, scale: int, *, opponentScores: bool = False
+    ) -> numpy.ndarray:
+        """
+        Returns the exact sum of the scores for each team (ordered by team index) from the given rows as 64-bit fixed-point integers with the given scale.
+        If opponentScores is True, the sum of the scores of each team's opponents is returned instead.
+        """
+        teamAScore, teamBScore = self.getFixedPointScores(scale, rows)
+        if opponentScores:
+            teamAScore, teamBScore = teamBScore, teamAScore
+        # numpy.bincount() only sums floats, so integers are added in place to keep them exact
+        pointsScored = numpy.zeros(self.numberOfTeams, dtype=numpy.int64)
+        numpy.add.at(pointsScored, self.teamAIndex[rows], teamAScore)
+        numpy.add.at(pointsScored, self.teamBIndex[rows], teamBScore)
+        return pointsScored
+
+    def getWeekRangeIndex(self, matchupTypes: list[MatchupType]) -> WeekRangeIndex:
+        """
+        Returns the WeekRangeIndex for the rows with the given matchup types.
+        WeekRangeIndexes are only built once for each combination of matchup types.
+        """
+        cacheKey = tuple(matchupTypes)
+        if cacheKey not in self.__weekRangeIndexCache:
+            rows = numpy.flatnonzero(
+                numpy.isin(self.matchupTypeCode, self.getMatchupTypeCodes(matchupTypes))
+            )
+            isMultiWeekMatchup = self.multiWeekMatchupGroup[rows] != -1
+            # rows that are not part of a multi-week matchup are their own simplified matchup
+            outcomes = tuple(numpy.zeros(len(rows), dtype=bool) for _ in range(3))
+            for outcome, singleRowOutcome in zip(
+                outcomes,
+                self.simplifyMultiWeekMatchups(rows[~isMultiWeekMatchup]).getOutcomes(),
+            ):
+                outcome[~isMultiWeekMatchup] = singleRowOutcome
+            self.__weekRangeIndexCache[cacheKey] = WeekRangeIndex.build(
+                rows,
+                self.numberOfWeeks,
+                self.numberOfTeams,
+                self.weekIndex[rows],
+                self.teamAIndex[rows],
+                self.teamBIndex[rows],
+                self.teamAScoreValue[rows],
+                self.teamBScoreValue[rows],
+                self.matchupTypeCode[rows]
+                == self.MATCHUP_TYPE_CODES[MatchupType.REGULAR_SEASON],
+                isMultiWeekMatchup,
+                outcomes,
+            )
+        return self.__weekRangeIndexCache[cacheKey]
+
+    def countGamesByTeam(
+        self,
+        yearFilters: YearFilters,
+        *,
+        countMultiWeekMatchupsAsOneGame: bool = False,
+        countLeagueMedianGamesAsTwoGames: bool = False,
+    ) -> numpy.ndarray:
+        """
+        Returns the number of games played for each team (ordered by team index) in the rows that are remaining after the given filters are applied.
+        Uses the WeekRangeIndex for the filters' matchup types, so only multi-week matchups are looked at row by row.
+        """
+        weekRangeIndex = self.getWeekRangeIndex(yearFilters.includeMatchupTypes)
+        weekRange = (yearFilters.weekNumberStart, yearFilters.weekNumberEnd)
+        countRegularSeasonGamesTwice = (
+            self.leagueMedianGames and countLeagueMedianGamesAsTwoGames
+        )
+        gamesPlayed = weekRangeIndex.getRangeTotal(
+            weekRangeIndex.gamesPlayed, *weekRange
+        )
+        if countRegularSeasonGamesTwice:
+            gamesPlayed = gamesPlayed + weekRangeIndex.getRangeTotal(
+                weekRangeIndex.regularSeasonGamesPlayed, *weekRange
+            )
+        if countMultiWeekMatchupsAsOneGame:
+            # only the first row in the range of each multi-week matchup counts as a game
+            multiWeekRows = weekRangeIndex.getMultiWeekMatchupRowsInRange(*weekRange)
+            extraRows = multiWeekRows[
+                ~self.getFirstRowOfEachMultiWeekMatchup(multiWeekRows)
+            ]
+            if countRegularSeasonGamesTwice:
+                extraRows = numpy.concatenate(
+                    (
+                        extraRows,
+                        extraRows[
+                            self.matchupTypeCode[extraRows]
+                            == self.MATCHUP_TYPE_CODES[MatchupType.REGULAR_SEASON]
+                        ],
+                    )
+                )
+            gamesPlayed = (
+                gamesPlayed
+                - self.countByTeam(self.teamAIndex[extraRows])
+                - self.countByTeam(self.teamBIndex[extraRows])
+            )
+        return gamesPlayed
+
+    def countOutcomesByTeam(
+        self, yearFilters: YearFilters, *, fixedPointScale: Optional[int] = None
+    ) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the number of wins, losses and ties for each team (ordered by team index) in the rows that are remaining after the given filters are applied.
+        Multi-week matchups are combined into single Matchups.
+        Uses the WeekRangeIndex for the filters' matchup types, so only multi-week matchups are looked at row by row.
+        If a fixed-point scale is given, scores are compared as fixed-point integers.
+        """
+        weekRangeIndex = self.getWeekRangeIndex(yearFilters.includeMatchupTypes)
+        weekRange = (yearFilters.weekNumberStart, yearFilters.weekNumberEnd)
+        if fixedPointScale is not None:
+            # 2 different scores that can be fixed-point integers are never the same fixed-point integer,
+            # so the outcomes of rows that aren't part of a multi-week matchup are the same as when they are compared as floats
+            self.__validateFixedPointFilters(yearFilters, fixedPointScale)
+        # a multi-week matchup is combined from its rows that are in the range
+        simplifiedMatchups = self.simplifyMultiWeekMatchups(
+            weekRangeIndex.getMultiWeekMatchupRowsInRange(*weekRange),
+            fixedPointScale=fixedPointScale,
+        )
+        teamAWon, teamBWon, tied = simplifiedMatchups.getOutcomes()
+        wins = (
+            weekRangeIndex.getRangeTotal(weekRangeIndex.wins, *weekRange)
+            + self.countByTeam(simplifiedMatchups.teamAIndex[teamAWon])
+            + self.countByTeam(simplifiedMatchups.teamBIndex[teamBWon])
+        )
+        losses = (
+            weekRangeIndex.getRangeTotal(weekRangeIndex.losses, *weekRange)
+            + self.countByTeam(simplifiedMatchups.teamBIndex[teamAWon])
+            + self.countByTeam(simplifiedMatchups.teamAIndex[teamBWon])
+        )
+        ties = (
+            weekRangeIndex.getRangeTotal(weekRangeIndex.ties, *weekRange)
+            + self.countByTeam(simplifiedMatchups.teamAIndex[tied])
+            + self.countByTeam(simplifiedMatchups.teamBIndex[tied])
+        )
+        return wins, losses, ties
+
+    def sumDecimalScoresInRangeByTeam(
+        self, yearFilters: YearFilters, *, opponentScores: bool = False
+    ) -> Optional[list[Decimal]]:
+        """
+        Returns the sum of the scores for each team (ordered by team index) in the rows that are remaining after the given filters are applied,
+        exactly as if each score had been added one at a time to Deci(0).
+        If opponentScores is True, the sum of the scores of each team's opponents is returned instead.
+        Returns None if the WeekRangeIndex for the filters' matchup types can't answer this exactly.
+        """
+        return self.getWeekRangeIndex(
+            yearFilters.includeMatchupTypes
+        ).getDecimalPointsScoredInRange(
+            yearFilters.weekNumberStart,
+            yearFilters.weekNumberEnd,
+            opponentScores=opponentScores,
+        )
+
+    def sumFixedPointScoresInRangeByTeam(
+        self, yearFilters: YearFilters, scale: int, *, opponentScores: bool = False
+    ) -> numpy.ndarray:
+        """
+        Returns the exact sum of the scores for each team (ordered by team index) in the rows that are remaining after the given filters are applied as 64-bit fixed-point integers with the given scale.
+        If opponentScores is True, the sum of the scores of each team's opponents is returned instead.
+        """
+        self.__validateFixedPointFilters(yearFilters, scale)
+        teamAScore, teamBScore, _ = self.__getAllFixedPointScores(scale)
+        # scores that can't be fixed-point integers are 0 and are never in the range, so they don't change its total
+        return self.getWeekRangeIndex(
+            yearFilters.includeMatchupTypes
+        ).getFixedPointPointsScoredInRange(
+            yearFilters.weekNumberStart,
+            yearFilters.weekNumberEnd,
+            scale,
+            (teamAScore, teamBScore),
+            opponentScores=opponentScores,
+        )
+
+    def __validateFixedPointFilters(self, yearFilters: YearFilters, scale: int) -> None:
+        """
+        Raises a ValueError if a score in the rows remaining after the given filters are applied can't be a fixed-point integer with the given scale.
+        The rows are only found if there is a score in the Year that can't be.
+        """
+        isNotFixedPoint = self.__getAllFixedPointScores(scale)[2]
+        if isNotFixedPoint.any():
+            self.__validateFixedPointRows(
+                self.getRows(yearFilters), scale, isNotFixedPoint
+            )
+
+    def getWeekRankings(self, yearFilters: YearFilters) -> WeekRankings:
+        """
+        Returns the WeekRankings for the rows that are remaining after the given filters are applied.
+        WeekRankings are only built once for each set of matchup types, every week range is taken from the WeekRankings for every week.
+        """
+        matchupTypes = tuple(yearFilters.includeMatchupTypes)
+        cacheKey = (
+            yearFilters.weekNumberStart,
+            yearFilters.weekNumberEnd,
+            matchupTypes,
+        )
+        if cacheKey not in self.__weekRankingsCache:
+            allWeeksCacheKey = (1, self.numberOfWeeks, matchupTypes)
+            if allWeeksCacheKey not in self.__weekRankingsCache:
+                rows = numpy.flatnonzero(
+                    numpy.isin(
+                        self.matchupTypeCode, self.getMatchupTypeCodes(matchupTypes)
+                    )
+                )
+                self.__weekRankingsCache[allWeeksCacheKey] = WeekRankings.build(
+                    rows,
+                    self.weekIndex[rows],
+                    self.teamAIndex[rows],
+                    self.teamBIndex[rows],
+                    self.teamAScore[rows],
+                    self.teamBScore[rows],
+                    self.teamAScoreValue[rows],
+                    self.teamBScoreValue[rows],
+                )
+            self.__weekRankingsCache[cacheKey] = self.__weekRankingsCache[
+                allWeeksCacheKey
+            ].getWeeks(yearFilters.weekNumberStart, yearFilters.weekNumberEnd)
+        return self.__weekRankingsCache[cacheKey]
+
+    def getSortedScores(self) -> SortedScores:
+        """
+        Returns a SortedScores with every score in the Year (with multi-week matchups combined into a single Matchup).
+        Will count all scores EXCEPT for IGNORE Matchups.
+        The SortedScores is only built once.
+        """
+        if not self.__sortedScoresCache:
+            simplifiedMatchups = self.simplifyMultiWeekMatchups(
+                numpy.flatnonzero(
+                    self.matchupTypeCode != self.MATCHUP_TYPE_CODES[MatchupType.IGNORE]
+                )
+            )
+            self.__sortedScoresCache.append(
+                SortedScores(
+                    simplifiedMatchups.teamAScoreValue.tolist()
+                    + simplifiedMatchups.teamBScoreValue.tolist()
+                )
+            )
+        return self.__sortedScoresCache[0]
+
+    def getScoresAggregate(self, yearFilters: YearFilters) -> ScoresAggregate:
+        """
+        Returns a ScoresAggregate (keyed by team ID) for the rows that are remaining after the given filters are applied.
+        ScoresAggregates are only built once for each combination of week range and matchup types.
+        """
+        cacheKey = (
+            yearFilters.weekNumberStart,
+            yearFilters.weekNumberEnd,
+            tuple(yearFilters.includeMatchupTypes),
+        )
+        if cacheKey not in self.__scoresAggregateCache:
+            rows = self.getRows(yearFilters)
+            groups = self.multiWeekMatchupGroup[rows]
+            singleRows = rows[groups == -1]
+            multiWeekRows = rows[groups != -1]
+            # each side of each Matchup, with team A's side coming before team B's side
+            teamIds = [
+                self.teamIds[teamIndex]
+                for teamIndex in numpy.column_stack(
+                    (self.teamAIndex[singleRows], self.teamBIndex[singleRows])
+                )
+                .ravel()
+                .tolist()
+            ]
+            teamAScoreValue = self.teamAScoreValue[singleRows]
+            teamBScoreValue = self.teamBScoreValue[singleRows]
+            self.__scoresAggregateCache[cacheKey] = ScoresAggregate(
+                ids=tuple(teamIds),
+                scores=tuple(
+                    numpy.column_stack((teamAScoreValue, teamBScoreValue))
+                    .ravel()
+                    .tolist()
+                ),
+                opponentScores=tuple(
+                    numpy.column_stack((teamBScoreValue, teamAScoreValue))
+                    .ravel()
+                    .tolist()
+                ),
+                multiWeekMatchupIds=tuple(
+                    self.multiWeekMatchupIds[group]
+                    for group in self.multiWeekMatchupGroup[multiWeekRows].tolist()
+                ),
+                multiWeekMatchupTeamAIds=tuple(
+                    self.teamIds[teamIndex]
+                    for teamIndex in self.teamAIndex[multiWeekRows].tolist()
+                ),
+                multiWeekMatchupTeamBIds=tuple(
+                    self.teamIds[teamIndex]
+                    for teamIndex in self.teamBIndex[multiWeekRows].tolist()
+                ),
+                multiWeekMatchupTeamAScores=tuple(
+                    self.teamAScoreValue[multiWeekRows].tolist()
+                ),
+                multiWeekMatchupTeamBScores=tuple(
+                    self.teamBScoreValue[multiWeekRows].tolist()
+                ),
+            )
+        return self.__scoresAggregateCache[cacheKey]
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from leeger.exception.DoesNotExistException import DoesNotExistException
+from leeger.model.league.Division import Division
+from leeger.model.league.Team import Team
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+
+
+@dataclass(kw_only=True, frozen=True, eq=False)
+class YearIndex:
+    """
+    Lookup tables for the Teams, Divisions and Weeks in a Year.
+
+    Each lookup is a dictionary, so finding a model does not require searching through the Year.
+    If IDs (or week numbers) are repeated, the first model in the Year is the one that is found.
+
+    Use YearNavigator.getYearIndex() to get a YearIndex that is only built again when the Year's Teams, Divisions or Weeks change.
+    """
+
+    teams: dict[str, Team]
+    divisions: dict[str, Division]
+    weeks: dict[int, Week]
+
+    @staticmethod
+    def fromYear(year: Year) -> YearIndex:
+        teams: dict[str, Team] = dict()
+        for team in year.teams:
+            teams.setdefault(team.id, team)
+        divisions: dict[str, Division] = dict()
+        for division in year.divisions:
+            divisions.setdefault(division.id, division)
+        weeks: dict[int, Week] = dict()
+        for week in year.weeks:
+            weeks.setdefault(week.weekNumber, week)
+        return YearIndex(teams=teams, divisions=divisions, weeks=weeks)
+
+    @staticmethod
+    def getStructureKey(year: Year) -> tuple[int, ...]:
+        """
+        Returns a key that will change whenever the Year or any of its Teams, Divisions or Weeks are modified, added, removed or reordered.
+        Matchups are not checked, since nothing in a YearIndex depends on them.
+        """
+        return year.getStructureKey()
+
+    def getTeamById(self, teamId: str) -> Team:
+        if teamId not in self.teams:
+            raise DoesNotExistException(
+                f"Team with ID '{teamId}' does not exist in the given Year."
+            )
+        return self.teams[teamId]
+
+    def getDivisionById(self, divisionId: str) -> Division:
+        if divisionId not in self.divisions:
+            raise DoesNotExistException(
+                f"Division with ID '{divisionId}' does not exist in the given Year."
+            )
+        return self.divisions[divisionId]
+
+    def getWeekByWeekNumber(self, weekNumber: int) -> Week:
+        if weekNumber not in self.weeks:
+            raise DoesNotExistException(
+                f"Year does not have a week with week number {weekNumber}."
+            )
+        return self.weeks[weekNumber]
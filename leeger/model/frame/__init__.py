@@ -0,0 +1,10 @@
+from .HeadToHead import HeadToHead
+from .LeagueIndex import LeagueIndex
+from .MatchupColumns import MatchupColumns
+from .ScoresAggregate import ScoresAggregate
+from .SimplifiedMatchups import SimplifiedMatchups
+from .Streaks import Streaks
+from .WeekRangeIndex import WeekRangeIndex
+from .WeekRankings import WeekRankings
+from .YearFrame import YearFrame
+from .YearIndex import YearIndex
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 
 from leeger.model.abstract.EqualityCheck import EqualityCheck
 from leeger.model.abstract.UniqueId import UniqueId
+from leeger.model.abstract.Versioned import Versioned
 from leeger.util.CustomLogger import CustomLogger
 from leeger.util.equality import modelEquals
 from leeger.util.JSONDeserializable import JSONDeserializable
@@ -11,7 +12,9 @@ from leeger.util.JSONSerializable import JSONSerializable
 
 
 @dataclass(kw_only=True, eq=False)
-class Division(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
+class Division(
+    UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable, Versioned
+):
     __LOGGER = CustomLogger.getLogger()
     name: str
 
@@ -6,7 +6,9 @@ from dataclasses import dataclass
 from leeger.exception import DoesNotExistException
 from leeger.model.abstract.EqualityCheck import EqualityCheck
 from leeger.model.abstract.UniqueId import UniqueId
+from leeger.model.abstract.Versioned import Versioned
 from leeger.model.league.Owner import Owner
+from leeger.model.league.Team import Team
 from leeger.model.league.Year import Year
 from leeger.util.CustomLogger import CustomLogger
 from leeger.util.equality import modelEquals
@@ -15,8 +17,10 @@ from leeger.util.JSONSerializable import JSONSerializable
 
 
 @dataclass(kw_only=True, eq=False)
-class League(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
+class League(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable, Versioned):
     __LOGGER = CustomLogger.getLogger()
+    # a LeagueIndex only depends on these models, see LeagueIndex.getStructureKey()
+    _STRUCTURE_MODEL_TYPES = (Owner, Year, Team)
     name: str
     owners: list[Owner]
     years: list[Year]
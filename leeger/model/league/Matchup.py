@@ -8,6 +8,7 @@ from leeger.exception import DoesNotExistException
 from leeger.exception.InvalidMatchupFormatException import InvalidMatchupFormatException
 from leeger.model.abstract.EqualityCheck import EqualityCheck
 from leeger.model.abstract.UniqueId import UniqueId
+from leeger.model.abstract.Versioned import Versioned
 from leeger.model.league_helper.Performance import Performance
 from leeger.util.CustomLogger import CustomLogger
 from leeger.util.equality import modelEquals
@@ -16,7 +17,7 @@ from leeger.util.JSONSerializable import JSONSerializable
 
 
 @dataclass(kw_only=True, eq=False)
-class Matchup(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
+class Matchup(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable, Versioned):
     __LOGGER = CustomLogger.getLogger()
     teamAId: str
     teamBId: str
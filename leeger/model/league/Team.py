@@ -5,6 +5,7 @@ from typing import Optional
 
 from leeger.model.abstract.EqualityCheck import EqualityCheck
 from leeger.model.abstract.UniqueId import UniqueId
+from leeger.model.abstract.Versioned import Versioned
 from leeger.util.CustomLogger import CustomLogger
 from leeger.util.equality import modelEquals
 from leeger.util.JSONDeserializable import JSONDeserializable
@@ -12,7 +13,7 @@ from leeger.util.JSONSerializable import JSONSerializable
 
 
 @dataclass(kw_only=True, eq=False)
-class Team(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
+class Team(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable, Versioned):
     __LOGGER = CustomLogger.getLogger()
     ownerId: str
     name: str
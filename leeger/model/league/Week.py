@@ -6,6 +6,7 @@ from leeger.enum.MatchupType import MatchupType
 from leeger.exception import DoesNotExistException
 from leeger.model.abstract.EqualityCheck import EqualityCheck
 from leeger.model.abstract.UniqueId import UniqueId
+from leeger.model.abstract.Versioned import Versioned
 from leeger.model.league.Matchup import Matchup
 from leeger.util.CustomLogger import CustomLogger
 from leeger.util.equality import modelEquals
@@ -14,7 +15,7 @@ from leeger.util.JSONSerializable import JSONSerializable
 
 
 @dataclass(kw_only=True, eq=False)
-class Week(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
+class Week(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable, Versioned):
     __LOGGER = CustomLogger.getLogger()
     weekNumber: int
     matchups: list[Matchup]
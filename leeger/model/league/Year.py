@@ -6,6 +6,7 @@ from typing import Optional
 from leeger.exception import DoesNotExistException
 from leeger.model.abstract.EqualityCheck import EqualityCheck
 from leeger.model.abstract.UniqueId import UniqueId
+from leeger.model.abstract.Versioned import Versioned
 from leeger.model.league.Division import Division
 from leeger.model.league.Team import Team
 from leeger.model.league.Week import Week
@@ -17,8 +18,10 @@ from leeger.util.JSONSerializable import JSONSerializable
 
 
 @dataclass(kw_only=True, eq=False)
-class Year(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
+class Year(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable, Versioned):
     __LOGGER = CustomLogger.getLogger()
+    # a YearIndex only depends on these models, see YearIndex.getStructureKey()
+    _STRUCTURE_MODEL_TYPES = (Team, Division, Week)
     yearNumber: int
     teams: list[Team]
     weeks: list[Week]
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from leeger.model.stat.ConfidenceInterval import ConfidenceInterval
+from leeger.util.Deci import Deci
+
+
+@dataclass(kw_only=True, frozen=True, eq=False)
+class BootstrapConfidenceIntervals:
+    """
+    Used to house bootstrap confidence intervals for per game team stats.
+
+    Every dict is keyed by team ID, and a team's interval is None if they have no games played in the range.
+    confidenceLevel is the share (from 0 to 1) of resamples that fall inside each interval.
+    """
+
+    numberOfResamples: int
+    confidenceLevel: Deci
+    pointsScoredPerGame: dict[str, Optional[ConfidenceInterval]]
+    awalPerGame: dict[str, Optional[ConfidenceInterval]]
+    smartWinsPerGame: dict[str, Optional[ConfidenceInterval]]
+    teamScore: dict[str, Optional[ConfidenceInterval]]
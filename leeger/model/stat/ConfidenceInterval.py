@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from leeger.util.Deci import Deci
+
+
+@dataclass(kw_only=True, frozen=True, eq=False)
+class ConfidenceInterval:
+    """
+    Used to house a stat along with the range it is expected to fall in.
+
+    estimate is the stat itself, and lower and upper are the bounds of the interval at the confidence level it was made with.
+    """
+
+    estimate: Deci
+    lower: Deci
+    upper: Deci
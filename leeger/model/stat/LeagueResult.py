@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from leeger.model.league.League import League
+
+
+@dataclass(kw_only=True, frozen=True, eq=False)
+class LeagueResult:
+    """
+    Used to house the result of calculating something for a single League in a batch of Leagues.
+
+    index is the position of the League in the Leagues that were given.
+    If calculating the League raised an exception, result is None and exception is that exception.
+    """
+
+    index: int
+    league: League
+    result: Optional[Any]
+    exception: Optional[Exception]
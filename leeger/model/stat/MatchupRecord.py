@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from leeger.model.league.Matchup import Matchup
+from leeger.util.Deci import Deci
+
+
+@dataclass(kw_only=True, frozen=True, eq=False)
+class MatchupRecord:
+    """
+    Used to house a single entry in a League's record book (e.g. one of the highest scores ever).
+
+    teamId and ownerId are who the record belongs to (the team that scored for score records, the winner for margin records),
+    and are None for records that belong to both teams in the Matchup (e.g. highest combined scores).
+    """
+
+    matchup: Matchup
+    yearNumber: int
+    weekNumber: int
+    teamId: Optional[str]
+    ownerId: Optional[str]
+    value: float | int | Deci
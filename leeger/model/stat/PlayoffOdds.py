@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from leeger.util.Deci import Deci
+
+
+@dataclass(kw_only=True, frozen=True, eq=False)
+class PlayoffOdds:
+    """
+    Used to house the results of playing out the rest of a Year many times.
+
+    Every dict is keyed by team ID.
+    Odds are the share of simulations (from 0 to 1) that the team made the playoffs, got a bye or won the championship in.
+    expectedWins is the team's average number of regular season wins at the end of the Year, where a tie counts as half a win.
+    """
+
+    numberOfSimulations: int
+    expectedWins: dict[str, Deci]
+    playoffOdds: dict[str, Deci]
+    byeOdds: dict[str, Deci]
+    championshipOdds: dict[str, Deci]
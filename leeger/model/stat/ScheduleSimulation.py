@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from leeger.util.Deci import Deci
+
+
+@dataclass(kw_only=True, frozen=True, eq=False)
+class ScheduleSimulation:
+    """
+    Used to house the results of playing each team's actual weekly scores against many random schedules.
+
+    A tie counts as half a win.
+    winDistribution is keyed by team ID, then by a number of wins, and has the number of simulations that ended with that many wins.
+    standingDistribution is keyed by team ID, and index i is the number of simulations that team finished in place i + 1.
+    """
+
+    numberOfSimulations: int
+    expectedWins: dict[str, Deci]
+    expectedStanding: dict[str, Deci]
+    winDistribution: dict[str, dict[Deci, int]]
+    standingDistribution: dict[str, list[int]]
@@ -1,2 +1,8 @@
 from .AllTimeStatSheet import AllTimeStatSheet
+from .BootstrapConfidenceIntervals import BootstrapConfidenceIntervals
+from .ConfidenceInterval import ConfidenceInterval
+from .LeagueResult import LeagueResult
+from .MatchupRecord import MatchupRecord
+from .PlayoffOdds import PlayoffOdds
+from .ScheduleSimulation import ScheduleSimulation
 from .YearStatSheet import YearStatSheet
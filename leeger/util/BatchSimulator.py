@@ -0,0 +1,82 @@
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy
+
+
+class BatchSimulator(ABC):
+    """
+    Used as the parent of simulators that run many random simulations as NumPy array operations.
+
+    Simulations are split into batches of BATCH_SIZE that each get their own random number generator,
+    spawned from the given seed, so the results for a seed are the same no matter how many workers are used.
+    """
+
+    BATCH_SIZE = 10_000
+
+    def simulate(
+        self, numberOfSimulations: int, *, seed: Optional[int] = None, workers: int = 1
+    ) -> tuple[numpy.ndarray, ...]:
+        """
+        Runs the given number of simulations and returns the results of every batch combined with combineBatchResults().
+        If workers is more than 1, batches are run in that many processes.
+        """
+        batchSizes = [self.BATCH_SIZE] * (numberOfSimulations // self.BATCH_SIZE)
+        if numberOfSimulations % self.BATCH_SIZE > 0:
+            batchSizes.append(numberOfSimulations % self.BATCH_SIZE)
+        seedSequences = numpy.random.SeedSequence(seed).spawn(len(batchSizes))
+
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                batchResults = list(
+                    executor.map(self.simulateBatch, batchSizes, seedSequences)
+                )
+        else:
+            batchResults = list(map(self.simulateBatch, batchSizes, seedSequences))
+
+        return self.combineBatchResults(batchResults)
+
+    def combineBatchResults(
+        self, batchResults: list[tuple[numpy.ndarray, ...]]
+    ) -> tuple[numpy.ndarray, ...]:
+        """
+        Returns the counts from every batch added together.
+        """
+        return tuple(sum(counts[1:], counts[0]) for counts in zip(*batchResults))
+
+    @abstractmethod
+    def simulateBatch(
+        self, numberOfSimulations: int, seedSequence: numpy.random.SeedSequence
+    ) -> tuple[numpy.ndarray, ...]:
+        """
+        Runs a single batch of simulations with a random number generator from the given SeedSequence.
+        Returns the counts (or other results) for just this batch.
+        """
+
+    @staticmethod
+    def _getPlaces(
+        halfWins: numpy.ndarray, pointsScored: numpy.ndarray
+    ) -> numpy.ndarray:
+        """
+        Takes the half wins and points scored of each team (columns) in each simulation (rows)
+        and returns the place in the standings (starting at 0) of each team in each simulation.
+        Teams are ordered by most half wins, then most points scored, then lowest team index.
+        """
+        order = numpy.lexsort(
+            (-numpy.broadcast_to(pointsScored, halfWins.shape), -halfWins), axis=-1
+        )
+        # order has the team in each place, so its inverse has the place of each team
+        return numpy.argsort(order, axis=-1)
+
+    @staticmethod
+    def _countByTeam(values: numpy.ndarray, numberOfValues: int) -> numpy.ndarray:
+        """
+        Takes a value from 0 to numberOfValues - 1 for each team (columns) in each simulation (rows)
+        and returns the number of simulations each team had each value in (teams x numberOfValues).
+        """
+        numberOfTeams = values.shape[1]
+        return numpy.bincount(
+            (numpy.arange(numberOfTeams) * numberOfValues + values).ravel(),
+            minlength=numberOfTeams * numberOfValues,
+        ).reshape(numberOfTeams, numberOfValues)
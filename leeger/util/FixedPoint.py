@@ -0,0 +1,53 @@
+from decimal import Decimal
+
+import numpy
+
+from leeger.util.Deci import Deci
+
+
+class FixedPoint:
+    """
+    Used to convert scores to and from fixed-point integers.
+
+    A score is stored as a fixed-point integer by multiplying it by 10 ** scale.
+    i.e. with a scale of 2, 100.25 is stored as 10025.
+    Sums, differences and comparisons of fixed-point integers are exact, unlike the same operations on floats.
+    """
+
+    @staticmethod
+    def toFixedPoint(score: float | int, scale: int) -> int:
+        """
+        Returns the given score as a fixed-point integer with the given scale.
+        Raises a ValueError if the score has more decimal places than the scale allows.
+        """
+        if isinstance(score, int):
+            return score * 10**scale
+        # the string is used for the same reason Deci uses it, so 1.1 is 1.1 and not 1.100000000000000088817841970012523
+        scaledScore = Decimal(str(score)).scaleb(scale)
+        if scaledScore != scaledScore.to_integral_value():
+            raise ValueError(
+                f"Score '{score}' cannot be represented with a fixed-point scale of {scale}."
+            )
+        return int(scaledScore)
+
+    @classmethod
+    def toFixedPointArray(cls, scores: list[float | int], scale: int) -> numpy.ndarray:
+        """
+        Returns the given scores as a 64-bit integer array of fixed-point integers with the given scale.
+        """
+        return numpy.array(
+            [cls.toFixedPoint(score, scale) for score in scores], dtype=numpy.int64
+        )
+
+    @staticmethod
+    def toDeci(value: int, scale: int) -> Deci:
+        """
+        Returns the given fixed-point integer with the given scale as a Deci.
+        Trailing zeros added by the scale are removed, so i.e. 123400 with a scale of 2 is Deci("1234") and not Deci("1234.00"),
+        the same as the Deci the decimal backend returns when adding up whole number scores.
+        """
+        deci = Decimal(int(value)).scaleb(-scale).normalize()
+        if deci.as_tuple().exponent > 0:
+            # normalize() would give i.e. 1.2E+3 for 1200
+            deci = deci.quantize(Decimal(1))
+        return Deci(deci)
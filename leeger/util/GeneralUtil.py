@@ -53,6 +53,21 @@ class GeneralUtil:
 
         return safeSum
 
+    @staticmethod
+    def validatePositiveInt(value: Any, name: str) -> int:
+        """
+        Raises a ValueError if the given value is not an int that is at least 1.
+        The given name is the name of the value in the error message.
+        Returns the given value.
+        """
+        if type(value) is not int:
+            raise ValueError(
+                f"'{name}' must be type 'int', not '{type(value).__name__}'."
+            )
+        if value < 1:
+            raise ValueError(f"'{name}' must be at least 1.")
+        return value
+
     def findDifferentFields(
         dict1: dict,
         dict2: dict,
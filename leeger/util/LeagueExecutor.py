@@ -0,0 +1,137 @@
+import json
+from concurrent.futures import as_completed
+from typing import Any, Callable, Iterator
+
+from leeger.enum.NumericBackend import NumericBackend
+from leeger.model.league.League import League
+from leeger.model.stat.LeagueResult import LeagueResult
+from leeger.util.ModelCache import ModelCache
+from leeger.util.NumericSettings import NumericSettings
+from leeger.util.YearExecutor import YearExecutor
+
+
+class LeagueExecutor:
+    """
+    Used to call a function for many Leagues, giving back each League's result as soon as it is done.
+
+    Takes the same "workers" and "executor" keyword arguments as YearExecutor.
+    Without either of them, each League is calculated one after another in this process.
+    With them, Leagues are sent to other processes as their JSON string instead of as pickled models,
+    and the most expensive Leagues (the ones with the most Matchups) are started first,
+    so one large League that is started last doesn't hold up the rest of the batch.
+
+    An exception raised while calculating a League is given back in that League's result,
+    and the rest of the Leagues are still calculated.
+    A League that can't be sent to another process (because it is malformed) is calculated in this process instead.
+    """
+
+    # League -> JSON string, only rebuilt if the League has been modified
+    __COMPACT_LEAGUE_CACHE = ModelCache()
+
+    @classmethod
+    def callForEachLeague(
+        cls,
+        function: Callable,
+        leagues: list[League],
+        leagueKwargs: dict[str, Any],
+        **kwargs,
+    ) -> Iterator[LeagueResult]:
+        """
+        Calls the given function with each League and the given kwargs, and yields a LeagueResult for each League as it finishes.
+        Results are yielded in the order the Leagues finish in, which is only the order they were given in if they are calculated in this process.
+        """
+        with YearExecutor.getExecutor(**kwargs) as executor:
+            if executor is None:
+                for index, league in enumerate(leagues):
+                    yield cls.__callInThisProcess(function, index, league, leagueKwargs)
+                return
+
+            # the default numeric settings in the other processes may not match the ones in this process
+            numericDefaults = (
+                NumericSettings.getDefaultNumericBackend(),
+                NumericSettings.getDefaultFixedPointScale(),
+            )
+            # (cost, index, compact League) for each League that can be sent to another process
+            compactLeagues = list()
+            unsendableIndexes = list()
+            for index, league in enumerate(leagues):
+                try:
+                    compactLeagues.append(
+                        (
+                            cls.__getLeagueCost(league),
+                            index,
+                            cls.__COMPACT_LEAGUE_CACHE.get(
+                                league, cls.__getCompactLeague
+                            ),
+                        )
+                    )
+                except Exception:
+                    unsendableIndexes.append(index)
+            compactLeagues.sort(
+                key=lambda compactLeague: compactLeague[0], reverse=True
+            )
+
+            futureToIndex = dict()
+            for _, index, compactLeague in compactLeagues:
+                future = executor.submit(
+                    _callWithCompactLeague,
+                    function,
+                    compactLeague,
+                    leagueKwargs,
+                    numericDefaults,
+                )
+                futureToIndex[future] = index
+            try:
+                # a malformed League can't be sent to another process,
+                # so it is calculated here to give back the same exception it would without workers
+                for index in unsendableIndexes:
+                    yield cls.__callInThisProcess(
+                        function, index, leagues[index], leagueKwargs
+                    )
+                for future in as_completed(futureToIndex):
+                    index = futureToIndex[future]
+                    exception = future.exception()
+                    yield LeagueResult(
+                        index=index,
+                        league=leagues[index],
+                        result=None if exception is not None else future.result(),
+                        exception=exception,
+                    )
+            finally:
+                # don't start any Leagues that haven't been started if the results stop being asked for
+                for future in futureToIndex:
+                    future.cancel()
+
+    @staticmethod
+    def __callInThisProcess(
+        function: Callable, index: int, league: League, leagueKwargs: dict[str, Any]
+    ) -> LeagueResult:
+        try:
+            result = function(league, **leagueKwargs)
+        except Exception as exception:
+            return LeagueResult(
+                index=index, league=league, result=None, exception=exception
+            )
+        return LeagueResult(index=index, league=league, result=result, exception=None)
+
+    @staticmethod
+    def __getLeagueCost(league: League) -> int:
+        return sum(len(week.matchups) for year in league.years for week in year.weeks)
+
+    @staticmethod
+    def __getCompactLeague(league: League) -> str:
+        return json.dumps(league.toJson(), separators=(",", ":"))
+
+
+def _callWithCompactLeague(
+    function: Callable,
+    compactLeague: str,
+    leagueKwargs: dict[str, Any],
+    numericDefaults: tuple[NumericBackend, int],
+) -> Any:
+    """
+    Runs in the process the League is being calculated in.
+    """
+    NumericSettings.setDefaultNumericBackend(numericDefaults[0])
+    NumericSettings.setDefaultFixedPointScale(numericDefaults[1])
+    return function(League.fromJson(json.loads(compactLeague)), **leagueKwargs)
@@ -0,0 +1,52 @@
+import weakref
+from typing import Any, Callable
+
+from leeger.model.abstract.Versioned import Versioned
+
+
+class ModelCache:
+    """
+    Used to cache values that are derived from a model.
+
+    Values are cached by the identity of the model they were derived from.
+    A cached value is rebuilt if that model (or any model nested in it) has been modified since the value was built.
+    A cached value is dropped once the model it was derived from is garbage collected.
+
+    By default, a modification anywhere in the model counts.
+    A different getVersionKey can be given when a value only depends on part of a model,
+    so only modifications to that part cause the value to be rebuilt (and checking for modifications is cheaper).
+    """
+
+    def __init__(
+        self,
+        getVersionKey: Callable[[Versioned], tuple[int, ...]] = Versioned.getVersionKey,
+    ):
+        self.__getVersionKey = getVersionKey
+        # model identity -> (model version key, cached value)
+        self.__cache: dict[int, tuple[tuple[int, ...], Any]] = dict()
+
+    def get(self, model: Versioned, builder: Callable[[Versioned], Any]) -> Any:
+        """
+        Returns the cached value for the given model.
+        If there is no up-to-date cached value, the given builder is called with the model and its result is cached.
+        """
+        modelId = id(model)
+        versionKey = self.__getVersionKey(model)
+        cached = self.__cache.get(modelId)
+        if cached is not None and cached[0] == versionKey:
+            return cached[1]
+        value = builder(model)
+        if cached is None:
+            # only keep this value around as long as the model is around
+            weakref.finalize(model, self.__cache.pop, modelId, None)
+        self.__cache[modelId] = (versionKey, value)
+        return value
+
+    def clear(self) -> None:
+        """
+        Removes every cached value.
+        """
+        self.__cache.clear()
+
+    def __len__(self) -> int:
+        return len(self.__cache)
@@ -0,0 +1,45 @@
+from collections import deque
+from typing import Any, Optional
+
+
+class MonotonicQueue:
+    """
+    Used to find the max (or min) value in a sliding window of values.
+
+    Values are pushed in order with the position (e.g. week) they belong to, and values from before a position can be dropped.
+    Each value is pushed and popped at most once, so finding the max (or min) of every window takes O(1) time per value instead of looking at every value in every window.
+    If values are equal, the one pushed first is kept, just like max() and min().
+    """
+
+    def __init__(self, *, maxValue: bool):
+        self.__maxValue = maxValue
+        # (position, key, value), the front is always the max (or min) value
+        self.__entries: deque[tuple[int, Any, Any]] = deque()
+
+    def push(self, position: int, value: Any, key: Any = None) -> None:
+        """
+        Adds the given value at the given position.
+        Values are compared by the given key, or by the value itself if no key is given.
+        """
+        key = value if key is None else key
+        # values that can never be the max (or min) again are dropped, equal values are kept so the first one stays in front
+        if self.__maxValue:
+            while self.__entries and self.__entries[-1][1] < key:
+                self.__entries.pop()
+        else:
+            while self.__entries and self.__entries[-1][1] > key:
+                self.__entries.pop()
+        self.__entries.append((position, key, value))
+
+    def dropBefore(self, position: int) -> None:
+        """
+        Removes every value from before the given position.
+        """
+        while self.__entries and self.__entries[0][0] < position:
+            self.__entries.popleft()
+
+    def getFront(self) -> Optional[Any]:
+        """
+        Returns the max (or min) value in the window, or None if there are no values in the window.
+        """
+        return self.__entries[0][2] if self.__entries else None
@@ -0,0 +1,98 @@
+from typing import Any, Optional
+
+from leeger.enum.NumericBackend import NumericBackend
+
+
+class NumericSettings:
+    """
+    Used to control how numbers are handled inside of calculations.
+
+    The numeric backend can be set for a single calculation with the "numericBackend" keyword argument,
+    or for every calculation with NumericSettings.setDefaultNumericBackend().
+
+    The fixed-point scale is the number of decimal places scores are kept to when the FIXED_POINT backend is used.
+    It can be set for a single calculation with the "fixedPointScale" keyword argument,
+    or for every calculation with NumericSettings.setDefaultFixedPointScale().
+    """
+
+    __defaultNumericBackend: NumericBackend = NumericBackend.DECIMAL
+    __defaultFixedPointScale: int = 2
+
+    @classmethod
+    def setDefaultNumericBackend(cls, numericBackend: NumericBackend | str) -> None:
+        cls.__defaultNumericBackend = cls.__toNumericBackend(numericBackend)
+
+    @classmethod
+    def getDefaultNumericBackend(cls) -> NumericBackend:
+        return cls.__defaultNumericBackend
+
+    @classmethod
+    def getNumericBackend(cls, **kwargs) -> NumericBackend:
+        """
+        Returns the numeric backend given in kwargs, or the default numeric backend if one is not given.
+        """
+        numericBackend = kwargs.get("numericBackend")
+        if numericBackend is None:
+            return cls.__defaultNumericBackend
+        return cls.__toNumericBackend(numericBackend)
+
+    @classmethod
+    def useFloat(cls, **kwargs) -> bool:
+        """
+        Returns whether calculations should be done with floats.
+        """
+        return cls.getNumericBackend(**kwargs) == NumericBackend.FLOAT
+
+    @classmethod
+    def useFixedPoint(cls, **kwargs) -> bool:
+        """
+        Returns whether calculations should be done with fixed-point integers.
+        """
+        return cls.getNumericBackend(**kwargs) == NumericBackend.FIXED_POINT
+
+    @classmethod
+    def setDefaultFixedPointScale(cls, fixedPointScale: int) -> None:
+        cls.__defaultFixedPointScale = cls.__validateFixedPointScale(fixedPointScale)
+
+    @classmethod
+    def getDefaultFixedPointScale(cls) -> int:
+        return cls.__defaultFixedPointScale
+
+    @classmethod
+    def getFixedPointScale(cls, **kwargs) -> int:
+        """
+        Returns the fixed-point scale given in kwargs, or the default fixed-point scale if one is not given.
+        """
+        fixedPointScale = kwargs.get("fixedPointScale")
+        if fixedPointScale is None:
+            return cls.__defaultFixedPointScale
+        return cls.__validateFixedPointScale(fixedPointScale)
+
+    @classmethod
+    def getFixedPointScaleIfUsed(cls, **kwargs) -> Optional[int]:
+        """
+        Returns the fixed-point scale if calculations should be done with fixed-point integers, otherwise None.
+        """
+        if cls.useFixedPoint(**kwargs):
+            return cls.getFixedPointScale(**kwargs)
+        return None
+
+    @staticmethod
+    def __validateFixedPointScale(fixedPointScale: Any) -> int:
+        if type(fixedPointScale) is not int:
+            raise ValueError(
+                f"'fixedPointScale' must be type 'int', not '{type(fixedPointScale).__name__}'."
+            )
+        if fixedPointScale < 0:
+            raise ValueError("'fixedPointScale' cannot be negative.")
+        return fixedPointScale
+
+    @staticmethod
+    def __toNumericBackend(numericBackend: Any) -> NumericBackend:
+        if isinstance(numericBackend, NumericBackend):
+            return numericBackend
+        if isinstance(numericBackend, str):
+            return NumericBackend.fromStr(numericBackend)
+        raise ValueError(
+            f"'numericBackend' must be type 'NumericBackend' or 'str', not '{type(numericBackend).__name__}'."
+        )
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy
+
+from leeger.util.BatchSimulator import BatchSimulator
+
+
+class ScheduleSimulator(BatchSimulator):
+    """
+    Used to play a group of weekly scores against many random schedules.
+
+    Each week, the teams that played that week are paired up at random and every team keeps the score they actually had that week.
+    Wins are kept as half wins (2 for a win, 1 for a tie), so every count is an exact integer.
+    Half wins that don't depend on the schedule (like league median wins) can be given as fixedHalfWins, and are added to every simulation.
+
+    simulate() returns the number of simulations that ended with each number of half wins for each team (teams x (maxHalfWins + 1))
+    and the number of simulations that ended in each place in the standings for each team (teams x teams).
+    """
+
+    def __init__(
+        self,
+        numberOfTeams: int,
+        weekTeamIndexes: list[numpy.ndarray],
+        weekScores: list[numpy.ndarray],
+        *,
+        fixedHalfWins: Optional[numpy.ndarray] = None,
+    ):
+        """
+        weekTeamIndexes and weekScores have one array per week, with the index and score of each team that played that week.
+        A "week" is any group of teams that are paired up with each other, such as the teams in multi-week matchups over the same weeks.
+        fixedHalfWins has the half wins each team has in every simulation, ordered by team index.
+        """
+        self.__numberOfTeams = numberOfTeams
+        self.__weekTeamIndexes = weekTeamIndexes
+        self.__weekScores = weekScores
+        self.__fixedHalfWins = (
+            numpy.zeros(numberOfTeams, dtype=numpy.int64)
+            if fixedHalfWins is None
+            else fixedHalfWins
+        )
+        self.__maxHalfWins = 2 * len(weekTeamIndexes) + int(
+            self.__fixedHalfWins.max(initial=0)
+        )
+        self.__pointsScored = numpy.zeros(numberOfTeams, dtype=numpy.float64)
+        for teamIndexes, scores in zip(weekTeamIndexes, weekScores):
+            self.__pointsScored[teamIndexes] += scores
+
+    @property
+    def maxHalfWins(self) -> int:
+        return self.__maxHalfWins
+
+    def simulateBatch(
+        self, numberOfSimulations: int, seedSequence: numpy.random.SeedSequence
+    ) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the half win counts and standing counts for a single batch of simulations.
+        """
+        generator = numpy.random.default_rng(seedSequence)
+        halfWins = self.simulateHalfWins(numberOfSimulations, generator)
+
+        # the total points scored is the same in every simulation, so it is only used to break ties in the standings
+        return self._countByTeam(halfWins, self.__maxHalfWins + 1), self._countByTeam(
+            self._getPlaces(halfWins, self.__pointsScored), self.__numberOfTeams
+        )
+
+    def simulateHalfWins(
+        self, numberOfSimulations: int, generator: numpy.random.Generator
+    ) -> numpy.ndarray:
+        """
+        Returns the half wins of each team (columns) in each of the given number of random schedules (rows).
+        """
+        halfWins = numpy.tile(self.__fixedHalfWins, (numberOfSimulations, 1))
+        simulationIndexes = numpy.arange(numberOfSimulations)[:, numpy.newaxis]
+        for teamIndexes, scores in zip(self.__weekTeamIndexes, self.__weekScores):
+            # shuffle the teams in each simulation and pair them up in order
+            positions = generator.permuted(
+                numpy.broadcast_to(
+                    numpy.arange(len(teamIndexes)),
+                    (numberOfSimulations, len(teamIndexes)),
+                ),
+                axis=1,
+            )
+            teamAPositions = positions[:, 0::2]
+            teamBPositions = positions[:, 1::2]
+            teamAScores = scores[teamAPositions]
+            teamBScores = scores[teamBPositions]
+            teamAHalfWins = 2 * (teamAScores > teamBScores) + (
+                teamAScores == teamBScores
+            )
+            # each team is in each simulation once a week, so no index is added to twice
+            halfWins[simulationIndexes, teamIndexes[teamAPositions]] += teamAHalfWins
+            halfWins[simulationIndexes, teamIndexes[teamBPositions]] += (
+                2 - teamAHalfWins
+            )
+        return halfWins
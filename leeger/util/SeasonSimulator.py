@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import numpy
+
+from leeger.util.BatchSimulator import BatchSimulator
+
+
+class SeasonSimulator(BatchSimulator):
+    """
+    Used to play out the rest of a season (and its playoffs) many times.
+
+    Every score in a simulated game is drawn from a normal distribution with that team's mean score and standard deviation.
+    The remaining games are added to each team's current half wins (2 for a win, 1 for a tie) and points scored to get the final standings,
+    along with a league median game for every team that plays in each remaining week if leagueMedianGames is True.
+    then the playoff teams are seeded by the standings and play a single-elimination bracket.
+    The top seeds get a bye in the first round, and in every round the best seed left plays the worst seed left.
+
+    simulate() returns the number of simulations each team made the playoffs in, got a bye in, won the championship in
+    and the total half wins each team had across every simulation (one array each, ordered by team index).
+    """
+
+    def __init__(
+        self,
+        *,
+        meanScores: numpy.ndarray,
+        scoreStandardDeviations: numpy.ndarray,
+        halfWins: numpy.ndarray,
+        pointsScored: numpy.ndarray,
+        remainingTeamAIndexes: list[numpy.ndarray],
+        remainingTeamBIndexes: list[numpy.ndarray],
+        numberOfPlayoffTeams: int,
+        numberOfByes: int,
+        leagueMedianGames: bool = False,
+    ):
+        """
+        remainingTeamAIndexes and remainingTeamBIndexes have one array per remaining week, with the teams in each game that week.
+        A team can only play once a week.
+        """
+        self.__meanScores = meanScores
+        self.__scoreStandardDeviations = scoreStandardDeviations
+        self.__halfWins = halfWins
+        self.__pointsScored = pointsScored
+        self.__remainingTeamAIndexes = remainingTeamAIndexes
+        self.__remainingTeamBIndexes = remainingTeamBIndexes
+        self.__numberOfPlayoffTeams = numberOfPlayoffTeams
+        self.__numberOfByes = numberOfByes
+        self.__leagueMedianGames = leagueMedianGames
+
+    def simulateBatch(
+        self, numberOfSimulations: int, seedSequence: numpy.random.SeedSequence
+    ) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the playoff, bye and championship counts and the half win totals for a single batch of simulations.
+        """
+        generator = numpy.random.default_rng(seedSequence)
+        numberOfTeams = len(self.__halfWins)
+        halfWins = numpy.tile(self.__halfWins, (numberOfSimulations, 1))
+        pointsScored = numpy.tile(self.__pointsScored, (numberOfSimulations, 1))
+
+        for teamAIndexes, teamBIndexes in zip(
+            self.__remainingTeamAIndexes, self.__remainingTeamBIndexes
+        ):
+            teamAScores = self.__drawScores(
+                generator, teamAIndexes, numberOfSimulations
+            )
+            teamBScores = self.__drawScores(
+                generator, teamBIndexes, numberOfSimulations
+            )
+            teamAHalfWins = 2 * (teamAScores > teamBScores) + (
+                teamAScores == teamBScores
+            )
+            halfWins[:, teamAIndexes] += teamAHalfWins
+            halfWins[:, teamBIndexes] += 2 - teamAHalfWins
+            pointsScored[:, teamAIndexes] += teamAScores
+            pointsScored[:, teamBIndexes] += teamBScores
+            if self.__leagueMedianGames:
+                self.__addLeagueMedianHalfWins(
+                    halfWins,
+                    numpy.concatenate((teamAIndexes, teamBIndexes)),
+                    numpy.concatenate((teamAScores, teamBScores), axis=1),
+                )
+
+        places = self._getPlaces(halfWins, pointsScored)
+        # the team in each seed of the playoffs for each simulation
+        seeds = numpy.argsort(places, axis=-1)[:, : self.__numberOfPlayoffTeams]
+        champions = self.__playBracket(generator, seeds)
+
+        return (
+            (places < self.__numberOfPlayoffTeams).sum(axis=0),
+            (places < self.__numberOfByes).sum(axis=0),
+            numpy.bincount(champions, minlength=numberOfTeams),
+            halfWins.sum(axis=0),
+        )
+
+    @staticmethod
+    def __addLeagueMedianHalfWins(
+        halfWins: numpy.ndarray, teamIndexes: numpy.ndarray, scores: numpy.ndarray
+    ) -> None:
+        """
+        Adds the league median game of the given teams (columns) for one week of each simulation (rows) to the given half wins.
+        A score above the median score of its week is a win, and a score equal to it is a tie.
+        """
+        medianScores = numpy.median(scores, axis=1, keepdims=True)
+        halfWins[:, teamIndexes] += 2 * (scores > medianScores) + (
+            scores == medianScores
+        )
+
+    def __drawScores(
+        self,
+        generator: numpy.random.Generator,
+        teamIndexes: numpy.ndarray,
+        numberOfSimulations: int,
+    ) -> numpy.ndarray:
+        """
+        Returns a random score for each of the given teams (which can be a 1D array or an array per simulation).
+        """
+        if teamIndexes.ndim == 1:
+            teamIndexes = numpy.broadcast_to(
+                teamIndexes, (numberOfSimulations, len(teamIndexes))
+            )
+        return generator.normal(
+            self.__meanScores[teamIndexes], self.__scoreStandardDeviations[teamIndexes]
+        )
+
+    def __playBracket(
+        self, generator: numpy.random.Generator, seeds: numpy.ndarray
+    ) -> numpy.ndarray:
+        """
+        Plays the playoff bracket for the team in each seed (columns) in each simulation (rows).
+        Returns the champion of each simulation.
+        """
+        numberOfSimulations = len(seeds)
+        # the seeds (starting at 0) that are still alive in each simulation, from best to worst
+        aliveSeeds = numpy.tile(
+            numpy.arange(self.__numberOfPlayoffTeams), (numberOfSimulations, 1)
+        )
+        numberOfByes = self.__numberOfByes
+        while aliveSeeds.shape[1] > 1:
+            playingSeeds = aliveSeeds[:, numberOfByes:]
+            numberOfGames = playingSeeds.shape[1] // 2
+            higherSeeds = playingSeeds[:, :numberOfGames]
+            lowerSeeds = playingSeeds[:, ::-1][:, :numberOfGames]
+            higherSeedScores = self.__drawScores(
+                generator,
+                numpy.take_along_axis(seeds, higherSeeds, axis=1),
+                numberOfSimulations,
+            )
+            lowerSeedScores = self.__drawScores(
+                generator,
+                numpy.take_along_axis(seeds, lowerSeeds, axis=1),
+                numberOfSimulations,
+            )
+            # the higher seed wins a tie
+            winningSeeds = numpy.where(
+                higherSeedScores >= lowerSeedScores, higherSeeds, lowerSeeds
+            )
+            aliveSeeds = numpy.sort(
+                numpy.concatenate((aliveSeeds[:, :numberOfByes], winningSeeds), axis=1),
+                axis=1,
+            )
+            numberOfByes = 0
+        return numpy.take_along_axis(seeds, aliveSeeds, axis=1)[:, 0]
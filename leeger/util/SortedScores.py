@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import numpy
+
+from leeger.util.Deci import Deci
+
+
+class SortedScores:
+    """
+    Used to compare scores against a collection of scores.
+    The collection is sorted once so any number of scores can be compared against it with a binary search.
+    """
+
+    def __init__(self, scores: list[float | int]):
+        self.__sortedScores = numpy.sort(numpy.array(scores, dtype=numpy.float64))
+
+    @classmethod
+    def merge(cls, sortedScoresList: list[SortedScores]) -> SortedScores:
+        """
+        Returns a SortedScores with every score in the given SortedScores.
+        """
+        return cls(
+            numpy.concatenate(
+                [sortedScores.__sortedScores for sortedScores in sortedScoresList]
+            )
+        )
+
+    def __len__(self) -> int:
+        return len(self.__sortedScores)
+
+    def getNumberOfScoresBeatAndTied(
+        self, scores: list[float | int]
+    ) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Returns how many scores in the collection each of the given scores beat and tied.
+        """
+        scores = numpy.array(scores, dtype=numpy.float64)
+        scoresBeat = numpy.searchsorted(self.__sortedScores, scores, side="left")
+        scoresBeatOrTied = numpy.searchsorted(self.__sortedScores, scores, side="right")
+        return scoresBeat, scoresBeatOrTied - scoresBeat
+
+    def getSmartWins(self, scores: list[float | int]) -> list[Deci]:
+        """
+        Returns the Smart Wins for each of the given scores when played against every score in the collection.
+        Each of the given scores is assumed to be in the collection, so 1 tie is removed for each of them.
+        """
+        scoresBeat, scoresTied = self.getNumberOfScoresBeatAndTied(scores)
+        # remove 1 from the scores tied since we will always find a tie for this score in the collection
+        scoresTied = scoresTied - 1
+        # many scores will beat and tie the same number of scores, so only calculate each unique result once
+        beatAndTiedToSmartWins: dict[tuple[int, int], Deci] = dict()
+        allSmartWins = list()
+        for beatAndTied in zip(scoresBeat.tolist(), scoresTied.tolist()):
+            smartWins = beatAndTiedToSmartWins.get(beatAndTied)
+            if smartWins is None:
+                scoreBeat, scoreTied = beatAndTied
+                smartWins = (scoreBeat + (scoreTied / Deci("2"))) / (
+                    len(self) - Deci("1")
+                )
+                beatAndTiedToSmartWins[beatAndTied] = smartWins
+            allSmartWins.append(smartWins)
+        return allSmartWins
+
+    def getSmartWinsAsFloats(self, scores: list[float | int]) -> numpy.ndarray:
+        """
+        Returns the Smart Wins for each of the given scores as 64-bit floats.
+        Uses the same logic as getSmartWins().
+        """
+        scoresBeat, scoresTied = self.getNumberOfScoresBeatAndTied(scores)
+        return (scoresBeat + ((scoresTied - 1) / 2)) / (len(self) - 1)
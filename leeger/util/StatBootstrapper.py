@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import numpy
+
+from leeger.util.BatchSimulator import BatchSimulator
+
+
+class StatBootstrapper(BatchSimulator):
+    """
+    Used to bootstrap per game team stats by resampling each team's games with replacement many times.
+
+    Each resample of a team has the same number of games as the team actually played,
+    and every resample of every team in a batch is drawn at once as NumPy array operations.
+    Stats that are a total divided by a number of games are found for a resample by dividing the resampled totals,
+    so a game that counts as 2 games (like a regular season game in a league median Year) keeps that weight.
+
+    simulate() returns the Points Scored per game, AWAL per game, Smart Wins per game and Team Score
+    of each team (columns) in each resample (rows).
+    Teams without any games are given NaN.
+    """
+
+    def __init__(
+        self,
+        *,
+        numberOfTeams: int,
+        scoreTeamIndexes: numpy.ndarray,
+        scores: numpy.ndarray,
+        awal: numpy.ndarray,
+        awalGames: numpy.ndarray,
+        gameTeamIndexes: numpy.ndarray,
+        smartWins: numpy.ndarray,
+        teamScoreMultipliers: tuple[float, float, float],
+    ):
+        """
+        scoreTeamIndexes, scores, awal and awalGames have a value for every score (each side of each Matchup in each week).
+        awal includes any league median win, and awalGames is the number of games that score counts as for AWAL per game.
+        gameTeamIndexes and smartWins have a value for every score with multi-week matchups combined into a single Matchup.
+        teamScoreMultipliers are the AWAL per game, Scoring Share and Max/Min Score multipliers used to calculate Team Score
+        (see SSLYearCalculator).
+        """
+        (
+            self.__awalPerGameMultiplier,
+            self.__scoringShareMultiplier,
+            self.__maxAndMinScoreMultiplier,
+        ) = teamScoreMultipliers
+        self.__numberOfTeams = numberOfTeams
+        self.__scoreGroups = self.__getGroups(scoreTeamIndexes, numberOfTeams)
+        scoreOrder = self.__scoreGroups[0]
+        self.__scores = scores[scoreOrder]
+        self.__awal = awal[scoreOrder]
+        self.__awalGames = awalGames[scoreOrder]
+        self.__gameGroups = self.__getGroups(gameTeamIndexes, numberOfTeams)
+        self.__smartWins = smartWins[self.__gameGroups[0]]
+        # Scoring Share for a resample is the team's resampled points over every other team's actual points plus their own resampled points
+        self.__pointsScored = numpy.bincount(
+            scoreTeamIndexes, weights=scores, minlength=numberOfTeams
+        )
+        self.__totalPointsScored = scores.sum()
+
+    @staticmethod
+    def __getGroups(
+        teamIndexes: numpy.ndarray, numberOfTeams: int
+    ) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the order that puts the given values next to the other values of the same team,
+        the index of the team with at least 1 value in each group, and the start and size of each group.
+        """
+        order = numpy.argsort(teamIndexes, kind="stable")
+        groupSizes = numpy.bincount(teamIndexes, minlength=numberOfTeams)
+        groupTeamIndexes = numpy.flatnonzero(groupSizes)
+        groupSizes = groupSizes[groupTeamIndexes]
+        groupStarts = numpy.cumsum(groupSizes) - groupSizes
+        return order, groupTeamIndexes, groupStarts, groupSizes
+
+    @staticmethod
+    def __drawResamples(
+        generator: numpy.random.Generator,
+        groups: tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray],
+        numberOfSimulations: int,
+    ) -> numpy.ndarray:
+        """
+        Returns the index of the value in each slot of each resample (rows).
+        Every value is a slot, and each slot is filled with a random value from the same team.
+        """
+        _, _, groupStarts, groupSizes = groups
+        slotGroups = numpy.repeat(numpy.arange(len(groupSizes)), groupSizes)
+        return groupStarts[slotGroups] + (
+            generator.random((numberOfSimulations, len(slotGroups)))
+            * groupSizes[slotGroups]
+        ).astype(numpy.int64)
+
+    def __reduceByTeam(
+        self,
+        function: numpy.ufunc,
+        values: numpy.ndarray,
+        groups: tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray],
+    ) -> numpy.ndarray:
+        """
+        Returns the given function reduced over each team's slots in each resample (rows), with NaN for teams without any slots.
+        """
+        _, groupTeamIndexes, groupStarts, _ = groups
+        reduced = numpy.full((len(values), self.__numberOfTeams), numpy.nan)
+        if len(groupStarts) > 0:
+            reduced[:, groupTeamIndexes] = function.reduceat(
+                values, groupStarts, axis=1
+            )
+        return reduced
+
+    def simulateBatch(
+        self, numberOfSimulations: int, seedSequence: numpy.random.SeedSequence
+    ) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the Points Scored per game, AWAL per game, Smart Wins per game and Team Score for a single batch of resamples.
+        """
+        generator = numpy.random.default_rng(seedSequence)
+        scoreResamples = self.__drawResamples(
+            generator, self.__scoreGroups, numberOfSimulations
+        )
+        gameResamples = self.__drawResamples(
+            generator, self.__gameGroups, numberOfSimulations
+        )
+
+        scores = self.__scores[scoreResamples]
+        pointsScored = self.__reduceByTeam(numpy.add, scores, self.__scoreGroups)
+        gamesPlayed = numpy.bincount(
+            self.__scoreGroups[1],
+            weights=self.__scoreGroups[3],
+            minlength=self.__numberOfTeams,
+        )
+        with numpy.errstate(invalid="ignore", divide="ignore"):
+            pointsScoredPerGame = pointsScored / gamesPlayed
+            awalPerGame = self.__reduceByTeam(
+                numpy.add, self.__awal[scoreResamples], self.__scoreGroups
+            ) / self.__reduceByTeam(
+                numpy.add, self.__awalGames[scoreResamples], self.__scoreGroups
+            )
+            smartWinsPerGame = self.__reduceByTeam(
+                numpy.add, self.__smartWins[gameResamples], self.__gameGroups
+            ) / numpy.bincount(
+                self.__gameGroups[1],
+                weights=self.__gameGroups[3],
+                minlength=self.__numberOfTeams,
+            )
+            totalPointsScored = (
+                self.__totalPointsScored - self.__pointsScored + pointsScored
+            )
+            scoringShare = numpy.where(
+                totalPointsScored == 0, 0, pointsScored / totalPointsScored * 100
+            )
+        teamScore = (
+            awalPerGame * self.__awalPerGameMultiplier
+            + scoringShare * self.__scoringShareMultiplier
+            + (
+                self.__reduceByTeam(numpy.maximum, scores, self.__scoreGroups)
+                + self.__reduceByTeam(numpy.minimum, scores, self.__scoreGroups)
+            )
+            * self.__maxAndMinScoreMultiplier
+        )
+        return pointsScoredPerGame, awalPerGame, smartWinsPerGame, teamScore
+
+    def combineBatchResults(
+        self, batchResults: list[tuple[numpy.ndarray, ...]]
+    ) -> tuple[numpy.ndarray, ...]:
+        """
+        Returns the resamples from every batch stacked together.
+        """
+        return tuple(numpy.concatenate(stats) for stats in zip(*batchResults))
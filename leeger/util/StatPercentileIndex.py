@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import fields
+from typing import Hashable, Optional
+
+import numpy
+
+from leeger.model.league.League import League
+from leeger.model.league.Year import Year
+from leeger.model.stat.YearStatSheet import YearStatSheet
+from leeger.util.Deci import Deci
+from leeger.util.stat_sheet import yearStatSheet
+
+
+class StatPercentileIndex:
+    """
+    Used to compare a team's stat in a Year against that stat for every team in every Year that has been added, across any number of Leagues.
+
+    Every stat in a YearStatSheet is indexed, and each added Year can be put in a group (e.g. the number of teams in it),
+    so a stat can be compared against just the Years in 1 group or against every Year that has been added.
+    Years added without a group are only ever compared against along with every other Year.
+    Each stat's values are kept sorted so finding a percentile is a binary search.
+    Added values are held until the next lookup, and are then sorted once and merged into the values already sorted,
+    so adding many Years never sorts every value again.
+    """
+
+    # every stat in a YearStatSheet (owner names and years are not stats)
+    STAT_NAMES = tuple(
+        field.name
+        for field in fields(YearStatSheet)
+        if field.name not in ("ownerNames", "years")
+    )
+
+    def __init__(self):
+        # (group, stat name) -> every value added for that stat in that group, sorted
+        self.__sortedValues: dict[tuple[Hashable, str], numpy.ndarray] = dict()
+        # (group, stat name) -> arrays of values that have been added but not merged into the sorted values yet
+        self.__pendingValues: dict[tuple[Hashable, str], list[numpy.ndarray]] = (
+            defaultdict(list)
+        )
+        self.__groups: list[Hashable] = list()
+
+    @classmethod
+    def merge(
+        cls, statPercentileIndexes: list[StatPercentileIndex]
+    ) -> StatPercentileIndex:
+        """
+        Returns a StatPercentileIndex with every value in the given StatPercentileIndexes.
+        Useful for building the index for many Leagues in other processes.
+        """
+        mergedStatPercentileIndex = cls()
+        for statPercentileIndex in statPercentileIndexes:
+            for group in statPercentileIndex.__groups:
+                mergedStatPercentileIndex.__addGroup(group)
+            for key in statPercentileIndex.__getKeys():
+                mergedStatPercentileIndex.__pendingValues[key].append(
+                    statPercentileIndex.__getSortedValues(key)
+                )
+        return mergedStatPercentileIndex
+
+    @property
+    def groups(self) -> list[Hashable]:
+        """
+        Returns every group a Year has been added to, in the order they were first added to.
+        """
+        return list(self.__groups)
+
+    def addYearStatSheet(
+        self, yearStatSheet: YearStatSheet, *, group: Hashable = None
+    ) -> None:
+        """
+        Adds every team's stats in the given YearStatSheet to the given group.
+        Stats a team doesn't have (e.g. per game stats for a team with no games played) and optional stats that weren't calculated are not added.
+        Adding the same Year more than once will count its teams more than once.
+        """
+        self.__addGroup(group)
+        for statName in self.STAT_NAMES:
+            teamIdAndValue = getattr(yearStatSheet, statName)
+            if teamIdAndValue is None:
+                continue
+            values = numpy.array(
+                [
+                    float(value)
+                    for value in teamIdAndValue.values()
+                    if value is not None
+                ],
+                dtype=numpy.float64,
+            )
+            if len(values) > 0:
+                self.__pendingValues[(group, statName)].append(values)
+
+    def addYear(self, year: Year, *, group: Hashable = None, **kwargs) -> None:
+        """
+        Calculates the YearStatSheet for the given Year and adds every team's stats in it to the given group.
+        Any other keyword arguments are used to calculate the YearStatSheet.
+
+        Example:
+            statPercentileIndex.addYear(year, group=len(year.teams))
+        """
+        self.addYearStatSheet(yearStatSheet(year, **kwargs), group=group)
+
+    def addLeague(self, league: League, *, group: Hashable = None, **kwargs) -> None:
+        """
+        Calculates the YearStatSheet for every Year in the given League and adds every team's stats in them to the given group.
+        Any other keyword arguments are used to calculate each YearStatSheet.
+        """
+        for year in league.years:
+            self.addYear(year, group=group, **kwargs)
+
+    def getNumberOfValues(self, statName: str, *, group: Hashable = None) -> int:
+        """
+        Returns how many values have been added for the given stat.
+        Counts every group if no group is given.
+        """
+        return sum(
+            len(self.__getSortedValues(key))
+            for key in self.__getKeysForStat(statName, group)
+        )
+
+    def getPercentiles(
+        self, statName: str, values: list[float | int | Deci], *, group: Hashable = None
+    ) -> list[Optional[Deci]]:
+        """
+        Returns the percentile (0 - 100) of each of the given values against every value added for the given stat.
+        Compares against every group if no group is given.
+        A value's percentile is the percentage of values it is greater than, with a tied value counting as half.
+        Returns None for a value if there are no values to compare against, or if the given value is None.
+        Higher is not always better (e.g. Opponent Points Scored), so the percentile is only a position.
+        """
+        keys = self.__getKeysForStat(statName, group)
+        hasValue = [value is not None for value in values]
+        givenValues = numpy.array(
+            [float(value) for value in values if value is not None],
+            dtype=numpy.float64,
+        )
+        numberOfValues = 0
+        valuesBeat = numpy.zeros(len(givenValues), dtype=numpy.int64)
+        valuesBeatOrTied = numpy.zeros(len(givenValues), dtype=numpy.int64)
+        for key in keys:
+            sortedValues = self.__getSortedValues(key)
+            numberOfValues += len(sortedValues)
+            valuesBeat += numpy.searchsorted(sortedValues, givenValues, side="left")
+            valuesBeatOrTied += numpy.searchsorted(
+                sortedValues, givenValues, side="right"
+            )
+        if numberOfValues == 0:
+            return [None for _ in values]
+
+        # many values will beat and tie the same number of values, so only calculate each unique result once
+        beatAndTiedToPercentile: dict[tuple[int, int], Deci] = dict()
+        percentiles = list()
+        for beatAndTied in zip(
+            valuesBeat.tolist(), (valuesBeatOrTied - valuesBeat).tolist()
+        ):
+            percentile = beatAndTiedToPercentile.get(beatAndTied)
+            if percentile is None:
+                beat, tied = beatAndTied
+                percentile = (
+                    Deci(100) * (beat + (tied / Deci(2))) / Deci(numberOfValues)
+                )
+                beatAndTiedToPercentile[beatAndTied] = percentile
+            percentiles.append(percentile)
+        percentilesIterator = iter(percentiles)
+        return [next(percentilesIterator) if has else None for has in hasValue]
+
+    def getPercentile(
+        self, statName: str, value: float | int | Deci, *, group: Hashable = None
+    ) -> Optional[Deci]:
+        """
+        Returns the percentile (0 - 100) of the given value against every value added for the given stat.
+        Uses the same logic as getPercentiles().
+
+        Example:
+            statPercentileIndex.getPercentile("awalPerGame", Deci("0.71"), group=14)
+        """
+        return self.getPercentiles(statName, [value], group=group)[0]
+
+    def getTeamPercentiles(
+        self, yearStatSheet: YearStatSheet, *, group: Hashable = None
+    ) -> dict[str, dict[str, Optional[Deci]]]:
+        """
+        Returns the percentile of every team's stats in the given YearStatSheet, keyed by stat name, then team ID.
+        Optional stats that weren't calculated in the YearStatSheet are not returned.
+
+        Example response:
+            {
+            "awalPerGame": {
+                "someTeamId": Deci("94.2"),
+                "someOtherTeamId": Deci("37.5"),
+                ...
+                },
+            ...
+            }
+        """
+        statNameAndTeamIdAndPercentile = dict()
+        for statName in self.STAT_NAMES:
+            teamIdAndValue = getattr(yearStatSheet, statName)
+            if teamIdAndValue is None:
+                continue
+            statNameAndTeamIdAndPercentile[statName] = dict(
+                zip(
+                    teamIdAndValue.keys(),
+                    self.getPercentiles(
+                        statName, list(teamIdAndValue.values()), group=group
+                    ),
+                )
+            )
+        return statNameAndTeamIdAndPercentile
+
+    def __addGroup(self, group: Hashable) -> None:
+        if group not in self.__groups:
+            self.__groups.append(group)
+
+    def __getKeys(self) -> list[tuple[Hashable, str]]:
+        return [
+            (group, statName) for group in self.__groups for statName in self.STAT_NAMES
+        ]
+
+    def __getKeysForStat(
+        self, statName: str, group: Hashable
+    ) -> list[tuple[Hashable, str]]:
+        if statName not in self.STAT_NAMES:
+            raise ValueError(f"'{statName}' is not a stat in a YearStatSheet.")
+        if group is None:
+            return [(group, statName) for group in self.__groups]
+        return [(group, statName)]
+
+    def __getSortedValues(self, key: tuple[Hashable, str]) -> numpy.ndarray:
+        """
+        Returns the sorted values for the given key, merging in any values that were added since the last time.
+        """
+        sortedValues = self.__sortedValues.get(key, numpy.empty(0, dtype=numpy.float64))
+        pendingValues = self.__pendingValues.pop(key, None)
+        if pendingValues:
+            newValues = numpy.sort(numpy.concatenate(pendingValues))
+            # each new value is put before the sorted values greater than or equal to it, which keeps the values sorted
+            sortedValues = numpy.insert(
+                sortedValues,
+                numpy.searchsorted(sortedValues, newValues, side="left"),
+                newValues,
+            )
+            self.__sortedValues[key] = sortedValues
+        return sortedValues
@@ -0,0 +1,107 @@
+import json
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Callable, Iterator, Optional
+
+from leeger.enum.NumericBackend import NumericBackend
+from leeger.model.league.Year import Year
+from leeger.util.GeneralUtil import GeneralUtil
+from leeger.util.ModelCache import ModelCache
+from leeger.util.NumericSettings import NumericSettings
+
+
+class YearExecutor:
+    """
+    Used to call a YearCalculator method for multiple Years.
+
+    By default, each Year is calculated one after another in this process.
+    If the "workers" keyword argument is given, the Years are calculated in that many processes at once.
+    If the "executor" keyword argument is given, the Years are calculated with that Executor (e.g. a ProcessPoolExecutor that is shared between calls).
+
+    Years are sent to other processes as their JSON string instead of as pickled models,
+    and each process only rebuilds a Year from its JSON the first time it sees it.
+    """
+
+    # Year -> JSON string, only rebuilt if the Year has been modified
+    __COMPACT_YEAR_CACHE = ModelCache()
+
+    @classmethod
+    def callForEachYear(
+        cls,
+        function: Callable,
+        yearsAndKwargs: list[tuple[Year, dict[str, Any]]],
+        **kwargs,
+    ) -> list:
+        """
+        Calls the given function with each Year and kwargs pair and returns the results in the same order.
+        The given function should be a YearCalculator method.
+        """
+        with cls.getExecutor(**kwargs) as executor:
+            if executor is None:
+                return [
+                    function(year, **yearKwargs) for year, yearKwargs in yearsAndKwargs
+                ]
+            # the default numeric settings in the other processes may not match the ones in this process
+            numericDefaults = (
+                NumericSettings.getDefaultNumericBackend(),
+                NumericSettings.getDefaultFixedPointScale(),
+            )
+            futures = [
+                executor.submit(
+                    _callWithCompactYear,
+                    function,
+                    cls.__COMPACT_YEAR_CACHE.get(year, cls.__getCompactYear),
+                    yearKwargs,
+                    numericDefaults,
+                )
+                for year, yearKwargs in yearsAndKwargs
+            ]
+            return [future.result() for future in futures]
+
+    @classmethod
+    @contextmanager
+    def getExecutor(cls, **kwargs) -> Iterator[Optional[Executor]]:
+        """
+        Yields the Executor that Years should be calculated with, or None if they should be calculated in this process.
+        If an Executor is created, it is shut down once the context is exited.
+        """
+        executor = kwargs.get("executor")
+        workers = kwargs.get("workers")
+        if executor is not None:
+            if not isinstance(executor, Executor):
+                raise ValueError(
+                    f"'executor' must be type 'Executor', not '{type(executor).__name__}'."
+                )
+            yield executor
+        elif (
+            workers is not None
+            and GeneralUtil.validatePositiveInt(workers, "workers") > 1
+        ):
+            with ProcessPoolExecutor(max_workers=workers) as processPoolExecutor:
+                yield processPoolExecutor
+        else:
+            yield None
+
+    @staticmethod
+    def __getCompactYear(year: Year) -> str:
+        return json.dumps(year.toJson(), separators=(",", ":"))
+
+
+@lru_cache(maxsize=128)
+def _getYearFromCompactYear(compactYear: str) -> Year:
+    return Year.fromJson(json.loads(compactYear))
+
+
+def _callWithCompactYear(
+    function: Callable,
+    compactYear: str,
+    yearKwargs: dict[str, Any],
+    numericDefaults: tuple[NumericBackend, int],
+) -> Any:
+    """
+    Runs in the process the Year is being calculated in.
+    """
+    NumericSettings.setDefaultNumericBackend(numericDefaults[0])
+    NumericSettings.setDefaultFixedPointScale(numericDefaults[1])
+    return function(_getYearFromCompactYear(compactYear), **yearKwargs)
@@ -185,12 +185,13 @@ def _yearToExcel(year: Year, workbook: Optional[Workbook] = None, **kwargs) -> W
     ownerIdToSeedMap = dict()
     teamIdToNameMap = dict()
     teamIdToDivisionNameMap = dict()
+    yearIndex = YearNavigator.getYearIndex(year)
     for team in year.teams:
         ownerIdToSeedMap[team.ownerId] = f"{team.ownerId}{datetime.now().date()}"
         teamIdToNameMap[team.id] = team.name
         if team.divisionId:
-            teamIdToDivisionNameMap[team.id] = YearNavigator.getDivisionById(
-                year, team.divisionId
+            teamIdToDivisionNameMap[team.id] = yearIndex.getDivisionById(
+                team.divisionId
             ).name
     ownerIdToColorMap = dict()
     for ownerId, seed in ownerIdToSeedMap.items():
@@ -6,20 +6,20 @@ from leeger.util.stat_sheet import yearStatSheet
 
 def allTimeTeamsStatSheet(league: League, **kwargs) -> list[tuple[str, dict]]:
     allTimeTeamsStatsWithTitles: list[tuple[str, dict]] = list()
+    leagueIndex = LeagueNavigator.getLeagueIndex(league)
     for year in league.years:
+        yearIndex = YearNavigator.getYearIndex(year)
         ownerNames: dict[str, str] = dict()
         years: dict[str, int] = dict()
         teamIdToNameMap = dict()
         teamIdToDivisionNameMap = dict()
         for team in year.teams:
-            ownerNames[team.id] = LeagueNavigator.getOwnerById(
-                league, team.ownerId
-            ).name
+            ownerNames[team.id] = leagueIndex.getOwnerById(team.ownerId).name
             years[team.id] = year.yearNumber
             teamIdToNameMap[team.id] = team.name
             if team.divisionId:
-                teamIdToDivisionNameMap[team.id] = YearNavigator.getDivisionById(
-                    year, team.divisionId
+                teamIdToDivisionNameMap[team.id] = yearIndex.getDivisionById(
+                    team.divisionId
                 ).name
         yearStatsWithTitles = yearStatSheet(
             year, ownerNames=ownerNames, years=years, **kwargs
@@ -69,6 +69,7 @@ def yearMatchupsStatSheet(
     yearNumbers: dict[str, int] = dict()
     weekNumbers: dict[str, int] = dict()
 
+    yearIndex = YearNavigator.getYearIndex(year)
     for week in year.weeks:
         if yearFilters.weekNumberStart <= week.weekNumber <= yearFilters.weekNumberEnd:
             for matchup in week.matchups:
@@ -76,8 +77,8 @@ def yearMatchupsStatSheet(
                     matchup.multiWeekMatchupId is None
                     or yearFilters.includeMultiWeekMatchups is True
                 ):
-                    teamA = YearNavigator.getTeamById(year, matchup.teamAId)
-                    teamB = YearNavigator.getTeamById(year, matchup.teamBId)
+                    teamA = yearIndex.getTeamById(matchup.teamAId)
+                    teamB = yearIndex.getTeamById(matchup.teamBId)
                     # add matchup for both teams
                     # add for "A" team
                     modifiedMatchupId = f"{matchup.id}A"
@@ -156,6 +157,7 @@ def allTimeMatchupsStatSheet(
             )
 
     # combine responses into 1 response
+    leagueIndex = LeagueNavigator.getLeagueIndex(league)
     for yearMatchupStatSheet in allYearMatchupStatSheets:
         for title, statDict in yearMatchupStatSheet:
             if title == "Team For":
@@ -176,14 +178,14 @@ def allTimeMatchupsStatSheet(
                 # turn owner IDs into owner names
                 currentOwnerForNames: dict[str, str] = dict()
                 for key, ownerId in statDict.items():
-                    owner = LeagueNavigator.getOwnerById(league, ownerId)
+                    owner = leagueIndex.getOwnerById(ownerId)
                     currentOwnerForNames[key] = owner.name
                 ownerForNames.update(currentOwnerForNames)
             elif title == "Owner ID Against":
                 # turn owner IDs into owner names
                 currentOwnerAgainstNames: dict[str, str] = dict()
                 for key, ownerId in statDict.items():
-                    owner = LeagueNavigator.getOwnerById(league, ownerId)
+                    owner = leagueIndex.getOwnerById(ownerId)
                     currentOwnerAgainstNames[key] = owner.name
                 ownerAgainstNames.update(currentOwnerAgainstNames)
 
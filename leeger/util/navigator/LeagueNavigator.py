@@ -1,10 +1,12 @@
 from leeger.exception.DoesNotExistException import DoesNotExistException
 from leeger.model.filter.AllTimeFilters import AllTimeFilters
 from leeger.model.filter.YearFilters import YearFilters
+from leeger.model.frame.LeagueIndex import LeagueIndex
 from leeger.model.league import Owner
 from leeger.model.league.League import League
 from leeger.model.league.Team import Team
 from leeger.model.league.Year import Year
+from leeger.util.ModelCache import ModelCache
 from leeger.util.navigator.YearNavigator import YearNavigator
 
 
@@ -13,33 +15,28 @@ class LeagueNavigator:
     Used to navigate the League model.
     """
 
-    @staticmethod
-    def getYearByYearNumber(league: League, yearNumber: int) -> Year:
-        for year in league.years:
-            if year.yearNumber == yearNumber:
-                return year
-        raise DoesNotExistException(
-            f"Year {yearNumber} does not exist in the given League."
-        )
+    __LEAGUE_INDEX_CACHE = ModelCache(getVersionKey=LeagueIndex.getStructureKey)
 
-    @staticmethod
-    def getTeamById(league: League, teamId: str) -> Team:
-        for year in league.years:
-            for team in year.teams:
-                if team.id == teamId:
-                    return team
-        raise DoesNotExistException(
-            f"Team with ID {teamId} does not exist in the given League."
-        )
+    @classmethod
+    def getLeagueIndex(cls, league: League) -> LeagueIndex:
+        """
+        Returns the LeagueIndex for the given League.
+        The LeagueIndex is only built again if the League's Owners, Years or Teams have been modified since it was last built.
+        When looking up many models in a loop, get the LeagueIndex once before the loop.
+        """
+        return cls.__LEAGUE_INDEX_CACHE.get(league, LeagueIndex.fromLeague)
 
-    @staticmethod
-    def getOwnerById(league: League, ownerId: str) -> Owner:
-        for owner in league.owners:
-            if owner.id == ownerId:
-                return owner
-        raise DoesNotExistException(
-            f"Owner with ID {ownerId} does not exist in the given League."
-        )
+    @classmethod
+    def getYearByYearNumber(cls, league: League, yearNumber: int) -> Year:
+        return cls.getLeagueIndex(league).getYearByYearNumber(yearNumber)
+
+    @classmethod
+    def getTeamById(cls, league: League, teamId: str) -> Team:
+        return cls.getLeagueIndex(league).getTeamById(teamId)
+
+    @classmethod
+    def getOwnerById(cls, league: League, ownerId: str) -> Owner:
+        return cls.getLeagueIndex(league).getOwnerById(ownerId)
 
     @staticmethod
     def getAllOwnerIds(league: League) -> list[str]:
@@ -128,10 +125,11 @@ class LeagueNavigator:
         for ownerId in allOwnerIds:
             ownerIdAndNumberOfGamesPlayed[ownerId] = 0
 
+        leagueIndex = cls.getLeagueIndex(league)
         for resultDict in allResultDicts:
             for teamId in resultDict.keys():
                 ownerIdAndNumberOfGamesPlayed[
-                    LeagueNavigator.getTeamById(league, teamId).ownerId
+                    leagueIndex.getOwnerIdByTeamId(teamId)
                 ] += resultDict[teamId]
 
         return ownerIdAndNumberOfGamesPlayed
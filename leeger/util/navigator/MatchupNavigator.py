@@ -2,6 +2,8 @@ import statistics
 from typing import Optional
 
 from leeger.model.league.Matchup import Matchup
+from leeger.util.FixedPoint import FixedPoint
+from leeger.util.NumericSettings import NumericSettings
 
 
 class MatchupNavigator:
@@ -13,38 +15,64 @@ class MatchupNavigator:
     def getTeamIdOfMatchupWinner(matchup: Matchup, **kwargs) -> Optional[str]:
         """
         Returns the team ID of the team that won the matchup or None if the matchup was a tie.
+        If the fixed-point numeric backend is used, scores are compared as fixed-point integers.
         """
+        teamAScore = matchup.teamAScore
+        teamBScore = matchup.teamBScore
+        if NumericSettings.useFixedPoint(**kwargs):
+            scale = NumericSettings.getFixedPointScale(**kwargs)
+            teamAScore = FixedPoint.toFixedPoint(teamAScore, scale)
+            teamBScore = FixedPoint.toFixedPoint(teamBScore, scale)
+
         winningTeamId = None
         # team A won
-        if (matchup.teamAScore > matchup.teamBScore) or (
-            matchup.teamAScore == matchup.teamBScore and matchup.teamAHasTiebreaker
+        if (teamAScore > teamBScore) or (
+            teamAScore == teamBScore and matchup.teamAHasTiebreaker
         ):
             winningTeamId = matchup.teamAId
         # team B won
-        elif (matchup.teamBScore > matchup.teamAScore) or (
-            matchup.teamAScore == matchup.teamBScore and matchup.teamBHasTiebreaker
+        elif (teamBScore > teamAScore) or (
+            teamAScore == teamBScore and matchup.teamBHasTiebreaker
         ):
             winningTeamId = matchup.teamBId
         return winningTeamId
 
     @staticmethod
-    def simplifyMultiWeekMatchups(matchups: list[Matchup]) -> Matchup:
+    def simplifyMultiWeekMatchups(matchups: list[Matchup], **kwargs) -> Matchup:
         """
         Takes a list of multi-week matchups and returns a single Matchup that is a combined representation of those matchups.
         This assumes the list of matchups given is validated.
+        If the fixed-point numeric backend is used, each week's score is made a fixed-point integer before they are added up,
+        so the combined scores are exact (i.e. 0.1 + 0.2 is 0.3) and can be compared with getTeamIdOfMatchupWinner().
         """
         if len(matchups) == 0:
             raise ValueError(f"matchups cannot be an empty list.")
         return Matchup(
             teamAId=matchups[0].teamAId,
             teamBId=matchups[0].teamBId,
-            teamAScore=sum([matchup.teamAScore for matchup in matchups]),
-            teamBScore=sum([matchup.teamBScore for matchup in matchups]),
+            teamAScore=MatchupNavigator.__sumScores(
+                [matchup.teamAScore for matchup in matchups], **kwargs
+            ),
+            teamBScore=MatchupNavigator.__sumScores(
+                [matchup.teamBScore for matchup in matchups], **kwargs
+            ),
             teamAHasTiebreaker=matchups[0].teamAHasTiebreaker,
             teamBHasTiebreaker=matchups[0].teamBHasTiebreaker,
             matchupType=matchups[0].matchupType,
         )
 
+    @staticmethod
+    def __sumScores(scores: list[float | int], **kwargs) -> float | int:
+        if not NumericSettings.useFixedPoint(**kwargs):
+            return sum(scores)
+        scale = NumericSettings.getFixedPointScale(**kwargs)
+        total = FixedPoint.toDeci(
+            sum(FixedPoint.toFixedPoint(score, scale) for score in scores), scale
+        )
+        if all(isinstance(score, int) for score in scores):
+            return int(total)
+        return float(total)
+
     @classmethod
     def getMedianScore(cls, matchups: list[Matchup]) -> float:
         """
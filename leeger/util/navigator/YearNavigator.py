@@ -1,11 +1,17 @@
 import copy
 
+import numpy
+
 from leeger.enum import MatchupType
 from leeger.exception import DoesNotExistException
 from leeger.model.filter.YearFilters import YearFilters
+from leeger.model.frame.YearFrame import YearFrame
+from leeger.model.frame.YearIndex import YearIndex
 from leeger.model.league import Matchup, Team
 from leeger.model.league.Division import Division
 from leeger.model.league.Year import Year
+from leeger.util.ModelCache import ModelCache
+from leeger.util.SortedScores import SortedScores
 
 
 class YearNavigator:
@@ -13,27 +19,46 @@ class YearNavigator:
     Used to navigate the Year model.
     """
 
+    __YEAR_FRAME_CACHE = ModelCache()
+    __YEAR_INDEX_CACHE = ModelCache(getVersionKey=YearIndex.getStructureKey)
+
+    @classmethod
+    def getYearFrame(cls, year: Year) -> YearFrame:
+        """
+        Returns the YearFrame for the given Year.
+        The YearFrame is only built again if the Year has been modified since it was last built.
+        """
+        return cls.__YEAR_FRAME_CACHE.get(year, YearFrame.fromYear)
+
+    @classmethod
+    def getSortedScores(cls, year: Year) -> SortedScores:
+        """
+        Returns a SortedScores with every score in the given Year (with multi-week matchups combined into a single Matchup).
+        Will count all scores EXCEPT for IGNORE Matchups.
+        The SortedScores is only built again if the Year has been modified since it was last built.
+        """
+        return cls.getYearFrame(year).getSortedScores()
+
     @staticmethod
     def getAllTeamIds(year: Year) -> list[str]:
         return [team.id for team in year.teams]
 
-    @staticmethod
-    def getTeamById(year: Year, teamId: str) -> Team:
-        for team in year.teams:
-            if team.id == teamId:
-                return team
-        raise DoesNotExistException(
-            f"Team with ID '{teamId}' does not exist in the given Year."
-        )
+    @classmethod
+    def getYearIndex(cls, year: Year) -> YearIndex:
+        """
+        Returns the YearIndex for the given Year.
+        The YearIndex is only built again if the Year's Teams, Divisions or Weeks have been modified since it was last built.
+        When looking up many models in a loop, get the YearIndex once before the loop.
+        """
+        return cls.__YEAR_INDEX_CACHE.get(year, YearIndex.fromYear)
 
-    @staticmethod
-    def getDivisionById(year: Year, divisionId: str) -> Division:
-        for division in year.divisions:
-            if division.id == divisionId:
-                return division
-        raise DoesNotExistException(
-            f"Division with ID '{divisionId}' does not exist in the given Year."
-        )
+    @classmethod
+    def getTeamById(cls, year: Year, teamId: str) -> Team:
+        return cls.getYearIndex(year).getTeamById(teamId)
+
+    @classmethod
+    def getDivisionById(cls, year: Year, divisionId: str) -> Division:
+        return cls.getYearIndex(year).getDivisionById(divisionId)
 
     @classmethod
     def getNumberOfGamesPlayed(
@@ -55,53 +80,42 @@ class YearNavigator:
             }
         """
 
-        teamIdAndNumberOfGamesPlayed = dict()
-        allTeamIds = YearNavigator.getAllTeamIds(year)
-        for teamId in allTeamIds:
-            teamIdAndNumberOfGamesPlayed[teamId] = 0
-
-        # keep track of multi-week matchups that have been counted
-        multiWeekMatchupIdsCounted: list[str] = list()
-
-        for i in range(yearFilters.weekNumberStart - 1, yearFilters.weekNumberEnd):
-            week = year.weeks[i]
-            for matchup in week.matchups:
-                if matchup.matchupType in yearFilters.includeMatchupTypes:
-                    mwmid = matchup.multiWeekMatchupId
-                    if mwmid is not None and countMultiWeekMatchupsAsOneGame is True:
-                        # these matchups will only count as 1 game
-                        if mwmid in multiWeekMatchupIdsCounted:
-                            # don't count this matchup as another game
-                            continue
-                        multiWeekMatchupIdsCounted.append(mwmid)
-                    numberOfGamesToAdd = 1
-                    # count regular season games in league median years as 2 games
-                    if (
-                        year.yearSettings.leagueMedianGames
-                        and matchup.matchupType == MatchupType.REGULAR_SEASON
-                        and countLeagueMedianGamesAsTwoGames
-                    ):
-                        numberOfGamesToAdd = 2
-                    teamIdAndNumberOfGamesPlayed[matchup.teamAId] += numberOfGamesToAdd
-                    teamIdAndNumberOfGamesPlayed[matchup.teamBId] += numberOfGamesToAdd
+        yearFrame = cls.getYearFrame(year)
+        # multi-week matchups can be counted as 1 game
+        # regular season games in league median years can be counted as 2 games
+        numberOfGamesPlayed = yearFrame.countGamesByTeam(
+            yearFilters,
+            countMultiWeekMatchupsAsOneGame=countMultiWeekMatchupsAsOneGame,
+            countLeagueMedianGamesAsTwoGames=countLeagueMedianGamesAsTwoGames,
+        )
+        teamIdAndNumberOfGamesPlayed = yearFrame.toTeamIdDict(
+            numberOfGamesPlayed.tolist()
+        )
         return teamIdAndNumberOfGamesPlayed
 
-    @staticmethod
+    @classmethod
     def getAllScoresInYear(
-        year: Year, simplifyMultiWeekMatchups=False
+        cls, year: Year, simplifyMultiWeekMatchups=False
     ) -> list[float | int]:
         """
         Returns a list of all scores for the given Year.
         Will count all scores EXCEPT for IGNORE Matchups.
         """
+        yearFrame = cls.getYearFrame(year)
+        rows = numpy.flatnonzero(
+            yearFrame.matchupTypeCode
+            != YearFrame.MATCHUP_TYPE_CODES[MatchupType.IGNORE]
+        )
         # add simplified multi-week matchup scores if requested
         if simplifyMultiWeekMatchups:
-            allMatchups = YearNavigator.getAllSimplifiedMatchupsInYear(year)
+            simplifiedMatchups = yearFrame.simplifyMultiWeekMatchups(rows)
+            teamAScoreValue = simplifiedMatchups.teamAScoreValue
+            teamBScoreValue = simplifiedMatchups.teamBScoreValue
         else:
-            allMatchups = YearNavigator.getAllMatchupsInYear(year)
+            teamAScoreValue = yearFrame.teamAScoreValue[rows]
+            teamBScoreValue = yearFrame.teamBScoreValue[rows]
 
-        allScores = [matchup.teamAScore for matchup in allMatchups]
-        allScores += [matchup.teamBScore for matchup in allMatchups]
+        allScores = teamAScoreValue.tolist() + teamBScoreValue.tolist()
 
         return allScores
 
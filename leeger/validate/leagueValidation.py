@@ -1,9 +1,8 @@
-from functools import lru_cache
-
 from leeger.exception.InvalidLeagueFormatException import InvalidLeagueFormatException
 from leeger.model.league.League import League
 from leeger.model.league.Owner import Owner
 from leeger.model.league.Year import Year
+from leeger.util.ModelCache import ModelCache
 from leeger.validate import ownerValidation, yearValidation
 
 """
@@ -15,8 +14,19 @@ Checker Functions
 """
 
 
-@lru_cache(maxsize=None)
+# Leagues that have passed every check, kept by identity and version so a League is only checked again once it has been modified
+__VALIDATED_LEAGUES = ModelCache()
+
+
 def runAllChecks(league: League) -> None:
+    """
+    Runs all checks on the given League.
+    If the League has passed every check and has not been modified since, the checks are not run again.
+    """
+    __VALIDATED_LEAGUES.get(league, __runAllChecks)
+
+
+def __runAllChecks(league: League) -> None:
     """
     Runs all checks on the given League.
     """
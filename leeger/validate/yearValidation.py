@@ -1,11 +1,10 @@
-from functools import lru_cache
-
 from leeger.exception.InvalidYearFormatException import InvalidYearFormatException
 from leeger.model.league import Matchup, YearSettings
 from leeger.model.league.Division import Division
 from leeger.model.league.Team import Team
 from leeger.model.league.Week import Week
 from leeger.model.league.Year import Year
+from leeger.util.ModelCache import ModelCache
 from leeger.util.navigator import YearNavigator
 from leeger.validate import (
     divisionValidation,
@@ -14,9 +13,19 @@ from leeger.validate import (
     yearSettingsValidation,
 )
 
+# Years that have passed every check, kept by identity and version so a Year is only checked again once it has been modified
+__VALIDATED_YEARS = ModelCache()
+
 
-@lru_cache(maxsize=None)
 def runAllChecks(year: Year) -> None:
+    """
+    Runs all checks on the given Year.
+    If the Year has passed every check and has not been modified since, the checks are not run again.
+    """
+    __VALIDATED_YEARS.get(year, __runAllChecks)
+
+
+def __runAllChecks(year: Year) -> None:
     """
     Runs all checks on the given Year.
     The order in which these are called matters.
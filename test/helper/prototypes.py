@@ -1,5 +1,9 @@
+from leeger.model.league.Matchup import Matchup
 from leeger.model.league.Owner import Owner
 from leeger.model.league.Team import Team
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.model.league.YearSettings import YearSettings
 
 
 def getNDefaultOwnersAndTeams(n: int) -> tuple[list[Owner], list[Team]]:
@@ -17,3 +21,45 @@ def getTeamsFromOwners(owners: list[Owner]) -> list[Team]:
     for i, owner in enumerate(owners):
         teams.append(Team(ownerId=owner.id, name=str(i + 1)))
     return teams
+
+
+def getYearWithNDefaultTeams(
+    n: int,
+    matchupsByWeek: list[list[tuple]],
+    *,
+    owners: list[Owner] = None,
+    yearNumber: int = 2000,
+    **kwargs,
+) -> tuple[Year, list[str]]:
+    """
+    Returns a Year with n default teams (see getNDefaultOwnersAndTeams()) and the IDs of those teams.
+    If owners are given, the teams belong to the first n of them (see getTeamsFromOwners()), so Years can be put in the same League.
+    Each week is a list of matchups and each matchup is (team A index, team B index, team A score, team B score),
+    optionally followed by a dict of any other Matchup fields.
+    Any other keyword arguments are used for the YearSettings.
+    """
+    if owners is None:
+        _, teams = getNDefaultOwnersAndTeams(n)
+    else:
+        teams = getTeamsFromOwners(owners[:n])
+    weeks = list()
+    for i, matchups in enumerate(matchupsByWeek):
+        weekMatchups = list()
+        for teamAIndex, teamBIndex, teamAScore, teamBScore, *matchupKwargs in matchups:
+            weekMatchups.append(
+                Matchup(
+                    teamAId=teams[teamAIndex].id,
+                    teamBId=teams[teamBIndex].id,
+                    teamAScore=teamAScore,
+                    teamBScore=teamBScore,
+                    **(matchupKwargs[0] if matchupKwargs else dict()),
+                )
+            )
+        weeks.append(Week(weekNumber=i + 1, matchups=weekMatchups))
+    year = Year(
+        yearNumber=yearNumber,
+        teams=teams,
+        weeks=weeks,
+        yearSettings=YearSettings(**kwargs),
+    )
+    return year, [team.id for team in teams]
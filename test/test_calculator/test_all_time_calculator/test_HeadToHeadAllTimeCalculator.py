@@ -0,0 +1,168 @@
+import unittest
+
+from leeger.calculator.all_time_calculator import (
+    GameOutcomeAllTimeCalculator,
+    HeadToHeadAllTimeCalculator,
+    PointsScoredAllTimeCalculator,
+)
+from leeger.enum.MatchupType import MatchupType
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.util.Deci import Deci
+from test.helper.prototypes import getNDefaultOwnersAndTeams, getTeamsFromOwners
+
+
+class TestHeadToHeadAllTimeCalculator(unittest.TestCase):
+    @staticmethod
+    def __getLeague() -> League:
+        owners, teamsA = getNDefaultOwnersAndTeams(3)
+        teamsB = getTeamsFromOwners(owners)
+
+        week1_a = Week(
+            weekNumber=1,
+            matchups=[
+                Matchup(
+                    teamAId=teamsA[0].id,
+                    teamBId=teamsA[1].id,
+                    teamAScore=100.1,
+                    teamBScore=90.2,
+                )
+            ],
+        )
+        week2_a = Week(
+            weekNumber=2,
+            matchups=[
+                Matchup(
+                    teamAId=teamsA[1].id,
+                    teamBId=teamsA[2].id,
+                    teamAScore=80,
+                    teamBScore=80,
+                )
+            ],
+        )
+        # a multi-week matchup is a single game, owner 1 wins it 170 to 160
+        week3_a = Week(
+            weekNumber=3,
+            matchups=[
+                Matchup(
+                    teamAId=teamsA[0].id,
+                    teamBId=teamsA[2].id,
+                    teamAScore=70,
+                    teamBScore=90,
+                    matchupType=MatchupType.PLAYOFF,
+                    multiWeekMatchupId="1",
+                )
+            ],
+        )
+        week4_a = Week(
+            weekNumber=4,
+            matchups=[
+                Matchup(
+                    teamAId=teamsA[0].id,
+                    teamBId=teamsA[2].id,
+                    teamAScore=100,
+                    teamBScore=70,
+                    matchupType=MatchupType.PLAYOFF,
+                    multiWeekMatchupId="1",
+                )
+            ],
+        )
+        yearA = Year(
+            yearNumber=2000, teams=teamsA, weeks=[week1_a, week2_a, week3_a, week4_a]
+        )
+
+        week1_b = Week(
+            weekNumber=1,
+            matchups=[
+                Matchup(
+                    teamAId=teamsB[1].id,
+                    teamBId=teamsB[0].id,
+                    teamAScore=110,
+                    teamBScore=95.5,
+                )
+            ],
+        )
+        yearB = Year(yearNumber=2001, teams=teamsB[:2], weeks=[week1_b])
+
+        return League(name="TEST", owners=owners, years=[yearA, yearB])
+
+    def test_getHeadToHead_happyPath(self):
+        league = self.__getLeague()
+        owner1, owner2, owner3 = [owner.id for owner in league.owners]
+
+        headToHead = HeadToHeadAllTimeCalculator.getHeadToHead(league)
+
+        self.assertEqual(1, headToHead.getWins(owner1, owner2))
+        self.assertEqual(1, headToHead.getLosses(owner1, owner2))
+        self.assertEqual(0, headToHead.getTies(owner1, owner2))
+        self.assertEqual(2, headToHead.getGamesPlayed(owner1, owner2))
+        self.assertEqual(Deci("195.6"), headToHead.getPointsScored(owner1, owner2))
+        self.assertEqual(
+            Deci("200.2"), headToHead.getOpponentPointsScored(owner1, owner2)
+        )
+        self.assertEqual(1, headToHead.getWins(owner2, owner1))
+        self.assertEqual(1, headToHead.getTies(owner2, owner3))
+        self.assertEqual(1, headToHead.getTies(owner3, owner2))
+        # the multi-week matchup
+        self.assertEqual(1, headToHead.getWins(owner1, owner3))
+        self.assertEqual(1, headToHead.getLosses(owner3, owner1))
+        self.assertEqual(1, headToHead.getGamesPlayed(owner1, owner3))
+        self.assertEqual(Deci("170"), headToHead.getPointsScored(owner1, owner3))
+        self.assertEqual(0, headToHead.getGamesPlayed(owner1, owner1))
+
+    def test_getHeadToHead_withFilters(self):
+        league = self.__getLeague()
+        owner1, owner2, owner3 = [owner.id for owner in league.owners]
+
+        headToHead = HeadToHeadAllTimeCalculator.getHeadToHead(
+            league, onlyRegularSeason=True
+        )
+        self.assertEqual(0, headToHead.getGamesPlayed(owner1, owner3))
+        self.assertEqual(2, headToHead.getGamesPlayed(owner1, owner2))
+
+        headToHead = HeadToHeadAllTimeCalculator.getHeadToHead(
+            league, yearNumberStart=2000, yearNumberEnd=2000, weekNumberEnd=3
+        )
+        self.assertEqual(1, headToHead.getGamesPlayed(owner1, owner2))
+        # only the first week of the multi-week matchup is in the range
+        self.assertEqual(0, headToHead.getWins(owner1, owner3))
+        self.assertEqual(1, headToHead.getLosses(owner1, owner3))
+
+    def test_getHeadToHead_matchesAllTimeCalculators(self):
+        league = self.__getLeague()
+
+        headToHead = HeadToHeadAllTimeCalculator.getHeadToHead(league)
+
+        wins = GameOutcomeAllTimeCalculator.getWins(league)
+        losses = GameOutcomeAllTimeCalculator.getLosses(league)
+        ties = GameOutcomeAllTimeCalculator.getTies(league)
+        pointsScored = PointsScoredAllTimeCalculator.getPointsScored(league)
+        for i, ownerId in enumerate(headToHead.ownerIds):
+            self.assertEqual(wins[ownerId], headToHead.wins[i].sum())
+            self.assertEqual(losses[ownerId], headToHead.losses[i].sum())
+            self.assertEqual(ties[ownerId], headToHead.ties[i].sum())
+            self.assertEqual(pointsScored[ownerId], sum(headToHead.pointsScored[i]))
+
+    def test_getRivalryTable_happyPath(self):
+        league = self.__getLeague()
+        owner1, owner2, owner3 = [owner.id for owner in league.owners]
+
+        rivalryTable = HeadToHeadAllTimeCalculator.getHeadToHead(
+            league, onlyRegularSeason=True
+        ).getRivalryTable()
+
+        self.assertEqual({owner2}, set(rivalryTable[owner1].keys()))
+        self.assertEqual({owner1, owner3}, set(rivalryTable[owner2].keys()))
+        self.assertEqual(
+            {
+                "wins": 0,
+                "losses": 0,
+                "ties": 1,
+                "gamesPlayed": 1,
+                "pointsScored": Deci("80"),
+                "opponentPointsScored": Deci("80"),
+            },
+            rivalryTable[owner3][owner2],
+        )
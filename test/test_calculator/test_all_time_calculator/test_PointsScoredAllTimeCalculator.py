@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 
 from leeger.calculator.all_time_calculator.PointsScoredAllTimeCalculator import (
     PointsScoredAllTimeCalculator,
@@ -9,6 +10,7 @@ from leeger.model.league.Matchup import Matchup
 from leeger.model.league.Week import Week
 from leeger.model.league.Year import Year
 from leeger.util.Deci import Deci
+from leeger.util.NumericSettings import NumericSettings
 from test.helper.prototypes import getNDefaultOwnersAndTeams, getTeamsFromOwners
 
 
@@ -2486,3 +2488,92 @@ class TestPointsScoredAllTimeCalculator(unittest.TestCase):
         self.assertEqual(Deci("3.3"), response[owners[3].id])
         self.assertEqual(Deci("5.5"), response[owners[4].id])
         self.assertEqual(Deci("4.4"), response[owners[5].id])
+
+    def test_getPointsScored_numericSettingsReachEveryYear(self):
+        owners, teamsA = getNDefaultOwnersAndTeams(2)
+        teamsB = getTeamsFromOwners(owners)
+
+        yearA = Year(
+            yearNumber=2000,
+            teams=teamsA,
+            weeks=[
+                Week(
+                    weekNumber=1,
+                    matchups=[
+                        Matchup(
+                            teamAId=teamsA[0].id,
+                            teamBId=teamsA[1].id,
+                            teamAScore=1.1,
+                            teamBScore=2.2,
+                        )
+                    ],
+                )
+            ],
+        )
+        yearB = Year(
+            yearNumber=2001,
+            teams=teamsB,
+            weeks=[
+                Week(
+                    weekNumber=1,
+                    matchups=[
+                        Matchup(
+                            teamAId=teamsB[0].id,
+                            teamBId=teamsB[1].id,
+                            teamAScore=3.3,
+                            teamBScore=4.4,
+                        )
+                    ],
+                )
+            ],
+        )
+        league = League(name="TEST", owners=owners, years=[yearA, yearB])
+
+        with patch.object(
+            NumericSettings,
+            "getNumericBackend",
+            wraps=NumericSettings.getNumericBackend,
+        ) as mockGetNumericBackend, patch.object(
+            NumericSettings,
+            "getFixedPointScale",
+            wraps=NumericSettings.getFixedPointScale,
+        ) as mockGetFixedPointScale:
+            response = PointsScoredAllTimeCalculator.getPointsScored(
+                league, numericBackend="fixed_point", fixedPointScale=1
+            )
+
+        self.assertEqual(Deci("4.4"), response[owners[0].id])
+        self.assertEqual(Deci("6.6"), response[owners[1].id])
+        self.assertGreaterEqual(mockGetNumericBackend.call_count, 2)
+        for call in mockGetNumericBackend.call_args_list:
+            self.assertEqual("fixed_point", call.kwargs["numericBackend"])
+        self.assertGreaterEqual(mockGetFixedPointScale.call_count, 2)
+        for call in mockGetFixedPointScale.call_args_list:
+            self.assertEqual(1, call.kwargs["fixedPointScale"])
+
+    def test_getPointsScored_numericSettingsReachEveryYearInOtherProcesses(self):
+        owners, teamsA = getNDefaultOwnersAndTeams(2)
+        teamsB = getTeamsFromOwners(owners)
+
+        years = list()
+        for yearNumber, teams in ((2000, teamsA), (2001, teamsB)):
+            matchup = Matchup(
+                teamAId=teams[0].id,
+                teamBId=teams[1].id,
+                teamAScore=1.25,
+                teamBScore=2.5,
+            )
+            week = Week(weekNumber=1, matchups=[matchup])
+            years.append(Year(yearNumber=yearNumber, teams=teams, weeks=[week]))
+        league = League(name="TEST", owners=owners, years=years)
+
+        response = PointsScoredAllTimeCalculator.getPointsScored(
+            league, numericBackend="fixed_point", fixedPointScale=2, workers=2
+        )
+
+        self.assertEqual(Deci("2.5"), response[owners[0].id])
+        # 1.25 can't be kept to 1 decimal place, so this only raises if the scale reaches each Year
+        with self.assertRaises(ValueError):
+            PointsScoredAllTimeCalculator.getPointsScored(
+                league, numericBackend="fixed_point", fixedPointScale=1, workers=2
+            )
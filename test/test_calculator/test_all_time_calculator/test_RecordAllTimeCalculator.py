@@ -0,0 +1,258 @@
+import unittest
+
+import numpy
+
+from leeger.calculator.all_time_calculator import RecordAllTimeCalculator
+from leeger.enum.MatchupType import MatchupType
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.util.Deci import Deci
+from test.helper.prototypes import getNDefaultOwnersAndTeams, getTeamsFromOwners
+
+
+class TestRecordAllTimeCalculator(unittest.TestCase):
+    @staticmethod
+    def __getLeague() -> League:
+        owners, teamsA = getNDefaultOwnersAndTeams(4)
+        teamsB = getTeamsFromOwners(owners)
+
+        week1_a = Week(
+            weekNumber=1,
+            matchups=[
+                Matchup(
+                    teamAId=teamsA[0].id,
+                    teamBId=teamsA[1].id,
+                    teamAScore=100.3,
+                    teamBScore=90.1,
+                ),
+                Matchup(
+                    teamAId=teamsA[2].id,
+                    teamBId=teamsA[3].id,
+                    teamAScore=80,
+                    teamBScore=80,
+                    teamBHasTiebreaker=True,
+                ),
+            ],
+        )
+        week2_a = Week(
+            weekNumber=2,
+            matchups=[
+                Matchup(
+                    teamAId=teamsA[0].id,
+                    teamBId=teamsA[2].id,
+                    teamAScore=120,
+                    teamBScore=60.5,
+                    matchupType=MatchupType.PLAYOFF,
+                ),
+                Matchup(
+                    teamAId=teamsA[1].id,
+                    teamBId=teamsA[3].id,
+                    teamAScore=70,
+                    teamBScore=70,
+                    matchupType=MatchupType.IGNORE,
+                ),
+            ],
+        )
+        yearA = Year(yearNumber=2000, teams=teamsA, weeks=[week1_a, week2_a])
+
+        week1_b = Week(
+            weekNumber=1,
+            matchups=[
+                Matchup(
+                    teamAId=teamsB[0].id,
+                    teamBId=teamsB[1].id,
+                    teamAScore=95.5,
+                    teamBScore=120,
+                ),
+                Matchup(
+                    teamAId=teamsB[2].id,
+                    teamBId=teamsB[3].id,
+                    teamAScore=50,
+                    teamBScore=50,
+                ),
+            ],
+        )
+        yearB = Year(yearNumber=2001, teams=teamsB, weeks=[week1_b])
+
+        return League(name="TEST", owners=owners, years=[yearA, yearB])
+
+    def test_getHighestScores_happyPath(self):
+        league = self.__getLeague()
+
+        response = RecordAllTimeCalculator.getHighestScores(league, 3)
+
+        self.assertEqual(3, len(response))
+        # tied scores are in the order they were played
+        self.assertEqual([120, 120, 100.3], [record.value for record in response])
+        self.assertEqual(
+            league.years[0].weeks[1].matchups[0].id, response[0].matchup.id
+        )
+        self.assertEqual(2000, response[0].yearNumber)
+        self.assertEqual(2, response[0].weekNumber)
+        self.assertEqual(league.years[0].teams[0].id, response[0].teamId)
+        self.assertEqual(league.owners[0].id, response[0].ownerId)
+        self.assertEqual(2001, response[1].yearNumber)
+        self.assertEqual(1, response[1].weekNumber)
+        self.assertEqual(league.years[1].teams[1].id, response[1].teamId)
+        self.assertEqual(league.owners[1].id, response[1].ownerId)
+
+    def test_getLowestScores_happyPath(self):
+        league = self.__getLeague()
+
+        response = RecordAllTimeCalculator.getLowestScores(league, 3)
+
+        self.assertEqual([50, 50, 60.5], [record.value for record in response])
+        self.assertEqual(league.owners[2].id, response[0].ownerId)
+        self.assertEqual(league.owners[3].id, response[1].ownerId)
+
+    def test_getBiggestBlowouts_happyPath(self):
+        league = self.__getLeague()
+
+        response = RecordAllTimeCalculator.getBiggestBlowouts(league, 2)
+
+        self.assertEqual([Deci("59.5"), Deci("24.5")], [r.value for r in response])
+        self.assertEqual(league.owners[0].id, response[0].ownerId)
+        self.assertEqual(league.owners[1].id, response[1].ownerId)
+
+    def test_getNarrowestWins_happyPath(self):
+        league = self.__getLeague()
+
+        response = RecordAllTimeCalculator.getNarrowestWins(league, 2)
+
+        # a win on a tiebreaker is the narrowest win, and ties are not wins
+        self.assertEqual([Deci("0"), Deci("10.2")], [r.value for r in response])
+        self.assertEqual(league.owners[3].id, response[0].ownerId)
+        self.assertEqual(league.owners[0].id, response[1].ownerId)
+
+    def test_getHighestCombinedScores_happyPath(self):
+        league = self.__getLeague()
+
+        response = RecordAllTimeCalculator.getHighestCombinedScores(league, 2)
+
+        self.assertEqual([Deci("215.5"), Deci("190.4")], [r.value for r in response])
+        self.assertIsNone(response[0].teamId)
+        self.assertIsNone(response[0].ownerId)
+
+    def test_getHighestScores_numberOfRecordsGreaterThanNumberOfScores(self):
+        league = self.__getLeague()
+
+        response = RecordAllTimeCalculator.getHighestScores(league, 100)
+
+        # the IGNORE Matchup is not included
+        self.assertEqual(10, len(response))
+
+    def test_getHighestScores_withFilters(self):
+        league = self.__getLeague()
+
+        response = RecordAllTimeCalculator.getHighestScores(
+            league, 1, onlyRegularSeason=True
+        )
+        self.assertEqual(2001, response[0].yearNumber)
+
+        response = RecordAllTimeCalculator.getHighestScores(
+            league, 2, yearNumberStart=2000, yearNumberEnd=2000, weekNumberEnd=1
+        )
+        self.assertEqual([100.3, 90.1], [record.value for record in response])
+
+    def test_getBiggestBlowouts_fixedPointAndFloatBackends(self):
+        league = self.__getLeague()
+
+        response = RecordAllTimeCalculator.getBiggestBlowouts(
+            league, 3, numericBackend="FIXED_POINT"
+        )
+        self.assertEqual(
+            [Deci("59.50"), Deci("24.50"), Deci("10.20")], [r.value for r in response]
+        )
+
+        response = RecordAllTimeCalculator.getBiggestBlowouts(
+            league, 3, numericBackend="FLOAT"
+        )
+        self.assertEqual(
+            [league.owners[0].id, league.owners[1].id, league.owners[0].id],
+            [r.ownerId for r in response],
+        )
+
+    def test_getRecordBook_matchesEachRecord(self):
+        league = self.__getLeague()
+
+        response = RecordAllTimeCalculator.getRecordBook(league, 3)
+
+        for recordName, function in (
+            ("highestScores", RecordAllTimeCalculator.getHighestScores),
+            ("lowestScores", RecordAllTimeCalculator.getLowestScores),
+            ("biggestBlowouts", RecordAllTimeCalculator.getBiggestBlowouts),
+            ("narrowestWins", RecordAllTimeCalculator.getNarrowestWins),
+            (
+                "highestCombinedScores",
+                RecordAllTimeCalculator.getHighestCombinedScores,
+            ),
+        ):
+            expected = function(league, 3)
+            self.assertEqual(
+                [(r.matchup.id, r.teamId, r.value) for r in expected],
+                [(r.matchup.id, r.teamId, r.value) for r in response[recordName]],
+            )
+
+    def test_getHighestScores_invalidNumberOfRecords_raisesException(self):
+        league = self.__getLeague()
+
+        with self.assertRaises(ValueError) as context:
+            RecordAllTimeCalculator.getHighestScores(league, 0)
+        self.assertEqual(
+            "'numberOfRecords' must be at least 1.", str(context.exception)
+        )
+
+        with self.assertRaises(ValueError) as context:
+            RecordAllTimeCalculator.getHighestScores(league, "10")
+        self.assertEqual(
+            "'numberOfRecords' must be type 'int', not 'str'.", str(context.exception)
+        )
+
+    def test_getNarrowestWins_marginsComparedExactly(self):
+        owners, teams = getNDefaultOwnersAndTeams(2)
+        # as floats, 0.3 - 0.1 is more than 10.2 - 10.0, but both margins are 0.2
+        weeks = [
+            Week(
+                weekNumber=weekNumber,
+                matchups=[
+                    Matchup(
+                        teamAId=teams[0].id,
+                        teamBId=teams[1].id,
+                        teamAScore=teamAScore,
+                        teamBScore=teamBScore,
+                    )
+                ],
+            )
+            for weekNumber, teamAScore, teamBScore in (
+                (1, 5.5, 5.0),
+                (2, 0.3, 0.1),
+                (3, 10.2, 10.0),
+            )
+        ]
+        league = League(
+            name="TEST",
+            owners=owners,
+            years=[Year(yearNumber=2000, teams=teams, weeks=weeks)],
+        )
+
+        response = RecordAllTimeCalculator.getNarrowestWins(league, 2)
+
+        self.assertEqual([2, 3], [record.weekNumber for record in response])
+        self.assertEqual([Deci("0.2"), Deci("0.2")], [r.value for r in response])
+
+    def test_getTopPositionsWithTolerance_onlyComparesCandidates(self):
+        approximateKeys = numpy.arange(1000, dtype=numpy.float64)
+        comparedPositions = list()
+
+        def getKey(i: int) -> Deci:
+            comparedPositions.append(i)
+            return Deci(i)
+
+        response = RecordAllTimeCalculator._getTopPositionsWithTolerance(
+            approximateKeys, 0.25, getKey, 3, largest=True
+        )
+
+        self.assertEqual([999, 998, 997], response)
+        self.assertEqual([997, 998, 999], sorted(comparedPositions))
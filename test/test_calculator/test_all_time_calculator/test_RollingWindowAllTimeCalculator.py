@@ -0,0 +1,151 @@
+import unittest
+
+from leeger.calculator.all_time_calculator import (
+    AWALAllTimeCalculator,
+    PointsScoredAllTimeCalculator,
+    RollingWindowAllTimeCalculator,
+    ScoringStandardDeviationAllTimeCalculator,
+    SingleScoreAllTimeCalculator,
+)
+from leeger.enum.MatchupType import MatchupType
+from leeger.model.league import YearSettings
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from test.helper.prototypes import getNDefaultOwnersAndTeams, getTeamsFromOwners
+
+
+class TestRollingWindowAllTimeCalculator(unittest.TestCase):
+    ROLLING_FUNCTION_AND_FUNCTION = [
+        (
+            RollingWindowAllTimeCalculator.getRollingPointsScoredPerGame,
+            PointsScoredAllTimeCalculator.getPointsScoredPerGame,
+        ),
+        (
+            RollingWindowAllTimeCalculator.getRollingAWALPerGame,
+            AWALAllTimeCalculator.getAWALPerGame,
+        ),
+        (
+            RollingWindowAllTimeCalculator.getRollingMaxScore,
+            SingleScoreAllTimeCalculator.getMaxScore,
+        ),
+        (
+            RollingWindowAllTimeCalculator.getRollingMinScore,
+            SingleScoreAllTimeCalculator.getMinScore,
+        ),
+        (
+            RollingWindowAllTimeCalculator.getRollingScoringStandardDeviation,
+            ScoringStandardDeviationAllTimeCalculator.getScoringStandardDeviation,
+        ),
+    ]
+
+    @staticmethod
+    def __getLeague() -> League:
+        owners, teamsA = getNDefaultOwnersAndTeams(4)
+        teamsB = getTeamsFromOwners(owners)
+        years = list()
+        for yearNumber, teams in ((2000, teamsA), (2001, teamsB)):
+            weeks = list()
+            for weekNumber, (matchupType, multiWeekMatchupId) in enumerate(
+                [
+                    (MatchupType.REGULAR_SEASON, None),
+                    (MatchupType.REGULAR_SEASON, None),
+                    (MatchupType.PLAYOFF, "1"),
+                    (MatchupType.PLAYOFF, "1"),
+                ],
+                start=1,
+            ):
+                weeks.append(
+                    Week(
+                        weekNumber=weekNumber,
+                        matchups=[
+                            Matchup(
+                                teamAId=teams[0].id,
+                                teamBId=teams[1].id,
+                                teamAScore=100 + (yearNumber + weekNumber * 7) % 5,
+                                teamBScore=100.5 + weekNumber * 3 % 4,
+                                matchupType=matchupType,
+                                multiWeekMatchupId=multiWeekMatchupId,
+                            ),
+                            Matchup(
+                                teamAId=teams[2].id,
+                                teamBId=teams[3].id,
+                                teamAScore=90.25 + weekNumber * 11 % 6,
+                                teamBScore=yearNumber - 1900 - weekNumber,
+                                matchupType=matchupType,
+                            ),
+                        ],
+                    )
+                )
+            years.append(
+                Year(
+                    yearNumber=yearNumber,
+                    teams=teams,
+                    weeks=weeks,
+                    yearSettings=YearSettings(leagueMedianGames=yearNumber == 2001),
+                )
+            )
+        return League(name="TEST", owners=owners, years=years)
+
+    def __assertMatchesFunctionForEachWindow(
+        self, league: League, windowSize: int, **kwargs
+    ):
+        weeks = [
+            (year.yearNumber, week.weekNumber)
+            for year in league.years
+            for week in year.weeks
+        ]
+        if "weekNumberStart" in kwargs:
+            weeks = weeks[weeks.index((2000, kwargs["weekNumberStart"])) :]
+        for rollingFunction, function in self.ROLLING_FUNCTION_AND_FUNCTION:
+            response = rollingFunction(league, windowSize, **kwargs)
+            for i, (yearNumberEnd, weekNumberEnd) in enumerate(weeks):
+                yearNumberStart, weekNumberStart = weeks[max(0, i - windowSize + 1)]
+                expected = function(
+                    league,
+                    **kwargs
+                    | {
+                        "yearNumberStart": yearNumberStart,
+                        "weekNumberStart": weekNumberStart,
+                        "yearNumberEnd": yearNumberEnd,
+                        "weekNumberEnd": weekNumberEnd,
+                    },
+                )
+                with self.subTest(
+                    function=rollingFunction.__name__,
+                    windowSize=windowSize,
+                    yearNumberEnd=yearNumberEnd,
+                    weekNumberEnd=weekNumberEnd,
+                ):
+                    self.assertEqual(
+                        repr(expected),
+                        repr({ownerId: response[ownerId][i] for ownerId in response}),
+                    )
+
+    def test_rollingFunctions_matchFunctionForEachWindow(self):
+        league = self.__getLeague()
+        for windowSize in (1, 3, 10):
+            self.__assertMatchesFunctionForEachWindow(league, windowSize)
+
+    def test_rollingFunctions_withFilters_matchFunctionForEachWindow(self):
+        league = self.__getLeague()
+        for kwargs in (
+            {"weekNumberStart": 2},
+            {"onlyRegularSeason": True},
+            {"onlyPostSeason": True},
+        ):
+            self.__assertMatchesFunctionForEachWindow(league, 3, **kwargs)
+
+    def test_getRollingMinScore_windowSpansYears(self):
+        league = self.__getLeague()
+        response = RollingWindowAllTimeCalculator.getRollingMinScore(league, 2)
+        ownerId = league.owners[3].id
+        self.assertEqual([99, 98, 97, 96, 96, 99, 98, 97], response[ownerId])
+
+    def test_rollingFunctions_invalidWindowSize_raisesException(self):
+        league = self.__getLeague()
+        for rollingFunction, _ in self.ROLLING_FUNCTION_AND_FUNCTION:
+            with self.assertRaises(ValueError) as context:
+                rollingFunction(league, 0)
+            self.assertEqual("'windowSize' must be at least 1.", str(context.exception))
@@ -1090,3 +1090,41 @@ class TestSSLAllTimeCalculator(unittest.TestCase):
         self.assertEqual(2, len(response.keys()))
         self.assertEqual(Deci("0"), response[owners[0].id])
         self.assertEqual(Deci("0"), response[owners[1].id])
+
+    def test__getAdjustedTeamScoreAndTeamSuccess_happyPath(self):
+        owners, teamsA = getNDefaultOwnersAndTeams(2)
+        teamsB = getTeamsFromOwners(owners)
+
+        matchup1_a = Matchup(
+            teamAId=teamsA[0].id, teamBId=teamsA[1].id, teamAScore=1, teamBScore=2
+        )
+        week1_a = Week(weekNumber=1, matchups=[matchup1_a])
+        matchup2_a = Matchup(
+            teamAId=teamsA[0].id, teamBId=teamsA[1].id, teamAScore=3, teamBScore=2
+        )
+        week2_a = Week(weekNumber=2, matchups=[matchup2_a])
+        yearA = Year(yearNumber=2000, teams=teamsA, weeks=[week1_a, week2_a])
+
+        matchup1_b = Matchup(
+            teamAId=teamsB[0].id,
+            teamBId=teamsB[1].id,
+            teamAScore=10,
+            teamBScore=2,
+            matchupType=MatchupType.PLAYOFF,
+        )
+        week1_b = Week(weekNumber=1, matchups=[matchup1_b])
+        yearB = Year(yearNumber=2001, teams=teamsB, weeks=[week1_b])
+
+        league = League(name="TEST", owners=owners, years=[yearA, yearB])
+
+        (
+            adjustedTeamScore,
+            adjustedTeamSuccess,
+        ) = SSLAllTimeCalculator._getAdjustedTeamScoreAndTeamSuccess(league)
+
+        self.assertEqual(
+            SSLAllTimeCalculator.getAdjustedTeamScore(league), adjustedTeamScore
+        )
+        self.assertEqual(
+            SSLAllTimeCalculator.getAdjustedTeamSuccess(league), adjustedTeamSuccess
+        )
@@ -1,10 +1,12 @@
 import math
 import unittest
+from unittest.mock import patch
 
 from leeger.calculator.all_time_calculator.SmartWinsAllTimeCalculator import (
     SmartWinsAllTimeCalculator,
 )
 from leeger.enum.MatchupType import MatchupType
+from leeger.model.frame.YearFrame import YearFrame
 from leeger.model.league.League import League
 from leeger.model.league.Matchup import Matchup
 from leeger.model.league.Week import Week
@@ -135,6 +137,43 @@ class TestSmartWinsAllTimeCalculator(unittest.TestCase):
         self.assertEqual(Deci("1.8"), response[owners[4].id])
         self.assertEqual(Deci("2.8"), response[owners[5].id])
 
+    def test_getSmartWins_yearAdded_onlyNewYearIsCalculated(self):
+        owners, _ = getNDefaultOwnersAndTeams(2)
+
+        def getYear(yearNumber: int, teamAScore: float, teamBScore: float) -> Year:
+            teams = getTeamsFromOwners(owners)
+            matchup = Matchup(
+                teamAId=teams[0].id,
+                teamBId=teams[1].id,
+                teamAScore=teamAScore,
+                teamBScore=teamBScore,
+            )
+            return Year(
+                yearNumber=yearNumber,
+                teams=teams,
+                weeks=[Week(weekNumber=1, matchups=[matchup])],
+            )
+
+        league = League(
+            name="TEST", owners=owners, years=[getYear(2000, 1, 2), getYear(2001, 3, 4)]
+        )
+        SmartWinsAllTimeCalculator.getSmartWins(league)
+
+        league.years.append(getYear(2002, 5, 6))
+        with patch.object(
+            YearFrame, "fromYear", wraps=YearFrame.fromYear
+        ) as mockFromYear:
+            response = SmartWinsAllTimeCalculator.getSmartWins(league)
+
+        # the Years that were already calculated are merged, not calculated again
+        mockFromYear.assert_called_once_with(league.years[2])
+        self.assertEqual(Deci("1.2"), response[owners[0].id])
+        self.assertEqual(Deci("1.8"), response[owners[1].id])
+        self.assertEqual(
+            response,
+            SmartWinsAllTimeCalculator.getSmartWins(League.fromJson(league.toJson())),
+        )
+
     def test_getSmartWins_noneIfNoGamesPlayed(self):
         owners, teamsA = getNDefaultOwnersAndTeams(3)
 
@@ -2697,3 +2736,51 @@ class TestSmartWinsAllTimeCalculator(unittest.TestCase):
         self.assertEqual(Deci("0.3571428571428571428571428571"), response[owners[3].id])
         self.assertEqual(Deci("0.9285714285714285714285714285"), response[owners[4].id])
         self.assertEqual(Deci("0.642857142857142857142857143"), response[owners[5].id])
+
+    def test_getSmartWins_floatNumericBackend(self):
+        owners, teamsA = getNDefaultOwnersAndTeams(4)
+        teamsB = getTeamsFromOwners(owners)
+
+        years = list()
+        for yearNumber, teams, scores in (
+            (2000, teamsA, (1.1, 2.2, 3.3, 2.2)),
+            (2001, teamsB, (4.4, 0.7, 1.9, 5.5)),
+        ):
+            week1 = Week(
+                weekNumber=1,
+                matchups=[
+                    Matchup(
+                        teamAId=teams[0].id,
+                        teamBId=teams[1].id,
+                        teamAScore=scores[0],
+                        teamBScore=scores[1],
+                    ),
+                    Matchup(
+                        teamAId=teams[2].id,
+                        teamBId=teams[3].id,
+                        teamAScore=scores[2],
+                        teamBScore=scores[3],
+                    ),
+                ],
+            )
+            years.append(Year(yearNumber=yearNumber, teams=teams, weeks=[week1]))
+
+        league = League(name="TEST", owners=owners, years=years)
+
+        for responseDecimal, responseFloat in [
+            (
+                SmartWinsAllTimeCalculator.getSmartWins(league),
+                SmartWinsAllTimeCalculator.getSmartWins(league, numericBackend="float"),
+            ),
+            (
+                SmartWinsAllTimeCalculator.getOpponentSmartWins(league),
+                SmartWinsAllTimeCalculator.getOpponentSmartWins(
+                    league, numericBackend="float"
+                ),
+            ),
+        ]:
+            self.assertEqual(responseDecimal.keys(), responseFloat.keys())
+            for ownerId, value in responseDecimal.items():
+                self.assertAlmostEqual(
+                    float(value), float(responseFloat[ownerId]), places=9
+                )
@@ -0,0 +1,110 @@
+import unittest
+
+from leeger.calculator.all_time_calculator import StreakAllTimeCalculator
+from leeger.model.league.League import League
+from test.helper.prototypes import getNDefaultOwnersAndTeams, getYearWithNDefaultTeams
+
+
+class TestStreakAllTimeCalculator(unittest.TestCase):
+    @staticmethod
+    def __getLeague() -> League:
+        """
+        Outcomes in the order they were played (2000 | 2001):
+            owner 1: W W L | L L
+            owner 2: L T W | W W
+            owner 3: W L L | W L
+            owner 4: L T W | L W
+        """
+        owners, _ = getNDefaultOwnersAndTeams(4)
+        yearA, _ = getYearWithNDefaultTeams(
+            4,
+            [
+                [(0, 1, 100, 90), (2, 3, 80, 70)],
+                [(0, 2, 110, 90), (1, 3, 85, 85)],
+                [(0, 3, 70, 95), (1, 2, 100, 100, {"teamAHasTiebreaker": True})],
+            ],
+            owners=owners,
+        )
+        yearB, _ = getYearWithNDefaultTeams(
+            4,
+            [
+                [(1, 0, 100, 90), (2, 3, 90, 80)],
+                [(1, 2, 100, 90), (3, 0, 95, 85)],
+            ],
+            owners=owners,
+            yearNumber=2001,
+        )
+        return League(name="TEST", owners=owners, years=[yearA, yearB])
+
+    def test_getLongestWinStreak_happyPath(self):
+        league = self.__getLeague()
+        owners = league.owners
+
+        response = StreakAllTimeCalculator.getLongestWinStreak(league)
+
+        self.assertIsInstance(response, dict)
+        self.assertEqual(4, len(response.keys()))
+        self.assertEqual(2, response[owners[0].id])
+        # the streak carries over into the next Year
+        self.assertEqual(3, response[owners[1].id])
+        self.assertEqual(1, response[owners[2].id])
+        self.assertEqual(1, response[owners[3].id])
+
+    def test_getLongestWinStreak_yearNumberStart(self):
+        league = self.__getLeague()
+        owners = league.owners
+
+        response = StreakAllTimeCalculator.getLongestWinStreak(
+            league, yearNumberStart=2001
+        )
+
+        self.assertEqual(0, response[owners[0].id])
+        self.assertEqual(2, response[owners[1].id])
+        self.assertEqual(1, response[owners[2].id])
+        self.assertEqual(1, response[owners[3].id])
+
+    def test_getLongestLossStreak_happyPath(self):
+        league = self.__getLeague()
+        owners = league.owners
+
+        response = StreakAllTimeCalculator.getLongestLossStreak(league)
+
+        self.assertEqual(3, response[owners[0].id])
+        self.assertEqual(1, response[owners[1].id])
+        self.assertEqual(2, response[owners[2].id])
+        self.assertEqual(1, response[owners[3].id])
+
+    def test_getCurrentStreak_happyPath(self):
+        league = self.__getLeague()
+        owners = league.owners
+
+        response = StreakAllTimeCalculator.getCurrentStreak(league)
+
+        self.assertEqual(-3, response[owners[0].id])
+        self.assertEqual(3, response[owners[1].id])
+        self.assertEqual(-1, response[owners[2].id])
+        self.assertEqual(1, response[owners[3].id])
+
+    def test_getCurrentStreak_weekNumberEnd(self):
+        league = self.__getLeague()
+        owners = league.owners
+
+        response = StreakAllTimeCalculator.getCurrentStreak(
+            league, yearNumberEnd=2000, weekNumberEnd=2
+        )
+
+        self.assertEqual(2, response[owners[0].id])
+        self.assertEqual(0, response[owners[1].id])
+        self.assertEqual(-1, response[owners[2].id])
+        self.assertEqual(0, response[owners[3].id])
+
+    def test_getLongestStreakAboveLeagueMedian_happyPath(self):
+        league = self.__getLeague()
+        owners = league.owners
+
+        response = StreakAllTimeCalculator.getLongestStreakAboveLeagueMedian(league)
+
+        self.assertEqual(2, response[owners[0].id])
+        self.assertEqual(3, response[owners[1].id])
+        self.assertEqual(2, response[owners[2].id])
+        self.assertEqual(1, response[owners[3].id])
@@ -0,0 +1,94 @@
+import unittest
+
+from leeger.calculator.all_time_calculator import StrengthOfScheduleAllTimeCalculator
+from leeger.calculator.year_calculator import StrengthOfScheduleYearCalculator
+from leeger.model.league.League import League
+from leeger.util.Deci import Deci
+from test.helper.prototypes import getNDefaultOwnersAndTeams, getYearWithNDefaultTeams
+
+
+class TestStrengthOfScheduleAllTimeCalculator(unittest.TestCase):
+    @staticmethod
+    def __getLeague() -> League:
+        """
+        Points Scored per game (2000 | 2001):
+            owner 1: 100 | 90
+            owner 2: 80 | 110
+            owner 3: 90 | 70
+            owner 4: 70 | 100
+        """
+        owners, _ = getNDefaultOwnersAndTeams(4)
+        yearA, _ = getYearWithNDefaultTeams(
+            4,
+            [
+                [(0, 1, 100, 80), (2, 3, 90, 70)],
+                [(0, 2, 100, 90), (1, 3, 80, 70)],
+            ],
+            owners=owners,
+        )
+        yearB, _ = getYearWithNDefaultTeams(
+            4, [[(0, 3, 90, 100), (1, 2, 110, 70)]], owners=owners, yearNumber=2001
+        )
+        return League(name="TEST", owners=owners, years=[yearA, yearB])
+
+    def test_getOpponentsAveragePointsScoredPerGame_happyPath(self):
+        league = self.__getLeague()
+        owners = league.owners
+
+        response = (
+            StrengthOfScheduleAllTimeCalculator.getOpponentsAveragePointsScoredPerGame(
+                league
+            )
+        )
+
+        self.assertIsInstance(response, dict)
+        self.assertEqual(4, len(response.keys()))
+        # each opponent's Points Scored per game is from the Year the game was played
+        self.assertEqual(Deci("90"), response[owners[0].id])
+        self.assertEqual(Deci("80"), response[owners[1].id])
+        self.assertEqual(Deci("280") / Deci("3"), response[owners[2].id])
+        self.assertEqual(Deci("260") / Deci("3"), response[owners[3].id])
+
+    def test_getOpponentsAveragePointsScoredPerGame_yearNumberStart(self):
+        league = self.__getLeague()
+        owners = league.owners
+
+        response = (
+            StrengthOfScheduleAllTimeCalculator.getOpponentsAveragePointsScoredPerGame(
+                league, yearNumberStart=2001
+            )
+        )
+
+        self.assertEqual(Deci("100"), response[owners[0].id])
+        self.assertEqual(Deci("70"), response[owners[1].id])
+
+    def test_getOpponentsAverage_sameAsYearCalculatorForOneYear(self):
+        league = self.__getLeague()
+        year = league.years[0]
+
+        for allTimeFunction, yearFunction in (
+            (
+                StrengthOfScheduleAllTimeCalculator.getOpponentsAverageAWALPerGame,
+                StrengthOfScheduleYearCalculator.getOpponentsAverageAWALPerGame,
+            ),
+            (
+                StrengthOfScheduleAllTimeCalculator.getOpponentsAverageWinPercentage,
+                StrengthOfScheduleYearCalculator.getOpponentsAverageWinPercentage,
+            ),
+        ):
+            allTimeResponse = allTimeFunction(
+                league, yearNumberStart=2000, yearNumberEnd=2000
+            )
+            yearResponse = yearFunction(year)
+            for team in year.teams:
+                self.assertEqual(yearResponse[team.id], allTimeResponse[team.ownerId])
+
+    def test_getOpponentsAverage_noGamesInRange(self):
+        league = self.__getLeague()
+
+        response = StrengthOfScheduleAllTimeCalculator.getOpponentsAverageWinPercentage(
+            league, onlyPostSeason=True
+        )
+
+        for owner in league.owners:
+            self.assertIsNone(response[owner.id])
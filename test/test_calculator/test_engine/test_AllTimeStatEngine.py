@@ -0,0 +1,234 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+from leeger.calculator.all_time_calculator import (
+    AWALAllTimeCalculator,
+    GameOutcomeAllTimeCalculator,
+    PlusMinusAllTimeCalculator,
+    PointsScoredAllTimeCalculator,
+    ScoringShareAllTimeCalculator,
+    ScoringStandardDeviationAllTimeCalculator,
+    SingleScoreAllTimeCalculator,
+    SmartWinsAllTimeCalculator,
+    SSLAllTimeCalculator,
+    TeamSummaryAllTimeCalculator,
+)
+from leeger.calculator.engine.AllTimeStatEngine import AllTimeStatEngine
+from leeger.enum.MatchupType import MatchupType
+from leeger.model.league import YearSettings
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.model.stat.AllTimeStatSheet import AllTimeStatSheet
+from test.helper.prototypes import getNDefaultOwnersAndTeams, getTeamsFromOwners
+
+
+class TestAllTimeStatEngine(unittest.TestCase):
+    STAT_NAME_AND_FUNCTION = [
+        ("gamesPlayed", TeamSummaryAllTimeCalculator.getGamesPlayed),
+        ("wins", GameOutcomeAllTimeCalculator.getWins),
+        ("losses", GameOutcomeAllTimeCalculator.getLosses),
+        ("ties", GameOutcomeAllTimeCalculator.getTies),
+        ("winPercentage", GameOutcomeAllTimeCalculator.getWinPercentage),
+        ("wal", GameOutcomeAllTimeCalculator.getWAL),
+        ("walPerGame", GameOutcomeAllTimeCalculator.getWALPerGame),
+        ("awal", AWALAllTimeCalculator.getAWAL),
+        ("awalPerGame", AWALAllTimeCalculator.getAWALPerGame),
+        ("opponentAWAL", AWALAllTimeCalculator.getOpponentAWAL),
+        ("opponentAWALPerGame", AWALAllTimeCalculator.getOpponentAWALPerGame),
+        ("smartWins", SmartWinsAllTimeCalculator.getSmartWins),
+        ("smartWinsPerGame", SmartWinsAllTimeCalculator.getSmartWinsPerGame),
+        ("opponentSmartWins", SmartWinsAllTimeCalculator.getOpponentSmartWins),
+        (
+            "opponentSmartWinsPerGame",
+            SmartWinsAllTimeCalculator.getOpponentSmartWinsPerGame,
+        ),
+        ("pointsScored", PointsScoredAllTimeCalculator.getPointsScored),
+        ("pointsScoredPerGame", PointsScoredAllTimeCalculator.getPointsScoredPerGame),
+        (
+            "opponentPointsScored",
+            PointsScoredAllTimeCalculator.getOpponentPointsScored,
+        ),
+        (
+            "opponentPointsScoredPerGame",
+            PointsScoredAllTimeCalculator.getOpponentPointsScoredPerGame,
+        ),
+        ("scoringShare", ScoringShareAllTimeCalculator.getScoringShare),
+        (
+            "opponentScoringShare",
+            ScoringShareAllTimeCalculator.getOpponentScoringShare,
+        ),
+        ("maxScoringShare", ScoringShareAllTimeCalculator.getMaxScoringShare),
+        ("minScoringShare", ScoringShareAllTimeCalculator.getMinScoringShare),
+        ("maxScore", SingleScoreAllTimeCalculator.getMaxScore),
+        ("minScore", SingleScoreAllTimeCalculator.getMinScore),
+        (
+            "scoringStandardDeviation",
+            ScoringStandardDeviationAllTimeCalculator.getScoringStandardDeviation,
+        ),
+        ("plusMinus", PlusMinusAllTimeCalculator.getPlusMinus),
+        ("adjustedTeamScore", SSLAllTimeCalculator.getAdjustedTeamScore),
+        ("adjustedTeamSuccess", SSLAllTimeCalculator.getAdjustedTeamSuccess),
+        ("adjustedTeamLuck", SSLAllTimeCalculator.getAdjustedTeamLuck),
+        ("totalGames", TeamSummaryAllTimeCalculator.getTotalGames),
+        ("leagueMedianWins", GameOutcomeAllTimeCalculator.getLeagueMedianWins),
+        (
+            "opponentLeagueMedianWins",
+            GameOutcomeAllTimeCalculator.getOpponentLeagueMedianWins,
+        ),
+    ]
+
+    @staticmethod
+    def __getLeague(*, leagueMedianGames: bool) -> League:
+        owners, teamsA = getNDefaultOwnersAndTeams(4)
+        teamsB = getTeamsFromOwners(owners)
+
+        yearA = Year(
+            yearNumber=2000,
+            teams=teamsA,
+            weeks=[
+                Week(
+                    weekNumber=1,
+                    matchups=[
+                        Matchup(
+                            teamAId=teamsA[0].id,
+                            teamBId=teamsA[1].id,
+                            teamAScore=100.1,
+                            teamBScore=90.2,
+                        ),
+                        Matchup(
+                            teamAId=teamsA[2].id,
+                            teamBId=teamsA[3].id,
+                            teamAScore=95,
+                            teamBScore=95,
+                        ),
+                    ],
+                ),
+                Week(
+                    weekNumber=2,
+                    matchups=[
+                        Matchup(
+                            teamAId=teamsA[0].id,
+                            teamBId=teamsA[2].id,
+                            teamAScore=80.5,
+                            teamBScore=120.4,
+                        ),
+                        Matchup(
+                            teamAId=teamsA[1].id,
+                            teamBId=teamsA[3].id,
+                            teamAScore=101.7,
+                            teamBScore=70,
+                        ),
+                    ],
+                ),
+            ],
+            yearSettings=YearSettings(leagueMedianGames=leagueMedianGames),
+        )
+        yearB = Year(
+            yearNumber=2001,
+            teams=teamsB,
+            weeks=[
+                Week(
+                    weekNumber=1,
+                    matchups=[
+                        Matchup(
+                            teamAId=teamsB[0].id,
+                            teamBId=teamsB[3].id,
+                            teamAScore=110,
+                            teamBScore=99.9,
+                        ),
+                        Matchup(
+                            teamAId=teamsB[1].id,
+                            teamBId=teamsB[2].id,
+                            teamAScore=60.6,
+                            teamBScore=130,
+                        ),
+                    ],
+                ),
+                Week(
+                    weekNumber=2,
+                    matchups=[
+                        Matchup(
+                            teamAId=teamsB[0].id,
+                            teamBId=teamsB[2].id,
+                            teamAScore=88.8,
+                            teamBScore=90,
+                            matchupType=MatchupType.PLAYOFF,
+                        ),
+                    ],
+                ),
+            ],
+        )
+        return League(name="TEST", owners=owners, years=[yearA, yearB])
+
+    def test_getAllTimeStatSheet_happyPath(self):
+        league = self.__getLeague(leagueMedianGames=False)
+
+        response = AllTimeStatEngine(league).getAllTimeStatSheet()
+
+        self.assertIsInstance(response, AllTimeStatSheet)
+        self.assertIsNone(response.totalGames)
+        self.assertIsNone(response.leagueMedianWins)
+        self.assertIsNone(response.opponentLeagueMedianWins)
+
+    def test_getStats_matchesCalculators(self):
+        for leagueMedianGames in (False, True):
+            league = self.__getLeague(leagueMedianGames=leagueMedianGames)
+            for kwargs in (dict(), {"onlyRegularSeason": True}):
+                response = AllTimeStatEngine(league, **kwargs).getStats()
+                for statName, function in self.STAT_NAME_AND_FUNCTION:
+                    with self.subTest(
+                        statName=statName, leagueMedianGames=leagueMedianGames, **kwargs
+                    ):
+                        # compare the repr so Decis must have the same exponent, not just the same value
+                        self.assertEqual(
+                            repr(function(league, **kwargs)), repr(response[statName])
+                        )
+
+    def test_getStats_onlyNeededStatsCalculated(self):
+        league = self.__getLeague(leagueMedianGames=False)
+
+        with (
+            patch.object(
+                SSLAllTimeCalculator,
+                "_getAdjustedTeamScoreAndTeamSuccess",
+                wraps=SSLAllTimeCalculator._getAdjustedTeamScoreAndTeamSuccess,
+            ) as mockGetAdjustedTeamScoreAndTeamSuccess,
+            patch.object(
+                SmartWinsAllTimeCalculator,
+                "getSmartWins",
+                wraps=SmartWinsAllTimeCalculator.getSmartWins,
+            ) as mockGetSmartWins,
+        ):
+            response = AllTimeStatEngine(league).getStats(
+                ["adjustedTeamScore", "adjustedTeamLuck"]
+            )
+
+        self.assertEqual(
+            ["adjustedTeamScore", "adjustedTeamLuck"], list(response.keys())
+        )
+        # Adjusted Team Score is shared with Adjusted Team Luck instead of calculated again
+        mockGetAdjustedTeamScoreAndTeamSuccess.assert_called_once()
+        mockGetSmartWins.assert_not_called()
+
+    def test_getStats_workersGiven_matchesCalculatorsAndSharesOneProcessPool(self):
+        league = self.__getLeague(leagueMedianGames=True)
+
+        with patch(
+            "leeger.util.YearExecutor.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+        ) as mockProcessPoolExecutor:
+            response = AllTimeStatEngine(league, workers=2).getStats()
+
+        mockProcessPoolExecutor.assert_called_once_with(max_workers=2)
+        for statName, function in self.STAT_NAME_AND_FUNCTION:
+            with self.subTest(statName=statName):
+                self.assertEqual(repr(function(league)), repr(response[statName]))
+
+    def test_getStats_unknownStat_raisesException(self):
+        league = self.__getLeague(leagueMedianGames=False)
+
+        with self.assertRaises(ValueError) as context:
+            AllTimeStatEngine(league).getStats(["teamLuck"])
+        self.assertEqual("'teamLuck' is not a registered stat.", str(context.exception))
@@ -0,0 +1,239 @@
+import unittest
+
+import numpy
+
+from leeger.calculator.engine.EloRatingEngine import EloRatingEngine
+from leeger.enum.MatchupType import MatchupType
+from leeger.exception.DoesNotExistException import DoesNotExistException
+from leeger.model.league.League import League
+from test.helper.prototypes import getNDefaultOwnersAndTeams, getYearWithNDefaultTeams
+
+
+class TestEloRatingEngine(unittest.TestCase):
+    @staticmethod
+    def __getLeague() -> League:
+        owners, _ = getNDefaultOwnersAndTeams(4)
+        yearA, _ = getYearWithNDefaultTeams(
+            4,
+            [
+                [(0, 1, 100, 90), (2, 3, 80, 70)],
+                [(0, 2, 110, 90), (1, 3, 85, 85)],
+                [(0, 3, 70, 95), (1, 2, 100, 90)],
+            ],
+            owners=owners,
+        )
+        yearB, _ = getYearWithNDefaultTeams(
+            4,
+            [
+                [(1, 0, 100, 90), (2, 3, 90, 80)],
+                [(1, 2, 100, 90), (3, 0, 95, 85)],
+            ],
+            owners=owners,
+            yearNumber=2001,
+        )
+        return League(name="TEST", owners=owners, years=[yearA, yearB])
+
+    def test_addWeek_happyPath(self):
+        owners, _ = getNDefaultOwnersAndTeams(4)
+        year, _ = getYearWithNDefaultTeams(
+            4, [[(0, 1, 100, 90), (2, 3, 80, 80)]], owners=owners
+        )
+        week = year.weeks[0]
+
+        eloRatingEngine = EloRatingEngine()
+        eloRatingEngine.addWeek(year, week)
+        response = eloRatingEngine.getRatings()
+
+        self.assertIsInstance(response, dict)
+        self.assertEqual(4, len(response.keys()))
+        self.assertAlmostEqual(1516, response[owners[0].id])
+        self.assertAlmostEqual(1484, response[owners[1].id])
+        # a tie between equal ratings doesn't change either rating
+        self.assertAlmostEqual(1500, response[owners[2].id])
+        self.assertAlmostEqual(1500, response[owners[3].id])
+
+    def test_addWeek_usesCurrentRatings(self):
+        owners, _ = getNDefaultOwnersAndTeams(2)
+        year, _ = getYearWithNDefaultTeams(
+            2, [[(0, 1, 100, 90)], [(0, 1, 100, 90)]], owners=owners
+        )
+
+        eloRatingEngine = EloRatingEngine(kFactor=20)
+        eloRatingEngine.addYear(year)
+
+        expectedChange = 20 * (1 - 1 / (1 + 10 ** (-20 / 400)))
+        self.assertAlmostEqual(
+            1510 + expectedChange, eloRatingEngine.getRating(owners[0].id)
+        )
+        self.assertAlmostEqual(
+            1490 - expectedChange, eloRatingEngine.getRating(owners[1].id)
+        )
+
+    def test_addWeek_tiebreaker(self):
+        owners, _ = getNDefaultOwnersAndTeams(2)
+        year, _ = getYearWithNDefaultTeams(
+            2, [[(0, 1, 100, 100, {"teamBHasTiebreaker": True})]], owners=owners
+        )
+        week = year.weeks[0]
+
+        eloRatingEngine = EloRatingEngine()
+        eloRatingEngine.addWeek(year, week)
+
+        self.assertAlmostEqual(1484, eloRatingEngine.getRating(owners[0].id))
+        self.assertAlmostEqual(1516, eloRatingEngine.getRating(owners[1].id))
+
+    def test_addWeek_ignoreMatchupsAreSkipped(self):
+        year, _ = getYearWithNDefaultTeams(
+            2, [[(0, 1, 100, 90, {"matchupType": MatchupType.IGNORE})]]
+        )
+        week = year.weeks[0]
+
+        eloRatingEngine = EloRatingEngine()
+        eloRatingEngine.addWeek(year, week)
+
+        self.assertDictEqual(dict(), eloRatingEngine.getRatings())
+        self.assertEqual((1, 0), eloRatingEngine.snapshotRatings.shape)
+
+    def test_addWeek_multiWeekMatchupIsRatedAsOneGame(self):
+        owners, _ = getNDefaultOwnersAndTeams(2)
+        year, _ = getYearWithNDefaultTeams(
+            2,
+            [
+                [(0, 1, 100, 90, {"multiWeekMatchupId": "1"})],
+                [(0, 1, 70, 90, {"multiWeekMatchupId": "1"})],
+            ],
+            owners=owners,
+        )
+        weekA, weekB = year.weeks
+
+        eloRatingEngine = EloRatingEngine()
+        eloRatingEngine.addWeek(year, weekA)
+        # team A is winning after the first week
+        self.assertAlmostEqual(1516, eloRatingEngine.getRating(owners[0].id))
+        eloRatingEngine.addWeek(year, weekB)
+
+        # team A lost 170 - 180, rated from the ratings before the multi-week matchup started
+        self.assertAlmostEqual(1484, eloRatingEngine.getRating(owners[0].id))
+        self.assertAlmostEqual(1516, eloRatingEngine.getRating(owners[1].id))
+        self.assertEqual([1516, 1484], eloRatingEngine.snapshotRatings[:, 0].tolist())
+
+    def test_addWeek_yearRegression(self):
+        owners, _ = getNDefaultOwnersAndTeams(2)
+        yearA, _ = getYearWithNDefaultTeams(2, [[(0, 1, 100, 90)]], owners=owners)
+        yearB, _ = getYearWithNDefaultTeams(
+            2, [[(0, 1, 100, 100)]], owners=owners, yearNumber=2001
+        )
+
+        eloRatingEngine = EloRatingEngine(yearRegression=0.25)
+        eloRatingEngine.addWeek(yearA, yearA.weeks[0])
+        eloRatingEngine.addWeek(yearB, yearB.weeks[0])
+
+        # 1516 is moved to 1512 at the start of 2001, then loses some of it to the tie
+        expectedChange = 32 * (0.5 - 1 / (1 + 10 ** (-24 / 400)))
+        self.assertAlmostEqual(
+            1512 + expectedChange, eloRatingEngine.getRating(owners[0].id)
+        )
+        self.assertAlmostEqual(
+            1488 - expectedChange, eloRatingEngine.getRating(owners[1].id)
+        )
+
+    def test_addWeek_outOfOrder_raisesException(self):
+        year, _ = getYearWithNDefaultTeams(2, [[(0, 1, 100, 90)], [(0, 1, 100, 90)]])
+        weekA, weekB = year.weeks
+
+        eloRatingEngine = EloRatingEngine()
+        eloRatingEngine.addWeek(year, weekB)
+
+        with self.assertRaises(ValueError) as context:
+            eloRatingEngine.addWeek(year, weekA)
+        self.assertEqual(
+            "Week 1 of Year 2000 can't be added after week 2 of Year 2000.",
+            str(context.exception),
+        )
+
+    def test_fromLeague_sameAsAddingEachWeek(self):
+        league = self.__getLeague()
+
+        response = EloRatingEngine.fromLeague(league, kFactor=24, yearRegression=0.5)
+        eloRatingEngine = EloRatingEngine(kFactor=24, yearRegression=0.5)
+        for year in league.years:
+            for week in year.weeks:
+                eloRatingEngine.addWeek(year, week)
+
+        self.assertEqual(eloRatingEngine.getRatings(), response.getRatings())
+        # Elo is zero-sum, so the average rating is always the initial rating
+        self.assertAlmostEqual(1500, numpy.mean(list(response.getRatings().values())))
+
+    def test_snapshots(self):
+        league = self.__getLeague()
+        owners = league.owners
+
+        eloRatingEngine = EloRatingEngine.fromLeague(league)
+
+        self.assertEqual(
+            [2000, 2000, 2000, 2001, 2001],
+            eloRatingEngine.snapshotYearNumbers.tolist(),
+        )
+        self.assertEqual([1, 2, 3, 1, 2], eloRatingEngine.snapshotWeekNumbers.tolist())
+        self.assertEqual((5, 4), eloRatingEngine.snapshotRatings.shape)
+        self.assertEqual(tuple(owner.id for owner in owners), eloRatingEngine.ownerIds)
+        self.assertEqual(
+            eloRatingEngine.getRatings(),
+            eloRatingEngine.getRatingsAfterWeek(2001, 2),
+        )
+        ratingsAfterFirstWeek = eloRatingEngine.getRatingsAfterWeek(2000, 1)
+        self.assertAlmostEqual(1516, ratingsAfterFirstWeek[owners[0].id])
+        self.assertAlmostEqual(1484, ratingsAfterFirstWeek[owners[1].id])
+
+    def test_snapshots_ownersAddedLater(self):
+        owners, _ = getNDefaultOwnersAndTeams(4)
+        year, _ = getYearWithNDefaultTeams(
+            4, [[(0, 1, 100, 90)], [(2, 3, 100, 90)]], owners=owners
+        )
+
+        eloRatingEngine = EloRatingEngine()
+        eloRatingEngine.addYear(year)
+
+        self.assertTrue(numpy.isnan(eloRatingEngine.snapshotRatings[0, 2:]).all())
+        self.assertEqual(
+            {owners[0].id: 1516, owners[1].id: 1484},
+            eloRatingEngine.getRatingsAfterWeek(2000, 1),
+        )
+
+    def test_getRatingsAfterWeek_weekNotAdded_raisesException(self):
+        eloRatingEngine = EloRatingEngine.fromLeague(self.__getLeague())
+
+        with self.assertRaises(DoesNotExistException) as context:
+            eloRatingEngine.getRatingsAfterWeek(2001, 3)
+        self.assertEqual(
+            "Week 3 of Year 2001 has not been added to this EloRatingEngine.",
+            str(context.exception),
+        )
+
+    def test_getRating_ownerNotAdded_raisesException(self):
+        eloRatingEngine = EloRatingEngine()
+
+        with self.assertRaises(DoesNotExistException) as context:
+            eloRatingEngine.getRating("someOwnerId")
+        self.assertEqual(
+            "Owner with ID someOwnerId has not played in any Week added to this EloRatingEngine.",
+            str(context.exception),
+        )
+
+    def test_init_invalidSettings_raisesException(self):
+        with self.assertRaises(ValueError) as context:
+            EloRatingEngine(kFactor=0)
+        self.assertEqual("'kFactor' must be greater than 0.", str(context.exception))
+
+        with self.assertRaises(ValueError) as context:
+            EloRatingEngine(yearRegression=1.5)
+        self.assertEqual(
+            "'yearRegression' must be between 0 and 1.", str(context.exception)
+        )
+
+        with self.assertRaises(ValueError) as context:
+            EloRatingEngine(initialRating="1500")
+        self.assertEqual(
+            "'initialRating' must be type 'int' or 'float', not 'str'.",
+            str(context.exception),
+        )
@@ -0,0 +1,95 @@
+import unittest
+
+from leeger.calculator.engine.StatNode import StatNode
+from leeger.calculator.engine.StatRegistry import StatRegistry
+
+
+class TestStatRegistry(unittest.TestCase):
+    @staticmethod
+    def __getRegistry() -> StatRegistry:
+        registry = StatRegistry()
+
+        @registry.intermediate("shared")
+        def calculateShared(engine):
+            return 1
+
+        @registry.stat("a", inputs=("shared",))
+        def calculateA(engine, shared):
+            return shared + 1
+
+        @registry.stat("b", inputs=("a", "shared"))
+        def calculateB(engine, a, shared):
+            return a + shared
+
+        @registry.stat("c")
+        def calculateC(engine):
+            return 0
+
+        return registry
+
+    def test_getStatNames_happyPath(self):
+        registry = self.__getRegistry()
+
+        self.assertEqual(["a", "b", "c"], registry.getStatNames())
+
+    def test_getNode_happyPath(self):
+        registry = self.__getRegistry()
+
+        node = registry.getNode("b")
+
+        self.assertIsInstance(node, StatNode)
+        self.assertEqual("b", node.name)
+        self.assertEqual(("a", "shared"), node.inputs)
+        self.assertTrue(node.isStat)
+        self.assertFalse(registry.getNode("shared").isStat)
+
+    def test_getCalculationOrder_happyPath(self):
+        registry = self.__getRegistry()
+
+        order = [node.name for node in registry.getCalculationOrder(["b"])]
+
+        self.assertEqual(["shared", "a", "b"], order)
+
+    def test_getCalculationOrder_sharedInputOnlyReturnedOnce(self):
+        registry = self.__getRegistry()
+
+        order = [node.name for node in registry.getCalculationOrder(["a", "b", "a"])]
+
+        self.assertEqual(["shared", "a", "b"], order)
+
+    def test_getCalculationOrder_onlyNeededNodesReturned(self):
+        registry = self.__getRegistry()
+
+        order = [node.name for node in registry.getCalculationOrder(["c"])]
+
+        self.assertEqual(["c"], order)
+
+    def test_getCalculationOrder_unknownStat_raisesException(self):
+        registry = self.__getRegistry()
+
+        with self.assertRaises(ValueError) as context:
+            registry.getCalculationOrder(["bad"])
+        self.assertEqual("'bad' is not a registered stat.", str(context.exception))
+
+    def test_getCalculationOrder_intermediateRequested_raisesException(self):
+        registry = self.__getRegistry()
+
+        with self.assertRaises(ValueError) as context:
+            registry.getCalculationOrder(["shared"])
+        self.assertEqual("'shared' is not a registered stat.", str(context.exception))
+
+    def test_getCalculationOrder_cycle_raisesException(self):
+        registry = StatRegistry()
+        registry.stat("a", inputs=("b",))(lambda engine, b: b)
+        registry.stat("b", inputs=("a",))(lambda engine, a: a)
+
+        with self.assertRaises(ValueError) as context:
+            registry.getCalculationOrder(["a"])
+        self.assertEqual("'a' depends on itself.", str(context.exception))
+
+    def test_register_nameAlreadyRegistered_raisesException(self):
+        registry = self.__getRegistry()
+
+        with self.assertRaises(ValueError) as context:
+            registry.stat("a")
+        self.assertEqual("'a' has already been registered.", str(context.exception))
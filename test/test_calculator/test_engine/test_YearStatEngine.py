@@ -0,0 +1,347 @@
+import unittest
+from unittest.mock import patch
+
+from leeger.calculator.engine.YearStatEngine import YearStatEngine
+from leeger.calculator.year_calculator import (
+    AWALYearCalculator,
+    GameOutcomeYearCalculator,
+    PlusMinusYearCalculator,
+    PointsScoredYearCalculator,
+    ScoringShareYearCalculator,
+    ScoringStandardDeviationYearCalculator,
+    SingleScoreYearCalculator,
+    SmartWinsYearCalculator,
+    SSLYearCalculator,
+    TeamSummaryYearCalculator,
+)
+from leeger.enum.MatchupType import MatchupType
+from leeger.model.league import YearSettings
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.model.stat.YearStatSheet import YearStatSheet
+from test.helper.prototypes import getNDefaultOwnersAndTeams
+
+
+class TestYearStatEngine(unittest.TestCase):
+    STAT_NAME_AND_FUNCTION = [
+        ("gamesPlayed", TeamSummaryYearCalculator.getGamesPlayed),
+        ("wins", GameOutcomeYearCalculator.getWins),
+        ("losses", GameOutcomeYearCalculator.getLosses),
+        ("ties", GameOutcomeYearCalculator.getTies),
+        ("winPercentage", GameOutcomeYearCalculator.getWinPercentage),
+        ("wal", GameOutcomeYearCalculator.getWAL),
+        ("walPerGame", GameOutcomeYearCalculator.getWALPerGame),
+        ("awal", AWALYearCalculator.getAWAL),
+        ("awalPerGame", AWALYearCalculator.getAWALPerGame),
+        ("opponentAWAL", AWALYearCalculator.getOpponentAWAL),
+        ("opponentAWALPerGame", AWALYearCalculator.getOpponentAWALPerGame),
+        ("smartWins", SmartWinsYearCalculator.getSmartWins),
+        ("smartWinsPerGame", SmartWinsYearCalculator.getSmartWinsPerGame),
+        ("opponentSmartWins", SmartWinsYearCalculator.getOpponentSmartWins),
+        (
+            "opponentSmartWinsPerGame",
+            SmartWinsYearCalculator.getOpponentSmartWinsPerGame,
+        ),
+        ("pointsScored", PointsScoredYearCalculator.getPointsScored),
+        ("pointsScoredPerGame", PointsScoredYearCalculator.getPointsScoredPerGame),
+        ("opponentPointsScored", PointsScoredYearCalculator.getOpponentPointsScored),
+        (
+            "opponentPointsScoredPerGame",
+            PointsScoredYearCalculator.getOpponentPointsScoredPerGame,
+        ),
+        ("scoringShare", ScoringShareYearCalculator.getScoringShare),
+        ("opponentScoringShare", ScoringShareYearCalculator.getOpponentScoringShare),
+        ("maxScoringShare", ScoringShareYearCalculator.getMaxScoringShare),
+        ("minScoringShare", ScoringShareYearCalculator.getMinScoringShare),
+        ("maxScore", SingleScoreYearCalculator.getMaxScore),
+        ("minScore", SingleScoreYearCalculator.getMinScore),
+        (
+            "scoringStandardDeviation",
+            ScoringStandardDeviationYearCalculator.getScoringStandardDeviation,
+        ),
+        ("plusMinus", PlusMinusYearCalculator.getPlusMinus),
+        ("teamScore", SSLYearCalculator.getTeamScore),
+        ("teamSuccess", SSLYearCalculator.getTeamSuccess),
+        ("teamLuck", SSLYearCalculator.getTeamLuck),
+    ]
+    LEAGUE_MEDIAN_STAT_NAME_AND_FUNCTION = [
+        ("totalGames", TeamSummaryYearCalculator.getTotalGames),
+        ("leagueMedianWins", GameOutcomeYearCalculator.getLeagueMedianWins),
+        (
+            "opponentLeagueMedianWins",
+            GameOutcomeYearCalculator.getOpponentLeagueMedianWins,
+        ),
+    ]
+
+    def __getYear(self, *, leagueMedianGames: bool) -> Year:
+        _, teams = getNDefaultOwnersAndTeams(6)
+
+        def matchup(teamA, teamB, teamAScore, teamBScore, **kwargs) -> Matchup:
+            return Matchup(
+                teamAId=teamA.id,
+                teamBId=teamB.id,
+                teamAScore=teamAScore,
+                teamBScore=teamBScore,
+                **kwargs,
+            )
+
+        week1 = Week(
+            weekNumber=1,
+            matchups=[
+                matchup(teams[0], teams[1], 100.1, 90.2),
+                matchup(teams[2], teams[3], 95, 95.5),
+                matchup(teams[4], teams[5], 80.3, 110),
+            ],
+        )
+        week2 = Week(
+            weekNumber=2,
+            matchups=[
+                matchup(teams[0], teams[2], 101.7, 101.7),
+                matchup(teams[1], teams[4], 88.8, 120.4),
+                matchup(teams[3], teams[5], 95.5, 70),
+            ],
+        )
+        week3 = Week(
+            weekNumber=3,
+            matchups=[
+                matchup(teams[0], teams[3], 75.25, 99.9),
+                matchup(teams[1], teams[5], 130, 60.6),
+                matchup(teams[2], teams[4], 100.1, 100.2),
+            ],
+        )
+        week4 = Week(
+            weekNumber=4,
+            matchups=[
+                matchup(
+                    teams[0],
+                    teams[1],
+                    50.5,
+                    60.6,
+                    matchupType=MatchupType.PLAYOFF,
+                    multiWeekMatchupId="1",
+                ),
+                matchup(
+                    teams[2], teams[3], 110.1, 90.9, matchupType=MatchupType.PLAYOFF
+                ),
+                matchup(teams[4], teams[5], 70, 80, matchupType=MatchupType.IGNORE),
+            ],
+        )
+        week5 = Week(
+            weekNumber=5,
+            matchups=[
+                matchup(
+                    teams[0],
+                    teams[1],
+                    70.7,
+                    55.5,
+                    matchupType=MatchupType.PLAYOFF,
+                    multiWeekMatchupId="1",
+                ),
+            ],
+        )
+        week6 = Week(
+            weekNumber=6,
+            matchups=[
+                matchup(
+                    teams[0],
+                    teams[2],
+                    99.9,
+                    99.9,
+                    matchupType=MatchupType.CHAMPIONSHIP,
+                    teamAHasTiebreaker=True,
+                ),
+            ],
+        )
+
+        return Year(
+            yearNumber=2000,
+            teams=teams,
+            weeks=[week1, week2, week3, week4, week5, week6],
+            yearSettings=YearSettings(leagueMedianGames=leagueMedianGames),
+        )
+
+    def __assertMatchesCalculators(self, year: Year, **kwargs):
+        yearStatSheet = YearStatEngine(year, **kwargs).getYearStatSheet()
+        statNamesAndFunctions = self.STAT_NAME_AND_FUNCTION
+        if year.yearSettings.leagueMedianGames:
+            statNamesAndFunctions = (
+                statNamesAndFunctions + self.LEAGUE_MEDIAN_STAT_NAME_AND_FUNCTION
+            )
+        for statName, function in statNamesAndFunctions:
+            with self.subTest(statName=statName, **kwargs):
+                # compare the repr so Decis must have the same exponent, not just the same value
+                self.assertEqual(
+                    repr(function(year, **kwargs)),
+                    repr(getattr(yearStatSheet, statName)),
+                )
+
+    def test_getYearStatSheet_happyPath(self):
+        year = self.__getYear(leagueMedianGames=False)
+
+        response = YearStatEngine(year).getYearStatSheet(ownerNames=["a"], years=[2000])
+
+        self.assertIsInstance(response, YearStatSheet)
+        self.assertEqual(["a"], response.ownerNames)
+        self.assertEqual([2000], response.years)
+        self.assertIsNone(response.totalGames)
+        self.assertIsNone(response.leagueMedianWins)
+        self.assertIsNone(response.opponentLeagueMedianWins)
+
+    def test_getYearStatSheet_matchesCalculators(self):
+        filterKwargs = [
+            dict(),
+            {"onlyPostSeason": True},
+            {"weekNumberStart": 2, "weekNumberEnd": 4},
+        ]
+        for leagueMedianGames in (False, True):
+            year = self.__getYear(leagueMedianGames=leagueMedianGames)
+            for kwargs in filterKwargs:
+                self.__assertMatchesCalculators(year, **kwargs)
+            for numericBackend in ("FLOAT", "FIXED_POINT"):
+                self.__assertMatchesCalculators(year, numericBackend=numericBackend)
+
+    def test_getYearStatSheet_multiWeekMatchupsExcluded_raisesException(self):
+        year = self.__getYear(leagueMedianGames=False)
+
+        with self.assertRaises(ValueError) as context:
+            YearStatEngine(year, includeMultiWeekMatchups=False).getYearStatSheet()
+        self.assertEqual(
+            "Multi-Week matchups must be included in this calculation.",
+            str(context.exception),
+        )
+
+    def test_getStats_onlyNeededStatsCalculated(self):
+        year = self.__getYear(leagueMedianGames=False)
+
+        with (
+            patch.object(
+                AWALYearCalculator,
+                "_getAWALFromWeeks",
+                wraps=AWALYearCalculator._getAWALFromWeeks,
+            ) as mockGetAWALFromWeeks,
+            patch.object(
+                SmartWinsYearCalculator,
+                "_getSmartWinsByTeam",
+                wraps=SmartWinsYearCalculator._getSmartWinsByTeam,
+            ) as mockGetSmartWinsByTeam,
+        ):
+            response = YearStatEngine(year).getStats(["awal", "teamLuck"])
+
+        self.assertEqual(["awal", "teamLuck"], list(response.keys()))
+        self.assertEqual(repr(AWALYearCalculator.getAWAL(year)), repr(response["awal"]))
+        self.assertEqual(
+            repr(SSLYearCalculator.getTeamLuck(year)), repr(response["teamLuck"])
+        )
+        # AWAL is shared between the stats and only calculated once, opponent AWAL is not needed
+        mockGetAWALFromWeeks.assert_called_once()
+        mockGetSmartWinsByTeam.assert_not_called()
+
+    def test_getStats_calledTwice_statsNotRecalculated(self):
+        year = self.__getYear(leagueMedianGames=False)
+        engine = YearStatEngine(year)
+
+        with patch.object(
+            SmartWinsYearCalculator,
+            "_getSmartWinsByTeam",
+            wraps=SmartWinsYearCalculator._getSmartWinsByTeam,
+        ) as mockGetSmartWinsByTeam:
+            response1 = engine.getStats(["smartWins"])
+            response2 = engine.getStats(["smartWins", "smartWinsPerGame"])
+
+        self.assertIs(response1["smartWins"], response2["smartWins"])
+        mockGetSmartWinsByTeam.assert_called_once()
+
+    def test_getStats_noStatNamesGiven_returnsAllStats(self):
+        year = self.__getYear(leagueMedianGames=False)
+
+        response = YearStatEngine(year).getStats()
+
+        self.assertEqual(YearStatEngine.getStatNames(), list(response.keys()))
+
+    def test_getStats_unknownStat_raisesException(self):
+        year = self.__getYear(leagueMedianGames=False)
+
+        with self.assertRaises(ValueError) as context:
+            YearStatEngine(year).getStats(["awal", "bad"])
+        self.assertEqual("'bad' is not a registered stat.", str(context.exception))
+
+    def test_getStatProgression_matchesCalculatorsForEachWeek(self):
+        year = self.__getYear(leagueMedianGames=True)
+        statNamesAndFunctions = (
+            self.STAT_NAME_AND_FUNCTION + self.LEAGUE_MEDIAN_STAT_NAME_AND_FUNCTION
+        )
+
+        for kwargs in (
+            dict(),
+            {"weekNumberStart": 2, "onlyRegularSeason": True},
+            {"numericBackend": "FLOAT"},
+            {"numericBackend": "FIXED_POINT"},
+        ):
+            response = YearStatEngine.getStatProgression(
+                year, [statName for statName, _ in statNamesAndFunctions], **kwargs
+            )
+            weekNumberStart = kwargs.get("weekNumberStart", 1)
+            for statName, function in statNamesAndFunctions:
+                for i, weekNumberEnd in enumerate(
+                    range(weekNumberStart, len(year.weeks) + 1)
+                ):
+                    with self.subTest(
+                        statName=statName, weekNumberEnd=weekNumberEnd, **kwargs
+                    ):
+                        expected = function(year, weekNumberEnd=weekNumberEnd, **kwargs)
+                        self.assertEqual(
+                            repr(expected),
+                            repr(
+                                {
+                                    teamId: response[statName][teamId][i]
+                                    for teamId in expected
+                                }
+                            ),
+                        )
+
+    def test_getStatProgression_scoresOnlyLookedAtOnce(self):
+        year = self.__getYear(leagueMedianGames=True)
+
+        with (
+            patch.object(
+                AWALYearCalculator,
+                "_getAWALFromWeeks",
+                wraps=AWALYearCalculator._getAWALFromWeeks,
+            ) as mockGetAWALFromWeeks,
+            patch.object(
+                SmartWinsYearCalculator,
+                "_getSmartWinsByTeam",
+                wraps=SmartWinsYearCalculator._getSmartWinsByTeam,
+            ) as mockGetSmartWinsByTeam,
+        ):
+            response = YearStatEngine.getStatProgression(
+                year, ["awal", "smartWins", "teamLuck"]
+            )
+
+        # every week is calculated at once instead of calculating each week's range again
+        mockGetAWALFromWeeks.assert_not_called()
+        mockGetSmartWinsByTeam.assert_not_called()
+        self.assertEqual(
+            repr(AWALYearCalculator.getAWAL(year, weekNumberEnd=3)),
+            repr({teamId: awal[2] for teamId, awal in response["awal"].items()}),
+        )
+
+    def test_getStatProgression_yearOnlyValidatedOnce(self):
+        year = self.__getYear(leagueMedianGames=False)
+
+        with patch(
+            "leeger.calculator.engine.YearStatEngine.yearValidation.runAllChecks"
+        ) as mockRunAllChecks:
+            response = YearStatEngine.getStatProgression(year, ["wins"])
+
+        mockRunAllChecks.assert_called_once_with(year)
+        self.assertEqual(["wins"], list(response.keys()))
+        self.assertEqual([1, 1, 1, 1, 2, 3], response["wins"][year.teams[0].id])
+
+    def test_getStatProgression_unknownStat_raisesException(self):
+        year = self.__getYear(leagueMedianGames=False)
+
+        with self.assertRaises(ValueError) as context:
+            YearStatEngine.getStatProgression(year, ["bad"])
+        self.assertEqual("'bad' is not a registered stat.", str(context.exception))
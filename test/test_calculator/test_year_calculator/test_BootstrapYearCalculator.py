@@ -0,0 +1,162 @@
+import unittest
+
+from leeger.calculator.year_calculator import (
+    AWALYearCalculator,
+    BootstrapYearCalculator,
+    PointsScoredYearCalculator,
+    SmartWinsYearCalculator,
+    SSLYearCalculator,
+)
+from leeger.model.stat.BootstrapConfidenceIntervals import (
+    BootstrapConfidenceIntervals,
+)
+from leeger.model.stat.ConfidenceInterval import ConfidenceInterval
+from leeger.util.Deci import Deci
+from test.helper.prototypes import getYearWithNDefaultTeams
+
+
+class TestBootstrapYearCalculator(unittest.TestCase):
+    # team 1 scores 100 every week, team 4 only plays in week 3
+    MATCHUPS_BY_WEEK = [
+        [(0, 1, 100, 90.5)],
+        [(0, 2, 100, 120)],
+        [(1, 0, 80, 100), (2, 3, 70.2, 95)],
+        [(1, 2, 99, 101)],
+    ]
+
+    def test_getConfidenceIntervals_happyPath(self):
+        year, teamIds = getYearWithNDefaultTeams(4, self.MATCHUPS_BY_WEEK)
+
+        response = BootstrapYearCalculator.getConfidenceIntervals(year, 2000, seed=0)
+
+        self.assertIsInstance(response, BootstrapConfidenceIntervals)
+        self.assertEqual(2000, response.numberOfResamples)
+        self.assertEqual(Deci("0.95"), response.confidenceLevel)
+        for stat, calculatorFunction in (
+            (
+                response.pointsScoredPerGame,
+                PointsScoredYearCalculator.getPointsScoredPerGame,
+            ),
+            (response.awalPerGame, AWALYearCalculator.getAWALPerGame),
+            (response.smartWinsPerGame, SmartWinsYearCalculator.getSmartWinsPerGame),
+            (response.teamScore, SSLYearCalculator.getTeamScore),
+        ):
+            self.assertIsInstance(stat, dict)
+            self.assertEqual(4, len(stat.keys()))
+            estimates = calculatorFunction(year)
+            for teamId in teamIds:
+                self.assertIsInstance(stat[teamId], ConfidenceInterval)
+                self.assertEqual(estimates[teamId], stat[teamId].estimate)
+                self.assertLessEqual(stat[teamId].lower, stat[teamId].upper)
+        # team 1 scores 100 every week, so every resample has the same score
+        self.assertEqual(Deci("100"), response.pointsScoredPerGame[teamIds[0]].lower)
+        self.assertEqual(Deci("100"), response.pointsScoredPerGame[teamIds[0]].upper)
+        # team 4 only played once
+        self.assertEqual(Deci("95"), response.pointsScoredPerGame[teamIds[3]].lower)
+        self.assertEqual(Deci("95"), response.pointsScoredPerGame[teamIds[3]].upper)
+        self.assertAlmostEqual(
+            float(response.awalPerGame[teamIds[3]].estimate),
+            float(response.awalPerGame[teamIds[3]].lower),
+        )
+        self.assertLess(
+            response.pointsScoredPerGame[teamIds[2]].lower,
+            response.pointsScoredPerGame[teamIds[2]].upper,
+        )
+
+    def test_getConfidenceIntervals_leagueMedianGames(self):
+        year, teamIds = getYearWithNDefaultTeams(
+            4, self.MATCHUPS_BY_WEEK, leagueMedianGames=True
+        )
+
+        response = BootstrapYearCalculator.getConfidenceIntervals(year, 2000, seed=0)
+
+        awalPerGame = AWALYearCalculator.getAWALPerGame(year)
+        for teamId in teamIds:
+            self.assertEqual(awalPerGame[teamId], response.awalPerGame[teamId].estimate)
+        # team 4 beat 2 of the 3 other scores in week 3 and the league median
+        self.assertAlmostEqual(
+            (2 / 3 + 1) / 2, float(response.awalPerGame[teamIds[3]].lower)
+        )
+        self.assertAlmostEqual(
+            (2 / 3 + 1) / 2, float(response.awalPerGame[teamIds[3]].upper)
+        )
+
+    def test_getConfidenceIntervals_noGamesInRange(self):
+        year, teamIds = getYearWithNDefaultTeams(4, self.MATCHUPS_BY_WEEK)
+
+        response = BootstrapYearCalculator.getConfidenceIntervals(
+            year, 500, seed=0, weekNumberEnd=2
+        )
+
+        self.assertIsNone(response.pointsScoredPerGame[teamIds[3]])
+        self.assertIsNone(response.awalPerGame[teamIds[3]])
+        self.assertIsNone(response.smartWinsPerGame[teamIds[3]])
+        self.assertIsNone(response.teamScore[teamIds[3]])
+        self.assertEqual(
+            Deci("90.5"), response.pointsScoredPerGame[teamIds[1]].estimate
+        )
+
+    def test_getConfidenceIntervals_confidenceLevel(self):
+        year, teamIds = getYearWithNDefaultTeams(4, self.MATCHUPS_BY_WEEK)
+
+        narrow = BootstrapYearCalculator.getConfidenceIntervals(
+            year, 5000, confidenceLevel=0.5, seed=2
+        )
+        wide = BootstrapYearCalculator.getConfidenceIntervals(
+            year, 5000, confidenceLevel=0.99, seed=2
+        )
+
+        self.assertEqual(Deci("0.5"), narrow.confidenceLevel)
+        for teamId in teamIds[1:3]:
+            self.assertLessEqual(
+                wide.teamScore[teamId].lower, narrow.teamScore[teamId].lower
+            )
+            self.assertGreaterEqual(
+                wide.teamScore[teamId].upper, narrow.teamScore[teamId].upper
+            )
+
+    def test_getConfidenceIntervals_sameSeedSameResults(self):
+        year, teamIds = getYearWithNDefaultTeams(4, self.MATCHUPS_BY_WEEK)
+
+        response1 = BootstrapYearCalculator.getConfidenceIntervals(year, 15_000, seed=7)
+        response2 = BootstrapYearCalculator.getConfidenceIntervals(
+            year, 15_000, seed=7, workers=2
+        )
+
+        for teamId in teamIds:
+            for stat1, stat2 in (
+                (response1.pointsScoredPerGame, response2.pointsScoredPerGame),
+                (response1.awalPerGame, response2.awalPerGame),
+                (response1.smartWinsPerGame, response2.smartWinsPerGame),
+                (response1.teamScore, response2.teamScore),
+            ):
+                self.assertEqual(stat1[teamId].lower, stat2[teamId].lower)
+                self.assertEqual(stat1[teamId].upper, stat2[teamId].upper)
+
+    def test_getConfidenceIntervals_invalidArguments_raisesException(self):
+        year, _ = getYearWithNDefaultTeams(4, self.MATCHUPS_BY_WEEK)
+
+        with self.assertRaises(ValueError) as context:
+            BootstrapYearCalculator.getConfidenceIntervals(year, 0)
+        self.assertEqual(
+            "'numberOfResamples' must be at least 1.", str(context.exception)
+        )
+
+        with self.assertRaises(ValueError) as context:
+            BootstrapYearCalculator.getConfidenceIntervals(year, workers=1.5)
+        self.assertEqual(
+            "'workers' must be type 'int', not 'float'.", str(context.exception)
+        )
+
+        with self.assertRaises(ValueError) as context:
+            BootstrapYearCalculator.getConfidenceIntervals(year, confidenceLevel=1)
+        self.assertEqual(
+            "'confidenceLevel' must be type 'float', not 'int'.",
+            str(context.exception),
+        )
+
+        with self.assertRaises(ValueError) as context:
+            BootstrapYearCalculator.getConfidenceIntervals(year, confidenceLevel=1.0)
+        self.assertEqual(
+            "'confidenceLevel' must be between 0 and 1.", str(context.exception)
+        )
@@ -642,6 +642,45 @@ class TestGameOutcomeYearCalculator(unittest.TestCase):
         self.assertEqual(2, response[teams[0].id])
         self.assertEqual(2, response[teams[1].id])
 
+    def test_getTies_multiWeekMatchupsFixedPointNumericBackend(self):
+        owners, teams = getNDefaultOwnersAndTeams(2)
+
+        matchup1 = Matchup(
+            teamAId=teams[0].id,
+            teamBId=teams[1].id,
+            teamAScore=0.1,
+            teamBScore=0.3,
+            multiWeekMatchupId="1",
+        )
+        week1 = Week(weekNumber=1, matchups=[matchup1])
+
+        matchup2 = Matchup(
+            teamAId=teams[0].id,
+            teamBId=teams[1].id,
+            teamAScore=0.2,
+            teamBScore=0,
+            multiWeekMatchupId="1",
+        )
+        week2 = Week(weekNumber=2, matchups=[matchup2])
+
+        year = Year(yearNumber=2000, teams=teams, weeks=[week1, week2])
+
+        # 0.1 + 0.2 is 0.30000000000000004 as floats
+        response = GameOutcomeYearCalculator.getTies(year)
+        fixedPointResponse = GameOutcomeYearCalculator.getTies(
+            year, numericBackend="fixed_point"
+        )
+        fixedPointWins = GameOutcomeYearCalculator.getWins(
+            year, numericBackend="fixed_point"
+        )
+
+        self.assertEqual(0, response[teams[0].id])
+        self.assertEqual(0, response[teams[1].id])
+        self.assertEqual(1, fixedPointResponse[teams[0].id])
+        self.assertEqual(1, fixedPointResponse[teams[1].id])
+        self.assertEqual(0, fixedPointWins[teams[0].id])
+        self.assertEqual(0, fixedPointWins[teams[1].id])
+
     def test_getTies_noneIfNoGamesPlayed(self):
         owners, teams = getNDefaultOwnersAndTeams(3)
 
@@ -0,0 +1,142 @@
+import unittest
+
+from leeger.calculator.year_calculator import PlayoffOddsYearCalculator
+from leeger.enum.MatchupType import MatchupType
+from leeger.exception.DoesNotExistException import DoesNotExistException
+from leeger.model.stat.PlayoffOdds import PlayoffOdds
+from leeger.util.Deci import Deci
+from test.helper.prototypes import getYearWithNDefaultTeams
+
+
+class TestPlayoffOddsYearCalculator(unittest.TestCase):
+    MATCHUPS_BY_WEEK = [
+        [(0, 1, 150, 100), (2, 3, 101, 50)],
+        [(0, 2, 160, 99), (1, 3, 100, 60)],
+    ]
+
+    def test_getPlayoffOdds_happyPath(self):
+        year, teamIds = getYearWithNDefaultTeams(4, self.MATCHUPS_BY_WEEK)
+        remainingSchedule = [[(teamIds[0], teamIds[3]), (teamIds[1], teamIds[2])]]
+
+        response = PlayoffOddsYearCalculator.getPlayoffOdds(
+            year, remainingSchedule, 2, 2000, seed=0
+        )
+
+        self.assertIsInstance(response, PlayoffOdds)
+        self.assertEqual(2000, response.numberOfSimulations)
+        self.assertEqual(Deci("2"), sum(response.playoffOdds.values()))
+        self.assertEqual(Deci("0"), sum(response.byeOdds.values()))
+        self.assertEqual(Deci("1"), sum(response.championshipOdds.values()))
+        # team 1 is 2-0 and scores far more than anyone else
+        self.assertEqual(Deci("1"), response.playoffOdds[teamIds[0]])
+        self.assertLess(Deci("2.9"), response.expectedWins[teamIds[0]])
+        # team 4 is 0-2 and can't get more than 1 win
+        self.assertEqual(Deci("0"), response.playoffOdds[teamIds[3]])
+        self.assertLess(response.expectedWins[teamIds[3]], Deci("0.1"))
+
+    def test_getPlayoffOdds_withByes(self):
+        year, teamIds = getYearWithNDefaultTeams(4, self.MATCHUPS_BY_WEEK)
+        remainingSchedule = [[(teamIds[0], teamIds[3]), (teamIds[1], teamIds[2])]]
+
+        response = PlayoffOddsYearCalculator.getPlayoffOdds(
+            year, remainingSchedule, 3, 2000, numberOfByes=1, seed=0
+        )
+
+        self.assertEqual(Deci("3"), sum(response.playoffOdds.values()))
+        self.assertEqual(Deci("1"), sum(response.byeOdds.values()))
+        self.assertEqual(Deci("1"), response.byeOdds[teamIds[0]])
+
+    def test_getPlayoffOdds_sameSeedSameResults(self):
+        year, teamIds = getYearWithNDefaultTeams(4, self.MATCHUPS_BY_WEEK)
+        remainingSchedule = [[(teamIds[0], teamIds[3]), (teamIds[1], teamIds[2])]]
+
+        response1 = PlayoffOddsYearCalculator.getPlayoffOdds(
+            year, remainingSchedule, 2, 500, seed=4
+        )
+        response2 = PlayoffOddsYearCalculator.getPlayoffOdds(
+            year, remainingSchedule, 2, 500, seed=4
+        )
+
+        self.assertEqual(response1.playoffOdds, response2.playoffOdds)
+        self.assertEqual(response1.championshipOdds, response2.championshipOdds)
+
+    def test_getPlayoffOdds_noRemainingWeeks(self):
+        year, teamIds = getYearWithNDefaultTeams(4, self.MATCHUPS_BY_WEEK)
+
+        response = PlayoffOddsYearCalculator.getPlayoffOdds(year, list(), 2, 100)
+
+        self.assertEqual(Deci("1"), response.playoffOdds[teamIds[0]])
+        self.assertEqual(Deci("1"), response.playoffOdds[teamIds[1]])
+        self.assertEqual(Deci("2"), response.expectedWins[teamIds[0]])
+
+    def test_getPlayoffOdds_playoffWeeksNotCounted(self):
+        # team 4 wins a playoff game in week 3
+        year, teamIds = getYearWithNDefaultTeams(
+            4,
+            self.MATCHUPS_BY_WEEK
+            + [[(0, 3, 90, 120, {"matchupType": MatchupType.PLAYOFF})]],
+        )
+
+        response = PlayoffOddsYearCalculator.getPlayoffOdds(year, list(), 2, 100)
+
+        self.assertEqual(Deci("2"), response.expectedWins[teamIds[0]])
+        self.assertEqual(Deci("0"), response.expectedWins[teamIds[3]])
+
+    def test_getPlayoffOdds_leagueMedianGames(self):
+        year, teamIds = getYearWithNDefaultTeams(
+            4, self.MATCHUPS_BY_WEEK, leagueMedianGames=True
+        )
+
+        response = PlayoffOddsYearCalculator.getPlayoffOdds(year, list(), 2, 100)
+
+        # team 1 also scored above the median in both weeks
+        self.assertEqual(Deci("4"), response.expectedWins[teamIds[0]])
+        self.assertEqual(Deci("2"), response.expectedWins[teamIds[1]])
+        self.assertEqual(Deci("2"), response.expectedWins[teamIds[2]])
+        self.assertEqual(Deci("0"), response.expectedWins[teamIds[3]])
+
+    def test_getPlayoffOdds_leagueMedianGamesSimulated(self):
+        year, teamIds = getYearWithNDefaultTeams(
+            4, self.MATCHUPS_BY_WEEK, leagueMedianGames=True
+        )
+        remainingSchedule = [[(teamIds[0], teamIds[3]), (teamIds[1], teamIds[2])]]
+
+        response = PlayoffOddsYearCalculator.getPlayoffOdds(
+            year, remainingSchedule, 2, 2000, seed=0
+        )
+
+        # every remaining week has 2 game wins and 2 league median wins
+        self.assertAlmostEqual(12, float(sum(response.expectedWins.values())), places=9)
+        self.assertLess(Deci("5.8"), response.expectedWins[teamIds[0]])
+
+    def test_getPlayoffOdds_badBracket_raisesException(self):
+        year, _ = getYearWithNDefaultTeams(4, self.MATCHUPS_BY_WEEK)
+
+        with self.assertRaises(ValueError) as context:
+            PlayoffOddsYearCalculator.getPlayoffOdds(year, list(), 4, numberOfByes=2)
+        self.assertEqual(
+            "4 playoff teams with 2 byes can't be played as a single-elimination bracket.",
+            str(context.exception),
+        )
+
+        with self.assertRaises(ValueError) as context:
+            PlayoffOddsYearCalculator.getPlayoffOdds(year, list(), 5)
+        self.assertEqual(
+            "'numberOfPlayoffTeams' can't be more than the number of teams (4).",
+            str(context.exception),
+        )
+
+    def test_getPlayoffOdds_badRemainingSchedule_raisesException(self):
+        year, teamIds = getYearWithNDefaultTeams(4, self.MATCHUPS_BY_WEEK)
+
+        with self.assertRaises(DoesNotExistException):
+            PlayoffOddsYearCalculator.getPlayoffOdds(year, [[(teamIds[0], "badId")]], 2)
+
+        with self.assertRaises(ValueError) as context:
+            PlayoffOddsYearCalculator.getPlayoffOdds(
+                year, [[(teamIds[0], teamIds[1]), (teamIds[0], teamIds[2])]], 2
+            )
+        self.assertEqual(
+            "A team can't play more than once in week 1 of the remaining schedule.",
+            str(context.exception),
+        )
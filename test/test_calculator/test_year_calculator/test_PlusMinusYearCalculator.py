@@ -281,3 +281,57 @@ class TestPlusMinusYearCalculator(unittest.TestCase):
         self.assertEqual(2, len(response.keys()))
         self.assertEqual(Deci("-2.6"), response[teams[0].id])
         self.assertEqual(Deci("2.6"), response[teams[1].id])
+
+    def test_getPlusMinus_fixedPointNumericBackend(self):
+        owners, teams = getNDefaultOwnersAndTeams(4)
+
+        week1 = Week(
+            weekNumber=1,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[1].id,
+                    teamAScore=1.1,
+                    teamBScore=2.2,
+                ),
+                Matchup(
+                    teamAId=teams[2].id,
+                    teamBId=teams[3].id,
+                    teamAScore=3.3,
+                    teamBScore=3.3,
+                ),
+            ],
+        )
+        week2 = Week(
+            weekNumber=2,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[2].id,
+                    teamAScore=3.3,
+                    teamBScore=100,
+                ),
+                Matchup(
+                    teamAId=teams[1].id,
+                    teamBId=teams[3].id,
+                    teamAScore=2.2,
+                    teamBScore=0.7,
+                ),
+            ],
+        )
+
+        year = Year(yearNumber=2000, teams=teams, weeks=[week1, week2])
+
+        response = PlusMinusYearCalculator.getPlusMinus(
+            year, numericBackend="FIXED_POINT", weekNumberStart=2
+        )
+
+        self.assertEqual(4, len(response.keys()))
+        self.assertEqual(Deci("-96.7"), response[teams[0].id])
+        self.assertEqual(Deci("1.5"), response[teams[1].id])
+        self.assertEqual(Deci("96.7"), response[teams[2].id])
+        self.assertEqual(Deci("-1.5"), response[teams[3].id])
+        self.assertEqual(
+            PlusMinusYearCalculator.getPlusMinus(year),
+            PlusMinusYearCalculator.getPlusMinus(year, numericBackend="FIXED_POINT"),
+        )
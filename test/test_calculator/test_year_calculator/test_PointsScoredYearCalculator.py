@@ -1145,3 +1145,203 @@ class TestPointsScoredYearCalculator(unittest.TestCase):
         self.assertEqual(2, len(response.keys()))
         self.assertEqual(Deci("2.55"), response[teams[0].id])
         self.assertEqual(Deci("1.25"), response[teams[1].id])
+
+    def test_getPointsScored_floatNumericBackend(self):
+        owners, teams = getNDefaultOwnersAndTeams(4)
+
+        week1 = Week(
+            weekNumber=1,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[1].id,
+                    teamAScore=1.1,
+                    teamBScore=2.2,
+                ),
+                Matchup(
+                    teamAId=teams[2].id,
+                    teamBId=teams[3].id,
+                    teamAScore=3.3,
+                    teamBScore=2.2,
+                ),
+            ],
+        )
+        week2 = Week(
+            weekNumber=2,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[2].id,
+                    teamAScore=4.4,
+                    teamBScore=0.7,
+                ),
+                Matchup(
+                    teamAId=teams[1].id,
+                    teamBId=teams[3].id,
+                    teamAScore=1.9,
+                    teamBScore=5.5,
+                ),
+            ],
+        )
+
+        year = Year(yearNumber=2000, teams=teams, weeks=[week1, week2])
+
+        for responseDecimal, responseFloat in [
+            (
+                PointsScoredYearCalculator.getPointsScored(year),
+                PointsScoredYearCalculator.getPointsScored(
+                    year, numericBackend="float"
+                ),
+            ),
+            (
+                PointsScoredYearCalculator.getOpponentPointsScored(year),
+                PointsScoredYearCalculator.getOpponentPointsScored(
+                    year, numericBackend="float"
+                ),
+            ),
+        ]:
+            self.assertEqual(responseDecimal.keys(), responseFloat.keys())
+            for teamId, value in responseDecimal.items():
+                self.assertAlmostEqual(
+                    float(value), float(responseFloat[teamId]), places=9
+                )
+
+    def test_getPointsScored_fixedPointNumericBackend(self):
+        owners, teams = getNDefaultOwnersAndTeams(4)
+
+        week1 = Week(
+            weekNumber=1,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[1].id,
+                    teamAScore=1.1,
+                    teamBScore=2.2,
+                ),
+                Matchup(
+                    teamAId=teams[2].id,
+                    teamBId=teams[3].id,
+                    teamAScore=3.3,
+                    teamBScore=3.3,
+                ),
+            ],
+        )
+        week2 = Week(
+            weekNumber=2,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[2].id,
+                    teamAScore=3.3,
+                    teamBScore=100,
+                ),
+                Matchup(
+                    teamAId=teams[1].id,
+                    teamBId=teams[3].id,
+                    teamAScore=2.2,
+                    teamBScore=0.7,
+                ),
+            ],
+        )
+
+        year = Year(yearNumber=2000, teams=teams, weeks=[week1, week2])
+
+        response = PointsScoredYearCalculator.getPointsScored(
+            year, numericBackend="FIXED_POINT"
+        )
+        opponentResponse = PointsScoredYearCalculator.getOpponentPointsScored(
+            year, numericBackend="FIXED_POINT", fixedPointScale=1
+        )
+
+        self.assertEqual(4, len(response.keys()))
+        self.assertEqual(Deci("4.4"), response[teams[0].id])
+        self.assertEqual(Deci("4.4"), response[teams[1].id])
+        self.assertEqual(Deci("103.3"), response[teams[2].id])
+        self.assertEqual(Deci("4.0"), response[teams[3].id])
+        self.assertEqual(Deci("102.2"), opponentResponse[teams[0].id])
+        self.assertEqual(Deci("1.8"), opponentResponse[teams[1].id])
+        self.assertEqual(Deci("6.6"), opponentResponse[teams[2].id])
+        self.assertEqual(Deci("5.5"), opponentResponse[teams[3].id])
+
+    def test_getPointsScored_fixedPointNumericBackendWholeNumberScores_sameAsDecimal(
+        self,
+    ):
+        owners, teams = getNDefaultOwnersAndTeams(2)
+
+        week1 = Week(
+            weekNumber=1,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[1].id,
+                    teamAScore=1000,
+                    teamBScore=200,
+                )
+            ],
+        )
+        week2 = Week(
+            weekNumber=2,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[1].id,
+                    teamAScore=234,
+                    teamBScore=0,
+                )
+            ],
+        )
+
+        year = Year(yearNumber=2000, teams=teams, weeks=[week1, week2])
+
+        response = PointsScoredYearCalculator.getPointsScored(
+            year, numericBackend="FIXED_POINT"
+        )
+        decimalResponse = PointsScoredYearCalculator.getPointsScored(year)
+
+        self.assertEqual("1234", str(response[teams[0].id]))
+        self.assertEqual("200", str(response[teams[1].id]))
+        for teamId in decimalResponse:
+            self.assertEqual(str(decimalResponse[teamId]), str(response[teamId]))
+
+    def test_getPointsScored_fixedPointNumericBackendOnlyRangeMustBeFixedPoint(self):
+        owners, teams = getNDefaultOwnersAndTeams(2)
+
+        week1 = Week(
+            weekNumber=1,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[1].id,
+                    teamAScore=100.123,
+                    teamBScore=2.2,
+                )
+            ],
+        )
+        week2 = Week(
+            weekNumber=2,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[1].id,
+                    teamAScore=3.3,
+                    teamBScore=1.15,
+                )
+            ],
+        )
+
+        year = Year(yearNumber=2000, teams=teams, weeks=[week1, week2])
+
+        response = PointsScoredYearCalculator.getPointsScored(
+            year, numericBackend="fixed_point", weekNumberStart=2
+        )
+
+        self.assertEqual(Deci("3.3"), response[teams[0].id])
+        self.assertEqual(Deci("1.15"), response[teams[1].id])
+        with self.assertRaises(ValueError) as context:
+            PointsScoredYearCalculator.getPointsScored(
+                year, numericBackend="fixed_point"
+            )
+        self.assertEqual(
+            "Score '100.123' cannot be represented with a fixed-point scale of 2.",
+            str(context.exception),
+        )
@@ -0,0 +1,168 @@
+import unittest
+
+from leeger.calculator.year_calculator import (
+    AWALYearCalculator,
+    PointsScoredYearCalculator,
+    RollingWindowYearCalculator,
+    ScoringStandardDeviationYearCalculator,
+    SingleScoreYearCalculator,
+)
+from leeger.enum.MatchupType import MatchupType
+from leeger.model.league import YearSettings
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from test.helper.prototypes import getNDefaultOwnersAndTeams
+
+
+class TestRollingWindowYearCalculator(unittest.TestCase):
+    ROLLING_FUNCTION_AND_FUNCTION = [
+        (
+            RollingWindowYearCalculator.getRollingPointsScoredPerGame,
+            PointsScoredYearCalculator.getPointsScoredPerGame,
+        ),
+        (
+            RollingWindowYearCalculator.getRollingAWALPerGame,
+            AWALYearCalculator.getAWALPerGame,
+        ),
+        (
+            RollingWindowYearCalculator.getRollingMaxScore,
+            SingleScoreYearCalculator.getMaxScore,
+        ),
+        (
+            RollingWindowYearCalculator.getRollingMinScore,
+            SingleScoreYearCalculator.getMinScore,
+        ),
+        (
+            RollingWindowYearCalculator.getRollingScoringStandardDeviation,
+            ScoringStandardDeviationYearCalculator.getScoringStandardDeviation,
+        ),
+    ]
+
+    @staticmethod
+    def __getYear(leagueMedianGames: bool = False) -> Year:
+        _, teams = getNDefaultOwnersAndTeams(4)
+        weeks = list()
+        for weekNumber, (matchupType, multiWeekMatchupId) in enumerate(
+            [
+                (MatchupType.REGULAR_SEASON, None),
+                (MatchupType.REGULAR_SEASON, None),
+                (MatchupType.REGULAR_SEASON, None),
+                (MatchupType.PLAYOFF, "1"),
+                (MatchupType.PLAYOFF, "1"),
+            ],
+            start=1,
+        ):
+            weeks.append(
+                Week(
+                    weekNumber=weekNumber,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams[0].id,
+                            teamBId=teams[1].id,
+                            teamAScore=100 + weekNumber * 7 % 5,
+                            teamBScore=100.5 + weekNumber * 3 % 4,
+                            matchupType=matchupType,
+                            multiWeekMatchupId=multiWeekMatchupId,
+                        ),
+                        Matchup(
+                            teamAId=teams[2].id,
+                            teamBId=teams[3].id,
+                            teamAScore=90.25 + weekNumber * 11 % 6,
+                            teamBScore=101 - weekNumber,
+                            matchupType=matchupType,
+                        ),
+                    ],
+                )
+            )
+        return Year(
+            yearNumber=2000,
+            teams=teams,
+            weeks=weeks,
+            yearSettings=YearSettings(leagueMedianGames=leagueMedianGames),
+        )
+
+    def __assertMatchesFunctionForEachWindow(
+        self, year: Year, windowSize: int, **kwargs
+    ):
+        weekNumberStart = kwargs.get("weekNumberStart", 1)
+        weekNumberEnd = kwargs.get("weekNumberEnd", len(year.weeks))
+        for rollingFunction, function in self.ROLLING_FUNCTION_AND_FUNCTION:
+            response = rollingFunction(year, windowSize, **kwargs)
+            for i, windowWeekNumberEnd in enumerate(
+                range(weekNumberStart, weekNumberEnd + 1)
+            ):
+                expected = function(
+                    year,
+                    **kwargs
+                    | {
+                        "weekNumberStart": max(
+                            weekNumberStart, windowWeekNumberEnd - windowSize + 1
+                        ),
+                        "weekNumberEnd": windowWeekNumberEnd,
+                    },
+                )
+                with self.subTest(
+                    function=rollingFunction.__name__,
+                    windowSize=windowSize,
+                    weekNumberEnd=windowWeekNumberEnd,
+                ):
+                    self.assertEqual(
+                        repr(expected),
+                        repr({teamId: response[teamId][i] for teamId in response}),
+                    )
+
+    def test_rollingFunctions_matchFunctionForEachWindow(self):
+        for leagueMedianGames in (False, True):
+            year = self.__getYear(leagueMedianGames)
+            for windowSize in (1, 2, 3, 10):
+                self.__assertMatchesFunctionForEachWindow(year, windowSize)
+
+    def test_rollingFunctions_withFilters_matchFunctionForEachWindow(self):
+        year = self.__getYear(leagueMedianGames=True)
+        for kwargs in (
+            {"weekNumberStart": 2, "weekNumberEnd": 4},
+            {"onlyRegularSeason": True},
+            {"onlyPostSeason": True},
+            {"numericBackend": "FIXED_POINT"},
+            {"numericBackend": "FLOAT"},
+        ):
+            self.__assertMatchesFunctionForEachWindow(year, 2, **kwargs)
+
+    def test_getRollingMaxScore_happyPath(self):
+        year = self.__getYear()
+        response = RollingWindowYearCalculator.getRollingMaxScore(year, 2)
+        teamId = year.teams[3].id
+        self.assertEqual([100, 100, 99, 98, 97], response[teamId])
+
+    def test_getRollingMaxScore_noGamesInWindow_returnsNone(self):
+        year = self.__getYear()
+        response = RollingWindowYearCalculator.getRollingMaxScore(
+            year, 1, onlyPostSeason=True
+        )
+        self.assertEqual([None, None, None, 97, 96], response[year.teams[3].id])
+
+    def test_rollingFunctions_invalidWindowSize_raisesException(self):
+        year = self.__getYear()
+        for rollingFunction, _ in self.ROLLING_FUNCTION_AND_FUNCTION:
+            with self.assertRaises(ValueError) as context:
+                rollingFunction(year, 0)
+            self.assertEqual("'windowSize' must be at least 1.", str(context.exception))
+            with self.assertRaises(ValueError) as context:
+                rollingFunction(year, 2.0)
+            self.assertEqual(
+                "'windowSize' must be type 'int', not 'float'.", str(context.exception)
+            )
+
+    def test_getRollingScoringStandardDeviation_multiWeekMatchupsNotIncluded_raisesException(
+        self,
+    ):
+        year = self.__getYear()
+        with self.assertRaises(ValueError) as context:
+            RollingWindowYearCalculator.getRollingScoringStandardDeviation(
+                year, 2, includeMultiWeekMatchups=False
+            )
+        self.assertEqual(
+            "Multi-Week matchups must be included in this calculation.",
+            str(context.exception),
+        )
@@ -1,5 +1,9 @@
 import unittest
+from unittest.mock import patch
 
+from leeger.calculator.year_calculator.ScoringShareYearCalculator import (
+    ScoringShareYearCalculator,
+)
 from leeger.calculator.year_calculator.SSLYearCalculator import SSLYearCalculator
 from leeger.enum.MatchupType import MatchupType
 from leeger.model.league.Matchup import Matchup
@@ -843,3 +847,56 @@ class TestSSLYearCalculator(unittest.TestCase):
         self.assertEqual(2, len(response.keys()))
         self.assertEqual(Deci("0"), response[teams[0].id])
         self.assertEqual(Deci("0"), response[teams[1].id])
+
+    def test_getTeamLuck_sharedStatsOnlyCalculatedOnce(self):
+        owners, teams = getNDefaultOwnersAndTeams(4)
+
+        week1 = Week(
+            weekNumber=1,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[1].id,
+                    teamAScore=1.1,
+                    teamBScore=3,
+                ),
+                Matchup(
+                    teamAId=teams[2].id, teamBId=teams[3].id, teamAScore=2, teamBScore=2
+                ),
+            ],
+        )
+        year = Year(yearNumber=2000, teams=teams, weeks=[week1])
+
+        with patch.object(
+            ScoringShareYearCalculator,
+            "getScoringShare",
+            wraps=ScoringShareYearCalculator.getScoringShare,
+        ) as mockGetScoringShare:
+            response = SSLYearCalculator.getTeamLuck(year)
+
+        mockGetScoringShare.assert_called_once()
+        self.assertEqual(4, len(response.keys()))
+
+    def test__getTeamScoreAndTeamSuccess_happyPath(self):
+        owners, teams = getNDefaultOwnersAndTeams(2)
+
+        matchup1 = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1.1, teamBScore=3
+        )
+        matchup2 = Matchup(
+            teamAId=teams[0].id,
+            teamBId=teams[1].id,
+            teamAScore=1.2,
+            teamBScore=3,
+            matchupType=MatchupType.PLAYOFF,
+        )
+
+        week1 = Week(weekNumber=1, matchups=[matchup1])
+        week2 = Week(weekNumber=2, matchups=[matchup2])
+
+        year = Year(yearNumber=2000, teams=teams, weeks=[week1, week2])
+
+        teamScore, teamSuccess = SSLYearCalculator._getTeamScoreAndTeamSuccess(year)
+
+        self.assertEqual(SSLYearCalculator.getTeamScore(year), teamScore)
+        self.assertEqual(SSLYearCalculator.getTeamSuccess(year), teamSuccess)
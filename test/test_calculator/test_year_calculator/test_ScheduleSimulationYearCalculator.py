@@ -0,0 +1,142 @@
+import unittest
+
+from leeger.calculator.year_calculator import (
+    AWALYearCalculator,
+    ScheduleSimulationYearCalculator,
+)
+from leeger.enum.MatchupType import MatchupType
+from leeger.model.stat.ScheduleSimulation import ScheduleSimulation
+from leeger.util.Deci import Deci
+from test.helper.prototypes import getYearWithNDefaultTeams
+
+
+class TestScheduleSimulationYearCalculator(unittest.TestCase):
+    MATCHUPS_BY_WEEK = [
+        [(0, 1, 4, 3), (2, 3, 2, 1)],
+        [(0, 2, 100, 90, {"matchupType": MatchupType.PLAYOFF})],
+    ]
+
+    def test_simulateSchedules_happyPath(self):
+        year, teamIds = getYearWithNDefaultTeams(4, self.MATCHUPS_BY_WEEK)
+
+        response = ScheduleSimulationYearCalculator.simulateSchedules(
+            year, 1000, seed=0
+        )
+
+        self.assertIsInstance(response, ScheduleSimulation)
+        self.assertEqual(1000, response.numberOfSimulations)
+        # team 1 has the best score every week, and the playoff week isn't simulated
+        self.assertEqual(Deci("1"), response.expectedWins[teamIds[0]])
+        self.assertEqual(Deci("1"), response.expectedStanding[teamIds[0]])
+        self.assertEqual({Deci("1"): 1000}, response.winDistribution[teamIds[0]])
+        self.assertEqual([1000, 0, 0, 0], response.standingDistribution[teamIds[0]])
+        self.assertEqual({Deci("0"): 1000}, response.winDistribution[teamIds[3]])
+        self.assertEqual(
+            {Deci("0"), Deci("1")}, set(response.winDistribution[teamIds[1]].keys())
+        )
+        for teamId in teamIds:
+            self.assertEqual(1000, sum(response.winDistribution[teamId].values()))
+            self.assertEqual(1000, sum(response.standingDistribution[teamId]))
+
+    def test_simulateSchedules_onlyPostSeason(self):
+        year, teamIds = getYearWithNDefaultTeams(4, self.MATCHUPS_BY_WEEK)
+
+        response = ScheduleSimulationYearCalculator.simulateSchedules(
+            year, 100, seed=0, onlyPostSeason=True
+        )
+
+        self.assertEqual({Deci("1"): 100}, response.winDistribution[teamIds[0]])
+        self.assertEqual({Deci("0"): 100}, response.winDistribution[teamIds[2]])
+        self.assertEqual({Deci("0"): 100}, response.winDistribution[teamIds[1]])
+
+    def test_simulateSchedules_multiWeekMatchupsAreOneGame(self):
+        # teams 1 and 2 are in one multi-week matchup over weeks 1 and 2, and teams 3 and 4 are in another
+        year, teamIds = getYearWithNDefaultTeams(
+            4,
+            [
+                [
+                    (0, 1, 4, 3, {"multiWeekMatchupId": "1"}),
+                    (2, 3, 2, 1, {"multiWeekMatchupId": "2"}),
+                ],
+                [
+                    (0, 1, 1, 10, {"multiWeekMatchupId": "1"}),
+                    (2, 3, 2, 1, {"multiWeekMatchupId": "2"}),
+                ],
+            ],
+        )
+
+        response = ScheduleSimulationYearCalculator.simulateSchedules(
+            year, 1000, seed=0
+        )
+
+        # combined scores are 5, 13, 4 and 2
+        self.assertEqual({Deci("1"): 1000}, response.winDistribution[teamIds[1]])
+        self.assertEqual({Deci("0"): 1000}, response.winDistribution[teamIds[3]])
+        self.assertEqual(
+            {Deci("0"), Deci("1")}, set(response.winDistribution[teamIds[0]].keys())
+        )
+
+    def test_simulateSchedules_leagueMedianGames(self):
+        year, teamIds = getYearWithNDefaultTeams(
+            4, self.MATCHUPS_BY_WEEK, leagueMedianGames=True
+        )
+
+        response = ScheduleSimulationYearCalculator.simulateSchedules(
+            year, 1000, seed=0
+        )
+
+        # teams 1 and 2 score above the median of 2.5 in the regular season week
+        self.assertEqual({Deci("2"): 1000}, response.winDistribution[teamIds[0]])
+        self.assertEqual(
+            {Deci("1"), Deci("2")}, set(response.winDistribution[teamIds[1]].keys())
+        )
+        self.assertEqual({Deci("0"): 1000}, response.winDistribution[teamIds[3]])
+
+    def test_simulateSchedules_expectedWinsCloseToAWAL(self):
+        year, teamIds = getYearWithNDefaultTeams(4, self.MATCHUPS_BY_WEEK)
+
+        response = ScheduleSimulationYearCalculator.simulateSchedules(
+            year, 20_000, seed=1, onlyRegularSeason=True
+        )
+        awal = AWALYearCalculator.getAWAL(year, onlyRegularSeason=True)
+
+        for teamId in teamIds:
+            self.assertAlmostEqual(
+                float(awal[teamId]), float(response.expectedWins[teamId]), delta=0.02
+            )
+
+    def test_simulateSchedules_sameSeedSameResults(self):
+        year, _ = getYearWithNDefaultTeams(4, self.MATCHUPS_BY_WEEK)
+
+        response1 = ScheduleSimulationYearCalculator.simulateSchedules(
+            year, 500, seed=3
+        )
+        response2 = ScheduleSimulationYearCalculator.simulateSchedules(
+            year, 500, seed=3
+        )
+
+        self.assertEqual(response1.winDistribution, response2.winDistribution)
+        self.assertEqual(response1.standingDistribution, response2.standingDistribution)
+
+    def test_simulateSchedules_badNumberOfSimulations_raisesException(self):
+        year, _ = getYearWithNDefaultTeams(4, self.MATCHUPS_BY_WEEK)
+
+        with self.assertRaises(ValueError) as context:
+            ScheduleSimulationYearCalculator.simulateSchedules(year, 0)
+        self.assertEqual(
+            "'numberOfSimulations' must be at least 1.", str(context.exception)
+        )
+
+        with self.assertRaises(ValueError) as context:
+            ScheduleSimulationYearCalculator.simulateSchedules(year, 1.5)
+        self.assertEqual(
+            "'numberOfSimulations' must be type 'int', not 'float'.",
+            str(context.exception),
+        )
+
+    def test_simulateSchedules_badWorkers_raisesException(self):
+        year, _ = getYearWithNDefaultTeams(4, self.MATCHUPS_BY_WEEK)
+
+        with self.assertRaises(ValueError) as context:
+            ScheduleSimulationYearCalculator.simulateSchedules(year, 10, workers=0)
+        self.assertEqual("'workers' must be at least 1.", str(context.exception))
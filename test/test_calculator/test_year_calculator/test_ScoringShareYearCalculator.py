@@ -1211,3 +1211,63 @@ class TestScoringShareYearCalculator(unittest.TestCase):
         self.assertEqual(2, len(response.keys()))
         self.assertEqual(Deci("32.43243243243243243243243243"), response[teams[0].id])
         self.assertEqual(Deci("66.66666666666665982905982906"), response[teams[1].id])
+
+    def test_getMaxAndMinScoringShare_floatNumericBackend(self):
+        owners, teams = getNDefaultOwnersAndTeams(4)
+
+        week1 = Week(
+            weekNumber=1,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[1].id,
+                    teamAScore=1.1,
+                    teamBScore=2.2,
+                ),
+                Matchup(
+                    teamAId=teams[2].id,
+                    teamBId=teams[3].id,
+                    teamAScore=3.3,
+                    teamBScore=2.2,
+                ),
+            ],
+        )
+        week2 = Week(
+            weekNumber=2,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[2].id,
+                    teamAScore=4.4,
+                    teamBScore=0.7,
+                ),
+                Matchup(
+                    teamAId=teams[1].id,
+                    teamBId=teams[3].id,
+                    teamAScore=1.9,
+                    teamBScore=5.5,
+                ),
+            ],
+        )
+
+        year = Year(yearNumber=2000, teams=teams, weeks=[week1, week2])
+
+        for responseDecimal, responseFloat in [
+            (
+                ScoringShareYearCalculator.getMaxScoringShare(year),
+                ScoringShareYearCalculator.getMaxScoringShare(
+                    year, numericBackend="float"
+                ),
+            ),
+            (
+                ScoringShareYearCalculator.getMinScoringShare(year),
+                ScoringShareYearCalculator.getMinScoringShare(
+                    year, numericBackend="float"
+                ),
+            ),
+        ]:
+            self.assertEqual(responseDecimal.keys(), responseFloat.keys())
+            for teamId, value in responseDecimal.items():
+                self.assertAlmostEqual(
+                    float(value), float(responseFloat[teamId]), places=9
+                )
@@ -351,3 +351,59 @@ class TestScoringStandardDeviationYearCalculator(unittest.TestCase):
         self.assertEqual(2, len(response.keys()))
         self.assertEqual(Deci("0.05"), response[teams[0].id])
         self.assertEqual(Deci("5.05"), response[teams[1].id])
+
+    def test_getScoringStandardDeviation_floatNumericBackend(self):
+        owners, teams = getNDefaultOwnersAndTeams(4)
+
+        week1 = Week(
+            weekNumber=1,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[1].id,
+                    teamAScore=1.1,
+                    teamBScore=2.2,
+                ),
+                Matchup(
+                    teamAId=teams[2].id,
+                    teamBId=teams[3].id,
+                    teamAScore=3.3,
+                    teamBScore=2.2,
+                ),
+            ],
+        )
+        week2 = Week(
+            weekNumber=2,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[2].id,
+                    teamAScore=4.4,
+                    teamBScore=0.7,
+                ),
+                Matchup(
+                    teamAId=teams[1].id,
+                    teamBId=teams[3].id,
+                    teamAScore=1.9,
+                    teamBScore=5.5,
+                ),
+            ],
+        )
+
+        year = Year(yearNumber=2000, teams=teams, weeks=[week1, week2])
+
+        for responseDecimal, responseFloat in [
+            (
+                ScoringStandardDeviationYearCalculator.getScoringStandardDeviation(
+                    year
+                ),
+                ScoringStandardDeviationYearCalculator.getScoringStandardDeviation(
+                    year, numericBackend="float"
+                ),
+            ),
+        ]:
+            self.assertEqual(responseDecimal.keys(), responseFloat.keys())
+            for teamId, value in responseDecimal.items():
+                self.assertAlmostEqual(
+                    float(value), float(responseFloat[teamId]), places=9
+                )
@@ -988,3 +988,66 @@ class TestSingleScoreYearCalculator(unittest.TestCase):
         self.assertEqual(4.2, response[teams[3].id])
         self.assertEqual(4.2, response[teams[4].id])
         self.assertEqual(6, response[teams[5].id])
+
+    def test_getMaxAndMinScore_fixedPointNumericBackend(self):
+        owners, teams = getNDefaultOwnersAndTeams(4)
+
+        week1 = Week(
+            weekNumber=1,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[1].id,
+                    teamAScore=1.1,
+                    teamBScore=2.2,
+                ),
+                Matchup(
+                    teamAId=teams[2].id,
+                    teamBId=teams[3].id,
+                    teamAScore=3.3,
+                    teamBScore=3.3,
+                ),
+            ],
+        )
+        week2 = Week(
+            weekNumber=2,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[2].id,
+                    teamAScore=3.3,
+                    teamBScore=100,
+                ),
+                Matchup(
+                    teamAId=teams[1].id,
+                    teamBId=teams[3].id,
+                    teamAScore=2.2,
+                    teamBScore=0.7,
+                ),
+            ],
+        )
+
+        year = Year(yearNumber=2000, teams=teams, weeks=[week1, week2])
+
+        maxResponse = SingleScoreYearCalculator.getMaxScore(
+            year, numericBackend="FIXED_POINT"
+        )
+        minResponse = SingleScoreYearCalculator.getMinScore(
+            year, numericBackend="FIXED_POINT"
+        )
+
+        self.assertEqual(4, len(maxResponse.keys()))
+        self.assertEqual(3.3, maxResponse[teams[0].id])
+        self.assertEqual(2.2, maxResponse[teams[1].id])
+        self.assertEqual(100, maxResponse[teams[2].id])
+        self.assertIsInstance(maxResponse[teams[2].id], int)
+        self.assertEqual(3.3, maxResponse[teams[3].id])
+        self.assertEqual(1.1, minResponse[teams[0].id])
+        self.assertEqual(2.2, minResponse[teams[1].id])
+        self.assertEqual(3.3, minResponse[teams[2].id])
+        self.assertEqual(0.7, minResponse[teams[3].id])
+
+        noGamesResponse = SingleScoreYearCalculator.getMaxScore(
+            year, numericBackend="FIXED_POINT", weekNumberStart=2, onlyPostSeason=True
+        )
+        self.assertEqual({team.id: None for team in teams}, noGamesResponse)
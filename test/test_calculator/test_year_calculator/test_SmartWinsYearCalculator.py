@@ -2279,3 +2279,61 @@ class TestSmartWinsYearCalculator(unittest.TestCase):
         self.assertEqual(Deci("0.3333333333333333333333333333"), response[teams[3].id])
         self.assertEqual(Deci("0.9333333333333333333333333335"), response[teams[4].id])
         self.assertEqual(Deci("0.6333333333333333333333333335"), response[teams[5].id])
+
+    def test_getSmartWins_floatNumericBackend(self):
+        owners, teams = getNDefaultOwnersAndTeams(4)
+
+        week1 = Week(
+            weekNumber=1,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[1].id,
+                    teamAScore=1.1,
+                    teamBScore=2.2,
+                ),
+                Matchup(
+                    teamAId=teams[2].id,
+                    teamBId=teams[3].id,
+                    teamAScore=3.3,
+                    teamBScore=2.2,
+                ),
+            ],
+        )
+        week2 = Week(
+            weekNumber=2,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[2].id,
+                    teamAScore=4.4,
+                    teamBScore=0.7,
+                ),
+                Matchup(
+                    teamAId=teams[1].id,
+                    teamBId=teams[3].id,
+                    teamAScore=1.9,
+                    teamBScore=5.5,
+                ),
+            ],
+        )
+
+        year = Year(yearNumber=2000, teams=teams, weeks=[week1, week2])
+
+        for responseDecimal, responseFloat in [
+            (
+                SmartWinsYearCalculator.getSmartWins(year),
+                SmartWinsYearCalculator.getSmartWins(year, numericBackend="float"),
+            ),
+            (
+                SmartWinsYearCalculator.getOpponentSmartWins(year),
+                SmartWinsYearCalculator.getOpponentSmartWins(
+                    year, numericBackend="float"
+                ),
+            ),
+        ]:
+            self.assertEqual(responseDecimal.keys(), responseFloat.keys())
+            for teamId, value in responseDecimal.items():
+                self.assertAlmostEqual(
+                    float(value), float(responseFloat[teamId]), places=9
+                )
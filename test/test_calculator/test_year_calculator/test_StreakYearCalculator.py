@@ -0,0 +1,197 @@
+import unittest
+
+from leeger.calculator.year_calculator import StreakYearCalculator
+from leeger.enum.MatchupType import MatchupType
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Team import Team
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from test.helper.prototypes import getNDefaultOwnersAndTeams
+
+
+def getStreakYear(teams: list[Team], yearNumber: int = 2000) -> Year:
+    """
+    Outcomes in the order they were played:
+        team 1: W W L W L
+        team 2: L T W W (the multi-week matchup is decided in week 5)
+        team 3: W L L L
+        team 4: L T W L W
+    """
+    week1 = Week(
+        weekNumber=1,
+        matchups=[
+            Matchup(
+                teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=100, teamBScore=90
+            ),
+            Matchup(
+                teamAId=teams[2].id, teamBId=teams[3].id, teamAScore=80, teamBScore=70
+            ),
+        ],
+    )
+    week2 = Week(
+        weekNumber=2,
+        matchups=[
+            Matchup(
+                teamAId=teams[0].id, teamBId=teams[2].id, teamAScore=110, teamBScore=90
+            ),
+            Matchup(
+                teamAId=teams[1].id, teamBId=teams[3].id, teamAScore=85, teamBScore=85
+            ),
+        ],
+    )
+    week3 = Week(
+        weekNumber=3,
+        matchups=[
+            Matchup(
+                teamAId=teams[0].id, teamBId=teams[3].id, teamAScore=70, teamBScore=95
+            ),
+            Matchup(
+                teamAId=teams[1].id,
+                teamBId=teams[2].id,
+                teamAScore=100,
+                teamBScore=100,
+                teamAHasTiebreaker=True,
+            ),
+        ],
+    )
+    week4 = Week(
+        weekNumber=4,
+        matchups=[
+            Matchup(
+                teamAId=teams[0].id,
+                teamBId=teams[3].id,
+                teamAScore=120,
+                teamBScore=100,
+                matchupType=MatchupType.PLAYOFF,
+            ),
+            Matchup(
+                teamAId=teams[1].id,
+                teamBId=teams[2].id,
+                teamAScore=50,
+                teamBScore=60,
+                matchupType=MatchupType.PLAYOFF,
+                multiWeekMatchupId="1",
+            ),
+        ],
+    )
+    week5 = Week(
+        weekNumber=5,
+        matchups=[
+            Matchup(
+                teamAId=teams[0].id,
+                teamBId=teams[3].id,
+                teamAScore=90,
+                teamBScore=95,
+                matchupType=MatchupType.PLAYOFF,
+            ),
+            Matchup(
+                teamAId=teams[1].id,
+                teamBId=teams[2].id,
+                teamAScore=80,
+                teamBScore=60,
+                matchupType=MatchupType.PLAYOFF,
+                multiWeekMatchupId="1",
+            ),
+        ],
+    )
+    return Year(
+        yearNumber=yearNumber,
+        teams=teams,
+        weeks=[week1, week2, week3, week4, week5],
+    )
+
+
+class TestStreakYearCalculator(unittest.TestCase):
+    def test_getLongestWinStreak_happyPath(self):
+        _, teams = getNDefaultOwnersAndTeams(4)
+        year = getStreakYear(teams)
+
+        response = StreakYearCalculator.getLongestWinStreak(year)
+
+        self.assertIsInstance(response, dict)
+        self.assertEqual(4, len(response.keys()))
+        self.assertEqual(2, response[teams[0].id])
+        self.assertEqual(2, response[teams[1].id])
+        self.assertEqual(1, response[teams[2].id])
+        self.assertEqual(1, response[teams[3].id])
+
+    def test_getLongestWinStreak_onlyRegularSeason(self):
+        _, teams = getNDefaultOwnersAndTeams(4)
+        year = getStreakYear(teams)
+
+        response = StreakYearCalculator.getLongestWinStreak(
+            year, onlyRegularSeason=True
+        )
+
+        self.assertEqual(2, response[teams[0].id])
+        self.assertEqual(1, response[teams[1].id])
+        self.assertEqual(1, response[teams[2].id])
+        self.assertEqual(1, response[teams[3].id])
+
+    def test_getLongestLossStreak_happyPath(self):
+        _, teams = getNDefaultOwnersAndTeams(4)
+        year = getStreakYear(teams)
+
+        response = StreakYearCalculator.getLongestLossStreak(year)
+
+        self.assertEqual(1, response[teams[0].id])
+        self.assertEqual(1, response[teams[1].id])
+        self.assertEqual(3, response[teams[2].id])
+        self.assertEqual(1, response[teams[3].id])
+
+    def test_getCurrentStreak_happyPath(self):
+        _, teams = getNDefaultOwnersAndTeams(4)
+        year = getStreakYear(teams)
+
+        response = StreakYearCalculator.getCurrentStreak(year)
+
+        self.assertEqual(-1, response[teams[0].id])
+        self.assertEqual(2, response[teams[1].id])
+        self.assertEqual(-3, response[teams[2].id])
+        self.assertEqual(1, response[teams[3].id])
+
+    def test_getCurrentStreak_multiWeekMatchupCutByRange(self):
+        _, teams = getNDefaultOwnersAndTeams(4)
+        year = getStreakYear(teams)
+
+        # only the first week of the multi-week matchup is in the range
+        response = StreakYearCalculator.getCurrentStreak(year, weekNumberEnd=4)
+
+        self.assertEqual(1, response[teams[0].id])
+        self.assertEqual(-1, response[teams[1].id])
+        self.assertEqual(1, response[teams[2].id])
+        self.assertEqual(-1, response[teams[3].id])
+
+    def test_getCurrentStreak_lastGameTied(self):
+        _, teams = getNDefaultOwnersAndTeams(4)
+        year = getStreakYear(teams)
+
+        response = StreakYearCalculator.getCurrentStreak(year, weekNumberEnd=2)
+
+        self.assertEqual(0, response[teams[1].id])
+        self.assertEqual(0, response[teams[3].id])
+
+    def test_getLongestStreakAboveLeagueMedian_happyPath(self):
+        _, teams = getNDefaultOwnersAndTeams(4)
+        year = getStreakYear(teams)
+
+        response = StreakYearCalculator.getLongestStreakAboveLeagueMedian(year)
+
+        self.assertEqual(2, response[teams[0].id])
+        self.assertEqual(1, response[teams[1].id])
+        self.assertEqual(2, response[teams[2].id])
+        self.assertEqual(2, response[teams[3].id])
+
+    def test_getStreaks_noGamesInRange(self):
+        _, teams = getNDefaultOwnersAndTeams(4)
+        year = getStreakYear(teams)
+
+        streaks = StreakYearCalculator.getStreaks(year, onlyChampionship=True)
+
+        self.assertEqual(
+            {team.id: 0 for team in teams}, streaks.toIdDict(streaks.currentStreak)
+        )
+        self.assertEqual(
+            {team.id: 0 for team in teams},
+            streaks.toIdDict(streaks.longestStreakAboveMedian),
+        )
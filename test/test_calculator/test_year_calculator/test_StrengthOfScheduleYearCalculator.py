@@ -0,0 +1,132 @@
+import unittest
+
+from leeger.calculator.year_calculator import (
+    AWALYearCalculator,
+    GameOutcomeYearCalculator,
+    StrengthOfScheduleYearCalculator,
+)
+from leeger.enum.MatchupType import MatchupType
+from leeger.util.Deci import Deci
+from test.helper.prototypes import getYearWithNDefaultTeams
+
+
+class TestStrengthOfScheduleYearCalculator(unittest.TestCase):
+    # Points Scored per game: team 1 = 100, team 2 = 80, team 3 = 90, team 4 = 70
+    # Win percentage: team 1 = 1, team 2 = 1/3, team 3 = 2/3, team 4 = 0
+    MATCHUPS_BY_WEEK = [
+        [(0, 1, 100, 80), (2, 3, 90, 70)],
+        [(0, 2, 100, 90), (1, 3, 80, 70)],
+        [(1, 2, 80, 90, {"matchupType": MatchupType.PLAYOFF})],
+    ]
+
+    def test_getOpponentsAveragePointsScoredPerGame_happyPath(self):
+        year, teamIds = getYearWithNDefaultTeams(4, self.MATCHUPS_BY_WEEK)
+
+        response = (
+            StrengthOfScheduleYearCalculator.getOpponentsAveragePointsScoredPerGame(
+                year
+            )
+        )
+
+        self.assertIsInstance(response, dict)
+        self.assertEqual(4, len(response.keys()))
+        self.assertEqual(Deci("85"), response[teamIds[0]])
+        self.assertEqual(Deci("260") / Deci("3"), response[teamIds[1]])
+        self.assertEqual(Deci("250") / Deci("3"), response[teamIds[2]])
+        self.assertEqual(Deci("85"), response[teamIds[3]])
+
+    def test_getOpponentsAveragePointsScoredPerGame_onlyRegularSeason(self):
+        year, teamIds = getYearWithNDefaultTeams(4, self.MATCHUPS_BY_WEEK)
+
+        response = (
+            StrengthOfScheduleYearCalculator.getOpponentsAveragePointsScoredPerGame(
+                year, onlyRegularSeason=True
+            )
+        )
+
+        # team 3's Points Scored per game is also only from the regular season
+        self.assertEqual(Deci("85"), response[teamIds[0]])
+        self.assertEqual(Deci("85"), response[teamIds[1]])
+        self.assertEqual(Deci("85"), response[teamIds[2]])
+
+    def test_getOpponentsAverageWinPercentage_happyPath(self):
+        year, teamIds = getYearWithNDefaultTeams(4, self.MATCHUPS_BY_WEEK)
+        winPercentage = GameOutcomeYearCalculator.getWinPercentage(year)
+
+        response = StrengthOfScheduleYearCalculator.getOpponentsAverageWinPercentage(
+            year
+        )
+
+        self.assertEqual(
+            (winPercentage[teamIds[1]] + winPercentage[teamIds[2]]) / Deci("2"),
+            response[teamIds[0]],
+        )
+        self.assertEqual(
+            (
+                winPercentage[teamIds[0]]
+                + winPercentage[teamIds[3]]
+                + winPercentage[teamIds[2]]
+            )
+            / Deci("3"),
+            response[teamIds[1]],
+        )
+        self.assertAlmostEqual(0.5, float(response[teamIds[3]]))
+
+    def test_getOpponentsAverageAWALPerGame_happyPath(self):
+        year, teamIds = getYearWithNDefaultTeams(4, self.MATCHUPS_BY_WEEK)
+        awalPerGame = AWALYearCalculator.getAWALPerGame(year, weekNumberEnd=1)
+
+        response = StrengthOfScheduleYearCalculator.getOpponentsAverageAWALPerGame(
+            year, weekNumberEnd=1
+        )
+
+        # every team played 1 game in week 1
+        self.assertEqual(awalPerGame[teamIds[1]], response[teamIds[0]])
+        self.assertEqual(awalPerGame[teamIds[0]], response[teamIds[1]])
+        self.assertEqual(awalPerGame[teamIds[3]], response[teamIds[2]])
+        self.assertEqual(awalPerGame[teamIds[2]], response[teamIds[3]])
+        self.assertEqual(Deci("0"), response[teamIds[2]])
+
+    def test_getOpponentsAverage_multiWeekMatchupCountsAsOneGame(self):
+        year, teamIds = getYearWithNDefaultTeams(
+            2,
+            [
+                [(0, 1, 100, 110)],
+                [(0, 1, 100, 90, {"multiWeekMatchupId": "1"})],
+                [(0, 1, 100, 90, {"multiWeekMatchupId": "1"})],
+            ],
+        )
+
+        response = StrengthOfScheduleYearCalculator.getOpponentsAverageWinPercentage(
+            year
+        )
+
+        # each team won 1 of the 2 games (the multi-week matchup is 1 game)
+        self.assertEqual(Deci("0.5"), response[teamIds[0]])
+        self.assertEqual(Deci("0.5"), response[teamIds[1]])
+
+    def test_getOpponentsAverage_noGamesInRange(self):
+        year, teamIds = getYearWithNDefaultTeams(4, self.MATCHUPS_BY_WEEK)
+
+        response = (
+            StrengthOfScheduleYearCalculator.getOpponentsAveragePointsScoredPerGame(
+                year, onlyPostSeason=True
+            )
+        )
+
+        self.assertIsNone(response[teamIds[0]])
+        self.assertEqual(Deci("90"), response[teamIds[1]])
+        self.assertEqual(Deci("80"), response[teamIds[2]])
+        self.assertIsNone(response[teamIds[3]])
+
+    def test_getOpponentsAverage_floatBackend(self):
+        year, teamIds = getYearWithNDefaultTeams(4, self.MATCHUPS_BY_WEEK)
+
+        response = (
+            StrengthOfScheduleYearCalculator.getOpponentsAveragePointsScoredPerGame(
+                year, numericBackend="FLOAT"
+            )
+        )
+
+        self.assertEqual(Deci("85"), response[teamIds[0]])
+        self.assertAlmostEqual(260 / 3, float(response[teamIds[1]]))
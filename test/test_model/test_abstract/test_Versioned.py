@@ -0,0 +1,103 @@
+import copy
+import pickle
+import unittest
+
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from test.helper.prototypes import getNDefaultOwnersAndTeams
+
+
+class TestVersioned(unittest.TestCase):
+    def test_version_changesWhenAttributeIsSet(self):
+        matchup = Matchup(teamAId="a", teamBId="b", teamAScore=1, teamBScore=2)
+        version = matchup.version
+
+        matchup.teamAScore = 3
+
+        self.assertGreater(matchup.version, version)
+
+    def test_getVersionKey_changesWhenNestedModelIsModified(self):
+        matchup = Matchup(teamAId="a", teamBId="b", teamAScore=1, teamBScore=2)
+        week = Week(weekNumber=1, matchups=[matchup])
+        versionKey = week.getVersionKey()
+
+        self.assertEqual(versionKey, week.getVersionKey())
+        matchup.teamBScore = 3
+        self.assertNotEqual(versionKey, week.getVersionKey())
+
+    def test_getVersionKey_changesWhenNestedListIsModified(self):
+        matchup = Matchup(teamAId="a", teamBId="b", teamAScore=1, teamBScore=2)
+        week = Week(weekNumber=1, matchups=list())
+        versionKey = week.getVersionKey()
+
+        week.matchups.append(matchup)
+
+        self.assertNotEqual(versionKey, week.getVersionKey())
+
+    def test_getVersionKey_listAttributeIsNotCopied(self):
+        matchup = Matchup(teamAId="a", teamBId="b", teamAScore=1, teamBScore=2)
+        matchups = list()
+        week = Week(weekNumber=1, matchups=matchups)
+        versionKey = week.getVersionKey()
+
+        matchups.append(matchup)
+
+        self.assertIs(matchups, week.matchups)
+        self.assertNotEqual(versionKey, week.getVersionKey())
+
+    def test_getVersionKey_sameWhenOtherModelIsModified(self):
+        matchup = Matchup(teamAId="a", teamBId="b", teamAScore=1, teamBScore=2)
+        otherMatchup = Matchup(teamAId="a", teamBId="b", teamAScore=1, teamBScore=2)
+        week = Week(weekNumber=1, matchups=[matchup])
+        otherWeek = Week(weekNumber=1, matchups=[otherMatchup])
+        versionKey = week.getVersionKey()
+        otherWeek.getVersionKey()
+
+        otherMatchup.teamAScore = 3
+        otherWeek.matchups.append(matchup)
+
+        self.assertEqual(versionKey, week.getVersionKey())
+
+    def test_getVersionKey_changesWhenDeeplyNestedModelIsModified(self):
+        owners, teams = getNDefaultOwnersAndTeams(2)
+        matchup = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=2
+        )
+        year = Year(
+            yearNumber=2000,
+            teams=teams,
+            weeks=[Week(weekNumber=1, matchups=[matchup])],
+        )
+        league = League(name="TEST", owners=owners, years=[year])
+        versionKey = league.getVersionKey()
+
+        matchup.teamAScore = 3
+        self.assertNotEqual(versionKey, league.getVersionKey())
+
+        versionKey = league.getVersionKey()
+        year.weeks[0].matchups[0] = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=2
+        )
+        self.assertNotEqual(versionKey, league.getVersionKey())
+
+        versionKey = league.getVersionKey()
+        year.weeks[0].matchups[0].teamBScore = 4
+        self.assertNotEqual(versionKey, league.getVersionKey())
+
+    def test_getVersionKey_copiesAreVersionedSeparately(self):
+        matchup = Matchup(teamAId="a", teamBId="b", teamAScore=1, teamBScore=2)
+        week = Week(weekNumber=1, matchups=[matchup])
+
+        for weekCopy in (copy.deepcopy(week), pickle.loads(pickle.dumps(week))):
+            versionKey = week.getVersionKey()
+            copyVersionKey = weekCopy.getVersionKey()
+
+            weekCopy.matchups[0].teamAScore = 3
+            weekCopy.matchups.append(matchup)
+
+            self.assertEqual(versionKey, week.getVersionKey())
+            self.assertNotEqual(copyVersionKey, weekCopy.getVersionKey())
+            self.assertEqual(1, matchup.teamAScore)
+            self.assertEqual(1, len(week.matchups))
@@ -0,0 +1,86 @@
+import unittest
+
+from leeger.exception.DoesNotExistException import DoesNotExistException
+from leeger.model.filter.YearFilters import YearFilters
+from leeger.model.frame.HeadToHead import HeadToHead
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.util.Deci import Deci
+from leeger.util.navigator.YearNavigator import YearNavigator
+from test.helper.prototypes import getNDefaultOwnersAndTeams
+
+
+class TestHeadToHead(unittest.TestCase):
+    def __getHeadToHead(self) -> tuple[HeadToHead, list[str]]:
+        owners, teams = getNDefaultOwnersAndTeams(2)
+        week1 = Week(
+            weekNumber=1,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[1].id,
+                    teamAScore=1.5,
+                    teamBScore=1.5,
+                    teamAHasTiebreaker=True,
+                )
+            ],
+        )
+        week2 = Week(
+            weekNumber=2,
+            matchups=[
+                Matchup(
+                    teamAId=teams[1].id,
+                    teamBId=teams[0].id,
+                    teamAScore=3,
+                    teamBScore=2.25,
+                )
+            ],
+        )
+        year = Year(yearNumber=2000, teams=teams, weeks=[week1, week2])
+        yearFrame = YearNavigator.getYearFrame(year)
+        ownerIds = [owner.id for owner in owners]
+        return (
+            HeadToHead.build(
+                ownerIds,
+                [
+                    (
+                        yearFrame,
+                        yearFrame.getRows(YearFilters.getForYear(year)),
+                        ownerIds,
+                    )
+                ],
+            ),
+            ownerIds,
+        )
+
+    def test_build_happyPath(self):
+        headToHead, (owner1, owner2) = self.__getHeadToHead()
+
+        # owner 1 won on a tiebreaker
+        self.assertEqual([[0, 1], [1, 0]], headToHead.wins.tolist())
+        self.assertEqual([[0, 1], [1, 0]], headToHead.losses.tolist())
+        self.assertEqual([[0, 0], [0, 0]], headToHead.ties.tolist())
+        self.assertEqual([[0, 2], [2, 0]], headToHead.gamesPlayed.tolist())
+        self.assertEqual(Deci("3.75"), headToHead.getPointsScored(owner1, owner2))
+        self.assertEqual(Deci("4.5"), headToHead.getPointsScored(owner2, owner1))
+        self.assertEqual(
+            Deci("4.5"), headToHead.getOpponentPointsScored(owner1, owner2)
+        )
+
+    def test_build_noRows(self):
+        headToHead = HeadToHead.build(["a", "b"], list())
+
+        self.assertEqual(0, headToHead.getGamesPlayed("a", "b"))
+        self.assertEqual(Deci("0"), headToHead.getPointsScored("a", "b"))
+        self.assertEqual({"a": dict(), "b": dict()}, headToHead.getRivalryTable())
+
+    def test_getWins_ownerDoesNotExist_raisesException(self):
+        headToHead, (owner1, _) = self.__getHeadToHead()
+
+        with self.assertRaises(DoesNotExistException) as context:
+            headToHead.getWins(owner1, "badId")
+        self.assertEqual(
+            "Owner with ID badId does not exist in the given League.",
+            str(context.exception),
+        )
@@ -0,0 +1,91 @@
+import unittest
+
+from leeger.exception.DoesNotExistException import DoesNotExistException
+from leeger.model.frame.LeagueIndex import LeagueIndex
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Owner import Owner
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from test.helper.prototypes import getNDefaultOwnersAndTeams, getTeamsFromOwners
+
+
+class TestLeagueIndex(unittest.TestCase):
+    def __getLeague(self) -> League:
+        owners, teamsA = getNDefaultOwnersAndTeams(2)
+        teamsB = getTeamsFromOwners(owners)
+        yearA = Year(yearNumber=2000, teams=teamsA, weeks=list())
+        yearB = Year(yearNumber=2001, teams=teamsB, weeks=list())
+        return League(name="TEST", owners=owners, years=[yearA, yearB])
+
+    def test_fromLeague_happyPath(self):
+        league = self.__getLeague()
+
+        leagueIndex = LeagueIndex.fromLeague(league)
+
+        for owner in league.owners:
+            self.assertIs(owner, leagueIndex.getOwnerById(owner.id))
+        for year in league.years:
+            self.assertIs(year, leagueIndex.getYearByYearNumber(year.yearNumber))
+            for team in year.teams:
+                self.assertIs(team, leagueIndex.getTeamById(team.id))
+                self.assertEqual(team.ownerId, leagueIndex.getOwnerIdByTeamId(team.id))
+
+    def test_getOwnerById_notFound_raisesException(self):
+        leagueIndex = LeagueIndex.fromLeague(self.__getLeague())
+
+        with self.assertRaises(DoesNotExistException) as context:
+            leagueIndex.getOwnerById("badId")
+        self.assertEqual(
+            "Owner with ID badId does not exist in the given League.",
+            str(context.exception),
+        )
+
+    def test_getYearByYearNumber_notFound_raisesException(self):
+        leagueIndex = LeagueIndex.fromLeague(self.__getLeague())
+
+        with self.assertRaises(DoesNotExistException) as context:
+            leagueIndex.getYearByYearNumber(1999)
+        self.assertEqual(
+            "Year 1999 does not exist in the given League.", str(context.exception)
+        )
+
+    def test_getTeamById_notFound_raisesException(self):
+        leagueIndex = LeagueIndex.fromLeague(self.__getLeague())
+
+        with self.assertRaises(DoesNotExistException) as context:
+            leagueIndex.getTeamById("badId")
+        self.assertEqual(
+            "Team with ID badId does not exist in the given League.",
+            str(context.exception),
+        )
+        with self.assertRaises(DoesNotExistException):
+            leagueIndex.getOwnerIdByTeamId("badId")
+
+    def test_getStructureKey_changesWhenStructureIsModified(self):
+        league = self.__getLeague()
+        structureKey = LeagueIndex.getStructureKey(league)
+
+        league.owners.append(Owner(name="new owner"))
+        self.assertNotEqual(structureKey, LeagueIndex.getStructureKey(league))
+        structureKey = LeagueIndex.getStructureKey(league)
+
+        league.years[1].teams[0].ownerId = league.owners[1].id
+        self.assertNotEqual(structureKey, LeagueIndex.getStructureKey(league))
+        structureKey = LeagueIndex.getStructureKey(league)
+
+        league.years[0].yearNumber = 1999
+        self.assertNotEqual(structureKey, LeagueIndex.getStructureKey(league))
+
+    def test_getStructureKey_weeksAreNotPartOfTheKey(self):
+        league = self.__getLeague()
+        week = Week(weekNumber=1, matchups=list())
+        league.years[0].weeks.append(week)
+        structureKey = LeagueIndex.getStructureKey(league)
+
+        week.weekNumber = 2
+        week.matchups.append(
+            Matchup(teamAId="a", teamBId="b", teamAScore=1, teamBScore=2)
+        )
+
+        self.assertEqual(structureKey, LeagueIndex.getStructureKey(league))
@@ -0,0 +1,74 @@
+import unittest
+
+import numpy
+
+from leeger.model.frame.MatchupColumns import MatchupColumns
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.util.navigator.YearNavigator import YearNavigator
+from test.helper.prototypes import getNDefaultOwnersAndTeams
+
+
+class TestMatchupColumns(unittest.TestCase):
+    @staticmethod
+    def __getYear(yearNumber: int, teamAScore: float | int) -> Year:
+        _, teams = getNDefaultOwnersAndTeams(2)
+        week1 = Week(
+            weekNumber=1,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[1].id,
+                    teamAScore=teamAScore,
+                    teamBScore=10,
+                    teamBHasTiebreaker=True,
+                )
+            ],
+        )
+        week2 = Week(
+            weekNumber=2,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[1].id,
+                    teamAScore=1.25,
+                    teamBScore=2,
+                )
+            ],
+        )
+        return Year(yearNumber=yearNumber, teams=teams, weeks=[week1, week2])
+
+    def test_build_happyPath(self):
+        yearA = self.__getYear(2000, 10)
+        yearB = self.__getYear(2001, 11.5)
+        yearFrameA = YearNavigator.getYearFrame(yearA)
+        yearFrameB = YearNavigator.getYearFrame(yearB)
+
+        matchupColumns = MatchupColumns.build(
+            [(yearFrameA, numpy.array([0, 1])), (yearFrameB, numpy.array([0]))]
+        )
+
+        self.assertEqual(3, len(matchupColumns))
+        self.assertEqual([10, 1.25, 11.5], matchupColumns.teamAScoreValue.tolist())
+        self.assertEqual(numpy.float64, matchupColumns.teamAKey.dtype)
+        self.assertEqual([False, False, True], matchupColumns.teamAWon.tolist())
+        # team B won on a tiebreaker
+        self.assertEqual([True, True, False], matchupColumns.teamBWon.tolist())
+        self.assertEqual((yearFrameB, 0), matchupColumns.getYearFrameAndRow(2))
+
+    def test_build_fixedPointScaleGiven_keysAreFixedPointIntegers(self):
+        yearFrame = YearNavigator.getYearFrame(self.__getYear(2000, 10))
+
+        matchupColumns = MatchupColumns.build(
+            [(yearFrame, numpy.array([0, 1]))], fixedPointScale=2
+        )
+
+        self.assertEqual([1000, 125], matchupColumns.teamAKey.tolist())
+        self.assertEqual([1000, 200], matchupColumns.teamBKey.tolist())
+
+    def test_build_noRows(self):
+        matchupColumns = MatchupColumns.build(list())
+
+        self.assertEqual(0, len(matchupColumns))
+        self.assertEqual(0, len(matchupColumns.teamAWon))
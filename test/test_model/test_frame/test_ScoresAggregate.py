@@ -0,0 +1,88 @@
+import unittest
+
+from leeger.model.frame.ScoresAggregate import ScoresAggregate
+
+
+class TestScoresAggregate(unittest.TestCase):
+    @staticmethod
+    def __getScoresAggregate(
+        teamAId: str,
+        teamBId: str,
+        teamAScore: float | int,
+        teamBScore: float | int,
+        *,
+        multiWeekMatchupId: str = None,
+    ) -> ScoresAggregate:
+        if multiWeekMatchupId is None:
+            return ScoresAggregate(
+                ids=(teamAId, teamBId),
+                scores=(teamAScore, teamBScore),
+                opponentScores=(teamBScore, teamAScore),
+                multiWeekMatchupIds=tuple(),
+                multiWeekMatchupTeamAIds=tuple(),
+                multiWeekMatchupTeamBIds=tuple(),
+                multiWeekMatchupTeamAScores=tuple(),
+                multiWeekMatchupTeamBScores=tuple(),
+            )
+        return ScoresAggregate(
+            ids=tuple(),
+            scores=tuple(),
+            opponentScores=tuple(),
+            multiWeekMatchupIds=(multiWeekMatchupId,),
+            multiWeekMatchupTeamAIds=(teamAId,),
+            multiWeekMatchupTeamBIds=(teamBId,),
+            multiWeekMatchupTeamAScores=(teamAScore,),
+            multiWeekMatchupTeamBScores=(teamBScore,),
+        )
+
+    def test_merge_happyPath(self):
+        scoresAggregate = ScoresAggregate.merge(
+            [
+                self.__getScoresAggregate("a", "b", 1, 2),
+                self.__getScoresAggregate("a", "c", 3, 4, multiWeekMatchupId="1"),
+                self.__getScoresAggregate("b", "c", 5, 6),
+            ]
+        )
+
+        self.assertEqual(("a", "b", "b", "c"), scoresAggregate.ids)
+        self.assertEqual((1, 2, 5, 6), scoresAggregate.scores)
+        self.assertEqual((2, 1, 6, 5), scoresAggregate.opponentScores)
+        self.assertEqual(("1",), scoresAggregate.multiWeekMatchupIds)
+        self.assertEqual((3,), scoresAggregate.multiWeekMatchupTeamAScores)
+
+    def test_merge_noScoresAggregates(self):
+        scoresAggregate = ScoresAggregate.merge(list())
+
+        self.assertEqual((list(), list()), scoresAggregate.getIdsAndScores())
+
+    def test_mapIds_happyPath(self):
+        scoresAggregate = ScoresAggregate.merge(
+            [
+                self.__getScoresAggregate("a", "b", 1, 2),
+                self.__getScoresAggregate("a", "c", 3, 4, multiWeekMatchupId="1"),
+            ]
+        ).mapIds({"a": "A", "b": "B", "c": "C"})
+
+        self.assertEqual(("A", "B"), scoresAggregate.ids)
+        self.assertEqual(("A",), scoresAggregate.multiWeekMatchupTeamAIds)
+        self.assertEqual(("C",), scoresAggregate.multiWeekMatchupTeamBIds)
+        self.assertEqual((1, 2), scoresAggregate.scores)
+
+    def test_getIdsAndScores_multiWeekMatchupsCombinedAfterMerging(self):
+        # the same multi-week matchup is split between the merged ScoresAggregates
+        scoresAggregate = ScoresAggregate.merge(
+            [
+                self.__getScoresAggregate("a", "b", 1.1, 2.2, multiWeekMatchupId="1"),
+                self.__getScoresAggregate("c", "d", 3, 4),
+                self.__getScoresAggregate("c", "d", 5, 6, multiWeekMatchupId="2"),
+                self.__getScoresAggregate("a", "b", 3.3, 4.4, multiWeekMatchupId="1"),
+            ]
+        )
+
+        ids, scores = scoresAggregate.getIdsAndScores()
+        _, opponentScores = scoresAggregate.getIdsAndScores(opponentScores=True)
+
+        # combined multi-week matchups come last, in the order they were first played
+        self.assertEqual(["c", "d", "a", "b", "c", "d"], ids)
+        self.assertEqual([3, 4, 1.1 + 3.3, 2.2 + 4.4, 5, 6], scores)
+        self.assertEqual([4, 3, 2.2 + 4.4, 1.1 + 3.3, 6, 5], opponentScores)
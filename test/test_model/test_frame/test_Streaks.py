@@ -0,0 +1,44 @@
+import unittest
+
+import numpy
+
+from leeger.model.frame.Streaks import Streaks
+
+
+class TestStreaks(unittest.TestCase):
+    def test_build_happyPath(self):
+        # games are interleaved between ids, but each id's games are in the order they were played
+        streaks = Streaks.build(
+            ["a", "b", "c"],
+            numpy.array([0, 1, 0, 1, 0, 1, 0, 1, 0]),
+            numpy.array([1, -1, 1, -1, 0, -1, 1, 1, 1]),
+            numpy.array([0, 1, 0, 1, 0, 1]),
+            numpy.array([True, False, True, True, False, True]),
+        )
+
+        self.assertEqual(("a", "b", "c"), streaks.ids)
+        self.assertEqual([2, 1, 0], streaks.longestWinStreak.tolist())
+        self.assertEqual([0, 3, 0], streaks.longestLossStreak.tolist())
+        self.assertEqual([2, 1, 0], streaks.currentStreak.tolist())
+        self.assertEqual([2, 2, 0], streaks.longestStreakAboveMedian.tolist())
+
+    def test_build_noGames(self):
+        empty = numpy.array([], dtype=numpy.int64)
+
+        streaks = Streaks.build(["a"], empty, empty, empty, empty.astype(bool))
+
+        self.assertEqual([0], streaks.longestWinStreak.tolist())
+        self.assertEqual([0], streaks.longestLossStreak.tolist())
+        self.assertEqual([0], streaks.currentStreak.tolist())
+        self.assertEqual([0], streaks.longestStreakAboveMedian.tolist())
+
+    def test_toIdDict_happyPath(self):
+        streaks = Streaks.build(
+            ["a", "b"],
+            numpy.array([0, 1]),
+            numpy.array([-1, 1]),
+            numpy.array([0, 1]),
+            numpy.array([False, True]),
+        )
+
+        self.assertEqual({"a": -1, "b": 1}, streaks.toIdDict(streaks.currentStreak))
@@ -0,0 +1,131 @@
+import decimal
+import unittest
+
+import numpy
+
+from leeger.model.filter.YearFilters import YearFilters
+from leeger.model.frame.YearFrame import YearFrame
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.util.Deci import Deci
+from test.helper.prototypes import getNDefaultOwnersAndTeams
+
+
+class TestWeekRangeIndex(unittest.TestCase):
+    def __getYear(self, scores: list[tuple[float | int, float | int]]) -> Year:
+        _, teams = getNDefaultOwnersAndTeams(2)
+        weeks = [
+            Week(
+                weekNumber=i + 1,
+                matchups=[
+                    Matchup(
+                        teamAId=teams[0].id,
+                        teamBId=teams[1].id,
+                        teamAScore=teamAScore,
+                        teamBScore=teamBScore,
+                    )
+                ],
+            )
+            for i, (teamAScore, teamBScore) in enumerate(scores)
+        ]
+        return Year(yearNumber=2000, teams=teams, weeks=weeks)
+
+    def __getWeekRangeIndex(self, year: Year):
+        return YearFrame.fromYear(year).getWeekRangeIndex(
+            YearFilters.getForYear(year).includeMatchupTypes
+        )
+
+    def test_build_runningTotals(self):
+        year = self.__getYear([(100, 90), (80, 80), (70, 75.5)])
+
+        weekRangeIndex = self.__getWeekRangeIndex(year)
+
+        self.assertEqual(
+            [[0, 0], [1, 1], [2, 2], [3, 3]], weekRangeIndex.gamesPlayed.tolist()
+        )
+        self.assertEqual([[0, 0], [1, 0], [1, 0], [1, 1]], weekRangeIndex.wins.tolist())
+        self.assertEqual(
+            [[0, 0], [0, 1], [0, 1], [1, 1]], weekRangeIndex.losses.tolist()
+        )
+        self.assertEqual([[0, 0], [0, 0], [1, 1], [1, 1]], weekRangeIndex.ties.tolist())
+
+    def test_getRangeTotal_happyPath(self):
+        year = self.__getYear([(100, 90), (80, 80), (70, 75.5)])
+        weekRangeIndex = self.__getWeekRangeIndex(year)
+
+        self.assertEqual(
+            [0, 1], weekRangeIndex.getRangeTotal(weekRangeIndex.wins, 2, 3).tolist()
+        )
+        self.assertEqual(
+            [1, 1], weekRangeIndex.getRangeTotal(weekRangeIndex.ties, 2, 2).tolist()
+        )
+
+    def test_getDecimalPointsScoredInRange_matchesAddingScoresOneAtATime(self):
+        scores = [(100.25, 90), (80, 80.5), (70, 75), (0.1, 0.2)]
+        year = self.__getYear(scores)
+        weekRangeIndex = self.__getWeekRangeIndex(year)
+
+        for weekNumberStart in range(1, len(scores) + 1):
+            for weekNumberEnd in range(weekNumberStart, len(scores) + 1):
+                for opponentScores in (False, True):
+                    expected = [Deci(0), Deci(0)]
+                    for teamAScore, teamBScore in scores[
+                        weekNumberStart - 1 : weekNumberEnd
+                    ]:
+                        if opponentScores:
+                            teamAScore, teamBScore = teamBScore, teamAScore
+                        expected[0] += Deci(teamAScore)
+                        expected[1] += Deci(teamBScore)
+                    with self.subTest(
+                        weekNumberStart=weekNumberStart,
+                        weekNumberEnd=weekNumberEnd,
+                        opponentScores=opponentScores,
+                    ):
+                        # compare the repr so Decimals must have the same exponent, not just the same value
+                        self.assertEqual(
+                            repr(expected),
+                            repr(
+                                weekRangeIndex.getDecimalPointsScoredInRange(
+                                    weekNumberStart,
+                                    weekNumberEnd,
+                                    opponentScores=opponentScores,
+                                )
+                            ),
+                        )
+
+    def test_getDecimalPointsScoredInRange_inexactRunningTotal_returnsNone(self):
+        year = self.__getYear([(1.25, 2), (3, 4)])
+
+        with decimal.localcontext() as context:
+            context.prec = 2
+            weekRangeIndex = self.__getWeekRangeIndex(year)
+
+        self.assertIsNone(weekRangeIndex.pointsScored)
+        # 1.25 + 3 needs 3 digits
+        self.assertIsNone(weekRangeIndex.getDecimalPointsScoredInRange(1, 2))
+
+    def test_getFixedPointPointsScoredInRange_builtOncePerScale(self):
+        year = self.__getYear([(100.25, 90), (80, 80.5)])
+        yearFrame = YearFrame.fromYear(year)
+        weekRangeIndex = yearFrame.getWeekRangeIndex(
+            YearFilters.getForYear(year).includeMatchupTypes
+        )
+        fixedPointScores = yearFrame.getFixedPointScores(
+            2, numpy.arange(len(yearFrame.teamAIndex))
+        )
+
+        self.assertEqual(
+            [18025, 17050],
+            weekRangeIndex.getFixedPointPointsScoredInRange(
+                1, 2, 2, fixedPointScores
+            ).tolist(),
+        )
+        # the fixed-point scores are only needed the first time a scale is used
+        emptyScores = (numpy.array([]), numpy.array([]))
+        self.assertEqual(
+            [8050, 8000],
+            weekRangeIndex.getFixedPointPointsScoredInRange(
+                2, 2, 2, emptyScores, opponentScores=True
+            ).tolist(),
+        )
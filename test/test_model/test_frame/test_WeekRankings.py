@@ -0,0 +1,135 @@
+import unittest
+
+from leeger.enum.MatchupType import MatchupType
+from leeger.model.filter.YearFilters import YearFilters
+from leeger.model.frame.YearFrame import YearFrame
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from test.helper.prototypes import getNDefaultOwnersAndTeams
+
+
+class TestWeekRankings(unittest.TestCase):
+    def __getYear(self) -> Year:
+        _, teams = getNDefaultOwnersAndTeams(4)
+        week1 = Week(
+            weekNumber=1,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[1].id,
+                    teamAScore=100,
+                    teamBScore=90.5,
+                ),
+                Matchup(
+                    teamAId=teams[2].id,
+                    teamBId=teams[3].id,
+                    teamAScore=90.5,
+                    teamBScore=80,
+                ),
+            ],
+        )
+        week2 = Week(
+            weekNumber=2,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[2].id,
+                    teamAScore=1,
+                    teamBScore=2,
+                ),
+                Matchup(
+                    teamAId=teams[1].id,
+                    teamBId=teams[3].id,
+                    teamAScore=3,
+                    teamBScore=4,
+                    matchupType=MatchupType.IGNORE,
+                ),
+            ],
+        )
+        return Year(yearNumber=2000, teams=teams, weeks=[week1, week2])
+
+    def test_getWeekRankings_happyPath(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+
+        weekRankings = yearFrame.getWeekRankings(YearFilters.getForYear(year))
+
+        self.assertEqual([0, 1, 2], weekRankings.rows.tolist())
+        self.assertEqual([0, 0, 1], weekRankings.weekPosition.tolist())
+        self.assertEqual([3, 1, 0], weekRankings.teamAScoresBeat.tolist())
+        self.assertEqual([0, 1, 0], weekRankings.teamAScoresTied.tolist())
+        self.assertEqual([1, 0, 1], weekRankings.teamBScoresBeat.tolist())
+        self.assertEqual([1, 0, 0], weekRankings.teamBScoresTied.tolist())
+        self.assertEqual([0, 1], weekRankings.weekIndex.tolist())
+        self.assertEqual([4, 2], weekRankings.numberOfScores.tolist())
+        self.assertEqual([90.5, 1.5], weekRankings.medianScore.tolist())
+        self.assertEqual((361.0, 3), weekRankings.totalScore)
+        self.assertIsInstance(weekRankings.totalScore[1], int)
+
+    def test_getWeekRankings_isOnlyBuiltOnce(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+
+        weekRankings = yearFrame.getWeekRankings(YearFilters.getForYear(year))
+
+        self.assertIs(
+            weekRankings, yearFrame.getWeekRankings(YearFilters.getForYear(year))
+        )
+        self.assertIsNot(
+            weekRankings,
+            yearFrame.getWeekRankings(
+                YearFilters.getForYear(year, onlyRegularSeason=True)
+            ),
+        )
+
+    def test_getWeeks_matchesRankingsBuiltFromOnlyThoseWeeks(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+        allWeeks = yearFrame.getWeekRankings(YearFilters.getForYear(year))
+
+        weekRankings = allWeeks.getWeeks(2, 2)
+
+        self.assertEqual([2], weekRankings.rows.tolist())
+        self.assertEqual([0], weekRankings.weekPosition.tolist())
+        self.assertEqual([0], weekRankings.teamAScoresBeat.tolist())
+        self.assertEqual([1], weekRankings.teamBScoresBeat.tolist())
+        self.assertEqual([1], weekRankings.weekIndex.tolist())
+        self.assertEqual([2], weekRankings.numberOfScores.tolist())
+        self.assertEqual([1.5], weekRankings.medianScore.tolist())
+        self.assertEqual((3,), weekRankings.totalScore)
+        self.assertEqual(0, len(allWeeks.getWeeks(3, 3).rows))
+
+    def test_getWeekRankings_weekRangeTakenFromEveryWeek(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+
+        weekRankings = yearFrame.getWeekRankings(
+            YearFilters.getForYear(year, weekNumberStart=1, weekNumberEnd=1)
+        )
+
+        self.assertEqual([0, 1], weekRankings.rows.tolist())
+        self.assertEqual([3, 1], weekRankings.teamAScoresBeat.tolist())
+        self.assertEqual((361.0,), weekRankings.totalScore)
+
+    def test_getRankingOfEachScore_happyPath(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+        weekRankings = yearFrame.getWeekRankings(YearFilters.getForYear(year))
+
+        teamIndexes, scoresBeat, scoresTied, numberOfScores = (
+            weekRankings.getRankingOfEachScore()
+        )
+
+        self.assertEqual([0, 1, 2, 3, 0, 2], teamIndexes.tolist())
+        self.assertEqual([3, 1, 1, 0, 0, 1], scoresBeat.tolist())
+        self.assertEqual([0, 1, 1, 0, 0, 0], scoresTied.tolist())
+        self.assertEqual([4, 4, 4, 4, 2, 2], numberOfScores.tolist())
+
+        teamIndexes, scoresBeat, scoresTied, numberOfScores = (
+            weekRankings.getRankingOfEachScore(opponentScores=True)
+        )
+
+        self.assertEqual([0, 1, 2, 3, 0, 2], teamIndexes.tolist())
+        self.assertEqual([1, 3, 0, 1, 1, 0], scoresBeat.tolist())
+        self.assertEqual([1, 0, 0, 1, 0, 0], scoresTied.tolist())
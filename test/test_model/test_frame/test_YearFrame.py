@@ -0,0 +1,430 @@
+import unittest
+
+import numpy
+
+from leeger.enum.MatchupType import MatchupType
+from leeger.model.filter.YearFilters import YearFilters
+from leeger.model.frame.YearFrame import YearFrame
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from test.helper.prototypes import getNDefaultOwnersAndTeams
+
+
+class TestYearFrame(unittest.TestCase):
+    def __getYear(self) -> Year:
+        _, teams = getNDefaultOwnersAndTeams(3)
+        matchup1 = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=2
+        )
+        matchup2 = Matchup(
+            teamAId=teams[0].id,
+            teamBId=teams[2].id,
+            teamAScore=1.1,
+            teamBScore=2.2,
+            matchupType=MatchupType.PLAYOFF,
+            multiWeekMatchupId="1",
+        )
+        matchup3 = Matchup(
+            teamAId=teams[0].id,
+            teamBId=teams[2].id,
+            teamAScore=3.3,
+            teamBScore=1.1,
+            matchupType=MatchupType.PLAYOFF,
+            multiWeekMatchupId="1",
+            teamAHasTiebreaker=True,
+        )
+        matchup4 = Matchup(
+            teamAId=teams[1].id,
+            teamBId=teams[2].id,
+            teamAScore=5,
+            teamBScore=5,
+            matchupType=MatchupType.IGNORE,
+        )
+        week1 = Week(weekNumber=1, matchups=[matchup1])
+        week2 = Week(weekNumber=2, matchups=[matchup2])
+        week3 = Week(weekNumber=3, matchups=[matchup3, matchup4])
+        return Year(yearNumber=2000, teams=teams, weeks=[week1, week2, week3])
+
+    def test_fromYear_happyPath(self):
+        year = self.__getYear()
+
+        yearFrame = YearFrame.fromYear(year)
+
+        self.assertEqual(2000, yearFrame.yearNumber)
+        self.assertEqual(tuple(team.id for team in year.teams), yearFrame.teamIds)
+        self.assertEqual(3, yearFrame.numberOfTeams)
+        self.assertEqual(3, yearFrame.numberOfWeeks)
+        self.assertEqual(("1",), yearFrame.multiWeekMatchupIds)
+        self.assertEqual([0, 1, 2, 2], yearFrame.weekIndex.tolist())
+        self.assertEqual([0, 0, 0, 1], yearFrame.teamAIndex.tolist())
+        self.assertEqual([1, 2, 2, 2], yearFrame.teamBIndex.tolist())
+        self.assertEqual([1, 1.1, 3.3, 5], yearFrame.teamAScoreValue.tolist())
+        self.assertIsInstance(yearFrame.teamAScoreValue[0], int)
+        self.assertEqual([0, 1, 1, 3], yearFrame.matchupTypeCode.tolist())
+        self.assertEqual([-1, 0, 0, -1], yearFrame.multiWeekMatchupGroup.tolist())
+        self.assertEqual(
+            [False, False, True, False], yearFrame.teamAHasTiebreaker.tolist()
+        )
+
+    def test_getRows_happyPath(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+
+        self.assertEqual(
+            [0, 1, 2], yearFrame.getRows(YearFilters.getForYear(year)).tolist()
+        )
+        self.assertEqual(
+            [1],
+            yearFrame.getRows(
+                YearFilters.getForYear(year, weekNumberStart=2, weekNumberEnd=2)
+            ).tolist(),
+        )
+        self.assertEqual(
+            [0],
+            yearFrame.getRows(
+                YearFilters.getForYear(year), excludeMultiWeekMatchups=True
+            ).tolist(),
+        )
+
+    def test_simplifyMultiWeekMatchups_happyPath(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+
+        simplifiedMatchups = yearFrame.simplifyMultiWeekMatchups(
+            yearFrame.getRows(YearFilters.getForYear(year))
+        )
+
+        self.assertEqual(2, len(simplifiedMatchups))
+        self.assertEqual([1, 4.4], simplifiedMatchups.teamAScoreValue.tolist())
+        self.assertEqual(
+            [2, 3.3000000000000003], simplifiedMatchups.teamBScoreValue.tolist()
+        )
+        # tiebreakers come from the first matchup in a multi-week matchup
+        self.assertEqual([False, False], simplifiedMatchups.teamAHasTiebreaker.tolist())
+        teamAWon, teamBWon, tied = simplifiedMatchups.getOutcomes()
+        self.assertEqual([False, True], teamAWon.tolist())
+        self.assertEqual([True, False], teamBWon.tolist())
+        self.assertEqual([False, False], tied.tolist())
+
+    def test_getScoresByTeam_happyPath(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+        rows = yearFrame.getRows(YearFilters.getForYear(year))
+
+        self.assertEqual(
+            [[1, 1.1, 3.3], [2], [2.2, 1.1]], yearFrame.getScoresByTeam(rows)
+        )
+        self.assertEqual(
+            [[2, 2.2, 1.1], [1], [1.1, 3.3]],
+            yearFrame.getScoresByTeam(rows, opponentScores=True),
+        )
+
+    def test_getScoresAggregate_happyPath(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+        teamIds = [team.id for team in year.teams]
+
+        scoresAggregate = yearFrame.getScoresAggregate(YearFilters.getForYear(year))
+
+        self.assertEqual((teamIds[0], teamIds[1]), scoresAggregate.ids)
+        self.assertEqual((1, 2), scoresAggregate.scores)
+        self.assertEqual((2, 1), scoresAggregate.opponentScores)
+        # multi-week matchups are kept as they were played
+        self.assertEqual(("1", "1"), scoresAggregate.multiWeekMatchupIds)
+        self.assertEqual(
+            (teamIds[0], teamIds[0]), scoresAggregate.multiWeekMatchupTeamAIds
+        )
+        self.assertEqual((1.1, 3.3), scoresAggregate.multiWeekMatchupTeamAScores)
+        self.assertEqual((2.2, 1.1), scoresAggregate.multiWeekMatchupTeamBScores)
+        # only built once for the same filters
+        self.assertIs(
+            scoresAggregate,
+            yearFrame.getScoresAggregate(YearFilters.getForYear(year)),
+        )
+
+    def test_getScoresAggregate_filtered(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+
+        scoresAggregate = yearFrame.getScoresAggregate(
+            YearFilters.getForYear(year, onlyRegularSeason=True)
+        )
+
+        self.assertEqual((1, 2), scoresAggregate.scores)
+        self.assertEqual(tuple(), scoresAggregate.multiWeekMatchupIds)
+
+    def test_getSortedScores_happyPath(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+
+        sortedScores = yearFrame.getSortedScores()
+
+        # the IGNORE matchup is not counted and the multi-week matchup is combined
+        self.assertEqual(4, len(sortedScores))
+        self.assertEqual(
+            [0, 3], sortedScores.getNumberOfScoresBeatAndTied([1, 4.4])[0].tolist()
+        )
+        self.assertIs(sortedScores, yearFrame.getSortedScores())
+
+    def test_getFirstRowOfEachMultiWeekMatchup_happyPath(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+        rows = yearFrame.getRows(YearFilters.getForYear(year))
+
+        self.assertEqual(
+            [True, True, False],
+            yearFrame.getFirstRowOfEachMultiWeekMatchup(rows).tolist(),
+        )
+
+    def test_countByTeam_happyPath(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+
+        self.assertEqual([2, 0, 1], yearFrame.countByTeam([0, 2, 0]).tolist())
+
+    def test_countPlayedByEachWeek_happyPath(self):
+        # rows 1 and 2 are in week 1, row 3 is in week 3
+        weekIndex = numpy.array([0, 0, 2])
+
+        self.assertEqual([2, 2, 3], YearFrame.countPlayedByEachWeek(weekIndex, 1, 3))
+        self.assertEqual([2, 3], YearFrame.countPlayedByEachWeek(weekIndex, 2, 3))
+
+    def test_countByTeamAfterEachWeek_happyPath(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+        teamIndexes = numpy.array([0, 2, 0, 1])
+        weights = numpy.array([0.1, 0.2, 0.3, 0.4])
+
+        self.assertEqual(
+            [[1, 0, 1], [1, 0, 1], [2, 1, 1]],
+            yearFrame.countByTeamAfterEachWeek(teamIndexes, [2, 2, 4]).tolist(),
+        )
+        self.assertEqual(
+            [[0.1, 0.0, 0.2], [0.1 + 0.3, 0.4, 0.2]],
+            yearFrame.countByTeamAfterEachWeek(teamIndexes, [2, 4], weights).tolist(),
+        )
+        # the last week is always the same as countByTeam()
+        self.assertEqual(
+            yearFrame.countByTeam(teamIndexes[:3], weights[:3]).tolist(),
+            yearFrame.countByTeamAfterEachWeek(teamIndexes, [3], weights)[0].tolist(),
+        )
+
+    def test_getFixedPointScores_happyPath(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+
+        teamAScore, teamBScore = yearFrame.getFixedPointScores(
+            2, numpy.array([0, 1, 2, 3])
+        )
+
+        self.assertEqual("int64", str(teamAScore.dtype))
+        self.assertEqual([100, 110, 330, 500], teamAScore.tolist())
+        self.assertEqual([200, 220, 110, 500], teamBScore.tolist())
+        self.assertEqual(
+            [11, 50], yearFrame.getFixedPointScores(1, numpy.array([1, 3]))[0].tolist()
+        )
+
+    def test_simplifyMultiWeekMatchups_fixedPointScale(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+        rows = yearFrame.getRows(YearFilters.getForYear(year))
+
+        simplifiedMatchups = yearFrame.simplifyMultiWeekMatchups(
+            rows, fixedPointScale=1
+        )
+
+        # each week's score is made a fixed-point integer before they are added up
+        self.assertEqual([10, 44], simplifiedMatchups.teamAScore.tolist())
+        self.assertEqual([20, 33], simplifiedMatchups.teamBScore.tolist())
+
+    def test_getFixedPointScores_onlyGivenRowsMustBeFixedPoint(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+
+        teamAScore, teamBScore = yearFrame.getFixedPointScores(0, numpy.array([0, 3]))
+
+        self.assertEqual([1, 5], teamAScore.tolist())
+        self.assertEqual([2, 5], teamBScore.tolist())
+        with self.assertRaises(ValueError) as context:
+            yearFrame.getFixedPointScores(0, numpy.array([0, 1]))
+        self.assertEqual(
+            "Score '1.1' cannot be represented with a fixed-point scale of 0.",
+            str(context.exception),
+        )
+
+    def test_sumFixedPointScoresByTeam_happyPath(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+        rows = yearFrame.getRows(YearFilters.getForYear(year))
+
+        # 2.2 + 1.1 is exactly 3.3 here, where floats would give 3.3000000000000003
+        self.assertEqual(
+            [540, 200, 330], yearFrame.sumFixedPointScoresByTeam(rows, 2).tolist()
+        )
+        self.assertEqual(
+            [530, 100, 440],
+            yearFrame.sumFixedPointScoresByTeam(rows, 2, opponentScores=True).tolist(),
+        )
+
+    def test_getWeekRangeIndex_builtOncePerMatchupTypes(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+        filters = YearFilters.getForYear(year)
+
+        weekRangeIndex = yearFrame.getWeekRangeIndex(filters.includeMatchupTypes)
+
+        self.assertIs(
+            weekRangeIndex, yearFrame.getWeekRangeIndex(filters.includeMatchupTypes)
+        )
+        self.assertIsNot(
+            weekRangeIndex, yearFrame.getWeekRangeIndex([MatchupType.PLAYOFF])
+        )
+        self.assertEqual([0, 1, 2], weekRangeIndex.rows.tolist())
+
+    def test_countGamesByTeam_happyPath(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+        filters = YearFilters.getForYear(year)
+
+        self.assertEqual([3, 1, 2], yearFrame.countGamesByTeam(filters).tolist())
+        self.assertEqual(
+            [2, 1, 1],
+            yearFrame.countGamesByTeam(
+                filters, countMultiWeekMatchupsAsOneGame=True
+            ).tolist(),
+        )
+        # only 1 week of the multi-week matchup is in the range
+        self.assertEqual(
+            [1, 0, 1],
+            yearFrame.countGamesByTeam(
+                YearFilters.getForYear(year, weekNumberStart=3, weekNumberEnd=3),
+                countMultiWeekMatchupsAsOneGame=True,
+            ).tolist(),
+        )
+
+    def test_countGamesAgainstEachTeam_happyPath(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+
+        gamesAgainstEachTeam = yearFrame.countGamesAgainstEachTeam(
+            yearFrame.getRows(YearFilters.getForYear(year))
+        )
+
+        # the multi-week matchup is 1 game and the IGNORE matchup isn't counted
+        self.assertEqual(
+            [[0, 1, 1], [1, 0, 0], [1, 0, 0]], gamesAgainstEachTeam.tolist()
+        )
+        self.assertEqual(
+            yearFrame.countGamesByTeam(
+                YearFilters.getForYear(year), countMultiWeekMatchupsAsOneGame=True
+            ).tolist(),
+            gamesAgainstEachTeam.sum(axis=1).tolist(),
+        )
+
+    def test_countOutcomesByTeam_happyPath(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+
+        wins, losses, ties = yearFrame.countOutcomesByTeam(YearFilters.getForYear(year))
+
+        self.assertEqual([1, 1, 0], wins.tolist())
+        self.assertEqual([1, 0, 1], losses.tolist())
+        self.assertEqual([0, 0, 0], ties.tolist())
+
+    def test_countOutcomesByTeam_multiWeekMatchupCutByRange(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+
+        # the multi-week matchup is only combined from the weeks in the range
+        wins, losses, _ = yearFrame.countOutcomesByTeam(
+            YearFilters.getForYear(year, weekNumberStart=1, weekNumberEnd=2)
+        )
+
+        self.assertEqual([0, 1, 1], wins.tolist())
+        self.assertEqual([2, 0, 0], losses.tolist())
+
+    def test_getOutcomesInOrderPlayed_happyPath(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+
+        # the multi-week matchup is 1 game that is decided in week 3
+        teamIndex, outcome = yearFrame.getOutcomesInOrderPlayed(
+            yearFrame.getRows(YearFilters.getForYear(year))
+        )
+
+        self.assertEqual([0, 1, 0, 2], teamIndex.tolist())
+        self.assertEqual([-1, 1, 1, -1], outcome.tolist())
+
+    def test_getOutcomesInOrderPlayed_multiWeekMatchupCutByRange(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+
+        teamIndex, outcome = yearFrame.getOutcomesInOrderPlayed(
+            yearFrame.getRows(
+                YearFilters.getForYear(year, weekNumberStart=1, weekNumberEnd=2)
+            )
+        )
+
+        self.assertEqual([0, 1, 0, 2], teamIndex.tolist())
+        self.assertEqual([-1, 1, -1, 1], outcome.tolist())
+
+    def test_getScoresAboveMedianInOrderPlayed_happyPath(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+
+        teamIndex, aboveMedian = yearFrame.getScoresAboveMedianInOrderPlayed(
+            YearFilters.getForYear(year)
+        )
+
+        self.assertEqual([0, 1, 0, 2, 0, 2], teamIndex.tolist())
+        self.assertEqual([False, True, False, True, True, False], aboveMedian.tolist())
+
+    def test_sumDecimalScoresInRangeByTeam_happyPath(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+
+        self.assertEqual(
+            "[Decimal('5.4'), Decimal('2'), Decimal('3.3')]",
+            repr(yearFrame.sumDecimalScoresInRangeByTeam(YearFilters.getForYear(year))),
+        )
+        self.assertEqual(
+            "[Decimal('1'), Decimal('2'), Decimal('0')]",
+            repr(
+                yearFrame.sumDecimalScoresInRangeByTeam(
+                    YearFilters.getForYear(year, weekNumberStart=1, weekNumberEnd=1)
+                )
+            ),
+        )
+        self.assertEqual(
+            "[Decimal('3.3'), Decimal('0'), Decimal('4.4')]",
+            repr(
+                yearFrame.sumDecimalScoresInRangeByTeam(
+                    YearFilters.getForYear(year, weekNumberStart=2, weekNumberEnd=3),
+                    opponentScores=True,
+                )
+            ),
+        )
+
+    def test_sumFixedPointScoresInRangeByTeam_happyPath(self):
+        year = self.__getYear()
+        yearFrame = YearFrame.fromYear(year)
+
+        self.assertEqual(
+            [540, 200, 330],
+            yearFrame.sumFixedPointScoresInRangeByTeam(
+                YearFilters.getForYear(year), 2
+            ).tolist(),
+        )
+        self.assertEqual(
+            [110, 0, 220],
+            yearFrame.sumFixedPointScoresInRangeByTeam(
+                YearFilters.getForYear(year, weekNumberStart=2, weekNumberEnd=2), 2
+            ).tolist(),
+        )
+        self.assertEqual(
+            [530, 100, 440],
+            yearFrame.sumFixedPointScoresInRangeByTeam(
+                YearFilters.getForYear(year), 2, opponentScores=True
+            ).tolist(),
+        )
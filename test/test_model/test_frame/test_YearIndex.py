@@ -0,0 +1,94 @@
+import unittest
+
+from leeger.exception.DoesNotExistException import DoesNotExistException
+from leeger.model.frame.YearIndex import YearIndex
+from leeger.model.league.Division import Division
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Team import Team
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+
+
+class TestYearIndex(unittest.TestCase):
+    def __getYear(self) -> Year:
+        division = Division(name="d1")
+        team1 = Team(ownerId="o1", name="t1", divisionId=division.id)
+        team2 = Team(ownerId="o2", name="t2", divisionId=division.id)
+        matchup = Matchup(
+            teamAId=team1.id, teamBId=team2.id, teamAScore=1, teamBScore=2
+        )
+        return Year(
+            yearNumber=2000,
+            teams=[team1, team2],
+            weeks=[Week(weekNumber=1, matchups=[matchup])],
+            divisions=[division],
+        )
+
+    def test_fromYear_happyPath(self):
+        year = self.__getYear()
+
+        yearIndex = YearIndex.fromYear(year)
+
+        self.assertIs(year.teams[0], yearIndex.getTeamById(year.teams[0].id))
+        self.assertIs(year.teams[1], yearIndex.getTeamById(year.teams[1].id))
+        self.assertIs(
+            year.divisions[0], yearIndex.getDivisionById(year.divisions[0].id)
+        )
+        self.assertIs(year.weeks[0], yearIndex.getWeekByWeekNumber(1))
+
+    def test_fromYear_repeatedId_firstModelFound(self):
+        year = self.__getYear()
+        year.teams[1].id = year.teams[0].id
+
+        yearIndex = YearIndex.fromYear(year)
+
+        self.assertIs(year.teams[0], yearIndex.getTeamById(year.teams[0].id))
+
+    def test_getTeamById_notFound_raisesException(self):
+        yearIndex = YearIndex.fromYear(self.__getYear())
+
+        with self.assertRaises(DoesNotExistException) as context:
+            yearIndex.getTeamById("badId")
+        self.assertEqual(
+            "Team with ID 'badId' does not exist in the given Year.",
+            str(context.exception),
+        )
+
+    def test_getDivisionById_notFound_raisesException(self):
+        yearIndex = YearIndex.fromYear(self.__getYear())
+
+        with self.assertRaises(DoesNotExistException) as context:
+            yearIndex.getDivisionById("badId")
+        self.assertEqual(
+            "Division with ID 'badId' does not exist in the given Year.",
+            str(context.exception),
+        )
+
+    def test_getWeekByWeekNumber_notFound_raisesException(self):
+        yearIndex = YearIndex.fromYear(self.__getYear())
+
+        with self.assertRaises(DoesNotExistException) as context:
+            yearIndex.getWeekByWeekNumber(2)
+        self.assertEqual(
+            "Year does not have a week with week number 2.",
+            str(context.exception),
+        )
+
+    def test_getStructureKey_changesWhenStructureIsModified(self):
+        year = self.__getYear()
+        structureKey = YearIndex.getStructureKey(year)
+
+        # matchups are not part of the key
+        year.weeks[0].matchups[0].teamAScore = 5
+        self.assertEqual(structureKey, YearIndex.getStructureKey(year))
+
+        year.teams[0].name = "new name"
+        self.assertNotEqual(structureKey, YearIndex.getStructureKey(year))
+        structureKey = YearIndex.getStructureKey(year)
+
+        year.teams.reverse()
+        self.assertNotEqual(structureKey, YearIndex.getStructureKey(year))
+        structureKey = YearIndex.getStructureKey(year)
+
+        year.weeks.append(Week(weekNumber=2, matchups=list()))
+        self.assertNotEqual(structureKey, YearIndex.getStructureKey(year))
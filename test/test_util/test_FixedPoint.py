@@ -0,0 +1,43 @@
+import unittest
+
+from leeger.util.Deci import Deci
+from leeger.util.FixedPoint import FixedPoint
+
+
+class TestFixedPoint(unittest.TestCase):
+    def test_toFixedPoint_happyPath(self):
+        self.assertEqual(10025, FixedPoint.toFixedPoint(100.25, 2))
+        self.assertEqual(10000, FixedPoint.toFixedPoint(100, 2))
+        self.assertEqual(-110, FixedPoint.toFixedPoint(-1.1, 2))
+        self.assertEqual(1, FixedPoint.toFixedPoint(1, 0))
+        self.assertIsInstance(FixedPoint.toFixedPoint(1.1, 2), int)
+
+    def test_toFixedPoint_tooManyDecimalPlaces_raisesException(self):
+        with self.assertRaises(ValueError) as context:
+            FixedPoint.toFixedPoint(1.234, 2)
+        self.assertEqual(
+            "Score '1.234' cannot be represented with a fixed-point scale of 2.",
+            str(context.exception),
+        )
+
+    def test_toFixedPointArray_happyPath(self):
+        response = FixedPoint.toFixedPointArray([1, 1.1, 2.25], 2)
+
+        self.assertEqual("int64", str(response.dtype))
+        self.assertEqual([100, 110, 225], response.tolist())
+
+    def test_toDeci_happyPath(self):
+        response = FixedPoint.toDeci(10025, 2)
+
+        self.assertIsInstance(response, Deci)
+        self.assertEqual(Deci("100.25"), response)
+        self.assertEqual(Deci("-1.1"), FixedPoint.toDeci(-110, 2))
+        self.assertEqual(Deci("5"), FixedPoint.toDeci(5, 0))
+
+    def test_toDeci_trailingZerosFromScaleAreRemoved(self):
+        self.assertEqual("1234", str(FixedPoint.toDeci(123400, 2)))
+        self.assertEqual("1200", str(FixedPoint.toDeci(120000, 2)))
+        self.assertEqual("100.5", str(FixedPoint.toDeci(10050, 2)))
+        self.assertEqual("-1.1", str(FixedPoint.toDeci(-110, 2)))
+        self.assertEqual("0", str(FixedPoint.toDeci(0, 2)))
+        self.assertEqual("5", str(FixedPoint.toDeci(5, 0)))
@@ -60,6 +60,27 @@ class TestGeneralUtil(unittest.TestCase):
         response = GeneralUtil.safeSum(1, 1, 1)
         self.assertEqual(3, response)
 
+    def test_validatePositiveInt_happyPath(self):
+        self.assertEqual(1, GeneralUtil.validatePositiveInt(1, "foo"))
+        self.assertEqual(100, GeneralUtil.validatePositiveInt(100, "foo"))
+
+    def test_validatePositiveInt_notInt_raisesException(self):
+        for value, typeName in ((1.0, "float"), (True, "bool"), (None, "NoneType")):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError) as context:
+                    GeneralUtil.validatePositiveInt(value, "foo")
+                self.assertEqual(
+                    f"'foo' must be type 'int', not '{typeName}'.",
+                    str(context.exception),
+                )
+
+    def test_validatePositiveInt_lessThanOne_raisesException(self):
+        for value in (0, -1):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError) as context:
+                    GeneralUtil.validatePositiveInt(value, "foo")
+                self.assertEqual("'foo' must be at least 1.", str(context.exception))
+
     def test_findDifferentFields_noDifference_simpleDict(self):
         d1 = {"foo": "baz", "bar": "bot"}
         d2 = {"foo": "baz", "bar": "bot"}
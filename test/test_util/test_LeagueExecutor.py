@@ -0,0 +1,136 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from leeger.calculator.all_time_calculator import GameOutcomeAllTimeCalculator
+from leeger.exception.InvalidLeagueFormatException import (
+    InvalidLeagueFormatException,
+)
+from leeger.exception.InvalidYearFormatException import InvalidYearFormatException
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.model.stat.LeagueResult import LeagueResult
+from leeger.util.LeagueExecutor import LeagueExecutor
+from test.helper.prototypes import getNDefaultOwnersAndTeams
+
+
+class TestLeagueExecutor(unittest.TestCase):
+    @staticmethod
+    def __getLeagues() -> list[League]:
+        """
+        The 2nd League is the biggest, and the 3rd League has a Year with a missing week.
+        """
+        leagues = list()
+        for leagueNumber, weekNumbers in enumerate(((1, 2), (1, 2, 3, 4), (1, 3))):
+            owners, teams = getNDefaultOwnersAndTeams(2)
+            weeks = [
+                Week(
+                    weekNumber=weekNumber,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams[0].id,
+                            teamBId=teams[1].id,
+                            teamAScore=100 + leagueNumber + weekNumber,
+                            teamBScore=100,
+                        )
+                    ],
+                )
+                for weekNumber in weekNumbers
+            ]
+            year = Year(yearNumber=2000, teams=teams, weeks=weeks)
+            leagues.append(
+                League(name=f"TEST {leagueNumber}", owners=owners, years=[year])
+            )
+        return leagues
+
+    def __assertResults(
+        self, leagues: list[League], results: list[LeagueResult]
+    ) -> None:
+        self.assertEqual([0, 1, 2], sorted(result.index for result in results))
+        for result in results:
+            self.assertIsInstance(result, LeagueResult)
+            self.assertIs(leagues[result.index], result.league)
+            if result.index == 2:
+                self.assertIsNone(result.result)
+                self.assertIsInstance(result.exception, InvalidYearFormatException)
+            else:
+                self.assertIsNone(result.exception)
+                self.assertEqual(
+                    GameOutcomeAllTimeCalculator.getWins(leagues[result.index]),
+                    result.result,
+                )
+
+    def test_callForEachLeague_noWorkersOrExecutorGiven_calculatesInThisProcess(self):
+        leagues = self.__getLeagues()
+
+        with patch("leeger.util.YearExecutor.ProcessPoolExecutor") as mockExecutor:
+            results = list(
+                LeagueExecutor.callForEachLeague(
+                    GameOutcomeAllTimeCalculator.getWins, leagues, dict()
+                )
+            )
+
+        mockExecutor.assert_not_called()
+        self.assertEqual([0, 1, 2], [result.index for result in results])
+        self.__assertResults(leagues, results)
+
+    def test_callForEachLeague_workersGiven_failuresDoNotStopBatch(self):
+        leagues = self.__getLeagues()
+
+        results = list(
+            LeagueExecutor.callForEachLeague(
+                GameOutcomeAllTimeCalculator.getWins, leagues, dict(), workers=2
+            )
+        )
+
+        self.__assertResults(leagues, results)
+
+    def test_callForEachLeague_executorGiven_biggestLeagueStartedFirst(self):
+        leagues = self.__getLeagues()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with patch.object(executor, "submit", wraps=executor.submit) as mockSubmit:
+                results = list(
+                    LeagueExecutor.callForEachLeague(
+                        GameOutcomeAllTimeCalculator.getWins,
+                        leagues,
+                        {"onlyRegularSeason": True},
+                        executor=executor,
+                    )
+                )
+
+        self.assertEqual(3, mockSubmit.call_count)
+        # the 2nd League has the most Matchups
+        self.assertIn('"TEST 1"', mockSubmit.call_args_list[0].args[2])
+        self.assertEqual(
+            {"onlyRegularSeason": True}, mockSubmit.call_args_list[0].args[3]
+        )
+        self.__assertResults(leagues, results)
+
+    def test_callForEachLeague_executorGiven_malformedLeagueDoesNotStopBatch(self):
+        leagues = self.__getLeagues()
+        malformedLeague = League(name="MALFORMED", owners=list(), years=None)
+        leagues.append(malformedLeague)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            results = list(
+                LeagueExecutor.callForEachLeague(
+                    GameOutcomeAllTimeCalculator.getWins,
+                    leagues,
+                    dict(),
+                    executor=executor,
+                )
+            )
+
+        malformedResults = [result for result in results if result.index == 3]
+        self.assertEqual(1, len(malformedResults))
+        self.assertIs(malformedLeague, malformedResults[0].league)
+        self.assertIsNone(malformedResults[0].result)
+        self.assertIsInstance(
+            malformedResults[0].exception, InvalidLeagueFormatException
+        )
+        self.__assertResults(
+            leagues, [result for result in results if result.index != 3]
+        )
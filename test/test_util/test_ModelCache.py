@@ -0,0 +1,61 @@
+import gc
+import unittest
+
+from leeger.model.league.Week import Week
+from leeger.util.ModelCache import ModelCache
+
+
+class TestModelCache(unittest.TestCase):
+    def test_get_onlyBuildsAgainWhenModelIsModified(self):
+        modelCache = ModelCache()
+        week = Week(weekNumber=1, matchups=list())
+        calls = list()
+
+        def builder(model: Week) -> int:
+            calls.append(model)
+            return model.weekNumber
+
+        self.assertEqual(1, modelCache.get(week, builder))
+        self.assertEqual(1, modelCache.get(week, builder))
+        self.assertEqual(1, len(calls))
+        week.weekNumber = 2
+        self.assertEqual(2, modelCache.get(week, builder))
+        self.assertEqual(2, len(calls))
+
+    def test_get_getVersionKeyGiven_onlyBuildsAgainWhenVersionKeyChanges(self):
+        modelCache = ModelCache(getVersionKey=lambda model: (model.weekNumber,))
+        week = Week(weekNumber=1, matchups=list())
+        calls = list()
+
+        def builder(model: Week) -> int:
+            calls.append(model)
+            return model.weekNumber
+
+        modelCache.get(week, builder)
+        # not part of the version key
+        week.matchups = list()
+        modelCache.get(week, builder)
+        self.assertEqual(1, len(calls))
+        week.weekNumber = 2
+        self.assertEqual(2, modelCache.get(week, builder))
+        self.assertEqual(2, len(calls))
+
+    def test_get_dropsValueWhenModelIsGarbageCollected(self):
+        modelCache = ModelCache()
+        week = Week(weekNumber=1, matchups=list())
+
+        modelCache.get(week, lambda model: model.weekNumber)
+        self.assertEqual(1, len(modelCache))
+        del week
+        gc.collect()
+
+        self.assertEqual(0, len(modelCache))
+
+    def test_clear(self):
+        modelCache = ModelCache()
+        week = Week(weekNumber=1, matchups=list())
+
+        modelCache.get(week, lambda model: model.weekNumber)
+        modelCache.clear()
+
+        self.assertEqual(0, len(modelCache))
@@ -0,0 +1,43 @@
+import unittest
+
+from leeger.util.MonotonicQueue import MonotonicQueue
+
+
+class TestMonotonicQueue(unittest.TestCase):
+    def test_getFront_maxValue_returnsMaxValueInWindow(self):
+        monotonicQueue = MonotonicQueue(maxValue=True)
+        self.assertIsNone(monotonicQueue.getFront())
+        monotonicQueue.push(1, 5)
+        monotonicQueue.push(2, 3)
+        self.assertEqual(5, monotonicQueue.getFront())
+        monotonicQueue.dropBefore(2)
+        self.assertEqual(3, monotonicQueue.getFront())
+        monotonicQueue.push(3, 4)
+        self.assertEqual(4, monotonicQueue.getFront())
+        monotonicQueue.dropBefore(4)
+        self.assertIsNone(monotonicQueue.getFront())
+
+    def test_getFront_minValue_returnsMinValueInWindow(self):
+        monotonicQueue = MonotonicQueue(maxValue=False)
+        monotonicQueue.push(1, 5)
+        monotonicQueue.push(2, 3)
+        monotonicQueue.push(3, 4)
+        self.assertEqual(3, monotonicQueue.getFront())
+        monotonicQueue.dropBefore(3)
+        self.assertEqual(4, monotonicQueue.getFront())
+
+    def test_getFront_equalValues_keepsFirstValuePushed(self):
+        monotonicQueue = MonotonicQueue(maxValue=True)
+        monotonicQueue.push(1, 100.0)
+        monotonicQueue.push(2, 100)
+        self.assertIsInstance(monotonicQueue.getFront(), float)
+        monotonicQueue.dropBefore(2)
+        self.assertIsInstance(monotonicQueue.getFront(), int)
+
+    def test_push_keyGiven_comparesByKeyAndReturnsValue(self):
+        monotonicQueue = MonotonicQueue(maxValue=True)
+        monotonicQueue.push(1, "a", 2)
+        monotonicQueue.push(1, "b", 1)
+        self.assertEqual("a", monotonicQueue.getFront())
+        monotonicQueue.push(2, "c", 3)
+        self.assertEqual("c", monotonicQueue.getFront())
@@ -0,0 +1,75 @@
+import unittest
+
+from leeger.enum.NumericBackend import NumericBackend
+from leeger.util.NumericSettings import NumericSettings
+
+
+class TestNumericSettings(unittest.TestCase):
+    def tearDown(self):
+        NumericSettings.setDefaultNumericBackend(NumericBackend.DECIMAL)
+        NumericSettings.setDefaultFixedPointScale(2)
+
+    def test_getNumericBackend_noKwarg_returnsDecimal(self):
+        self.assertEqual(NumericBackend.DECIMAL, NumericSettings.getNumericBackend())
+        self.assertFalse(NumericSettings.useFloat())
+
+    def test_getNumericBackend_kwargGiven(self):
+        self.assertEqual(
+            NumericBackend.FLOAT,
+            NumericSettings.getNumericBackend(numericBackend=NumericBackend.FLOAT),
+        )
+        self.assertEqual(
+            NumericBackend.FLOAT,
+            NumericSettings.getNumericBackend(numericBackend="float"),
+        )
+        self.assertTrue(NumericSettings.useFloat(numericBackend="FLOAT"))
+
+    def test_setDefaultNumericBackend(self):
+        NumericSettings.setDefaultNumericBackend("float")
+        self.assertEqual(
+            NumericBackend.FLOAT, NumericSettings.getDefaultNumericBackend()
+        )
+        self.assertTrue(NumericSettings.useFloat())
+        # kwarg overrides the default
+        self.assertFalse(
+            NumericSettings.useFloat(numericBackend=NumericBackend.DECIMAL)
+        )
+
+    def test_getNumericBackend_invalidValue_raisesException(self):
+        with self.assertRaises(ValueError) as context:
+            NumericSettings.getNumericBackend(numericBackend="bad")
+        self.assertEqual("'bad' is not a valid NumericBackend.", str(context.exception))
+
+        with self.assertRaises(ValueError) as context:
+            NumericSettings.getNumericBackend(numericBackend=1)
+        self.assertEqual(
+            "'numericBackend' must be type 'NumericBackend' or 'str', not 'int'.",
+            str(context.exception),
+        )
+
+    def test_useFixedPoint(self):
+        self.assertFalse(NumericSettings.useFixedPoint())
+        self.assertTrue(NumericSettings.useFixedPoint(numericBackend="fixed_point"))
+        self.assertTrue(
+            NumericSettings.useFixedPoint(numericBackend=NumericBackend.FIXED_POINT)
+        )
+
+    def test_getFixedPointScale(self):
+        self.assertEqual(2, NumericSettings.getFixedPointScale())
+        self.assertEqual(3, NumericSettings.getFixedPointScale(fixedPointScale=3))
+        NumericSettings.setDefaultFixedPointScale(4)
+        self.assertEqual(4, NumericSettings.getDefaultFixedPointScale())
+        self.assertEqual(4, NumericSettings.getFixedPointScale())
+
+    def test_getFixedPointScale_invalidValue_raisesException(self):
+        with self.assertRaises(ValueError) as context:
+            NumericSettings.getFixedPointScale(fixedPointScale=1.5)
+        self.assertEqual(
+            "'fixedPointScale' must be type 'int', not 'float'.", str(context.exception)
+        )
+
+        with self.assertRaises(ValueError) as context:
+            NumericSettings.setDefaultFixedPointScale(-1)
+        self.assertEqual(
+            "'fixedPointScale' cannot be negative.", str(context.exception)
+        )
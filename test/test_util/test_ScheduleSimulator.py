@@ -0,0 +1,69 @@
+import unittest
+
+import numpy
+
+from leeger.util.ScheduleSimulator import ScheduleSimulator
+
+
+class TestScheduleSimulator(unittest.TestCase):
+    def __getScheduleSimulator(self) -> ScheduleSimulator:
+        # week 1 has every team, week 2 only has teams 1 and 2 (and they tie)
+        return ScheduleSimulator(
+            4,
+            [numpy.array([0, 1, 2, 3]), numpy.array([1, 2])],
+            [numpy.array([4.0, 3.0, 2.0, 1.0]), numpy.array([5.0, 5.0])],
+        )
+
+    def test_simulateHalfWins_happyPath(self):
+        scheduleSimulator = self.__getScheduleSimulator()
+
+        halfWins = scheduleSimulator.simulateHalfWins(1000, numpy.random.default_rng(0))
+
+        self.assertEqual((1000, 4), halfWins.shape)
+        self.assertEqual([2], numpy.unique(halfWins[:, 0]).tolist())
+        self.assertEqual([1, 3], numpy.unique(halfWins[:, 1]).tolist())
+        self.assertEqual([1, 3], numpy.unique(halfWins[:, 2]).tolist())
+        self.assertEqual([0], numpy.unique(halfWins[:, 3]).tolist())
+        # every game gives out 2 half wins
+        self.assertTrue((halfWins.sum(axis=1) == 6).all())
+
+    def test_simulateHalfWins_fixedHalfWinsAddedToEverySimulation(self):
+        scheduleSimulator = ScheduleSimulator(
+            4,
+            [numpy.array([0, 1, 2, 3])],
+            [numpy.array([4.0, 3.0, 2.0, 1.0])],
+            fixedHalfWins=numpy.array([2, 2, 0, 1]),
+        )
+
+        halfWins = scheduleSimulator.simulateHalfWins(1000, numpy.random.default_rng(0))
+
+        self.assertEqual(4, scheduleSimulator.maxHalfWins)
+        self.assertEqual([4], numpy.unique(halfWins[:, 0]).tolist())
+        self.assertEqual([1], numpy.unique(halfWins[:, 3]).tolist())
+        self.assertTrue((halfWins.sum(axis=1) == 9).all())
+
+    def test_simulate_happyPath(self):
+        scheduleSimulator = self.__getScheduleSimulator()
+
+        halfWinCounts, standingCounts = scheduleSimulator.simulate(25_000, seed=1)
+
+        self.assertEqual(4, scheduleSimulator.maxHalfWins)
+        self.assertEqual((4, 5), halfWinCounts.shape)
+        self.assertEqual([0, 0, 25_000, 0, 0], halfWinCounts[0].tolist())
+        self.assertEqual(25_000, halfWinCounts[1, 1] + halfWinCounts[1, 3])
+        self.assertEqual((4, 4), standingCounts.shape)
+        self.assertEqual([0, 0, 0, 25_000], standingCounts[3].tolist())
+        self.assertEqual([25_000] * 4, standingCounts.sum(axis=0).tolist())
+        # team 2 is only beaten by team 1, so it wins 2/3 of the time in week 1
+        self.assertAlmostEqual(2 / 3, halfWinCounts[1, 3] / 25_000, delta=0.02)
+
+    def test_simulate_sameSeedSameResults(self):
+        scheduleSimulator = self.__getScheduleSimulator()
+
+        halfWinCounts1, standingCounts1 = scheduleSimulator.simulate(15_000, seed=7)
+        halfWinCounts2, standingCounts2 = scheduleSimulator.simulate(
+            15_000, seed=7, workers=2
+        )
+
+        self.assertEqual(halfWinCounts1.tolist(), halfWinCounts2.tolist())
+        self.assertEqual(standingCounts1.tolist(), standingCounts2.tolist())
@@ -0,0 +1,70 @@
+import unittest
+
+import numpy
+
+from leeger.util.SeasonSimulator import SeasonSimulator
+
+
+class TestSeasonSimulator(unittest.TestCase):
+    def __getSeasonSimulator(self, **kwargs) -> SeasonSimulator:
+        settings = dict(
+            # every team always scores their mean score
+            meanScores=numpy.array([200.0, 100.0, 90.0, 10.0]),
+            scoreStandardDeviations=numpy.array([0.0, 0.0, 0.0, 0.0]),
+            halfWins=numpy.array([0, 2, 2, 4]),
+            pointsScored=numpy.array([0.0, 0.0, 0.0, 0.0]),
+            remainingTeamAIndexes=[numpy.array([0, 1]), numpy.array([0, 1])],
+            remainingTeamBIndexes=[numpy.array([3, 2]), numpy.array([2, 3])],
+            numberOfPlayoffTeams=2,
+            numberOfByes=0,
+        )
+        settings.update(kwargs)
+        return SeasonSimulator(**settings)
+
+    def test_simulate_happyPath(self):
+        seasonSimulator = self.__getSeasonSimulator()
+
+        playoffCounts, byeCounts, championshipCounts, halfWinTotals = (
+            seasonSimulator.simulate(1000, seed=0)
+        )
+
+        # team 1 and team 2 win every remaining game
+        self.assertEqual([1000, 1000, 0, 0], playoffCounts.tolist())
+        self.assertEqual([0, 0, 0, 0], byeCounts.tolist())
+        self.assertEqual([1000, 0, 0, 0], championshipCounts.tolist())
+        self.assertEqual([4000, 6000, 2000, 4000], halfWinTotals.tolist())
+
+    def test_simulate_leagueMedianGames(self):
+        seasonSimulator = self.__getSeasonSimulator(leagueMedianGames=True)
+
+        _, _, _, halfWinTotals = seasonSimulator.simulate(1000, seed=0)
+
+        # team 1 and team 2 also score above the median of 95 every remaining week
+        self.assertEqual([8000, 10000, 2000, 4000], halfWinTotals.tolist())
+
+    def test_simulate_withByes(self):
+        seasonSimulator = self.__getSeasonSimulator(
+            numberOfPlayoffTeams=3, numberOfByes=1
+        )
+
+        playoffCounts, byeCounts, championshipCounts, _ = seasonSimulator.simulate(
+            1000, seed=0
+        )
+
+        # team 1 and team 4 are tied in wins, but team 1 scored more points
+        self.assertEqual([1000, 1000, 0, 1000], playoffCounts.tolist())
+        self.assertEqual([0, 1000, 0, 0], byeCounts.tolist())
+        self.assertEqual([1000, 0, 0, 0], championshipCounts.tolist())
+
+    def test_simulate_sameSeedSameResults(self):
+        seasonSimulator = self.__getSeasonSimulator(
+            meanScores=numpy.array([100.0, 100.0, 100.0, 100.0]),
+            scoreStandardDeviations=numpy.array([10.0, 10.0, 10.0, 10.0]),
+        )
+
+        results1 = seasonSimulator.simulate(12_000, seed=5)
+        results2 = seasonSimulator.simulate(12_000, seed=5, workers=2)
+
+        for counts1, counts2 in zip(results1, results2):
+            self.assertEqual(counts1.tolist(), counts2.tolist())
+        self.assertEqual(12_000, results1[2].sum())
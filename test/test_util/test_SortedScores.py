@@ -0,0 +1,44 @@
+import unittest
+
+from leeger.util.Deci import Deci
+from leeger.util.SortedScores import SortedScores
+
+
+class TestSortedScores(unittest.TestCase):
+    def test_getNumberOfScoresBeatAndTied_happyPath(self):
+        sortedScores = SortedScores([100, 90.5, 110, 90.5, 80])
+
+        scoresBeat, scoresTied = sortedScores.getNumberOfScoresBeatAndTied(
+            [90.5, 110, 70, 120, 100.0]
+        )
+
+        self.assertEqual([1, 4, 0, 5, 3], scoresBeat.tolist())
+        self.assertEqual([2, 1, 0, 0, 1], scoresTied.tolist())
+
+    def test_getSmartWins_happyPath(self):
+        sortedScores = SortedScores([100, 90.5, 110, 90.5, 80])
+
+        response = sortedScores.getSmartWins([90.5, 110, 80])
+
+        self.assertEqual(3, len(response))
+        self.assertEqual(Deci("0.375"), response[0])
+        self.assertEqual(Deci("1"), response[1])
+        self.assertEqual(Deci("0"), response[2])
+
+    def test_getSmartWins_noScores(self):
+        sortedScores = SortedScores([100, 90.5])
+
+        response = sortedScores.getSmartWins([])
+
+        self.assertEqual(list(), response)
+
+    def test_merge_happyPath(self):
+        sortedScores = SortedScores.merge(
+            [SortedScores([100, 90.5]), SortedScores([110, 90.5, 80]), SortedScores([])]
+        )
+
+        self.assertEqual(5, len(sortedScores))
+        self.assertEqual(
+            SortedScores([100, 90.5, 110, 90.5, 80]).getSmartWins([90.5, 110, 80]),
+            sortedScores.getSmartWins([90.5, 110, 80]),
+        )
@@ -0,0 +1,71 @@
+import unittest
+
+import numpy
+
+from leeger.util.StatBootstrapper import StatBootstrapper
+
+
+class TestStatBootstrapper(unittest.TestCase):
+    def __getStatBootstrapper(self, scores: list[float]) -> StatBootstrapper:
+        # team 1 and team 2 each have 2 scores, team 3 has none
+        return StatBootstrapper(
+            numberOfTeams=3,
+            scoreTeamIndexes=numpy.array([0, 1, 0, 1]),
+            scores=numpy.array(scores),
+            awal=numpy.array([1.5, 0.0, 1.0, 0.0]),
+            awalGames=numpy.array([2.0, 2.0, 2.0, 2.0]),
+            gameTeamIndexes=numpy.array([0, 1, 0, 1]),
+            smartWins=numpy.array([1.0, 0.0, 0.5, 0.0]),
+            teamScoreMultipliers=(100.0, 2.0, 0.05),
+        )
+
+    def test_simulate_happyPath(self):
+        statBootstrapper = self.__getStatBootstrapper([100.0, 50.0, 100.0, 50.0])
+
+        pointsScoredPerGame, awalPerGame, smartWinsPerGame, teamScore = (
+            statBootstrapper.simulate(1000, seed=0)
+        )
+
+        for stat in (pointsScoredPerGame, awalPerGame, smartWinsPerGame, teamScore):
+            self.assertEqual((1000, 3), stat.shape)
+            self.assertTrue(numpy.isnan(stat[:, 2]).all())
+        # every score for a team is the same, so every resample is the same
+        self.assertEqual([100.0], numpy.unique(pointsScoredPerGame[:, 0]).tolist())
+        self.assertEqual([50.0], numpy.unique(pointsScoredPerGame[:, 1]).tolist())
+        self.assertEqual([0.0], numpy.unique(awalPerGame[:, 1]).tolist())
+        # team 1's Team Score is 100 * (AWAL per game) + 2 * (200 / 300) * 100 + (100 + 100) * 0.05
+        self.assertTrue(
+            numpy.allclose(teamScore[:, 0], 100 * awalPerGame[:, 0] + 2 * 200 / 3 + 10)
+        )
+        self.assertEqual(
+            {0.5, 0.625, 0.75}, set(numpy.unique(awalPerGame[:, 0]).tolist())
+        )
+        self.assertEqual(
+            {0.5, 0.75, 1.0}, set(numpy.unique(smartWinsPerGame[:, 0]).tolist())
+        )
+        self.assertAlmostEqual(0.625, awalPerGame[:, 0].mean(), delta=0.01)
+
+    def test_simulate_resampledScoresChangeScoringShare(self):
+        statBootstrapper = self.__getStatBootstrapper([100.0, 50.0, 60.0, 50.0])
+
+        pointsScoredPerGame, _, _, teamScore = statBootstrapper.simulate(1000, seed=0)
+
+        self.assertEqual(
+            {60.0, 80.0, 100.0}, set(numpy.unique(pointsScoredPerGame[:, 0]).tolist())
+        )
+        # a resample where team 1 scored 100 both weeks has 200 of the 300 points scored
+        bothHigh = pointsScoredPerGame[:, 0] == 100
+        self.assertTrue(bothHigh.any())
+        self.assertTrue(
+            numpy.allclose(teamScore[bothHigh, 0], 100 * 0.75 + 2 * 200 / 3 + 10)
+        )
+
+    def test_simulate_sameSeedSameResults(self):
+        statBootstrapper = self.__getStatBootstrapper([100.0, 50.0, 60.0, 50.0])
+
+        results1 = statBootstrapper.simulate(15_000, seed=7)
+        results2 = statBootstrapper.simulate(15_000, seed=7, workers=2)
+
+        for stat1, stat2 in zip(results1, results2):
+            self.assertEqual((15_000, 3), stat1.shape)
+            numpy.testing.assert_array_equal(stat1, stat2)
@@ -0,0 +1,166 @@
+import unittest
+
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.util.Deci import Deci
+from leeger.util.stat_sheet import yearStatSheet
+from leeger.util.StatPercentileIndex import StatPercentileIndex
+from test.helper.prototypes import getNDefaultOwnersAndTeams
+
+
+class TestStatPercentileIndex(unittest.TestCase):
+    @staticmethod
+    def __getYear(yearNumber: int, scores: list[tuple[float, float]]) -> Year:
+        owners, teams = getNDefaultOwnersAndTeams(2 * len(scores))
+        matchups = [
+            Matchup(
+                teamAId=teams[2 * i].id,
+                teamBId=teams[2 * i + 1].id,
+                teamAScore=teamAScore,
+                teamBScore=teamBScore,
+            )
+            for i, (teamAScore, teamBScore) in enumerate(scores)
+        ]
+        return Year(
+            yearNumber=yearNumber,
+            teams=teams,
+            weeks=[Week(weekNumber=1, matchups=matchups)],
+        )
+
+    def test_getPercentile_happyPath(self):
+        statPercentileIndex = StatPercentileIndex()
+        statPercentileIndex.addYear(self.__getYear(2000, [(100, 90), (80, 70)]))
+        statPercentileIndex.addYear(self.__getYear(2001, [(110, 90), (60, 50)]))
+
+        # points scored: 50, 60, 70, 80, 90, 90, 100, 110
+        self.assertEqual(8, statPercentileIndex.getNumberOfValues("pointsScored"))
+        self.assertEqual(
+            Deci("62.5"), statPercentileIndex.getPercentile("pointsScored", 90)
+        )
+        self.assertEqual(
+            Deci("75"), statPercentileIndex.getPercentile("pointsScored", 95)
+        )
+        self.assertEqual(
+            Deci("100"), statPercentileIndex.getPercentile("pointsScored", 120)
+        )
+        self.assertEqual(
+            Deci("0"), statPercentileIndex.getPercentile("pointsScored", Deci("10"))
+        )
+
+    def test_getPercentile_valuesAddedAfterLookupAreMerged(self):
+        statPercentileIndex = StatPercentileIndex()
+        statPercentileIndex.addYear(self.__getYear(2000, [(100, 90)]))
+        self.assertEqual(
+            Deci("50"), statPercentileIndex.getPercentile("pointsScored", 95)
+        )
+
+        statPercentileIndex.addYear(self.__getYear(2001, [(80, 96)]))
+        statPercentileIndex.addYear(self.__getYear(2002, [(95, 70)]))
+
+        # points scored: 70, 80, 90, 95, 96, 100
+        self.assertEqual(6, statPercentileIndex.getNumberOfValues("pointsScored"))
+        self.assertEqual(
+            Deci("75"), statPercentileIndex.getPercentile("pointsScored", 96)
+        )
+        self.assertEqual(
+            Deci("100"), statPercentileIndex.getPercentile("pointsScored", 101)
+        )
+
+    def test_getPercentile_byGroup(self):
+        statPercentileIndex = StatPercentileIndex()
+        year1 = self.__getYear(2000, [(100, 90)])
+        year2 = self.__getYear(2000, [(110, 90), (60, 50)])
+        statPercentileIndex.addYear(year1, group=len(year1.teams))
+        statPercentileIndex.addYear(year2, group=len(year2.teams))
+
+        self.assertEqual([2, 4], statPercentileIndex.groups)
+        self.assertEqual(
+            Deci("100"), statPercentileIndex.getPercentile("pointsScored", 105, group=2)
+        )
+        self.assertEqual(
+            Deci("75"), statPercentileIndex.getPercentile("pointsScored", 105, group=4)
+        )
+        self.assertEqual(
+            Deci("5") / Deci("6") * Deci("100"),
+            statPercentileIndex.getPercentile("pointsScored", 105),
+        )
+        self.assertIsNone(
+            statPercentileIndex.getPercentile("pointsScored", 105, group=6)
+        )
+
+    def test_getPercentiles_noneValue(self):
+        statPercentileIndex = StatPercentileIndex()
+        statPercentileIndex.addYear(self.__getYear(2000, [(100, 90)]))
+
+        response = statPercentileIndex.getPercentiles("pointsScored", [100, None, 80])
+
+        self.assertEqual([Deci("75"), None, Deci("0")], response)
+
+    def test_getPercentile_emptyIndex(self):
+        statPercentileIndex = StatPercentileIndex()
+
+        self.assertIsNone(statPercentileIndex.getPercentile("awalPerGame", 0.5))
+        self.assertEqual(0, statPercentileIndex.getNumberOfValues("awalPerGame"))
+
+    def test_getPercentile_invalidStatName_raisesException(self):
+        statPercentileIndex = StatPercentileIndex()
+
+        with self.assertRaises(ValueError) as context:
+            statPercentileIndex.getPercentile("notAStat", 1)
+        self.assertEqual(
+            "'notAStat' is not a stat in a YearStatSheet.", str(context.exception)
+        )
+
+    def test_getTeamPercentiles_happyPath(self):
+        year = self.__getYear(2000, [(100, 90), (80, 70)])
+        owners, _ = getNDefaultOwnersAndTeams(4)
+        league = League(name="TEST", owners=owners, years=[year])
+        statPercentileIndex = StatPercentileIndex()
+        statPercentileIndex.addLeague(league)
+        yearStatSheet_ = yearStatSheet(year)
+
+        response = statPercentileIndex.getTeamPercentiles(yearStatSheet_)
+
+        self.assertEqual(
+            set(StatPercentileIndex.STAT_NAMES)
+            - {
+                "leagueMedianWins",
+                "opponentLeagueMedianWins",
+                "totalGames",
+            },
+            set(response.keys()),
+        )
+        teams = year.teams
+        self.assertEqual(Deci("87.5"), response["pointsScored"][teams[0].id])
+        self.assertEqual(Deci("12.5"), response["pointsScored"][teams[3].id])
+        self.assertEqual(
+            {
+                teams[0].id: Deci("87.5"),
+                teams[1].id: Deci("62.5"),
+                teams[2].id: Deci("37.5"),
+                teams[3].id: Deci("12.5"),
+            },
+            response["awal"],
+        )
+
+    def test_merge_happyPath(self):
+        statPercentileIndex1 = StatPercentileIndex()
+        statPercentileIndex1.addYear(self.__getYear(2000, [(100, 90)]), group="a")
+        statPercentileIndex1.getPercentile("pointsScored", 1)
+        statPercentileIndex2 = StatPercentileIndex()
+        statPercentileIndex2.addYear(self.__getYear(2000, [(80, 70)]), group="a")
+        statPercentileIndex2.addYear(self.__getYear(2000, [(60, 50)]), group="b")
+
+        statPercentileIndex = StatPercentileIndex.merge(
+            [statPercentileIndex1, statPercentileIndex2, StatPercentileIndex()]
+        )
+
+        self.assertEqual(["a", "b"], statPercentileIndex.groups)
+        self.assertEqual(
+            4, statPercentileIndex.getNumberOfValues("pointsScored", group="a")
+        )
+        self.assertEqual(
+            Deci("50"), statPercentileIndex.getPercentile("pointsScored", 75)
+        )
@@ -0,0 +1,117 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import patch
+
+from leeger.calculator.year_calculator import GameOutcomeYearCalculator
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.util.YearExecutor import YearExecutor
+from test.helper.prototypes import getNDefaultOwnersAndTeams
+
+
+class TestYearExecutor(unittest.TestCase):
+    @staticmethod
+    def __getYearsAndKwargs() -> list[tuple[Year, dict]]:
+        yearsAndKwargs = list()
+        for yearNumber in (2000, 2001, 2002):
+            _, teams = getNDefaultOwnersAndTeams(2)
+            weeks = [
+                Week(
+                    weekNumber=weekNumber,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams[0].id,
+                            teamBId=teams[1].id,
+                            teamAScore=yearNumber + weekNumber,
+                            teamBScore=yearNumber,
+                        )
+                    ],
+                )
+                for weekNumber in (1, 2)
+            ]
+            year = Year(yearNumber=yearNumber, teams=teams, weeks=weeks)
+            yearsAndKwargs.append((year, {"weekNumberEnd": 1 + yearNumber % 2}))
+        return yearsAndKwargs
+
+    def __getExpected(self, yearsAndKwargs: list[tuple[Year, dict]]) -> list[dict]:
+        return [
+            GameOutcomeYearCalculator.getWins(year, **yearKwargs)
+            for year, yearKwargs in yearsAndKwargs
+        ]
+
+    def test_callForEachYear_noWorkersOrExecutorGiven_calculatesInThisProcess(self):
+        yearsAndKwargs = self.__getYearsAndKwargs()
+
+        with patch("leeger.util.YearExecutor.ProcessPoolExecutor") as mockExecutor:
+            response = YearExecutor.callForEachYear(
+                GameOutcomeYearCalculator.getWins, yearsAndKwargs
+            )
+            YearExecutor.callForEachYear(
+                GameOutcomeYearCalculator.getWins, yearsAndKwargs, workers=1
+            )
+
+        mockExecutor.assert_not_called()
+        self.assertEqual(self.__getExpected(yearsAndKwargs), response)
+
+    def test_callForEachYear_workersGiven_resultsInYearOrder(self):
+        yearsAndKwargs = self.__getYearsAndKwargs()
+
+        response = YearExecutor.callForEachYear(
+            GameOutcomeYearCalculator.getWins, yearsAndKwargs, workers=2
+        )
+
+        self.assertEqual(self.__getExpected(yearsAndKwargs), response)
+
+    def test_callForEachYear_executorGiven_usesExecutor(self):
+        yearsAndKwargs = self.__getYearsAndKwargs()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with patch.object(executor, "submit", wraps=executor.submit) as mockSubmit:
+                response = YearExecutor.callForEachYear(
+                    GameOutcomeYearCalculator.getWins, yearsAndKwargs, executor=executor
+                )
+
+        self.assertEqual(3, mockSubmit.call_count)
+        self.assertEqual(self.__getExpected(yearsAndKwargs), response)
+
+    def test_callForEachYear_yearModified_modifiedYearIsSent(self):
+        yearsAndKwargs = self.__getYearsAndKwargs()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            YearExecutor.callForEachYear(
+                GameOutcomeYearCalculator.getWins, yearsAndKwargs, executor=executor
+            )
+            yearsAndKwargs[0][0].weeks[0].matchups[0].teamAScore = 0
+            response = YearExecutor.callForEachYear(
+                GameOutcomeYearCalculator.getWins, yearsAndKwargs, executor=executor
+            )
+
+        self.assertEqual(self.__getExpected(yearsAndKwargs), response)
+
+    def test_getExecutor_workersGiven_processPoolShutDownAfterwards(self):
+        with YearExecutor.getExecutor(workers=2) as executor:
+            self.assertIsInstance(executor, ProcessPoolExecutor)
+        with self.assertRaises(RuntimeError):
+            executor.submit(print)
+
+    def test_getExecutor_badWorkers_raisesException(self):
+        with self.assertRaises(ValueError) as context:
+            with YearExecutor.getExecutor(workers="2"):
+                pass
+        self.assertEqual(
+            "'workers' must be type 'int', not 'str'.", str(context.exception)
+        )
+
+        with self.assertRaises(ValueError) as context:
+            with YearExecutor.getExecutor(workers=0):
+                pass
+        self.assertEqual("'workers' must be at least 1.", str(context.exception))
+
+    def test_getExecutor_badExecutor_raisesException(self):
+        with self.assertRaises(ValueError) as context:
+            with YearExecutor.getExecutor(executor=2):
+                pass
+        self.assertEqual(
+            "'executor' must be type 'Executor', not 'int'.", str(context.exception)
+        )
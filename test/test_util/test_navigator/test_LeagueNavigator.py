@@ -1449,3 +1449,52 @@ class TestLeagueNavigator(unittest.TestCase):
         self.assertIsInstance(response, list)
         self.assertEqual(4, len(response))
         self.assertEqual([4, 5, 6, 6], sorted(response))
+
+    def test_getLeagueIndex_onlyBuildsAgainWhenStructureIsModified(self):
+        owners, teams = getNDefaultOwnersAndTeams(2)
+        matchup = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=2
+        )
+        year = Year(
+            yearNumber=2000,
+            teams=teams,
+            weeks=[Week(weekNumber=1, matchups=[matchup])],
+        )
+        league = League(name="TEST", owners=owners, years=[year])
+
+        leagueIndex = LeagueNavigator.getLeagueIndex(league)
+        self.assertIs(leagueIndex, LeagueNavigator.getLeagueIndex(league))
+        # matchups are not part of the index
+        matchup.teamAScore = 3
+        self.assertIs(leagueIndex, LeagueNavigator.getLeagueIndex(league))
+        # team owners are
+        teams[0].ownerId = owners[1].id
+        newLeagueIndex = LeagueNavigator.getLeagueIndex(league)
+        self.assertIsNot(leagueIndex, newLeagueIndex)
+        self.assertEqual(owners[1].id, newLeagueIndex.getOwnerIdByTeamId(teams[0].id))
+
+    def test_getYearByYearNumber_yearAddedToLeague_findsNewYear(self):
+        owners, teamsA = getNDefaultOwnersAndTeams(2)
+        teamsB = getTeamsFromOwners(owners)
+        yearA = Year(yearNumber=2000, teams=teamsA, weeks=list())
+        yearB = Year(yearNumber=2001, teams=teamsB, weeks=list())
+        league = League(name="TEST", owners=owners, years=[yearA])
+
+        with self.assertRaises(DoesNotExistException):
+            LeagueNavigator.getYearByYearNumber(league, 2001)
+        league.years.append(yearB)
+
+        self.assertIs(yearB, LeagueNavigator.getYearByYearNumber(league, 2001))
+        self.assertIs(teamsB[0], LeagueNavigator.getTeamById(league, teamsB[0].id))
+
+    def test_getOwnerById_ownerRemovedFromLeague_raisesException(self):
+        owners, teams = getNDefaultOwnersAndTeams(2)
+        year = Year(yearNumber=2000, teams=teams, weeks=list())
+        league = League(name="TEST", owners=owners, years=[year])
+
+        removedOwner = owners[1]
+        LeagueNavigator.getOwnerById(league, removedOwner.id)
+        league.owners.remove(removedOwner)
+
+        with self.assertRaises(DoesNotExistException):
+            LeagueNavigator.getOwnerById(league, removedOwner.id)
@@ -56,6 +56,49 @@ class TestMatchupNavigator(unittest.TestCase):
         self.assertEqual(teams[0].id, response1)
         self.assertEqual(teams[1].id, response2)
 
+    def test_getTeamIdOfMatchupWinner_fixedPointNumericBackend(self):
+        owners, teams = getNDefaultOwnersAndTeams(2)
+
+        matchup1 = Matchup(
+            teamAId=teams[0].id,
+            teamBId=teams[1].id,
+            teamAScore=100.1,
+            teamBScore=100.11,
+        )
+        matchup2 = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=100, teamBScore=100.0
+        )
+        matchup3 = Matchup(
+            teamAId=teams[0].id,
+            teamBId=teams[1].id,
+            teamAScore=100.25,
+            teamBScore=100.25,
+            teamBHasTiebreaker=True,
+        )
+
+        response1 = MatchupNavigator.getTeamIdOfMatchupWinner(
+            matchup1, numericBackend="FIXED_POINT"
+        )
+        response2 = MatchupNavigator.getTeamIdOfMatchupWinner(
+            matchup2, numericBackend="FIXED_POINT"
+        )
+        response3 = MatchupNavigator.getTeamIdOfMatchupWinner(
+            matchup3, numericBackend="FIXED_POINT"
+        )
+
+        self.assertEqual(teams[1].id, response1)
+        self.assertIsNone(response2)
+        self.assertEqual(teams[1].id, response3)
+
+        with self.assertRaises(ValueError) as context:
+            MatchupNavigator.getTeamIdOfMatchupWinner(
+                matchup1, numericBackend="FIXED_POINT", fixedPointScale=1
+            )
+        self.assertEqual(
+            "Score '100.11' cannot be represented with a fixed-point scale of 1.",
+            str(context.exception),
+        )
+
     def test_simplifyMultiWeekMatchups_happyPath(self):
         _, teams = getNDefaultOwnersAndTeams(2)
 
@@ -89,6 +132,36 @@ class TestMatchupNavigator(unittest.TestCase):
         self.assertEqual(6, response.teamBScore)
         self.assertEqual(MatchupType.PLAYOFF, response.matchupType)
 
+    def test_simplifyMultiWeekMatchups_fixedPointNumericBackend(self):
+        _, teams = getNDefaultOwnersAndTeams(2)
+        matchup1 = Matchup(
+            teamAId=teams[0].id,
+            teamBId=teams[1].id,
+            teamAScore=0.1,
+            teamBScore=0.3,
+            multiWeekMatchupId="1",
+        )
+        matchup2 = Matchup(
+            teamAId=teams[0].id,
+            teamBId=teams[1].id,
+            teamAScore=0.2,
+            teamBScore=0,
+            multiWeekMatchupId="1",
+        )
+
+        response = MatchupNavigator.simplifyMultiWeekMatchups(
+            [matchup1, matchup2], numericBackend="fixed_point"
+        )
+
+        # 0.1 + 0.2 would be 0.30000000000000004 as floats
+        self.assertEqual(0.3, response.teamAScore)
+        self.assertEqual(0.3, response.teamBScore)
+        self.assertIsNone(
+            MatchupNavigator.getTeamIdOfMatchupWinner(
+                response, numericBackend="fixed_point"
+            )
+        )
+
     def test_simplifyMultiWeekMatchups_emptyListGiven_raisesException(self):
         with self.assertRaises(ValueError) as context:
             MatchupNavigator.simplifyMultiWeekMatchups(list())
@@ -844,3 +844,55 @@ class TestYearNavigator(unittest.TestCase):
             "Multi-Week matchups must be included in this calculation.",
             str(context.exception),
         )
+
+    def test_getYearFrame_onlyBuildsAgainWhenYearIsModified(self):
+        _, teams = getNDefaultOwnersAndTeams(2)
+        matchup = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=2
+        )
+        year = Year(
+            yearNumber=2000,
+            teams=teams,
+            weeks=[Week(weekNumber=1, matchups=[matchup])],
+        )
+
+        yearFrame = YearNavigator.getYearFrame(year)
+        self.assertIs(yearFrame, YearNavigator.getYearFrame(year))
+        matchup.teamAScore = 3
+        newYearFrame = YearNavigator.getYearFrame(year)
+        self.assertIsNot(yearFrame, newYearFrame)
+        self.assertEqual([3], newYearFrame.teamAScoreValue.tolist())
+
+    def test_getYearIndex_onlyBuildsAgainWhenStructureIsModified(self):
+        _, teams = getNDefaultOwnersAndTeams(2)
+        matchup = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=2
+        )
+        year = Year(
+            yearNumber=2000,
+            teams=teams,
+            weeks=[Week(weekNumber=1, matchups=[matchup])],
+        )
+
+        yearIndex = YearNavigator.getYearIndex(year)
+        self.assertIs(yearIndex, YearNavigator.getYearIndex(year))
+        # matchups are not part of the index
+        matchup.teamAScore = 3
+        self.assertIs(yearIndex, YearNavigator.getYearIndex(year))
+        # adding a team is
+        newTeam = Team(ownerId="oid", name="t3")
+        year.teams.append(newTeam)
+        self.assertIsNot(yearIndex, YearNavigator.getYearIndex(year))
+        self.assertIs(newTeam, YearNavigator.getTeamById(year, newTeam.id))
+
+    def test_getTeamById_teamIdModified_raisesException(self):
+        team = Team(ownerId="oid", name="t1")
+        year = Year(yearNumber=2000, teams=[team], weeks=list())
+        oldTeamId = team.id
+
+        YearNavigator.getTeamById(year, oldTeamId)
+        team.id = "newId"
+
+        self.assertIs(team, YearNavigator.getTeamById(year, "newId"))
+        with self.assertRaises(DoesNotExistException):
+            YearNavigator.getTeamById(year, oldTeamId)
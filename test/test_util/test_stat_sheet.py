@@ -7,6 +7,7 @@ from leeger.model.league.Week import Week
 from leeger.model.league.Year import Year
 from leeger.model.stat.AllTimeStatSheet import AllTimeStatSheet
 from leeger.model.stat.YearStatSheet import YearStatSheet
+from leeger.util.Deci import Deci
 from test.helper.prototypes import getNDefaultOwnersAndTeams
 
 
@@ -69,6 +70,38 @@ class TestStatSheet(unittest.TestCase):
         # check optional stats are None
         self.assertIsNone(leagueStatSheet.leagueMedianWins)
 
+    def test_leagueStatSheets(self):
+        from leeger.util.stat_sheet import leagueStatSheet, leagueStatSheets
+
+        leagues = list()
+        for teamAScore in (1, 3):
+            owners, teams = getNDefaultOwnersAndTeams(2)
+            matchup = Matchup(
+                teamAId=teams[0].id,
+                teamBId=teams[1].id,
+                teamAScore=teamAScore,
+                teamBScore=2,
+            )
+            week = Week(weekNumber=1, matchups=[matchup])
+            year = Year(yearNumber=2000, teams=teams, weeks=[week])
+            leagues.append(League(name="TEST", owners=owners, years=[year]))
+        # a League without any Years is not valid
+        leagues.append(League(name="TEST", owners=owners, years=[]))
+
+        leagueResults = sorted(
+            leagueStatSheets(leagues, workers=2), key=lambda result: result.index
+        )
+
+        self.assertEqual([0, 1, 2], [result.index for result in leagueResults])
+        for leagueResult in leagueResults[:2]:
+            self.assertIsNone(leagueResult.exception)
+            self.assertIsInstance(leagueResult.result, AllTimeStatSheet)
+            self.assertEqual(
+                leagueStatSheet(leagueResult.league).wins, leagueResult.result.wins
+            )
+        self.assertIsNone(leagueResults[2].result)
+        self.assertIsInstance(leagueResults[2].exception, Exception)
+
     def test_leagueStatSheet_leagueMedianGamesIsTrueInAnyYearSettings(self):
         from leeger.util.stat_sheet import leagueStatSheet
 
@@ -236,3 +269,108 @@ class TestStatSheet(unittest.TestCase):
         self.assertIsInstance(yearStatSheet.leagueMedianWins, dict)
         self.assertIsInstance(yearStatSheet.totalGames, dict)
         self.assertIsInstance(yearStatSheet.opponentLeagueMedianWins, dict)
+
+    def test_leagueStats(self):
+        from leeger.util.stat_sheet import leagueStats
+
+        owners, teams = getNDefaultOwnersAndTeams(2)
+
+        matchup = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=2
+        )
+        week = Week(weekNumber=1, matchups=[matchup])
+        year = Year(yearNumber=2000, teams=teams, weeks=[week])
+
+        league = League(name="TEST", owners=owners, years=[year])
+
+        response = leagueStats(league, ["wins", "adjustedTeamLuck"])
+
+        self.assertEqual(["wins", "adjustedTeamLuck"], list(response.keys()))
+        self.assertEqual({owners[0].id: 0, owners[1].id: 1}, response["wins"])
+        self.assertIsInstance(response["adjustedTeamLuck"], dict)
+
+    def test_yearStats(self):
+        from leeger.util.stat_sheet import yearStats
+
+        _, teams = getNDefaultOwnersAndTeams(2)
+
+        matchup = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=2
+        )
+        week = Week(weekNumber=1, matchups=[matchup])
+        year = Year(yearNumber=2000, teams=teams, weeks=[week])
+
+        response = yearStats(year, ["awal", "teamLuck"])
+
+        self.assertEqual(["awal", "teamLuck"], list(response.keys()))
+        self.assertIsInstance(response["awal"], dict)
+        self.assertIsInstance(response["teamLuck"], dict)
+
+    def test_yearStatProgression(self):
+        from leeger.util.stat_sheet import yearStatProgression
+
+        _, teams = getNDefaultOwnersAndTeams(2)
+
+        week1 = Week(
+            weekNumber=1,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=2
+                )
+            ],
+        )
+        week2 = Week(
+            weekNumber=2,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[1].id,
+                    teamAScore=3.5,
+                    teamBScore=2,
+                )
+            ],
+        )
+        year = Year(yearNumber=2000, teams=teams, weeks=[week1, week2])
+
+        response = yearStatProgression(year, ["wins", "pointsScored"])
+
+        self.assertEqual(["wins", "pointsScored"], list(response.keys()))
+        self.assertEqual({teams[0].id: [0, 1], teams[1].id: [1, 1]}, response["wins"])
+        self.assertEqual(
+            {
+                teams[0].id: [Deci("1"), Deci("4.5")],
+                teams[1].id: [Deci("2"), Deci("4")],
+            },
+            response["pointsScored"],
+        )
+
+    def test_leagueRecords(self):
+        from leeger.util.stat_sheet import leagueRecords
+
+        owners, teams = getNDefaultOwnersAndTeams(2)
+        week1 = Week(
+            weekNumber=1,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=2
+                )
+            ],
+        )
+        year = Year(yearNumber=2000, teams=teams, weeks=[week1])
+        league = League(name="TEST", owners=owners, years=[year])
+
+        response = leagueRecords(league, 1)
+
+        self.assertEqual(
+            [
+                "highestScores",
+                "lowestScores",
+                "biggestBlowouts",
+                "narrowestWins",
+                "highestCombinedScores",
+            ],
+            list(response.keys()),
+        )
+        self.assertEqual(2, response["highestScores"][0].value)
+        self.assertEqual(owners[1].id, response["highestScores"][0].ownerId)
+        self.assertEqual(Deci("3"), response["highestCombinedScores"][0].value)
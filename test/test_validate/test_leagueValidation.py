@@ -1,7 +1,11 @@
+import gc
 import unittest
+import weakref
+from unittest.mock import patch
 
 from leeger.enum.MatchupType import MatchupType
 from leeger.exception.InvalidLeagueFormatException import InvalidLeagueFormatException
+from leeger.exception.InvalidYearFormatException import InvalidYearFormatException
 from leeger.model.league.League import League
 from leeger.model.league.Matchup import Matchup
 from leeger.model.league.Owner import Owner
@@ -101,6 +105,67 @@ class TestLeagueValidation(unittest.TestCase):
             League(name="TEST", owners=[owner1, owner2], years=[a_year, b_year])
         )
 
+    @staticmethod
+    def __getLeague() -> League:
+        owners, teams = getNDefaultOwnersAndTeams(2)
+        matchup = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=2
+        )
+        year = Year(
+            yearNumber=2000,
+            teams=teams,
+            weeks=[Week(weekNumber=1, matchups=[matchup])],
+        )
+        return League(name="TEST", owners=owners, years=[year])
+
+    def test_runAllChecks_leagueNotModified_checksNotRunAgain(self):
+        league = self.__getLeague()
+
+        with patch.object(
+            leagueValidation, "checkAllTypes", wraps=leagueValidation.checkAllTypes
+        ) as mockCheckAllTypes:
+            leagueValidation.runAllChecks(league)
+            leagueValidation.runAllChecks(league)
+
+        mockCheckAllTypes.assert_called_once()
+
+    def test_runAllChecks_leagueModified_checksRunAgain(self):
+        league = self.__getLeague()
+        leagueValidation.runAllChecks(league)
+
+        # an in-place list change doesn't set any attribute, but is still seen as a modification
+        league.owners.append(league.owners[0])
+        with self.assertRaises(InvalidLeagueFormatException):
+            leagueValidation.runAllChecks(league)
+
+        league.owners.pop()
+        leagueValidation.runAllChecks(league)
+        league.years[0].weeks[0].matchups[0].teamBId = "bad"
+        with self.assertRaises(InvalidYearFormatException):
+            leagueValidation.runAllChecks(league)
+
+    def test_runAllChecks_equalLeague_checksRunForEachLeague(self):
+        league = self.__getLeague()
+        leagueCopy = League.fromJson(league.toJson())
+
+        with patch.object(
+            leagueValidation, "checkAllTypes", wraps=leagueValidation.checkAllTypes
+        ) as mockCheckAllTypes:
+            leagueValidation.runAllChecks(league)
+            leagueValidation.runAllChecks(leagueCopy)
+
+        self.assertEqual(2, mockCheckAllTypes.call_count)
+
+    def test_runAllChecks_leagueNotKeptInMemory(self):
+        league = self.__getLeague()
+        leagueValidation.runAllChecks(league)
+        leagueReference = weakref.ref(league)
+
+        del league
+        gc.collect()
+
+        self.assertIsNone(leagueReference())
+
     def test_checkYearsAreInCorrectOrder_yearsArentInCorrectOrder_raisesException(self):
         a_week1 = Week(weekNumber=1, matchups=list())
         a_team1 = Team(ownerId="1", name="1")
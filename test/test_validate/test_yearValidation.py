@@ -1,4 +1,7 @@
+import gc
 import unittest
+import weakref
+from unittest.mock import patch
 
 from leeger.enum.MatchupType import MatchupType
 from leeger.exception.InvalidYearFormatException import InvalidYearFormatException
@@ -13,6 +16,54 @@ from test.helper.prototypes import getNDefaultOwnersAndTeams
 
 
 class TestYearValidation(unittest.TestCase):
+    @staticmethod
+    def __getYear() -> Year:
+        _, teams = getNDefaultOwnersAndTeams(2)
+        matchup = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=2
+        )
+        return Year(
+            yearNumber=2000,
+            teams=teams,
+            weeks=[Week(weekNumber=1, matchups=[matchup])],
+        )
+
+    def test_runAllChecks_yearNotModified_checksNotRunAgain(self):
+        year = self.__getYear()
+
+        with patch.object(
+            yearValidation, "checkAllTypes", wraps=yearValidation.checkAllTypes
+        ) as mockCheckAllTypes:
+            yearValidation.runAllChecks(year)
+            yearValidation.runAllChecks(year)
+
+        mockCheckAllTypes.assert_called_once()
+
+    def test_runAllChecks_yearModified_checksRunAgain(self):
+        year = self.__getYear()
+        yearValidation.runAllChecks(year)
+
+        # an in-place list change doesn't set any attribute, but is still seen as a modification
+        year.weeks.append(Week(weekNumber=3, matchups=[year.weeks[0].matchups[0]]))
+        with self.assertRaises(InvalidYearFormatException):
+            yearValidation.runAllChecks(year)
+
+        year.weeks.pop()
+        yearValidation.runAllChecks(year)
+        year.weeks[0].weekNumber = 2
+        with self.assertRaises(InvalidYearFormatException):
+            yearValidation.runAllChecks(year)
+
+    def test_runAllChecks_yearNotKeptInMemory(self):
+        year = self.__getYear()
+        yearValidation.runAllChecks(year)
+        yearReference = weakref.ref(year)
+
+        del year
+        gc.collect()
+
+        self.assertIsNone(yearReference())
+
     def test_checkAtLeastOneWeekInYear_yearHasNoWeeks_raisesException(self):
         with self.assertRaises(InvalidYearFormatException) as context:
             yearValidation.checkAtLeastOneWeekInYear(